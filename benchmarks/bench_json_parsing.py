@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: parsing a synthetic 5,000-drive `kubectl get drive` listing
+
+Compares the pure-Python yaml.safe_load the collector used to call with the
+libyaml CSafeLoader fallback and the JSON path (orjson when installed).
+
+Usage:
+    python benchmarks/bench_json_parsing.py [--drives 5000] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import yaml
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from information_collector.structured_output import JSON_BACKEND, YAML_LOADER, load_structured
+
+
+def make_drive_list(count: int) -> dict:
+    """Build a kubectl List of CSI Baremetal Drive objects"""
+    return {
+        'apiVersion': 'v1',
+        'kind': 'List',
+        'metadata': {'resourceVersion': ''},
+        'items': [{
+            'apiVersion': 'csi-baremetal.dell.com/v1',
+            'kind': 'Drive',
+            'metadata': {
+                'name': f"{i:08x}-47db-449d-9789-0d81660c2c4d",
+                'creationTimestamp': '2025-01-01T00:00:00Z',
+                'generation': 1,
+                'resourceVersion': str(100000 + i),
+                'uid': f"{i:08x}-1111-2222-3333-444444444444",
+            },
+            'spec': {
+                'Health': 'GOOD' if i % 50 else 'SUSPECT',
+                'IsClean': True,
+                'IsSystem': i % 10 == 0,
+                'NodeId': f"{i % 100:08x}-aaaa-bbbb-cccc-dddddddddddd",
+                'Path': f"/dev/sd{chr(97 + i % 26)}",
+                'PID': 'PERC H755 Front',
+                'SerialNumber': f"SN{i:010d}",
+                'Size': 3840755982336,
+                'Slot': str(i % 24),
+                'Status': 'ONLINE',
+                'Type': 'SSD' if i % 3 else 'HDD',
+                'Usage': 'IN_USE',
+                'VID': 'DELL',
+                'Firmware': '2.1.0',
+            },
+        } for i in range(count)],
+    }
+
+
+def best_of(repeat: int, func, *args) -> float:
+    """Best wall-clock time of several runs, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--drives', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    listing = make_drive_list(args.drives)
+    yaml_output = yaml.safe_dump(listing, default_flow_style=False)
+    json_output = json.dumps(listing, indent=4)
+
+    results = [
+        ('yaml.safe_load (pure Python)', best_of(args.repeat, yaml.safe_load, yaml_output)),
+        (f"yaml {YAML_LOADER.__name__}", best_of(args.repeat, yaml.load, yaml_output, YAML_LOADER)),
+        (f"json ({JSON_BACKEND})", best_of(args.repeat, load_structured, json_output)),
+    ]
+
+    print(f"{args.drives} drives: yaml {len(yaml_output) / 1e6:.1f} MB, json {len(json_output) / 1e6:.1f} MB")
+    baseline = results[0][1]
+    for name, seconds in results:
+        print(f"  {name:32s} {seconds * 1000:9.1f} ms  {baseline / seconds:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark: KnowledgeGraph.analyze_issues on a 50,000-pod graph
+
+Root-cause detection traces every unhealthy drive and node to its pods with
+the per-relationship reverse adjacency. The former nested scans (cubic in
+cluster size) are timed on a smaller graph for comparison. Repeated calls
+between mutations are served from the memoized analyses.
+
+Usage:
+    python benchmarks/bench_kg_analysis.py [--pods 50000] [--legacy-pods 2000] [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from knowledge_graph import KnowledgeGraph
+
+
+def build_graph(pods: int, nodes: int = 100, pods_per_drive: int = 4) -> KnowledgeGraph:
+    """Pod -> PVC -> PV -> Drive chains spread over nodes, with 2% bad drives and one NotReady node"""
+    kg = KnowledgeGraph()
+    for n in range(nodes):
+        kg.add_gnode_node(f"worker-{n}", Ready=n != 0, DiskPressure=False)
+    for d in range(pods // pods_per_drive + 1):
+        kg.add_gnode_drive(f"{d:08x}-47db-449d-9789-0d81660c2c4d", Health='BAD' if d % 50 == 0 else 'GOOD')
+    for i in range(pods):
+        pod_id = kg.add_gnode_pod(f"pod-{i}", f"ns-{i % 20}", node_name=f"worker-{i % nodes}")
+        pvc_id = kg.add_gnode_pvc(f"pvc-{i}", f"ns-{i % 20}")
+        pv_id = kg.add_gnode_pv(f"pv-{i}")
+        kg.add_relationship(pod_id, pvc_id, 'uses')
+        kg.add_relationship(pvc_id, pv_id, 'bound_to')
+        kg.add_relationship(pv_id, f"gnode:Drive:{i // pods_per_drive:08x}-47db-449d-9789-0d81660c2c4d", 'maps_to')
+        if i % 100 == 0:
+            kg.add_issue(pod_id, 'pod_error', 'Input/output error', 'high')
+    return kg
+
+
+def legacy_trace_drive_to_pods(kg: KnowledgeGraph, drive_id: str):
+    """The former Drive -> PV -> PVC -> Pod nested scans"""
+    pods = []
+    for pv_id in kg.find_nodes_by_type('PV'):
+        if drive_id in kg.find_connected_nodes(pv_id, 'maps_to'):
+            for pvc_id in kg.find_nodes_by_type('PVC'):
+                if pv_id in kg.find_connected_nodes(pvc_id, 'bound_to'):
+                    for pod_id in kg.find_nodes_by_type('Pod'):
+                        if pvc_id in kg.find_connected_nodes(pod_id, 'uses'):
+                            pods.append(pod_id)
+    return pods
+
+
+def legacy_root_causes(kg: KnowledgeGraph):
+    """Drive part of the former _identify_root_causes"""
+    return {drive_id: legacy_trace_drive_to_pods(kg, drive_id) for drive_id in kg.find_nodes_by_type('Drive')
+            if kg.graph.nodes[drive_id].get('Health') in ['SUSPECT', 'BAD']}
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pods', type=int, default=50000)
+    parser.add_argument('--legacy-pods', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    build_seconds, kg = timed(build_graph, args.pods)
+    analysis_seconds, analysis = timed(kg.analyze_issues)
+    print(f"{args.pods} pods, {kg.graph.number_of_nodes()} nodes, {kg.graph.number_of_edges()} edges "
+          f"(built in {build_seconds:.2f}s)")
+    print(f"  analyze_issues                 {analysis_seconds * 1000:9.1f} ms  "
+          f"{len(analysis['potential_root_causes'])} root causes, {len(analysis['issue_patterns'])} patterns")
+
+    # One agent iteration: analysis, fix plan, summary and the sorted issue list
+    def iteration():
+        kg.generate_fix_plan(kg.analyze_issues())
+        kg.get_summary()
+        kg.get_all_issues()
+
+    repeat_seconds, _ = timed(lambda: [iteration() for _ in range(args.repeat)])
+    stats = kg.get_cache_stats()['analyses']
+    print(f"  {args.repeat} unchanged iterations     {repeat_seconds * 1000:9.1f} ms  "
+          f"analyze_issues hit rate {stats['analyze_issues']['hit_rate']:.0%}")
+
+    small = build_graph(args.legacy_pods)
+    legacy_seconds, legacy = timed(legacy_root_causes, small)
+    indexed_seconds, indexed = timed(small.pods_by_drive)
+    assert all(indexed.get(drive_id, []) == pods for drive_id, pods in legacy.items())
+    print(f"  {args.legacy_pods} pods, bad-drive tracing: nested scans {legacy_seconds * 1000:9.1f} ms, "
+          f"reverse adjacency {indexed_seconds * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
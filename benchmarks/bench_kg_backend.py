@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Knowledge Graph storage backends, networkx vs compact
+
+Builds the cluster-wide graph of seeded synthetic clusters (benchmarks/synthetic_cluster.py)
+with ResidentKnowledgeGraph on each backend and reports, per size and backend:
+    build               seconds to bootstrap the graph from the listings
+    graph_mib           memory held by the graph object alone (nodes, edges, attributes)
+    kg_mib              memory held by the KnowledgeGraph (graph, indexes and relationship adjacency)
+    analyze_issues      cold analysis, after mark_changed
+    volume_chain        KnowledgeGraph.get_volume_chain() of the synthetic target pod
+    snapshot_mib        size of an uncompressed snapshot
+Memory is measured with tracemalloc in a separate build, so the build times are not
+slowed down by tracing.
+
+Usage:
+    python benchmarks/bench_kg_backend.py [--drives 1000 10000 100000] [--seed 0] [--repeat 3]
+                                          [--output results.json]
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import sys
+import tracemalloc
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_kg_scaling import _git_commit, _stats, _timed, add_cluster_issues
+from benchmarks.synthetic_cluster import SyntheticCluster
+from information_collector.resident_graph import RecordedEventSource, ResidentKnowledgeGraph
+from knowledge_graph.knowledge_graph import GRAPH_BACKENDS
+from knowledge_graph.snapshot import dumps_snapshot
+
+_MIB = 1024 * 1024
+
+
+def build(lists, backend: str):
+    """Bootstrap a resident graph on one backend; returns its KnowledgeGraph"""
+    resident = ResidentKnowledgeGraph(RecordedEventSource(lists), graph_backend=backend)
+    resident.bootstrap()
+    return resident.kg
+
+
+def _retained(func):
+    """Bytes still allocated by func's result once it returned"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = func()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, retained
+
+
+def run_backend(cluster: SyntheticCluster, lists, backend: str, repeat: int):
+    """Benchmark one backend on one cluster; returns its result entry"""
+    kg, times = _timed(lambda: build(lists, backend), repeat)
+    entry = {'build': _stats(times)}
+    del kg
+    gc.collect()
+
+    # Graph alone: add the same nodes and edges to an empty graph object
+    reference = build(lists, backend)
+    nodes = list(reference.graph.nodes(data=True))
+    edges = list(reference.graph.edges(data=True))
+    graph_class = type(reference.graph)
+
+    def fill():
+        graph = graph_class()
+        for node_id, attrs in nodes:
+            graph.add_node(node_id, **attrs)
+        for source_id, target_id, data in edges:
+            graph.add_edge(source_id, target_id, **data)
+        return graph
+
+    _, graph_bytes = _retained(fill)
+    del reference, nodes, edges
+    kg, kg_bytes = _retained(lambda: build(lists, backend))
+    entry['graph_mib'] = graph_bytes / _MIB
+    entry['kg_mib'] = kg_bytes / _MIB
+
+    add_cluster_issues(kg, cluster)
+
+    def analyze_cold():
+        kg.mark_changed()
+        return kg.analyze_issues()
+
+    _, times = _timed(analyze_cold, repeat)
+    entry['analyze_issues'] = _stats(times)
+    target = cluster.target()
+    pod_id = f"gnode:Pod:{target['namespace']}/{target['pod']}"
+    _, times = _timed(lambda: [kg.get_volume_chain(pod_id) for _ in range(100)], repeat)
+    entry['volume_chain_x100'] = _stats(times)
+    entry['snapshot_mib'] = len(dumps_snapshot(kg, 'none')) / _MIB
+    entry['nodes'] = kg.graph.number_of_nodes()
+    entry['edges'] = kg.graph.number_of_edges()
+    return entry
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--drives', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='Write results as JSON to this file')
+    args = parser.parse_args()
+
+    # The builders log every missing optional input; keep the table readable
+    logging.disable(logging.WARNING)
+
+    results = {
+        'benchmark': 'kg_backend',
+        'git_commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'sizes': [],
+    }
+    for drives in args.drives:
+        cluster = SyntheticCluster(drives, seed=args.seed)
+        lists = cluster.recorded_lists()
+        backends = {backend: run_backend(cluster, lists, backend, args.repeat) for backend in GRAPH_BACKENDS}
+        results['sizes'].append({'drives': drives, 'backends': backends})
+
+        first = backends[GRAPH_BACKENDS[0]]
+        print(f"\n{drives} drives: {first['nodes']} nodes, {first['edges']} edges")
+        print(f"  {'backend':<10} {'build ms':>10} {'graph MiB':>10} {'KG MiB':>8} {'analyze ms':>11} "
+              f"{'chain x100 ms':>14} {'snapshot MiB':>13}")
+        for backend, entry in backends.items():
+            print(f"  {backend:<10} {entry['build']['median_s'] * 1000:>10.1f} {entry['graph_mib']:>10.1f} "
+                  f"{entry['kg_mib']:>8.1f} {entry['analyze_issues']['median_s'] * 1000:>11.1f} "
+                  f"{entry['volume_chain_x100']['median_s'] * 1000:>14.2f} {entry['snapshot_mib']:>13.1f}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: token-budgeted plan-phase Knowledge Graph context on noisy clusters
+
+Builds Pod -> PVC -> PV -> Drive chains where every tenth pod carries an issue,
+then prepares the plan-phase context for one pod with and without a token
+budget. Extraction time should grow linearly with the graph while the budgeted
+context stays at its budget.
+
+Usage:
+    python benchmarks/bench_kg_context.py [--pods 1000 10000 100000] [--budget 8000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from knowledge_graph import KnowledgeGraph
+from knowledge_graph.subgraph import estimate_tokens
+from phases.kg_context_builder import KGContextBuilder
+
+SEVERITIES = ['critical', 'high', 'medium', 'low']
+
+
+def build_graph(pods: int, nodes: int = 100, pods_per_drive: int = 4) -> KnowledgeGraph:
+    """Pod chains spread over nodes; every tenth pod and every fiftieth drive has an issue"""
+    kg = KnowledgeGraph()
+    for n in range(nodes):
+        kg.add_gnode_node(f"worker-{n}", Ready=True)
+    for d in range(pods // pods_per_drive + 1):
+        drive_id = kg.add_gnode_drive(f"drive-{d}", Health='BAD' if d % 50 == 0 else 'GOOD')
+        kg.add_relationship(drive_id, f"gnode:Node:worker-{d % nodes}", 'located_on')
+        if d % 50 == 0:
+            kg.add_issue(drive_id, 'disk_health', f"Drive drive-{d} health is BAD", 'high')
+    for i in range(pods):
+        pod_id = kg.add_gnode_pod(f"pod-{i}", f"ns-{i % 20}", node_name=f"worker-{i % nodes}")
+        pvc_id = kg.add_gnode_pvc(f"pvc-{i}", f"ns-{i % 20}")
+        pv_id = kg.add_gnode_pv(f"pv-{i}")
+        kg.add_relationship(pod_id, pvc_id, 'uses')
+        kg.add_relationship(pvc_id, pv_id, 'bound_to')
+        kg.add_relationship(pv_id, f"gnode:Drive:drive-{i // pods_per_drive}", 'maps_to')
+        if i % 10 == 0:
+            kg.add_issue(pod_id, 'pod_error', f"Input/output error in pod-{i}", SEVERITIES[i // 10 % 4])
+    return kg
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pods', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--budget', type=int, default=8000)
+    args = parser.parse_args()
+
+    print(f"{'pods':>8} {'unbounded ms':>13} {'unbounded tok':>14} {'budgeted ms':>12} {'budgeted tok':>13} {'ns/node':>8}")
+    for pods in args.pods:
+        kg = build_graph(pods)
+        unbounded = KGContextBuilder(kg)
+        budgeted = KGContextBuilder(kg, {'plan_phase': {'kg_context_token_budget': args.budget}})
+
+        start = time.perf_counter()
+        full_context = unbounded.prepare_kg_context('pod-0', 'ns-0', '/data')
+        unbounded_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        context = budgeted.prepare_kg_context('pod-0', 'ns-0', '/data')
+        budgeted_s = time.perf_counter() - start
+
+        print(f"{pods:>8} {unbounded_ms:>13.1f} {estimate_tokens(full_context):>14} "
+              f"{budgeted_s * 1000:>12.1f} {context['subgraph']['estimated_tokens']:>13} "
+              f"{budgeted_s * 1e9 / kg.graph.number_of_nodes():>8.0f}")
+
+
+if __name__ == '__main__':
+    main()
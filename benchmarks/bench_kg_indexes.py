@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Knowledge Graph lookups on a 100,000-node graph
+
+Compares the index-backed find_nodes_by_type, get_summary and name/UUID
+resolution with the full node scans they replaced.
+
+Usage:
+    python benchmarks/bench_kg_indexes.py [--nodes 100000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from knowledge_graph import KnowledgeGraph
+
+
+def build_graph(count: int) -> KnowledgeGraph:
+    """Build a graph of roughly count nodes: pods, PVCs, PVs and drives across 100 nodes"""
+    kg = KnowledgeGraph()
+    for i in range(100):
+        kg.add_gnode_node(f"worker-{i}", Ready=True)
+    for i in range((count - 100) // 4):
+        namespace = f"ns-{i % 50}"
+        pod_id = kg.add_gnode_pod(f"pod-{i}", namespace, Phase='Running')
+        pvc_id = kg.add_gnode_pvc(f"pvc-{i}", namespace)
+        pv_id = kg.add_gnode_pv(f"pv-{i}")
+        drive_id = kg.add_gnode_drive(f"{i:08x}-47db-449d-9789-0d81660c2c4d", Health='GOOD')
+        kg.add_relationship(pod_id, pvc_id, 'uses')
+        kg.add_relationship(pvc_id, pv_id, 'bound_to')
+        kg.add_relationship(pv_id, drive_id, 'maps_to')
+    return kg
+
+
+def scan_by_type(kg: KnowledgeGraph, subtype: str):
+    """find_nodes_by_type() as it was"""
+    return [node_id for node_id, attrs in kg.graph.nodes(data=True)
+            if attrs.get('entity_type') == 'gnode' and attrs.get('gnode_subtype') == subtype]
+
+
+def scan_by_name_or_uuid(kg: KnowledgeGraph, subtype: str, key: str):
+    """The name/uuid fallback scan of the KG tools"""
+    for node_id, attrs in kg.graph.nodes(data=True):
+        if attrs.get('gnode_subtype') == subtype and (attrs.get('name') == key or attrs.get('uuid') == key):
+            return node_id
+    return None
+
+
+def scan_summary(kg: KnowledgeGraph):
+    """get_summary() as it was: node and edge totals plus 13 type scans"""
+    kg.graph.number_of_nodes()
+    kg.graph.number_of_edges()
+    return {subtype: len(scan_by_type(kg, subtype))
+            for subtype in ['Pod', 'PVC', 'PV', 'Drive', 'Node', 'StorageClass', 'LVG', 'AC', 'Volume',
+                            'System', 'ClusterNode', 'HistoricalExperience', 'HistoricalExperience']}
+
+
+def best_of(repeat: int, func, *args) -> float:
+    """Best wall-clock time of several runs, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--nodes', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    kg = build_graph(args.nodes)
+    build_seconds = time.perf_counter() - start
+    last = (args.nodes - 100) // 4 - 1
+    drive_uuid = f"{last:08x}-47db-449d-9789-0d81660c2c4d"
+
+    cases = [
+        ("find_nodes_by_type('Drive')", (scan_by_type, kg, 'Drive'), (kg.find_nodes_by_type, 'Drive')),
+        ("get_summary()", (scan_summary, kg), (kg.get_summary,)),
+        ("resolve Pod by name", (scan_by_name_or_uuid, kg, 'Pod', f"pod-{last}"), (kg.find_node_id, 'Pod', f"pod-{last}")),
+        ("resolve Drive by UUID", (scan_by_name_or_uuid, kg, 'Drive', drive_uuid), (kg.find_node_id, 'Drive', drive_uuid)),
+        ("find_nodes_by_namespace", (lambda: [n for n, a in kg.graph.nodes(data=True) if a.get('namespace') == 'ns-7'],),
+         (kg.find_nodes_by_namespace, 'ns-7')),
+    ]
+
+    print(f"{kg.graph.number_of_nodes()} nodes, {kg.graph.number_of_edges()} edges, built in {build_seconds:.2f}s")
+    for name, scan_call, index_call in cases:
+        scan_seconds = best_of(args.repeat, *scan_call)
+        index_seconds = best_of(args.repeat, *index_call)
+        print(f"  {name:30s} scan {scan_seconds * 1000:9.3f} ms  index {index_seconds * 1000:9.3f} ms  "
+              f"{scan_seconds / max(index_seconds, 1e-9):9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
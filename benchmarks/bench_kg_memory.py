@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Knowledge Graph memory with single attribute storage
+
+Builds a synthetic cluster whose entities carry rich attributes (CSI drive
+metadata, SMART output, describe text) and measures it with tracemalloc. The
+former layout is reproduced by adding what it also allocated: a second
+attribute dict per entity in the entities table and an issue list on every
+node with issues.
+
+Usage:
+    python benchmarks/bench_kg_memory.py [--nodes 20] [--drives-per-node 24] [--pods-per-drive 2]
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from knowledge_graph import KnowledgeGraph
+
+SMART_OUTPUT = "\n".join(f"{i:3d} Attribute_{i:<24} 0x0033 100 100 010 Pre-fail Always - {i * 7}" for i in range(1, 31))
+DESCRIBE_TEXT = "\n".join(f"  Event {i}: Normal Scheduled Successfully assigned pod to node" for i in range(20))
+
+
+def build_cluster(nodes: int, drives_per_node: int, pods_per_drive: int) -> KnowledgeGraph:
+    """Nodes with drives, each drive backing PV/PVC/pod chains; every tenth drive has issues"""
+    kg = KnowledgeGraph()
+    for n in range(nodes):
+        node_name = f"worker-{n}"
+        node_id = kg.add_gnode_node(node_name, Ready=True, DiskPressure=False,
+                                    labels={f"label-{i}": f"value-{i}" for i in range(15)})
+        for d in range(drives_per_node):
+            uuid = f"{n:04x}{d:04x}-47db-449d-9789-0d81660c2c4d"
+            drive_id = kg.add_gnode_drive(uuid, Health='BAD' if d % 10 == 0 else 'GOOD', Status='ONLINE',
+                                          Path=f"/dev/sd{chr(97 + d % 26)}", NodeId=node_name,
+                                          SerialNumber=f"SN{n:04d}{d:04d}", VID='ATA', PID='SAMSUNG',
+                                          Firmware='1.0', Size=1920383410176, Type='SSD',
+                                          smart_output=SMART_OUTPUT)
+            kg.add_relationship(drive_id, node_id, 'located_on')
+            if d % 10 == 0:
+                for i in range(3):
+                    kg.add_issue(drive_id, 'disk_health', f"SMART attribute {i} failing", 'high')
+            for p in range(pods_per_drive):
+                suffix = f"{n}-{d}-{p}"
+                pod_id = kg.add_gnode_pod(f"pod-{suffix}", 'default', node_name=node_name, Phase='Running',
+                                          describe=DESCRIBE_TEXT)
+                pvc_id = kg.add_gnode_pvc(f"pvc-{suffix}", 'default', StorageClass='csi-baremetal-sc-ssd',
+                                          Phase='Bound', Capacity='100Gi')
+                pv_id = kg.add_gnode_pv(f"pv-{suffix}", Phase='Bound', Capacity='100Gi', ReclaimPolicy='Delete')
+                kg.add_relationship(pod_id, pvc_id, 'uses')
+                kg.add_relationship(pvc_id, pv_id, 'bound_to')
+                kg.add_relationship(pv_id, drive_id, 'maps_to')
+    return kg
+
+
+def legacy_duplicates(kg: KnowledgeGraph):
+    """What the former layout allocated besides the graph: entity dict copies and node issue lists"""
+    tables = {table: {node_id: dict(view[node_id]) for node_id in view}
+              for table, view in kg.entities['gnodes'].items()}
+    node_issues = {node_id: list(issues) for node_id, issues in kg._issues_by_node.items()}
+    return tables, node_issues
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--nodes', type=int, default=20)
+    parser.add_argument('--drives-per-node', type=int, default=24)
+    parser.add_argument('--pods-per-drive', type=int, default=2)
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    kg = build_cluster(args.nodes, args.drives_per_node, args.pods_per_drive)
+    current = tracemalloc.get_traced_memory()[0]
+
+    duplicates = legacy_duplicates(kg)
+    legacy = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del duplicates
+
+    print(f"{kg.graph.number_of_nodes()} nodes, {kg.graph.number_of_edges()} edges, {len(kg.issues)} issues")
+    print(f"  former layout         {legacy / 2**20:8.1f} MiB")
+    print(f"  single storage        {current / 2**20:8.1f} MiB  ({1 - current / legacy:.0%} less)")
+
+
+if __name__ == "__main__":
+    main()
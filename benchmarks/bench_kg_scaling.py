@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Knowledge Graph scaling on seeded synthetic clusters
+
+Generates clusters of 10, 1,000 and 100,000 drives with benchmarks/synthetic_cluster.py
+and times, per size:
+    build_resident      cluster-wide graph from the listings (ResidentKnowledgeGraph.bootstrap)
+    build_phase0        Phase 0 KnowledgeBuilder graph for one target pod from collected_data
+                        (SSH hardware collection is skipped, it measures the nodes, not the graph)
+    analyze_issues      cold (after mark_changed) and warm (memoized); cold in the sparse
+                        analytics mode too when NumPy and SciPy are installed
+    generate_fix_plan, print_graph, export_graph
+    every kg_* tool     invoked through LangChain, on the cluster-wide graph
+Issues are added to the cluster-wide graph for unhealthy drives and NotReady nodes
+the way Phase 0 adds them.
+
+Results are written as JSON (median and min seconds per step, graph sizes, git
+commit, Python version, seed) so runs on different commits can be compared:
+
+Usage:
+    python benchmarks/bench_kg_scaling.py [--drives 10 1000 100000] [--seed 0] [--repeat 5]
+                                          [--output results.json] [--compare baseline.json]
+                                          [--format json|yaml] [--emit DIR]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_cluster import SyntheticCluster
+from information_collector.cluster_snapshot import ClusterSnapshot
+from information_collector.knowledge_builder import KnowledgeBuilder
+from information_collector.resident_graph import RecordedEventSource, ResidentKnowledgeGraph
+from knowledge_graph import KnowledgeGraph
+from tools.core import knowledge_graph as kg_tools
+
+
+class _OfflineKnowledgeBuilder(KnowledgeBuilder):
+    """Phase 0 builder without the per-node SSH hardware collection"""
+
+    def __init__(self, collected_data):
+        self.collected_data = collected_data
+        self.cluster_snapshot = ClusterSnapshot(collected_data)
+        self.knowledge_graph = KnowledgeGraph()
+        self.config = {}
+
+    async def _add_hardware_system_entity(self):
+        pass
+
+
+def _timed(func, repeat: int):
+    """Run func repeat times with stdout discarded; returns (last result, [seconds])"""
+    times = []
+    result = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            times.append(time.perf_counter() - start)
+    return result, times
+
+
+def _stats(times):
+    return {'median_s': statistics.median(times), 'min_s': min(times), 'runs': len(times)}
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ''
+
+
+def add_cluster_issues(kg: KnowledgeGraph, cluster: SyntheticCluster):
+    """Add disk_health and node_not_ready issues as Phase 0 does"""
+    for drive in cluster.objects['drive']:
+        health = drive['spec']['Health']
+        if health != 'GOOD':
+            kg.add_issue(f"gnode:Drive:{drive['metadata']['name']}", 'disk_health',
+                         f"Drive health issue: {health}", 'critical' if health == 'BAD' else 'high')
+    for node in cluster.objects['node']:
+        name = node['metadata']['name']
+        if any(c['type'] == 'Ready' and c['status'] != 'True' for c in node['status']['conditions']):
+            kg.add_issue(f"gnode:Node:{name}", 'node_not_ready', f"Node {name} is not ready", 'critical')
+
+
+def tool_calls(cluster: SyntheticCluster):
+    """One representative call per KG tool, addressed at the synthetic target"""
+    target = cluster.target()
+    chain = target['volume_chain']
+    pod_ref = f"{target['namespace']}/{target['pod']}"
+    pvc_namespace, pvc_name = chain['pvcs'][0].split('/', 1)
+    lvg = cluster.objects['lvg'][0]['metadata']['name'] if cluster.objects['lvg'] else 'missing'
+    ac = cluster.objects['ac'][0]['metadata']['name'] if cluster.objects['ac'] else 'missing'
+    return [
+        ('kg_get_entity_info', {'entity_type': 'Pod', 'id': pod_ref}),
+        ('kg_get_related_entities', {'entity_type': 'Drive', 'id': chain['drives'][0], 'max_depth': 2}),
+        ('kg_get_all_issues', {}),
+        ('kg_find_path', {'source_entity_type': 'Pod', 'source_id': pod_ref,
+                          'target_entity_type': 'Node', 'target_id': chain['nodes'][0]}),
+        ('kg_get_summary', {}),
+        ('kg_analyze_issues', {}),
+        ('kg_print_graph', {'include_details': False}),
+        ('kg_batch_query', {'volume_chain': f"Pod:{pod_ref}"}),
+        ('kg_list_entity_types', {}),
+        ('kg_list_entities', {'entity_type': 'Drive'}),
+        ('kg_list_relationship_types', {}),
+        ('kg_get_entity_of_pod', {'namespace': target['namespace'], 'name': target['pod']}),
+        ('kg_get_entity_of_pvc', {'namespace': pvc_namespace, 'name': pvc_name}),
+        ('kg_get_entity_of_pv', {'name': chain['pvs'][0]}),
+        ('kg_get_entity_of_drive', {'uuid': chain['drives'][0]}),
+        ('kg_get_entity_of_node', {'name': chain['nodes'][0]}),
+        ('kg_get_entity_of_lvg', {'name': lvg}),
+        ('kg_get_entity_of_ac', {'name': ac}),
+        ('kg_get_entity_of_volume', {'namespace': target['namespace'], 'name': chain['volumes'][0]}),
+    ]
+
+
+def run_size(drives: int, seed: int, repeat: int, fmt: str, emit: str = None):
+    """Benchmark one cluster size; returns its result entry"""
+    start = time.perf_counter()
+    cluster = SyntheticCluster(drives, seed=seed)
+    generate_s = time.perf_counter() - start
+    if emit:
+        cluster.write(os.path.join(emit, f"drives-{drives}"))
+    collected_data = cluster.collected_data(fmt)
+    target = cluster.target()
+    lists = cluster.recorded_lists()
+    steps = {}
+
+    def build_resident():
+        resident = ResidentKnowledgeGraph(RecordedEventSource(lists))
+        resident.bootstrap()
+        return resident.snapshot(read_only=False)
+
+    kg, times = _timed(build_resident, repeat)
+    steps['build_resident'] = _stats(times)
+
+    def build_phase0():
+        builder = _OfflineKnowledgeBuilder(json.loads(json.dumps(collected_data)))
+        return asyncio.run(builder._build_knowledge_graph_from_tools(
+            target['pod'], target['namespace'], target['volume_path'], target['volume_chain']))
+
+    phase0, times = _timed(build_phase0, repeat)
+    steps['build_phase0'] = _stats(times)
+
+    add_cluster_issues(kg, cluster)
+
+    def analyze_cold():
+        kg.mark_changed()
+        return kg.analyze_issues()
+
+    analysis, times = _timed(analyze_cold, repeat)
+    steps['analyze_issues_cold'] = _stats(times)
+    _, times = _timed(kg.analyze_issues, repeat)
+    steps['analyze_issues_warm'] = _stats(times)
+    if kg.set_analytics_mode('sparse') == 'sparse':
+        _, times = _timed(analyze_cold, repeat)
+        steps['analyze_issues_cold_sparse'] = _stats(times)
+        kg.set_analytics_mode('python')
+    _, times = _timed(lambda: kg.generate_fix_plan(analysis), repeat)
+    steps['generate_fix_plan'] = _stats(times)
+    _, times = _timed(lambda: kg.print_graph(use_rich=False), repeat)
+    steps['print_graph'] = _stats(times)
+    _, times = _timed(kg.export_graph, repeat)
+    steps['export_graph'] = _stats(times)
+
+    kg_tools.initialize_knowledge_graph(kg)
+    for name, args in tool_calls(cluster):
+        tool = getattr(kg_tools, name)
+        _, times = _timed(lambda: tool.invoke(args), repeat)
+        steps[f"tool.{name}"] = _stats(times)
+
+    return {
+        'drives': drives,
+        'objects': cluster.counts,
+        'generate_s': generate_s,
+        'graph': {'nodes': kg.graph.number_of_nodes(), 'edges': kg.graph.number_of_edges(),
+                  'issues': len(kg.issues)},
+        'phase0_graph': {'nodes': phase0.graph.number_of_nodes(), 'edges': phase0.graph.number_of_edges(),
+                         'issues': len(phase0.issues)},
+        'steps': steps,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--drives', type=int, nargs='+', default=[10, 1000, 100000])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--format', choices=['json', 'yaml'], default='json', help='Format of the Phase 0 listings')
+    parser.add_argument('--output', help='Write results as JSON to this file')
+    parser.add_argument('--compare', help='Results JSON of an earlier run to compare against')
+    parser.add_argument('--emit', help='Also write the generated YAML and JSON listings under this directory')
+    args = parser.parse_args()
+
+    # The builders log every missing optional input; keep the table readable
+    logging.disable(logging.WARNING)
+
+    results = {
+        'benchmark': 'kg_scaling',
+        'git_commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'format': args.format,
+        'sizes': [],
+    }
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = {entry['drives']: entry['steps'] for entry in json.load(f)['sizes']}
+
+    for drives in args.drives:
+        entry = run_size(drives, args.seed, args.repeat, args.format, args.emit)
+        results['sizes'].append(entry)
+        graph = entry['graph']
+        print(f"\n{drives} drives: {graph['nodes']} nodes, {graph['edges']} edges, {graph['issues']} issues "
+              f"(phase 0 graph {entry['phase0_graph']['nodes']} nodes)")
+        print(f"  {'step':<38} {'median ms':>11} {'min ms':>10}" + (f" {'vs base':>8}" if baseline else ''))
+        for step, stats in entry['steps'].items():
+            line = f"  {step:<38} {stats['median_s'] * 1000:>11.2f} {stats['min_s'] * 1000:>10.2f}"
+            base = baseline.get(drives, {}).get(step)
+            if base:
+                line += f" {stats['median_s'] / base['median_s']:>7.2f}x"
+            print(line)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
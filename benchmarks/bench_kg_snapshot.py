@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark: saving and loading Knowledge Graph snapshots
+
+Compares the binary snapshot (per compression) with the indented JSON export
+on a graph of about 100,000 nodes, reporting size, save time and load time.
+The JSON export has no loader, so its load time is only the json.loads.
+
+Usage:
+    python benchmarks/bench_kg_snapshot.py [--pods 33000] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from knowledge_graph.snapshot import dumps_snapshot, loads_snapshot
+from bench_kg_analysis import build_graph
+
+
+def best_of(repeat: int, func, *args):
+    """Best wall-clock time of several runs, in seconds, and the last result"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pods', type=int, default=33000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    kg = build_graph(args.pods)
+    print(f"{kg.graph.number_of_nodes()} nodes, {kg.graph.number_of_edges()} edges, {len(kg.issues)} issues")
+
+    save_seconds, exported = best_of(1, kg.export_graph, 'json')
+    load_seconds, _ = best_of(args.repeat, json.loads, exported)
+    print(f"  {'json export':14} {len(exported) / 1e6:8.1f} MB  save {save_seconds * 1000:7.0f} ms  "
+          f"load {load_seconds * 1000:7.0f} ms")
+
+    for compression in ('none', 'zlib', 'lzma'):
+        save_seconds, data = best_of(1, dumps_snapshot, kg, compression)
+        load_seconds, loaded = best_of(args.repeat, loads_snapshot, data)
+        assert loaded.graph.number_of_edges() == kg.graph.number_of_edges()
+        print(f"  {'snapshot ' + compression:14} {len(data) / 1e6:8.1f} MB  save {save_seconds * 1000:7.0f} ms  "
+              f"load {load_seconds * 1000:7.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark: classifying a synthetic multi-megabyte journal dump
+
+Compares the per-line keyword scans the collector used to run (one pass per
+rule set, `any(keyword in line.lower() ...)` and one grep-style regex per
+dmesg pattern) with one pass of the shared LogClassifier evaluated against
+all built-in rule sets.
+
+Usage:
+    python benchmarks/bench_log_classifier.py [--lines 200000] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.core.log_classifier import LogClassifier, _default_rule_sets
+
+TEMPLATES = [
+    "{ts} {host} kubelet[812]: I1016 {clock} reconciler.go:357] MountVolume.SetUp succeeded for volume \"pvc-{n}\"",
+    "{ts} {host} kubelet[812]: E1016 {clock} nestedpendingoperations.go:348] MountVolume.SetUp failed for volume \"pvc-{n}\": timeout",
+    "{ts} {host} systemd[1]: Started Session {n} of user root.",
+    "{ts} {host} sshd[{n}]: Accepted publickey for root from 10.0.{m}.{m} port {n} ssh2",
+    "{ts} {host} containerd[977]: time=\"2025-10-16T10:00:00Z\" level=info msg=\"ImageCreate event name:sha256:{n:x}\"",
+    "{ts} {host} kernel: nvme nvme{m}: I/O error on queue {n}, sector {n}",
+    "{ts} {host} kernel: sd 0:0:{m}:0: [sdb] tag#{m} FAILED Result: hostbyte=DID_OK driverbyte=DRIVER_SENSE",
+    "{ts} {host} kernel: XFS (sdb{m}): metadata I/O error in \"xfs_trans_read_buf_map\" at daddr 0x{n:x}",
+    "{ts} {host} csi-baremetal-node[99]: level=info msg=\"drive health check completed\" drive={n:x}",
+    "{ts} {host} NetworkManager[655]: <info>  [{n}.{m}] dhcp4 (eno1): state changed bound -> bound",
+]
+
+
+def make_journal(count: int, seed: int = 0) -> str:
+    """Build a journal dump in the short output format"""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(count):
+        lines.append(rng.choice(TEMPLATES).format(
+            ts=f"Oct 16 10:{i // 3600 % 60:02d}:{i // 60 % 60:02d}", clock=f"10:00:{i % 60:02d}.{i % 1000:06d}",
+            host=f"worker-{i % 7}", n=rng.randint(0, 1 << 20), m=rng.randint(0, 9)))
+    return '\n'.join(lines)
+
+
+def legacy_classify(text: str, rule_sets) -> int:
+    """Per-rule-set line loops, as before the shared classifier"""
+    matched = 0
+    lines = text.split('\n')
+    for rules in rule_sets.values():
+        for rule in rules:
+            if rule.sequence:
+                regex = re.compile('.*'.join(re.escape(keyword) for keyword in rule.sequence), re.IGNORECASE)
+                matched += sum(1 for line in lines if regex.search(line))
+        keyword_rules = [rule for rule in rules if not rule.sequence]
+        if not keyword_rules:
+            continue
+        for line in lines:
+            line_lower = line.strip().lower()
+            for rule in keyword_rules:
+                if all(any(keyword in line_lower for keyword in group) for group in rule.all_of):
+                    matched += 1
+                    break
+    return matched
+
+
+def classify(classifier: LogClassifier, text: str) -> int:
+    """One scan of the buffer, then every rule set evaluated on the hits"""
+    scan = classifier.scan(text)
+    matched = 0
+    for rule_set, rules in classifier.rule_sets.items():
+        if any(rule.sequence for rule in rules):
+            matched += sum(len(lines) for lines in scan.buckets(rule_set).values())
+        else:
+            matched += len(scan.first_matches(rule_set))
+    return matched
+
+
+def best_of(repeat: int, func, *args):
+    """Best wall-clock time of several runs, in seconds, and the last result"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--lines', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    text = make_journal(args.lines)
+    rule_sets = _default_rule_sets()
+    start = time.perf_counter()
+    classifier = LogClassifier(rule_sets)
+    compile_seconds = time.perf_counter() - start
+
+    legacy_seconds, legacy_matches = best_of(args.repeat, legacy_classify, text, rule_sets)
+    shared_seconds, shared_matches = best_of(args.repeat, classify, classifier, text)
+    if legacy_matches != shared_matches:
+        raise SystemExit(f"Classification mismatch: legacy {legacy_matches}, shared {shared_matches}")
+
+    print(f"{args.lines} journal lines ({len(text) / 1e6:.1f} MB), {len(rule_sets)} rule sets, "
+          f"{legacy_matches} matches, compile {compile_seconds * 1000:.1f} ms")
+    for name, seconds in [('per-rule-set line scans', legacy_seconds), ('shared LogClassifier', shared_seconds)]:
+        print(f"  {name:26s} {seconds * 1000:9.1f} ms  {args.lines / seconds:12,.0f} lines/s  "
+              f"{len(text) / 1e6 / seconds:6.1f} MB/s  {legacy_seconds / seconds:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-call overhead of ExecuteToolNode
+
+Runs graph steps of no-op tools through ExecuteToolNode and reports the time per tool
+call, which is all dispatch overhead: parsing, scheduling, thread and event loop
+handling, hooks and result collection. Per step size it measures:
+    sync             a tool with a sync implementation, node.invoke
+    async_only       a tool with only a coroutine (like MCP tools), node.invoke
+    async_only_ainvoke  the same tool, node.ainvoke
+Every call has distinct arguments, so the memo and single flight never answer it.
+
+Usage:
+    python benchmarks/bench_tool_dispatch.py [--calls 1 8] [--steps 200] [--repeat 5]
+                                             [--output results.json]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import platform
+import sys
+
+from langchain_core.messages import AIMessage
+from langchain_core.tools import StructuredTool
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_kg_scaling import _git_commit, _stats, _timed
+from troubleshooting.execute_tool_node import ExecuteToolNode
+
+
+def _echo(value: int) -> str:
+    """Return the value"""
+    return str(value)
+
+
+async def _aecho(value: int) -> str:
+    """Return the value"""
+    return str(value)
+
+
+def build_node() -> ExecuteToolNode:
+    """A node with a sync and an async-only no-op tool and silent hooks"""
+    tools = [StructuredTool.from_function(func=_echo, name='echo_sync'),
+             StructuredTool.from_function(coroutine=_aecho, name='echo_async_only')]
+    node = ExecuteToolNode(tools, {'echo_sync', 'echo_async_only'}, set())
+    node.register_before_call_hook(lambda name, args, call_type: None)
+    node.register_after_call_hook(lambda name, args, result, call_type: None)
+    return node
+
+
+def run_steps(node: ExecuteToolNode, tool_name: str, calls: int, steps: int, counter, use_async: bool):
+    """Run steps graph steps of calls tool calls each"""
+    def message():
+        return {'messages': [AIMessage(content='', tool_calls=[
+            {'name': tool_name, 'args': {'value': value}, 'id': f"c{value}"}
+            for value in itertools.islice(counter, calls)])]}
+
+    if use_async:
+        async def run():
+            for _ in range(steps):
+                await node.ainvoke(message())
+        asyncio.run(run())
+    else:
+        for _ in range(steps):
+            node.invoke(message())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--calls', type=int, nargs='+', default=[1, 8])
+    parser.add_argument('--steps', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='Write results as JSON to this file')
+    args = parser.parse_args()
+
+    # Tool execution logs every call; keep the table readable
+    logging.disable(logging.WARNING)
+
+    results = {
+        'benchmark': 'tool_dispatch',
+        'git_commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'steps': args.steps,
+        'repeat': args.repeat,
+        'sizes': [],
+    }
+    node = build_node()
+    counter = itertools.count()
+    scenarios = {
+        'sync': ('echo_sync', False),
+        'async_only': ('echo_async_only', False),
+        'async_only_ainvoke': ('echo_async_only', True),
+    }
+
+    print(f"{'calls/step':>10} {'scenario':<20} {'us/call':>10}")
+    for calls in args.calls:
+        entry = {'calls': calls, 'scenarios': {}}
+        for scenario, (tool_name, use_async) in scenarios.items():
+            # Warm up thread pools, event loops and tool schemas
+            run_steps(node, tool_name, calls, 5, counter, use_async)
+            _, times = _timed(lambda: run_steps(node, tool_name, calls, args.steps, counter, use_async), args.repeat)
+            stats = _stats(times)
+            stats['us_per_call'] = stats['median_s'] / (args.steps * calls) * 1e6
+            entry['scenarios'][scenario] = stats
+            print(f"{calls:>10} {scenario:<20} {stats['us_per_call']:>10.1f}")
+        results['sizes'].append(entry)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
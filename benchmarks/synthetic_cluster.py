@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Seeded synthetic CSI Baremetal cluster generator
+
+Builds a realistic cluster around a given number of drives: Nodes with their
+CSI Baremetal node mapping, Drives, LogicalVolumeGroups, AvailableCapacities,
+Volumes, PVs, PVCs and Pods, shaped like `kubectl get -o json` objects. The
+same seed always yields the same cluster, so benchmark results from different
+commits measure the same input.
+
+Outputs:
+    listing(kind, fmt)      `kubectl get <kind> -o json|yaml` List text
+    collected_data(fmt)     Phase 0 collected_data for one target pod, with its volume chain
+    recorded_lists()        list objects for information_collector.resident_graph.RecordedEventSource
+    write(directory)        one YAML and one JSON file per resource kind
+
+Usage:
+    python benchmarks/synthetic_cluster.py --drives 1000 --seed 7 --output /tmp/cluster
+"""
+
+import argparse
+import json
+import os
+import random
+import uuid
+from typing import Any, Dict, List, Tuple
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
+CSI_DRIVER = 'csi-baremetal.dell.com'
+
+# Resource kind -> (API version, List kind) of the generated objects
+KINDS = {
+    'node': ('v1', 'Node'),
+    'csibmnode': ('csi-baremetal.dell.com/v1', 'Node'),
+    'drive': ('csi-baremetal.dell.com/v1', 'Drive'),
+    'lvg': ('csi-baremetal.dell.com/v1', 'LogicalVolumeGroup'),
+    'ac': ('csi-baremetal.dell.com/v1', 'AvailableCapacity'),
+    'volume': ('csi-baremetal.dell.com/v1', 'Volume'),
+    'pv': ('v1', 'PersistentVolume'),
+    'pvc': ('v1', 'PersistentVolumeClaim'),
+    'pod': ('v1', 'Pod'),
+    'storageclass': ('storage.k8s.io/v1', 'StorageClass'),
+}
+
+# Drive type -> storage class of volumes placed directly on the drive
+STORAGE_CLASSES = {'HDD': 'csi-baremetal-sc-hdd', 'SSD': 'csi-baremetal-sc-ssd', 'NVME': 'csi-baremetal-sc-nvme'}
+LVG_STORAGE_CLASS = 'csi-baremetal-sc-hddlvg'
+
+
+class SyntheticCluster:
+    """
+    Deterministic synthetic cluster sized by its number of drives
+
+    Each node carries drives_per_node drives. About used_fraction of the drives
+    hold volumes; lvg_fraction of those are paired into LVGs with one LVG volume
+    each, the rest back one volume each. Free drives publish an AvailableCapacity.
+    Every volume has a PV and a PVC; pods mount one or two PVCs of their namespace.
+    bad_drive_rate and not_ready_node_rate inject unhealthy drives and nodes.
+    """
+
+    def __init__(self, drives: int, seed: int = 0, drives_per_node: int = 12, used_fraction: float = 0.7,
+                 lvg_fraction: float = 0.2, namespaces: int = 20, bad_drive_rate: float = 0.01,
+                 not_ready_node_rate: float = 0.01):
+        """
+        Generate the cluster
+
+        Args:
+            drives: Number of drives
+            seed: Random seed; equal seeds and sizes generate identical clusters
+            drives_per_node: Drives attached to each node
+            used_fraction: Fraction of drives holding volumes
+            lvg_fraction: Fraction of used drives grouped into LVGs
+            namespaces: Number of application namespaces
+            bad_drive_rate: Fraction of drives with BAD or SUSPECT health
+            not_ready_node_rate: Fraction of NotReady nodes
+        """
+        self.drive_count = drives
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self._drives_per_node = drives_per_node
+        self._used_fraction = used_fraction
+        self._lvg_fraction = lvg_fraction
+        self._namespaces = [f"app-{i}" for i in range(namespaces)]
+        self._bad_drive_rate = bad_drive_rate
+        self._not_ready_node_rate = not_ready_node_rate
+        self._resource_version = 1000
+        self.objects: Dict[str, List[Dict[str, Any]]] = {kind: [] for kind in KINDS}
+        self._generate()
+
+    def _uuid(self) -> str:
+        return str(uuid.UUID(int=self._rng.getrandbits(128), version=4))
+
+    def _metadata(self, name: str, namespace: str = None, **extra) -> Dict[str, Any]:
+        self._resource_version += 1
+        metadata = {'name': name, 'resourceVersion': str(self._resource_version),
+                    'uid': self._uuid(), 'creationTimestamp': '2024-05-01T08:00:00Z'}
+        if namespace:
+            metadata['namespace'] = namespace
+        metadata.update(extra)
+        return metadata
+
+    def _generate(self):
+        rng = self._rng
+        node_count = max(1, -(-self.drive_count // self._drives_per_node))
+
+        for sc_name, drive_type in [(sc, t) for t, sc in STORAGE_CLASSES.items()] + [(LVG_STORAGE_CLASS, 'HDD')]:
+            self.objects['storageclass'].append({
+                'metadata': self._metadata(sc_name),
+                'provisioner': CSI_DRIVER,
+                'parameters': {'storageType': drive_type, 'fsType': 'xfs'},
+                'reclaimPolicy': 'Delete',
+                'volumeBindingMode': 'WaitForFirstConsumer',
+                'allowVolumeExpansion': False,
+            })
+
+        nodes: List[Tuple[str, str]] = []
+        for n in range(node_count):
+            host = f"worker-{n:05d}"
+            node_uuid = self._uuid()
+            ip = f"10.{n // 65536 % 256}.{n // 256 % 256}.{n % 256}"
+            ready = rng.random() >= self._not_ready_node_rate
+            nodes.append((host, node_uuid))
+            self.objects['node'].append({
+                'metadata': self._metadata(host, labels={'kubernetes.io/hostname': host,
+                                                         'nodes.csi-baremetal.dell.com/uuid': node_uuid}),
+                'spec': {'podCIDR': f"10.244.{n % 256}.0/24"},
+                'status': {
+                    'addresses': [{'type': 'InternalIP', 'address': ip}, {'type': 'Hostname', 'address': host}],
+                    'capacity': {'cpu': '64', 'memory': '263846280Ki', 'ephemeral-storage': '936Gi', 'pods': '110'},
+                    'allocatable': {'cpu': '63500m', 'memory': '261646280Ki', 'ephemeral-storage': '860Gi',
+                                    'pods': '110'},
+                    'conditions': [
+                        {'type': 'MemoryPressure', 'status': 'False', 'reason': 'KubeletHasSufficientMemory'},
+                        {'type': 'DiskPressure', 'status': 'False', 'reason': 'KubeletHasNoDiskPressure'},
+                        {'type': 'PIDPressure', 'status': 'False', 'reason': 'KubeletHasSufficientPID'},
+                        {'type': 'Ready', 'status': 'True' if ready else 'False',
+                         'reason': 'KubeletReady' if ready else 'NodeStatusUnknown'},
+                    ],
+                    'nodeInfo': {'kubeletVersion': 'v1.29.4', 'osImage': 'Ubuntu 22.04.4 LTS',
+                                 'kernelVersion': '5.15.0-105-generic', 'containerRuntimeVersion': 'containerd://1.7.13'},
+                },
+            })
+            self.objects['csibmnode'].append({
+                'metadata': self._metadata(f"csibmnode-{node_uuid}"),
+                'spec': {'UUID': node_uuid, 'Addresses': {'Hostname': host, 'InternalIP': ip}},
+            })
+
+        drives = []
+        for d in range(self.drive_count):
+            host, node_uuid = nodes[d // self._drives_per_node]
+            drive_uuid = self._uuid()
+            drive_type = rng.choices(('HDD', 'SSD', 'NVME'), weights=(6, 3, 1))[0]
+            roll = rng.random()
+            health = 'BAD' if roll < self._bad_drive_rate / 2 else 'SUSPECT' if roll < self._bad_drive_rate else 'GOOD'
+            slot = d % self._drives_per_node
+            path = f"/dev/nvme{slot}n1" if drive_type == 'NVME' else f"/dev/sd{chr(ord('b') + slot % 24)}"
+            size = rng.choice((4, 8, 12, 16)) * 1000 ** 4 if drive_type == 'HDD' else rng.choice((960, 1920, 3840)) * 1000 ** 3
+            spec = {
+                'UUID': drive_uuid, 'NodeId': node_uuid, 'Health': health,
+                'Status': 'ONLINE' if health != 'BAD' or rng.random() < 0.5 else 'OFFLINE',
+                'Usage': 'IN_USE', 'Type': drive_type, 'Path': path, 'Size': size,
+                'SerialNumber': f"SN{rng.getrandbits(40):010X}", 'VID': rng.choice(('SEAGATE', 'TOSHIBA', 'SAMSUNG')),
+                'PID': f"MODEL-{drive_type}-{size // 1000 ** 3}", 'Firmware': 'FW01', 'Slot': str(slot),
+                'IsSystem': False, 'IsClean': True,
+            }
+            self.objects['drive'].append({'metadata': self._metadata(drive_uuid), 'spec': spec})
+            drives.append((spec, host))
+
+        used = [i for i in range(len(drives)) if rng.random() < self._used_fraction]
+        used_set = set(used)
+        for i, (spec, host) in enumerate(drives):
+            if i not in used_set:
+                self.objects['ac'].append({
+                    'metadata': self._metadata(f"ac-{spec['UUID'][:8]}-{host}"),
+                    'spec': {'Size': spec['Size'], 'storageClass': spec['Type'], 'Location': spec['UUID'],
+                             'NodeId': spec['NodeId']},
+                })
+
+        # Pair LVG drives on the same node; each LVG and each remaining drive backs one volume
+        placements = []
+        pending_lvg = {}
+        for i in used:
+            spec, host = drives[i]
+            if spec['Type'] == 'HDD' and rng.random() < self._lvg_fraction:
+                partner = pending_lvg.pop(host, None)
+                if partner is None:
+                    pending_lvg[host] = i
+                    continue
+                lvg_name = f"lvg-{self._uuid()[:13]}"
+                members = [drives[partner][0], spec]
+                self.objects['lvg'].append({
+                    'metadata': self._metadata(lvg_name),
+                    'spec': {'Name': lvg_name, 'Node': spec['NodeId'], 'Locations': [m['UUID'] for m in members],
+                             'Size': sum(m['Size'] for m in members), 'Health': 'GOOD' if all(
+                                 m['Health'] == 'GOOD' for m in members) else 'BAD', 'VolumeRefs': []},
+                    'status': {'Status': 'CREATED'},
+                })
+                placements.append((lvg_name, 'LVG', spec['NodeId'], host, LVG_STORAGE_CLASS, members[0]['Size'],
+                                   all(m['Health'] == 'GOOD' for m in members)))
+            else:
+                placements.append((spec['UUID'], 'DRIVE', spec['NodeId'], host, STORAGE_CLASSES[spec['Type']],
+                                   spec['Size'], spec['Health'] == 'GOOD'))
+        for i in pending_lvg.values():
+            spec, host = drives[i]
+            placements.append((spec['UUID'], 'DRIVE', spec['NodeId'], host, STORAGE_CLASSES[spec['Type']],
+                               spec['Size'], spec['Health'] == 'GOOD'))
+
+        # Volumes, PVs and PVCs; pods on the volume's node mount one or two PVCs
+        claims_by_host: Dict[Tuple[str, str], List[str]] = {}
+        for v, (location, location_type, node_uuid, host, storage_class, size, healthy) in enumerate(placements):
+            namespace = self._namespaces[v % len(self._namespaces)]
+            pvc_name = f"data-{namespace}-{v:06d}"
+            pv_name = f"pvc-{self._uuid()}"
+            request = f"{max(1, size // 1000 ** 3 // 4)}Gi"
+            self.objects['volume'].append({
+                'metadata': self._metadata(pv_name, namespace),
+                'spec': {'Id': pv_name, 'Location': location, 'LocationType': location_type, 'NodeId': node_uuid,
+                         'Size': size // 4, 'StorageClass': storage_class.rsplit('-', 1)[-1].upper(),
+                         'Health': 'GOOD' if healthy else 'BAD', 'CSIStatus': 'PUBLISHED',
+                         'OperationalStatus': 'OPERATIVE', 'Usage': 'IN_USE', 'Mode': 'FS', 'Type': 'xfs',
+                         'Owners': [f"{pvc_name}-pod"]},
+            })
+            if location_type == 'LVG':
+                lvg = next(obj for obj in reversed(self.objects['lvg']) if obj['metadata']['name'] == location)
+                lvg['spec']['VolumeRefs'].append(pv_name)
+            self.objects['pv'].append({
+                'metadata': self._metadata(pv_name, annotations={'pv.kubernetes.io/provisioned-by': CSI_DRIVER}),
+                'spec': {
+                    'capacity': {'storage': request}, 'accessModes': ['ReadWriteOnce'],
+                    'persistentVolumeReclaimPolicy': 'Delete', 'storageClassName': storage_class,
+                    'volumeMode': 'Filesystem',
+                    'csi': {'driver': CSI_DRIVER, 'volumeHandle': pv_name, 'fsType': 'xfs'},
+                    'claimRef': {'kind': 'PersistentVolumeClaim', 'namespace': namespace, 'name': pvc_name},
+                    'nodeAffinity': {'required': {'nodeSelectorTerms': [{'matchExpressions': [
+                        {'key': 'kubernetes.io/hostname', 'operator': 'In', 'values': [host]}]}]}},
+                },
+                'status': {'phase': 'Bound'},
+            })
+            self.objects['pvc'].append({
+                'metadata': self._metadata(pvc_name, namespace),
+                'spec': {'accessModes': ['ReadWriteOnce'], 'resources': {'requests': {'storage': request}},
+                         'storageClassName': storage_class, 'volumeMode': 'Filesystem', 'volumeName': pv_name},
+                'status': {'phase': 'Bound', 'accessModes': ['ReadWriteOnce'], 'capacity': {'storage': request}},
+            })
+            claims_by_host.setdefault((host, namespace), []).append(pvc_name)
+
+        for (host, namespace), claims in claims_by_host.items():
+            while claims:
+                mounted = [claims.pop() for _ in range(min(len(claims), rng.choice((1, 1, 1, 2))))]
+                pod_name = f"{mounted[0]}-pod"
+                restarts = rng.choice((0, 0, 0, 1, 5)) if rng.random() < 0.1 else 0
+                self.objects['pod'].append({
+                    'metadata': self._metadata(pod_name, namespace, labels={'app': namespace}),
+                    'spec': {
+                        'nodeName': host,
+                        'securityContext': {'fsGroup': 2000, 'runAsUser': 1000},
+                        'containers': [{'name': 'app', 'image': 'registry.local/app:1.4.2', 'volumeMounts': [
+                            {'name': f"vol-{i}", 'mountPath': f"/data/{i}"} for i in range(len(mounted))]}],
+                        'volumes': [{'name': f"vol-{i}", 'persistentVolumeClaim': {'claimName': claim}}
+                                    for i, claim in enumerate(mounted)],
+                    },
+                    'status': {'phase': 'Running', 'podIP': f"10.244.{rng.randrange(256)}.{rng.randrange(256)}",
+                               'containerStatuses': [{'name': 'app', 'ready': restarts == 0,
+                                                      'restartCount': restarts}]},
+                })
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Number of generated objects per resource kind"""
+        return {kind: len(items) for kind, items in self.objects.items()}
+
+    def list_object(self, kind: str) -> Dict[str, Any]:
+        """`kubectl get <kind> -o json` List object with apiVersion and kind on every item"""
+        api_version, item_kind = KINDS[kind]
+        items = [{'apiVersion': api_version, 'kind': item_kind, **obj} for obj in self.objects[kind]]
+        return {'apiVersion': 'v1', 'kind': 'List', 'metadata': {'resourceVersion': str(self._resource_version)},
+                'items': items}
+
+    def listing(self, kind: str, fmt: str = 'json') -> str:
+        """
+        Serialized listing of one resource kind
+
+        Args:
+            kind: Resource kind (see KINDS)
+            fmt: "json" or "yaml"
+
+        Returns:
+            str: Listing as kubectl prints it
+        """
+        listing = self.list_object(kind)
+        if fmt == 'yaml':
+            return yaml.dump(listing, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+        return json.dumps(listing, indent=4)
+
+    def target(self) -> Dict[str, Any]:
+        """
+        A pod on an unhealthy drive when there is one, else the first pod, with its volume chain
+
+        Returns:
+            Dict[str, Any]: pod, namespace, volume_path and volume_chain (pvcs, pvs, volumes, drives, nodes)
+        """
+        bad_drives = {obj['metadata']['name'] for obj in self.objects['drive'] if obj['spec']['Health'] != 'GOOD'}
+        volumes = {obj['metadata']['name']: obj for obj in self.objects['volume']}
+        pvcs = {(obj['metadata']['namespace'], obj['metadata']['name']): obj for obj in self.objects['pvc']}
+        lvg_drives = {obj['metadata']['name']: obj['spec']['Locations'] for obj in self.objects['lvg']}
+
+        def chain(pod):
+            namespace = pod['metadata']['namespace']
+            claim = pod['spec']['volumes'][0]['persistentVolumeClaim']['claimName']
+            pv_name = pvcs[(namespace, claim)]['spec']['volumeName']
+            location = volumes[pv_name]['spec']['Location']
+            return {'pvcs': [f"{namespace}/{claim}"], 'pvs': [pv_name], 'volumes': [pv_name],
+                    'drives': lvg_drives.get(location, [location]), 'nodes': [pod['spec']['nodeName']]}
+
+        pods = self.objects['pod']
+        pod = next((p for p in pods if set(chain(p)['drives']) & bad_drives), pods[0] if pods else None)
+        if pod is None:
+            return {}
+        return {'pod': pod['metadata']['name'], 'namespace': pod['metadata']['namespace'],
+                'volume_path': '/data/0', 'volume_chain': chain(pod)}
+
+    def collected_data(self, fmt: str = 'json') -> Dict[str, Any]:
+        """
+        Phase 0 collected_data as the information collector stores it, for target()
+
+        Args:
+            fmt: Output format of the listings, "json" or "yaml"
+
+        Returns:
+            Dict[str, Any]: collected_data with kubernetes and csi_baremetal listings
+        """
+        target = self.target()
+        pod = next((p for p in self.objects['pod'] if p['metadata']['name'] == target.get('pod')), None)
+        target_pod = ''
+        if pod is not None:
+            target_pod = self.listing_of([{'apiVersion': 'v1', 'kind': 'Pod', **pod}], fmt)
+        return {
+            'kubernetes': {
+                'target_pod': target_pod,
+                'pods': self.listing('pod', fmt),
+                'pvcs': self.listing('pvc', fmt),
+                'pvs': self.listing('pv', fmt),
+                # The collector always lists nodes as YAML; node names are extracted line by line
+                'nodes': self.listing('node', 'yaml'),
+                'storage_classes': self.listing('storageclass', fmt),
+            },
+            'csi_baremetal': {
+                'drives': self.listing('drive', fmt),
+                'nodes': self.listing('csibmnode', fmt),
+                'available_capacity': self.listing('ac', fmt),
+                'lvgs': self.listing('lvg', fmt),
+                'volumes': self.listing('volume', fmt),
+            },
+            'logs': {},
+            'system': {},
+            'ssh_data': {},
+            'tool_outputs': {},
+            'log_analysis': {},
+            'errors': [],
+        }
+
+    @staticmethod
+    def listing_of(items: List[Dict[str, Any]], fmt: str) -> str:
+        """Serialize a single object the way `kubectl get <kind> <name>` prints it"""
+        obj = items[0]
+        if fmt == 'yaml':
+            return yaml.dump(obj, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+        return json.dumps(obj, indent=4)
+
+    def recorded_lists(self) -> Dict[str, Dict[str, Any]]:
+        """List objects per resident graph resource kind, for RecordedEventSource"""
+        return {kind: self.list_object(kind) for kind in KINDS if kind != 'storageclass'}
+
+    def write(self, directory: str) -> List[str]:
+        """
+        Write one YAML and one JSON listing per resource kind
+
+        Args:
+            directory: Output directory, created if missing
+
+        Returns:
+            List[str]: Written file paths
+        """
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for kind in KINDS:
+            for fmt in ('yaml', 'json'):
+                path = os.path.join(directory, f"{kind}.{fmt}")
+                with open(path, 'w') as f:
+                    f.write(self.listing(kind, fmt))
+                paths.append(path)
+        return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--drives', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', required=True, help='Directory for the YAML and JSON listings')
+    args = parser.parse_args()
+
+    cluster = SyntheticCluster(args.drives, seed=args.seed)
+    paths = cluster.write(args.output)
+    print(json.dumps({'counts': cluster.counts, 'files': len(paths), 'target': cluster.target()}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -7,9 +7,15 @@ Contains base class with initialization, configuration, and core utilities.
 import os
 import logging
 import time
+import threading
 from typing import Dict, List, Any, Optional
 from kubernetes import client, config
 from knowledge_graph import KnowledgeGraph
+from tools.core.ssh_pool import initialize_ssh_pool
+from tools.kubernetes.backend import initialize_kubernetes_backend, KubernetesAPIBackend
+from tools.kubernetes.result_cache import initialize_result_cache
+from .cluster_snapshot import ClusterSnapshot
+from .structured_output import get_output_format
 
 
 class InformationCollectorBase:
@@ -31,11 +37,26 @@ class InformationCollectorBase:
             'errors': []
         }
         
+        # Output format requested for machine-parsed kubectl output
+        self.output_format = get_output_format(config_data)
+        
+        # Parse-once index over the bulk CSI Baremetal listings
+        self.cluster_snapshot = ClusterSnapshot(self.collected_data)
+        
+        # Raw kernel/journal logs fetched once per node per collection run
+        self.node_log_max_lines = int(config_data.get('troubleshoot', {}).get('node_log_max_lines', 5000))
+        self._node_log_cache = {}
+        self._node_log_locks = {}
+        self._node_log_lock = threading.Lock()
+        
         # Initialize Kubernetes client
         self._init_kubernetes_client()
         
-        # SSH clients cache
-        self.ssh_clients = {}
+        # Read-only kubectl results cache shared with the later phases
+        self.result_cache = initialize_result_cache(config_data)
+        
+        # Shared SSH connection pool used by all SSH-based diagnostic tools
+        self.ssh_clients = initialize_ssh_pool(config_data)
         
         # Interactive mode setting
         self.interactive_mode = config_data.get('troubleshoot', {}).get('interactive_mode', False)
@@ -43,8 +64,14 @@ class InformationCollectorBase:
         logging.info("Information Collector Base initialized")
     
     def _init_kubernetes_client(self):
-        """Initialize Kubernetes client"""
+        """Initialize Kubernetes client, sharing the kubectl tools' API connection pool"""
         try:
+            backend = initialize_kubernetes_backend(self.config)
+            if isinstance(backend, KubernetesAPIBackend):
+                self.k8s_client = backend.core_v1
+                logging.info("Using shared Kubernetes API client from kubectl tool backend")
+                return
+            
             if 'KUBERNETES_SERVICE_HOST' in os.environ:
                 config.load_incluster_config()
                 logging.info("Using in-cluster Kubernetes configuration")
@@ -0,0 +1,168 @@
+"""
+Cluster Snapshot
+
+Parses the bulk CSI Baremetal listings collected in Phase 0 exactly once and
+indexes them, so per-entity parsers and Knowledge Graph builders can look up
+drives, volumes, LVGs, available capacities and CSI Baremetal nodes in O(1)
+instead of re-parsing the cluster-wide YAML for every entity.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from .structured_output import load_structured
+
+# Keys under collected_data['csi_baremetal'] holding bulk kubectl output
+SNAPSHOT_RESOURCES = ('drives', 'nodes', 'available_capacity', 'lvgs', 'volumes')
+
+# Spec fields (CSI Baremetal uses both capitalised and camelCase spellings)
+_NODE_FIELDS = ('NodeId', 'nodeId', 'Node', 'node')
+_STORAGE_CLASS_FIELDS = ('StorageClass', 'storageClass')
+_LOCATION_FIELDS = ('Location', 'location', 'Locations', 'locations')
+
+
+def _spec_values(spec: Dict[str, Any], fields) -> List[str]:
+    """Collect the distinct non-empty string values of the given spec fields"""
+    values = []
+    for field in fields:
+        value = spec.get(field)
+        if isinstance(value, list):
+            candidates = value
+        else:
+            candidates = [value]
+        for candidate in candidates:
+            if isinstance(candidate, str) and candidate and candidate not in values:
+                values.append(candidate)
+    return values
+
+
+class ResourceIndex:
+    """Parsed items of one bulk listing with hash indexes over common fields"""
+
+    def __init__(self, items: List[Dict[str, Any]]):
+        self.items = items
+        self.by_name: Dict[str, Dict[str, Any]] = {}
+        self.by_node: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.by_storage_class: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.by_location: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+
+        for item in items:
+            name = (item.get('metadata') or {}).get('name')
+            if name and name not in self.by_name:
+                self.by_name[name] = item
+
+            spec = item.get('spec') or {}
+            if not isinstance(spec, dict):
+                continue
+            for node in _spec_values(spec, _NODE_FIELDS):
+                self.by_node[node].append(item)
+            for storage_class in _spec_values(spec, _STORAGE_CLASS_FIELDS):
+                self.by_storage_class[storage_class].append(item)
+            for location in _spec_values(spec, _LOCATION_FIELDS):
+                self.by_location[location].append(item)
+
+
+class ClusterSnapshot:
+    """
+    Parse-once, indexed view over the bulk CSI Baremetal tool outputs
+
+    Each listing is parsed on first use. The snapshot tracks the raw output it
+    was built from, so a listing replaced in collected_data (for example when
+    the CSI Baremetal tools are re-run) is re-parsed on the next lookup.
+    """
+
+    def __init__(self, collected_data: Dict[str, Any]):
+        """
+        Initialize the cluster snapshot
+
+        Args:
+            collected_data: Collector's collected_data dictionary
+        """
+        self.collected_data = collected_data
+        self._indexes: Dict[str, ResourceIndex] = {}
+        self._sources: Dict[str, str] = {}
+        self._errors: Dict[str, Exception] = {}
+        self._lock = threading.Lock()
+        self.stats = {'parses': 0, 'lookups': 0}
+
+    @staticmethod
+    def _items_from(data: Any) -> List[Dict[str, Any]]:
+        """Normalize a parsed listing (List, single object or plain list) to items"""
+        if isinstance(data, dict) and isinstance(data.get('items'), list):
+            items = data['items']
+        elif isinstance(data, dict) and data.get('metadata'):
+            items = [data]
+        elif isinstance(data, list):
+            items = data
+        else:
+            items = []
+        return [item for item in items if isinstance(item, dict)]
+
+    def _index(self, resource: str) -> Optional[ResourceIndex]:
+        """
+        Get the index for a listing, parsing it if it is new or has changed
+
+        Args:
+            resource: Key under collected_data['csi_baremetal']
+
+        Returns:
+            Optional[ResourceIndex]: Index, or None if nothing was collected
+
+        Raises:
+            Exception: If the listing cannot be parsed (raised on every
+                lookup so callers can use their text fallback)
+        """
+        raw = self.collected_data.get('csi_baremetal', {}).get(resource, '')
+        if not raw:
+            return None
+
+        with self._lock:
+            self.stats['lookups'] += 1
+            if self._sources.get(resource) is not raw:
+                self._sources[resource] = raw
+                self._indexes.pop(resource, None)
+                self._errors.pop(resource, None)
+                self.stats['parses'] += 1
+                try:
+                    self._indexes[resource] = ResourceIndex(self._items_from(load_structured(raw)))
+                except Exception as e:
+                    logging.warning(f"Error parsing CSI Baremetal {resource} output for cluster snapshot: {e}")
+                    self._errors[resource] = e
+
+            if resource in self._errors:
+                raise self._errors[resource]
+            return self._indexes[resource]
+
+    def items(self, resource: str) -> List[Dict[str, Any]]:
+        """Get all parsed items of a listing"""
+        index = self._index(resource)
+        return index.items if index else []
+
+    def get(self, resource: str, name: str) -> Optional[Dict[str, Any]]:
+        """Look up an item by metadata.name (drive/node UUID, volume, LVG or AC name)"""
+        index = self._index(resource)
+        return index.by_name.get(name) if index else None
+
+    def by_node(self, resource: str, node: str) -> List[Dict[str, Any]]:
+        """Look up items by node UUID or hostname"""
+        index = self._index(resource)
+        return list(index.by_node.get(node, [])) if index else []
+
+    def by_storage_class(self, resource: str, storage_class: str) -> List[Dict[str, Any]]:
+        """Look up items by storage class"""
+        index = self._index(resource)
+        return list(index.by_storage_class.get(storage_class, [])) if index else []
+
+    def by_location(self, resource: str, location: str) -> List[Dict[str, Any]]:
+        """Look up items by location (drive UUID or LVG name)"""
+        index = self._index(resource)
+        return list(index.by_location.get(location, [])) if index else []
+
+    def invalidate(self):
+        """Drop all parsed listings"""
+        with self._lock:
+            self._indexes.clear()
+            self._sources.clear()
+            self._errors.clear()
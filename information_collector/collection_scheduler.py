@@ -0,0 +1,215 @@
+"""
+Collection Scheduler
+
+Runs Phase 0 collection steps as a dependency graph. The diagnostic tools are
+synchronous, so each task runs in a worker thread; tasks whose dependencies
+are done run concurrently, bounded by per-resource limits (the API server and
+each node reached over SSH) and by a per-task timeout.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+# Resource key for calls served by the Kubernetes API server
+API_SERVER = 'api_server'
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_API_SERVER_CONCURRENCY = 4
+DEFAULT_PER_NODE_CONCURRENCY = 2
+DEFAULT_TASK_TIMEOUT_SECONDS = 300
+
+
+def node_resource(node_name: str) -> str:
+    """Resource key for commands run on a node over SSH"""
+    return f"node:{node_name}"
+
+
+class CollectionTask:
+    """A single collection step and its scheduling constraints"""
+
+    def __init__(self, name: str, func: Callable[..., Any], args: Sequence[Any] = (),
+                 depends_on: Sequence[str] = (),
+                 resources: Union[Sequence[str], Callable[[], Sequence[str]]] = (),
+                 timeout: Optional[float] = None):
+        """
+        Initialize a collection task
+
+        Args:
+            name: Unique task name
+            func: Synchronous callable doing the work
+            args: Positional arguments for func
+            depends_on: Names of tasks that must finish first
+            resources: Resource keys the task holds while running, or a callable
+                returning them once dependencies are done (e.g. a drive's node)
+            timeout: Task timeout in seconds (None uses the scheduler default)
+        """
+        self.name = name
+        self.func = func
+        self.args = tuple(args)
+        self.depends_on = tuple(depends_on)
+        self.resources = resources
+        self.timeout = timeout
+
+
+class CollectionScheduler:
+    """
+    Dependency-graph scheduler for Phase 0 collection tasks
+    """
+
+    def __init__(self, config_data: Dict[str, Any] = None, interactive: bool = False):
+        """
+        Initialize the collection scheduler
+
+        Args:
+            config_data: Configuration data from config.yaml
+            interactive: Run one task at a time so approval prompts do not interleave
+        """
+        scheduler_config = ((config_data or {}).get('troubleshoot', {}) or {}).get('collection_scheduler', {}) or {}
+
+        self.max_workers = 1 if interactive else max(1, int(scheduler_config.get('max_workers', DEFAULT_MAX_WORKERS)))
+        self.api_server_concurrency = max(1, int(scheduler_config.get('api_server_concurrency',
+                                                                      DEFAULT_API_SERVER_CONCURRENCY)))
+        self.per_node_concurrency = max(1, int(scheduler_config.get('per_node_concurrency',
+                                                                    DEFAULT_PER_NODE_CONCURRENCY)))
+        self.default_timeout = float(scheduler_config.get('task_timeout_seconds', DEFAULT_TASK_TIMEOUT_SECONDS))
+        self.task_timeouts = scheduler_config.get('task_timeouts', {}) or {}
+
+        self.tasks: Dict[str, CollectionTask] = {}
+        self.timings: Dict[str, Dict[str, Any]] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def add_task(self, name: str, func: Callable[..., Any], args: Sequence[Any] = (),
+                 depends_on: Sequence[str] = (),
+                 resources: Union[Sequence[str], Callable[[], Sequence[str]]] = (),
+                 timeout: Optional[float] = None) -> CollectionTask:
+        """
+        Add a task to the graph
+
+        Args:
+            name: Unique task name; its prefix before ':' selects a configured timeout
+            func: Synchronous callable doing the work
+            args: Positional arguments for func
+            depends_on: Names of tasks that must finish first
+            resources: Resource keys held while running (API_SERVER, node_resource(...))
+            timeout: Task timeout in seconds
+
+        Returns:
+            CollectionTask: The added task
+        """
+        if name in self.tasks:
+            raise ValueError(f"Duplicate collection task: {name}")
+        if timeout is None:
+            timeout = self.task_timeouts.get(name.split(':', 1)[0], self.default_timeout)
+        task = CollectionTask(name, func, args, depends_on, resources, timeout)
+        self.tasks[name] = task
+        return task
+
+    def _check_graph(self):
+        """Reject unknown dependencies and cycles"""
+        for task in self.tasks.values():
+            for dependency in task.depends_on:
+                if dependency not in self.tasks:
+                    raise ValueError(f"Task {task.name} depends on unknown task {dependency}")
+
+        visiting, done = set(), set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle through collection task {name}")
+            visiting.add(name)
+            for dependency in self.tasks[name].depends_on:
+                visit(dependency)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.tasks:
+            visit(name)
+
+    def _limit_for(self, resource: str) -> int:
+        """Concurrency limit for a resource key"""
+        if resource == API_SERVER:
+            return self.api_server_concurrency
+        return self.per_node_concurrency
+
+    def _semaphore(self, resource: str) -> asyncio.Semaphore:
+        if resource not in self._semaphores:
+            self._semaphores[resource] = asyncio.Semaphore(self._limit_for(resource))
+        return self._semaphores[resource]
+
+    async def _run_task(self, task: CollectionTask, done: Dict[str, asyncio.Event],
+                        executor: concurrent.futures.Executor, start: float):
+        """Wait for dependencies, acquire resources and run the task in a worker thread"""
+        for dependency in task.depends_on:
+            await done[dependency].wait()
+
+        timing = {'status': 'pending', 'depends_on': list(task.depends_on)}
+        self.timings[task.name] = timing
+        try:
+            resources = task.resources() if callable(task.resources) else task.resources
+            # Acquire in sorted order so tasks sharing resources cannot deadlock
+            resources = sorted(set(resources or ()))
+            timing['resources'] = resources
+
+            ready_at = time.monotonic()
+            semaphores = [self._semaphore(resource) for resource in resources]
+            for semaphore in semaphores:
+                await semaphore.acquire()
+            try:
+                started_at = time.monotonic()
+                timing['queued_seconds'] = round(started_at - ready_at, 4)
+                timing['start_offset_seconds'] = round(started_at - start, 4)
+                loop = asyncio.get_running_loop()
+                await asyncio.wait_for(loop.run_in_executor(executor, task.func, *task.args), task.timeout)
+                timing['status'] = 'completed'
+            finally:
+                timing['duration_seconds'] = round(time.monotonic() - started_at, 4)
+                for semaphore in reversed(semaphores):
+                    semaphore.release()
+        except asyncio.TimeoutError:
+            timing['status'] = 'timeout'
+            timing['error'] = f"Collection task {task.name} timed out after {task.timeout}s"
+            logging.warning(timing['error'])
+        except Exception as e:
+            timing['status'] = 'failed'
+            timing['error'] = f"Collection task {task.name} failed: {e}"
+            logging.error(timing['error'])
+        finally:
+            done[task.name].set()
+
+    async def run(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Run all tasks, respecting dependencies, resource limits and timeouts
+
+        A failed or timed-out task does not stop its dependents; like the
+        sequential collection, later steps work with whatever data exists.
+        A timed-out task's thread cannot be interrupted and finishes in the
+        background.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Per-task status and timing
+        """
+        self._check_graph()
+        self.timings = {}
+        self._semaphores = {}
+        done = {name: asyncio.Event() for name in self.tasks}
+        start = time.monotonic()
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers,
+                                                         thread_name_prefix='phase0-collect')
+        try:
+            await asyncio.gather(*(self._run_task(task, done, executor, start) for task in self.tasks.values()))
+        finally:
+            # Do not block on timed-out tasks still running in their threads
+            executor.shutdown(wait=False)
+
+        logging.info(f"Collection graph: {len(self.tasks)} tasks in {time.monotonic() - start:.2f}s")
+        return self.timings
+
+    def errors(self) -> List[str]:
+        """Error messages of failed and timed-out tasks"""
+        return [timing['error'] for timing in self.timings.values() if 'error' in timing]
@@ -23,6 +23,7 @@ from .base import InformationCollectorBase
 from .volume_discovery import VolumeDiscovery
 from .tool_executors import ToolExecutors
 from .knowledge_builder import KnowledgeBuilder
+from .collection_scheduler import CollectionScheduler, API_SERVER, node_resource
 
 
 class ComprehensiveInformationCollector(VolumeDiscovery, ToolExecutors, KnowledgeBuilder):
@@ -46,6 +47,9 @@ class ComprehensiveInformationCollector(VolumeDiscovery, ToolExecutors, Knowledg
         collector_logger.info("=== PHASE 0: INFORMATION-COLLECTION - Starting volume-focused data collection ===")
         start_time = time.time()
         
+        # Node logs are fetched once per collection run
+        self._node_log_cache = {}
+        
         try:
             # Step 1: Discover volume dependency chain
             collector_logger.info("Step 1: Discovering volume dependency chain...")
@@ -55,25 +59,9 @@ class ComprehensiveInformationCollector(VolumeDiscovery, ToolExecutors, Knowledg
             
             # Step 2: Execute volume-focused tools based on discovered chain
             collector_logger.info("Step 2: Executing volume-focused diagnostic tools...")
-            
-            # Pod discovery tools
-            if target_pod and target_namespace:
-                await self._execute_pod_discovery_tools(target_pod, target_namespace)
-            
-            # Volume chain discovery tools
-            await self._execute_volume_chain_tools(volume_chain, target_volume_path)
-            
-            # CSI Baremetal discovery tools
-            await self._execute_csi_baremetal_tools(volume_chain.get('drives', []))
-            
-            # Node and system discovery tools
-            await self._execute_node_system_tools(volume_chain.get('nodes', []))
-            
-            # SMART data collection tools
-            await self._execute_smart_data_tools(volume_chain.get('drives', []))
-            
-            # Enhanced log analysis tools
-            await self._execute_enhanced_log_analysis_tools(volume_chain.get('nodes', []))
+            scheduler = self._build_collection_graph(target_pod, target_namespace, target_volume_path, volume_chain)
+            task_timings = await scheduler.run()
+            self.collected_data['errors'].extend(scheduler.errors())
             
             # Step 3: Build enhanced Knowledge Graph from tool outputs
             collector_logger.info("Step 3: Building Knowledge Graph from tool outputs...")
@@ -104,7 +92,10 @@ class ComprehensiveInformationCollector(VolumeDiscovery, ToolExecutors, Knowledg
                     'target_volume_path': target_volume_path,
                     'tools_executed': len(self.collected_data['tool_outputs']),
                     'total_errors': len(self.collected_data['errors']),
-                    'interactive_mode': self.interactive_mode
+                    'interactive_mode': self.interactive_mode,
+                    'kubectl_cache': self.result_cache.get_stats(),
+                    'knowledge_graph_cache': self.knowledge_graph.get_cache_stats(),
+                    'task_timings': task_timings
                 }
             }
             
@@ -117,3 +108,61 @@ class ComprehensiveInformationCollector(VolumeDiscovery, ToolExecutors, Knowledg
             collector_logger.error(error_msg)
             self.collected_data['errors'].append(error_msg)
             raise
+    
+    def _build_collection_graph(self, target_pod: str, target_namespace: str,
+                                target_volume_path: str, volume_chain: Dict[str, List[str]]) -> CollectionScheduler:
+        """
+        Build the Phase 0 collection task graph
+        
+        Kubernetes API steps share the API server limit and SSH steps share
+        their node's limit, so node collection overlaps with CRD listing.
+        SMART collection waits for the drive listing to find each drive's node.
+        
+        Args:
+            target_pod: Target pod name
+            target_namespace: Target pod namespace
+            target_volume_path: Target volume path
+            volume_chain: Discovered volume dependency chain
+            
+        Returns:
+            CollectionScheduler: Scheduler holding the task graph
+        """
+        scheduler = CollectionScheduler(self.config, interactive=self.interactive_mode)
+        nodes = list(dict.fromkeys(volume_chain.get('nodes', [])))
+        drives = list(dict.fromkeys(volume_chain.get('drives', [])))
+        
+        # Pod discovery tools
+        if target_pod and target_namespace:
+            scheduler.add_task('pod_discovery', self._collect_pod_discovery_data,
+                               (target_pod, target_namespace), resources=[API_SERVER])
+        
+        # Volume chain discovery tools
+        scheduler.add_task('volume_chain', self._collect_volume_chain_data,
+                           (volume_chain, target_volume_path), resources=[API_SERVER])
+        
+        # CSI Baremetal discovery tools
+        scheduler.add_task('csi_baremetal', self._collect_csi_baremetal_data, resources=[API_SERVER])
+        
+        # The full node listing replaces the volume chain's single node entry
+        scheduler.add_task('cluster_nodes', self._collect_cluster_nodes,
+                           depends_on=['volume_chain'], resources=[API_SERVER])
+        
+        # Node system and enhanced log analysis tools
+        for node_name in nodes:
+            scheduler.add_task(f'node_system:{node_name}', self._collect_node_system_data,
+                               (node_name,), resources=[node_resource(node_name)])
+            scheduler.add_task(f'enhanced_logs:{node_name}', self._collect_node_enhanced_logs,
+                               (node_name,), resources=[node_resource(node_name)])
+        
+        # SMART data collection tools
+        for drive_uuid in drives:
+            scheduler.add_task(f'smart:{drive_uuid}', self._collect_smart_data, (drive_uuid,),
+                               depends_on=['csi_baremetal'],
+                               resources=lambda drive_uuid=drive_uuid: self._smart_task_resources(drive_uuid))
+        
+        return scheduler
+    
+    def _smart_task_resources(self, drive_uuid: str) -> List[str]:
+        """Resources for a SMART collection task: the drive's node, if known"""
+        node_name = self._get_drive_info_from_uuid(drive_uuid).get('node')
+        return [node_resource(node_name)] if node_name else []
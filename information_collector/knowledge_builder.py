@@ -4,12 +4,14 @@ Knowledge Graph Builder
 Contains methods for building enhanced Knowledge Graph from tool outputs.
 """
 
-import yaml
 import logging
 import re
 from typing import Dict, List, Any, Optional, Tuple
 from .base import InformationCollectorBase
+from .structured_output import load_structured, is_json_output
+from .log_aggregation import LogIssueAggregator, summarize_log_lines
 from .metadata_parsers import MetadataParsers
+from .resident_graph import get_resident_graph
 
 
 class KnowledgeBuilder(MetadataParsers):
@@ -31,8 +33,16 @@ class KnowledgeBuilder(MetadataParsers):
         """Build enhanced Knowledge Graph from tool outputs with rich CSI metadata"""
         logging.info("Building Knowledge Graph from tool outputs with CSI metadata...")
         
-        # Reset Knowledge Graph
-        self.knowledge_graph = self.knowledge_graph.__class__()
+        # Start from a snapshot of the resident cluster-wide graph when it is running, else from scratch
+        troubleshoot_config = (self.config or {}).get('troubleshoot', {}) or {}
+        resident_graph = get_resident_graph()
+        if resident_graph is not None and resident_graph.synced:
+            self.knowledge_graph = resident_graph.snapshot(read_only=False)
+            logging.info(f"Knowledge Graph seeded from resident graph version {self.knowledge_graph.version}")
+        else:
+            self.knowledge_graph = self.knowledge_graph.__class__(
+                backend=troubleshoot_config.get('knowledge_graph_backend', 'networkx'))
+        self.knowledge_graph.set_analytics_mode(troubleshoot_config.get('knowledge_graph_analytics', 'python'))
         
         # Load historical experience data
         await self._load_historical_experience()
@@ -327,18 +337,9 @@ class KnowledgeBuilder(MetadataParsers):
     def _process_lvg_entities(self, lvg_output: str):
         """Process logical volume group entities"""
         try:
-            # Parse the YAML output
-            lvg_data = yaml.safe_load(lvg_output)
-            
-            # Process LVGs from the parsed YAML
-            if lvg_data:
-                # Handle different YAML structures
-                lvg_items = []
-                if isinstance(lvg_data, dict) and 'items' in lvg_data and isinstance(lvg_data['items'], list):
-                    lvg_items = lvg_data['items']
-                elif isinstance(lvg_data, list):
-                    lvg_items = lvg_data
-                
+            # Items come from the parsed cluster snapshot
+            lvg_items = self.cluster_snapshot.items('lvgs')
+            if lvg_items:
                 for lvg in lvg_items:
                     if lvg.get('kind') == 'LogicalVolumeGroup' or 'LogicalVolumeGroup' in lvg.get('kind', ''):
                         # Extract LVG name
@@ -432,18 +433,9 @@ class KnowledgeBuilder(MetadataParsers):
             # Get relevant drive UUIDs to filter ACs
             relevant_drives = self._get_relevant_drive_uuids()
             
-            # Parse the YAML output
-            ac_data = yaml.safe_load(ac_output)
-            
-            # Process ACs from the parsed YAML
-            if ac_data:
-                # Handle different YAML structures
-                ac_items = []
-                if isinstance(ac_data, dict) and 'items' in ac_data and isinstance(ac_data['items'], list):
-                    ac_items = ac_data['items']
-                elif isinstance(ac_data, list):
-                    ac_items = ac_data
-                
+            # Items come from the parsed cluster snapshot
+            ac_items = self.cluster_snapshot.items('available_capacity')
+            if ac_items:
                 for ac in ac_items:
                     if ac.get('kind') == 'AvailableCapacity' or 'AvailableCapacity' in ac.get('kind', ''):
                         # Extract AC name
@@ -577,6 +569,15 @@ class KnowledgeBuilder(MetadataParsers):
             # Get relevant drive UUIDs from volume locations and LVGs
             relevant_drives = self._get_relevant_drive_uuids()
             
+            if is_json_output(drives_output):
+                # JSON output has no line structure; read drive specs from the cluster snapshot
+                for drive in self.cluster_snapshot.items('drives'):
+                    drive_uuid = drive.get('metadata', {}).get('name')
+                    if drive_uuid in relevant_drives:
+                        self._finalize_drive_entity(drive_uuid, self._drive_info_from_spec(drive.get('spec', {})))
+                logging.info(f"Processed {len(relevant_drives)} relevant drives from CSI Baremetal data")
+                return
+            
             lines = drives_output.split('\n')
             current_drive = None
             drive_info = {}
@@ -617,6 +618,20 @@ class KnowledgeBuilder(MetadataParsers):
         except Exception as e:
             logging.warning(f"Error processing relevant drives: {e}")
     
+    def _drive_info_from_spec(self, spec: Dict[str, Any]) -> Dict[str, str]:
+        """Map a parsed CSI Baremetal Drive spec to drive entity attributes"""
+        field_map = {
+            'Health': 'Health',
+            'Status': 'Status',
+            'Path': 'Path',
+            'Usage': 'Usage',
+            'Size': 'Size',
+            'Type': 'Type',
+            'NodeId': 'NodeName',
+            'SerialNumber': 'SerialNumber'
+        }
+        return {attr: str(spec[field]) for field, attr in field_map.items() if spec.get(field) not in (None, '')}
+    
     def _get_relevant_drive_uuids(self) -> set:
         """Get relevant drive UUIDs from volume locations and LVGs"""
         relevant_drives = set()
@@ -652,6 +667,14 @@ class KnowledgeBuilder(MetadataParsers):
         drive_uuids = set()
         
         try:
+            if is_json_output(lvg_output):
+                for lvg in self.cluster_snapshot.items('lvgs'):
+                    spec = lvg.get('spec', {})
+                    locations = spec.get('Locations', spec.get('locations', [])) or []
+                    drive_uuids.update(location for location in locations
+                                       if isinstance(location, str) and self._is_drive_uuid(location))
+                return drive_uuids
+            
             lines = lvg_output.split('\n')
             current_lvg = None
             
@@ -719,9 +742,12 @@ class KnowledgeBuilder(MetadataParsers):
             # Get actual cluster node names from kubectl get node output
             cluster_nodes = self._parse_cluster_node_names(nodes_output)
             
+            # Parse the listing once for all nodes
+            nodes_data = load_structured(nodes_output)
+            
             # Process only these cluster nodes
             for node_name in cluster_nodes:
-                node_info = self._parse_node_info_from_output(node_name, nodes_output)
+                node_info = self._parse_node_info_from_output(node_name, nodes_output, nodes_data)
                 self._finalize_cluster_node_entity(node_name, node_info)
                 
             logging.info(f"Processed {len(cluster_nodes)} actual cluster nodes from Kubernetes data")
@@ -773,7 +799,8 @@ class KnowledgeBuilder(MetadataParsers):
         # Cluster nodes typically have domain-like names
         return '.' in node_name or node_name.endswith('.local') or len(node_name.split('.')) > 1
     
-    def _parse_node_info_from_output(self, node_name: str, nodes_output: str) -> Dict[str, Any]:
+    def _parse_node_info_from_output(self, node_name: str, nodes_output: str,
+                                     nodes_data: Any = None) -> Dict[str, Any]:
         """
         Parse node information for a specific node from the output using YAML parser
         
@@ -786,6 +813,7 @@ class KnowledgeBuilder(MetadataParsers):
         Args:
             node_name: Name of the node to parse information for
             nodes_output: YAML output containing node information
+            nodes_data: nodes_output already parsed, so a listing of many nodes is parsed once
             
         Returns:
             Dictionary containing parsed node information
@@ -793,8 +821,9 @@ class KnowledgeBuilder(MetadataParsers):
         node_info = {}
         
         try:
-            # Parse the YAML output
-            nodes_data = yaml.safe_load(nodes_output)
+            # Parse the JSON/YAML output
+            if nodes_data is None:
+                nodes_data = load_structured(nodes_output)
             
             # Find the node with matching name
             target_node = None
@@ -1240,6 +1269,15 @@ class KnowledgeBuilder(MetadataParsers):
         volume_locations = {}
         
         try:
+            if is_json_output(volumes_output):
+                for volume in self.cluster_snapshot.items('volumes'):
+                    spec = volume.get('spec', {})
+                    location = spec.get('Location', spec.get('location'))
+                    volume_name = volume.get('metadata', {}).get('name')
+                    if volume_name and location:
+                        volume_locations[volume_name] = location
+                return volume_locations
+            
             lines = volumes_output.split('\n')
             current_volume = None
             
@@ -1328,12 +1366,21 @@ class KnowledgeBuilder(MetadataParsers):
             self.collected_data['errors'].append(error_msg)
     
     async def _add_log_based_issues(self):
-        """Add log-based issues to the knowledge graph"""
+        """Add log-based issues to the knowledge graph, aggregated by message template"""
         try:
             logging.info("Analyzing logs for storage-related issues...")
             
-            # Parse dmesg issues
-            dmesg_issues = self._parse_dmesg_issues()
+            # Repeated lines (e.g. a flapping controller's I/O errors) collapse into one issue per template
+            dmesg_aggregator = LogIssueAggregator()
+            for issue in self._parse_dmesg_issues():
+                dmesg_aggregator.add(issue, issue.get('node'))
+            dmesg_issues = dmesg_aggregator.issues()
+            
+            journal_aggregator = LogIssueAggregator()
+            for issue in self._parse_journal_issues():
+                journal_aggregator.add(issue, issue.get('node'))
+            journal_issues = journal_aggregator.issues()
+            
             for issue in dmesg_issues:
                 # Add system-level issues to a general system entity
                 system_id = "gnode:System:kernel"
@@ -1341,11 +1388,10 @@ class KnowledgeBuilder(MetadataParsers):
                     system_id,
                     issue['type'],
                     issue['description'],
-                    issue['severity']
+                    issue['severity'],
+                    self._log_issue_details(issue)
                 )
             
-            # Parse journal log issues
-            journal_issues = self._parse_journal_issues()
             for issue in journal_issues:
                 # Determine entity based on issue source
                 if issue['source'] == 'journal_kubelet':
@@ -1359,18 +1405,22 @@ class KnowledgeBuilder(MetadataParsers):
                     entity_id,
                     issue['type'],
                     issue['description'],
-                    issue['severity']
+                    issue['severity'],
+                    self._log_issue_details(issue)
                 )
             
             total_log_issues = len(dmesg_issues) + len(journal_issues)
+            total_log_lines = dmesg_aggregator.lines_seen + journal_aggregator.lines_seen
             logging.info(f"Added {total_log_issues} log-based issues to knowledge graph "
-                        f"({len(dmesg_issues)} from dmesg, {len(journal_issues)} from journal)")
+                        f"({len(dmesg_issues)} from dmesg, {len(journal_issues)} from journal), "
+                        f"aggregated from {total_log_lines} log lines")
             
             # Store log analysis summary
             self.collected_data['log_analysis'] = {
                 'dmesg_issues': dmesg_issues,
                 'journal_issues': journal_issues,
-                'total_issues': total_log_issues
+                'total_issues': total_log_issues,
+                'total_log_lines': total_log_lines
             }
             
         except Exception as e:
@@ -1378,6 +1428,11 @@ class KnowledgeBuilder(MetadataParsers):
             logging.error(error_msg)
             self.collected_data['errors'].append(error_msg)
     
+    def _log_issue_details(self, issue: Dict[str, Any]) -> Dict[str, Any]:
+        """Aggregation fields of a log-based issue kept on the Knowledge Graph issue"""
+        return {key: issue[key] for key in ('source', 'node', 'count', 'first_seen', 'last_seen')
+                if issue.get(key) is not None}
+    
     async def _add_smart_data_analysis(self):
         """Add SMART data analysis to the knowledge graph"""
         try:
@@ -1433,11 +1488,11 @@ class KnowledgeBuilder(MetadataParsers):
                         # Extract pattern type from key
                         pattern_type = pattern_key.replace('dmesg_', '').replace('_', ' ')
                         
-                        # Add issue to kernel system entity
+                        # Add issue to kernel system entity, with repeated lines collapsed
                         self.knowledge_graph.add_issue(
                             "gnode:System:kernel",
                             "enhanced_log_pattern",
-                            f"Enhanced log analysis detected {pattern_type} issues, log {log_output}",
+                            f"Enhanced log analysis detected {pattern_type} issues, log {summarize_log_lines(log_output.splitlines())}",
                             "medium"
                         )
             
@@ -0,0 +1,169 @@
+"""
+Log Aggregation
+
+Collapses repeated log-based issues before they reach the Knowledge Graph.
+Variable tokens (timestamps, PIDs, sector numbers, addresses, UUIDs) are
+normalized so that lines differing only in those tokens share a template;
+each template keeps an occurrence count and its first and last timestamps.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Leading timestamps of dmesg -T, raw dmesg, journalctl short and ISO formats
+_TIMESTAMP_PREFIXES = [
+    re.compile(r'^\[(?P<ts>[A-Z][a-z]{2} [A-Z][a-z]{2} [ \d]\d \d\d:\d\d:\d\d \d{4})\]\s*'),
+    re.compile(r'^\[\s*(?P<ts>\d+\.\d+)\]\s*'),
+    # The journal host name is dropped with the timestamp
+    re.compile(r'^(?P<ts>[A-Z][a-z]{2} [ \d]\d \d\d:\d\d:\d\d)\s+\S+\s+'),
+    re.compile(r'^(?P<ts>\d{4}-\d\d-\d\d[T ]\d\d:\d\d:\d\d(?:[.,]\d+)?(?:Z|[+-]\d\d:?\d\d)?)\s+'),
+]
+
+# Variable tokens inside a message, replaced in this order
+_VARIABLE_TOKENS = [
+    (re.compile(r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b', re.IGNORECASE), '<uuid>'),
+    (re.compile(r'(?<=[\w\-.])\[\d+\]'), '[<pid>]'),
+    (re.compile(r'\b0x[0-9a-f]+\b', re.IGNORECASE), '<hex>'),
+    (re.compile(r'\b\d\d:\d\d:\d\d(?:\.\d+)?\b'), '<time>'),
+    # Standalone numbers only, so device names such as nvme0n1 or sdb1 stay distinct
+    (re.compile(r'(?<![\w.])\d+(?:\.\d+)?(?![\w.])'), '<num>'),
+]
+
+SEVERITY_RANK = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
+
+
+def split_timestamp(line: str) -> Tuple[Optional[str], str]:
+    """
+    Split a log line into its leading timestamp and message
+
+    Args:
+        line: Log line
+
+    Returns:
+        Tuple[Optional[str], str]: Timestamp as written in the log (None if absent) and the message
+    """
+    line = line.strip()
+    for prefix in _TIMESTAMP_PREFIXES:
+        match = prefix.match(line)
+        if match:
+            return match.group('ts'), line[match.end():]
+    return None, line
+
+
+def normalize_message(message: str) -> str:
+    """Replace variable tokens of a log message with placeholders"""
+    for pattern, placeholder in _VARIABLE_TOKENS:
+        message = pattern.sub(placeholder, message)
+    return message
+
+
+def log_template(line: str) -> Tuple[Optional[str], str]:
+    """
+    Template of a log line
+
+    Returns:
+        Tuple[Optional[str], str]: The line's timestamp and its normalized message
+    """
+    timestamp, message = split_timestamp(line)
+    return timestamp, normalize_message(message)
+
+
+class LogIssueAggregator:
+    """
+    Streaming aggregation of log-based issues by source, node, type and message template
+    """
+
+    def __init__(self):
+        """Initialize an empty aggregator"""
+        self._groups: Dict[Tuple[str, str, str, str], Dict[str, Any]] = {}
+        self.lines_seen = 0
+
+    def add(self, issue: Dict[str, Any], node: str = None):
+        """
+        Add one per-line issue (as produced by the log classifier)
+
+        Args:
+            issue: Issue dict with type, severity, description, raw_log and source
+            node: Node the log line came from
+        """
+        self.lines_seen += 1
+        raw_log = issue.get('raw_log', '')
+        timestamp, template = log_template(raw_log)
+        key = (issue.get('source', ''), node or '', issue['type'], template)
+
+        group = self._groups.get(key)
+        if group is None:
+            description = issue.get('description', '')
+            prefix = description[:-len(raw_log)] if raw_log and description.endswith(raw_log) else f"{description}: "
+            self._groups[key] = {
+                'type': issue['type'],
+                'severity': issue['severity'],
+                'source': issue.get('source', ''),
+                'node': node,
+                'template': template,
+                'raw_log': raw_log,
+                'description_prefix': prefix,
+                'count': 1,
+                'first_seen': timestamp,
+                'last_seen': timestamp,
+            }
+            return
+
+        group['count'] += 1
+        if SEVERITY_RANK.get(issue['severity'], 4) < SEVERITY_RANK.get(group['severity'], 4):
+            group['severity'] = issue['severity']
+        if timestamp:
+            group['first_seen'] = group['first_seen'] or timestamp
+            group['last_seen'] = timestamp
+
+    def extend(self, issues: Iterable[Dict[str, Any]], node: str = None):
+        """Add several per-line issues from the same node"""
+        for issue in issues:
+            self.add(issue, node)
+
+    def issues(self) -> List[Dict[str, Any]]:
+        """
+        Aggregated issues in order of first occurrence
+
+        A template seen once keeps the original description; repeated templates
+        are described once with their count and first/last timestamps.
+
+        Returns:
+            List[Dict[str, Any]]: Issues with type, severity, description, raw_log, source,
+                node, template, count, first_seen and last_seen
+        """
+        aggregated = []
+        for group in self._groups.values():
+            issue = {key: value for key, value in group.items() if key != 'description_prefix'}
+            if group['count'] == 1:
+                issue['description'] = f"{group['description_prefix']}{group['raw_log']}"
+            else:
+                seen = f"{group['count']} occurrences"
+                if group['first_seen']:
+                    seen += f", first seen {group['first_seen']}, last seen {group['last_seen']}"
+                issue['description'] = f"{group['description_prefix']}{group['template']} ({seen})"
+            if group['node']:
+                issue['description'] += f" on node {group['node']}"
+            aggregated.append(issue)
+        return aggregated
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+
+def summarize_log_lines(lines: Iterable[str]) -> str:
+    """
+    Collapse log lines into their templates with counts, in order of first occurrence
+
+    Args:
+        lines: Log lines
+
+    Returns:
+        str: One line per template, suffixed with (xN) when repeated
+    """
+    counts: Dict[str, int] = {}
+    for line in lines:
+        if line.strip():
+            _, template = log_template(line)
+            counts[template] = counts.get(template, 0) + 1
+    return '\n'.join(template if count == 1 else f"{template} (x{count})" for template, count in counts.items())
@@ -8,6 +8,8 @@ import yaml
 import logging
 from typing import Dict, List, Any
 from .base import InformationCollectorBase
+from .structured_output import load_structured
+from tools.core.log_classifier import get_log_classifier
 
 
 class MetadataParsers(InformationCollectorBase):
@@ -25,8 +27,8 @@ class MetadataParsers(InformationCollectorBase):
         pod_output = self.collected_data.get('kubernetes', {}).get('target_pod', '')
         if pod_output:
             try:
-                # Parse the YAML output
-                pod_data = yaml.safe_load(pod_output)
+                # Parse the JSON/YAML output
+                pod_data = load_structured(pod_output)
                 
                 if pod_data:
                     # Extract pod phase
@@ -79,8 +81,8 @@ class MetadataParsers(InformationCollectorBase):
         pvcs_output = self.collected_data.get('kubernetes', {}).get('pvcs', '')
         if pvcs_output:
             try:
-                # Parse the YAML output
-                pvc_data = yaml.safe_load(pvcs_output)
+                # Parse the JSON/YAML output
+                pvc_data = load_structured(pvcs_output)
                 
                 # Find the PVC with matching name
                 target_pvc = None
@@ -159,8 +161,8 @@ class MetadataParsers(InformationCollectorBase):
         pvs_output = self.collected_data.get('kubernetes', {}).get('pvs', '')
         if pvs_output:
             try:
-                # Parse the YAML output
-                pv_data = yaml.safe_load(pvs_output)
+                # Parse the JSON/YAML output
+                pv_data = load_structured(pvs_output)
                 
                 # Find the PV with matching name
                 target_pv = None
@@ -249,28 +251,10 @@ class MetadataParsers(InformationCollectorBase):
         }
     
         volumes_output = self.collected_data.get('csi_baremetal', {}).get('volumes', '')
-        if volumes_output and vol_name in volumes_output:
+        if volumes_output:
             try:
-                # Parse the YAML output
-                volumes_data = yaml.safe_load(volumes_output)
-                
-                # Find the volume with matching name
-                target_volume = None
-                if isinstance(volumes_data, dict) and 'items' in volumes_data and isinstance(volumes_data['items'], list):
-                    # List of volumes case
-                    for volume in volumes_data['items']:
-                        if volume.get('metadata', {}).get('name') == vol_name:
-                            target_volume = volume
-                            break
-                elif isinstance(volumes_data, dict) and volumes_data.get('metadata', {}).get('name') == vol_name:
-                    # Single volume case
-                    target_volume = volumes_data
-                elif isinstance(volumes_data, list):
-                    # Direct list of volumes
-                    for volume in volumes_data:
-                        if volume.get('metadata', {}).get('name') == vol_name:
-                            target_volume = volume
-                            break
+                # Look up the volume in the parsed cluster snapshot
+                target_volume = self.cluster_snapshot.get('volumes', vol_name)
                 
                 if target_volume:
                     # Extract volume spec properties
@@ -350,8 +334,8 @@ class MetadataParsers(InformationCollectorBase):
             List of lines from the extracted section (for backward compatibility)
         """
         try:
-            # Parse the YAML output
-            yaml_data = yaml.safe_load(yaml_output)
+            # Parse the JSON/YAML output
+            yaml_data = load_structured(yaml_output)
             
             # Handle different YAML structures
             if yaml_data is None:
@@ -438,28 +422,10 @@ class MetadataParsers(InformationCollectorBase):
         }
         
         drives_output = self.collected_data.get('csi_baremetal', {}).get('drives', '')
-        if drives_output and drive_uuid in drives_output:
+        if drives_output:
             try:
-                # Parse the YAML output
-                drives_data = yaml.safe_load(drives_output)
-                
-                # Find the drive with matching UUID
-                target_drive = None
-                if isinstance(drives_data, dict) and 'items' in drives_data and isinstance(drives_data['items'], list):
-                    # List of drives case
-                    for drive in drives_data['items']:
-                        if drive.get('metadata', {}).get('name') == drive_uuid:
-                            target_drive = drive
-                            break
-                elif isinstance(drives_data, dict) and drives_data.get('metadata', {}).get('name') == drive_uuid:
-                    # Single drive case
-                    target_drive = drives_data
-                elif isinstance(drives_data, list):
-                    # Direct list of drives
-                    for drive in drives_data:
-                        if drive.get('metadata', {}).get('name') == drive_uuid:
-                            target_drive = drive
-                            break
+                # Look up the drive in the parsed cluster snapshot
+                target_drive = self.cluster_snapshot.get('drives', drive_uuid)
                 
                 if target_drive:
                     # Extract drive spec properties
@@ -536,28 +502,10 @@ class MetadataParsers(InformationCollectorBase):
         }
         
         volumes_output = self.collected_data.get('csi_baremetal', {}).get('volumes', '')
-        if volumes_output and volume_name in volumes_output:
+        if volumes_output:
             try:
-                # Parse the YAML output
-                volumes_data = yaml.safe_load(volumes_output)
-                
-                # Find the volume with matching name
-                target_volume = None
-                if isinstance(volumes_data, dict) and 'items' in volumes_data and isinstance(volumes_data['items'], list):
-                    # List of volumes case
-                    for volume in volumes_data['items']:
-                        if volume.get('metadata', {}).get('name') == volume_name:
-                            target_volume = volume
-                            break
-                elif isinstance(volumes_data, dict) and volumes_data.get('metadata', {}).get('name') == volume_name:
-                    # Single volume case
-                    target_volume = volumes_data
-                elif isinstance(volumes_data, list):
-                    # Direct list of volumes
-                    for volume in volumes_data:
-                        if volume.get('metadata', {}).get('name') == volume_name:
-                            target_volume = volume
-                            break
+                # Look up the volume in the parsed cluster snapshot
+                target_volume = self.cluster_snapshot.get('volumes', volume_name)
                 
                 if target_volume:
                     # Extract volume spec properties
@@ -620,28 +568,10 @@ class MetadataParsers(InformationCollectorBase):
         }
         
         lvgs_output = self.collected_data.get('csi_baremetal', {}).get('lvgs', '')
-        if lvgs_output and lvg_name in lvgs_output:
+        if lvgs_output:
             try:
-                # Parse the YAML output
-                lvgs_data = yaml.safe_load(lvgs_output)
-                
-                # Find the LVG with matching name
-                target_lvg = None
-                if isinstance(lvgs_data, dict) and 'items' in lvgs_data and isinstance(lvgs_data['items'], list):
-                    # List of LVGs case
-                    for lvg in lvgs_data['items']:
-                        if lvg.get('metadata', {}).get('name') == lvg_name:
-                            target_lvg = lvg
-                            break
-                elif isinstance(lvgs_data, dict) and lvgs_data.get('metadata', {}).get('name') == lvg_name:
-                    # Single LVG case
-                    target_lvg = lvgs_data
-                elif isinstance(lvgs_data, list):
-                    # Direct list of LVGs
-                    for lvg in lvgs_data:
-                        if lvg.get('metadata', {}).get('name') == lvg_name:
-                            target_lvg = lvg
-                            break
+                # Look up the LVG in the parsed cluster snapshot
+                target_lvg = self.cluster_snapshot.get('lvgs', lvg_name)
                 
                 if target_lvg:
                     # Extract LVG spec properties
@@ -701,28 +631,10 @@ class MetadataParsers(InformationCollectorBase):
         }
         
         ac_output = self.collected_data.get('csi_baremetal', {}).get('available_capacity', '')
-        if ac_output and ac_name in ac_output:
+        if ac_output:
             try:
-                # Parse the YAML output
-                ac_data = yaml.safe_load(ac_output)
-                
-                # Find the AC with matching name
-                target_ac = None
-                if isinstance(ac_data, dict) and 'items' in ac_data and isinstance(ac_data['items'], list):
-                    # List of ACs case
-                    for ac in ac_data['items']:
-                        if ac.get('metadata', {}).get('name') == ac_name:
-                            target_ac = ac
-                            break
-                elif isinstance(ac_data, dict) and ac_data.get('metadata', {}).get('name') == ac_name:
-                    # Single AC case
-                    target_ac = ac_data
-                elif isinstance(ac_data, list):
-                    # Direct list of ACs
-                    for ac in ac_data:
-                        if ac.get('metadata', {}).get('name') == ac_name:
-                            target_ac = ac
-                            break
+                # Look up the AC in the parsed cluster snapshot
+                target_ac = self.cluster_snapshot.get('available_capacity', ac_name)
                 
                 if target_ac:
                     # Extract AC spec properties
@@ -769,29 +681,14 @@ class MetadataParsers(InformationCollectorBase):
         csibm_nodes_output = self.collected_data.get('csi_baremetal', {}).get('nodes', '')
         if csibm_nodes_output:
             try:
-                # Parse the YAML output
-                nodes_data = yaml.safe_load(csibm_nodes_output)
-                
-                # Process CSI Baremetal node data
-                if nodes_data:
-                    # Handle different YAML structures
-                    node_items = []
-                    if isinstance(nodes_data, dict) and 'items' in nodes_data and isinstance(nodes_data['items'], list):
-                        # List of nodes case
-                        node_items = nodes_data['items']
-                    elif isinstance(nodes_data, list):
-                        # Direct list of nodes
-                        node_items = nodes_data
-                    
-                    # Extract UUID to hostname mapping
-                    for node in node_items:
-                        if isinstance(node, dict):
-                            node_uuid = node.get('metadata', {}).get('name', '')
-                            # Check if it's a UUID format (typically long string with hyphens)
-                            if len(node_uuid) > 30:
-                                hostname = node.get('spec', {}).get('hostname', '')
-                                if hostname:
-                                    node_mapping[node_uuid] = hostname
+                # Extract UUID to hostname mapping from the parsed cluster snapshot
+                for node in self.cluster_snapshot.items('nodes'):
+                    node_uuid = node.get('metadata', {}).get('name', '')
+                    # Check if it's a UUID format (typically long string with hyphens)
+                    if len(node_uuid) > 30:
+                        hostname = node.get('spec', {}).get('hostname', '')
+                        if hostname:
+                            node_mapping[node_uuid] = hostname
                     
             except Exception as e:
                 logging.warning(f"Error parsing CSI Baremetal node mapping with yaml package: {e}")
@@ -928,8 +825,8 @@ class MetadataParsers(InformationCollectorBase):
         nodes_output = self.collected_data.get('kubernetes', {}).get('nodes', '')
         if nodes_output and node_name in nodes_output:
             try:
-                # Parse the YAML output
-                nodes_data = yaml.safe_load(nodes_output)
+                # Parse the JSON/YAML output
+                nodes_data = load_structured(nodes_output)
                 
                 # Find the node with matching name
                 target_node = None
@@ -1014,109 +911,56 @@ class MetadataParsers(InformationCollectorBase):
         
         return node_info
     
+    def _system_log_outputs(self, log_key: str) -> List[tuple]:
+        """
+        Collected system log outputs of one kind, per node
+        
+        Args:
+            log_key: Log kind in collected_data['system'] (kernel_logs, journal_storage_logs, ...)
+            
+        Returns:
+            List[tuple]: (node_key, output) pairs; node_key is None for cluster-level output
+        """
+        system_data = self.collected_data.get('system', {})
+        outputs = []
+        if system_data.get(log_key):
+            outputs.append((None, system_data[log_key]))
+        for node_key, node_data in system_data.items():
+            if isinstance(node_data, dict) and node_data.get(log_key):
+                outputs.append((node_key, node_data[log_key]))
+        return outputs
+    
     def _parse_dmesg_issues(self) -> List[Dict[str, Any]]:
-        """Parse dmesg logs to identify storage-related issues"""
+        """Parse dmesg logs of every node to identify storage-related issues, one per log line"""
         issues = []
-        dmesg_output = self.collected_data.get('system', {}).get('kernel_logs', '')
         
-        if not dmesg_output:
-            return issues
-        
-        try:
-            lines = dmesg_output.split('\n')
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Parse timestamp and message
-                issue = self._extract_dmesg_issue(line)
-                if issue:
+        for node_key, dmesg_output in self._system_log_outputs('kernel_logs'):
+            try:
+                for issue in get_log_classifier().issues(dmesg_output, 'dmesg'):
+                    issue['node'] = node_key
                     issues.append(issue)
-        
-        except Exception as e:
-            logging.warning(f"Error parsing dmesg issues: {e}")
+            except Exception as e:
+                logging.warning(f"Error parsing dmesg issues: {e}")
         
         return issues
     
     def _extract_dmesg_issue(self, line: str) -> Dict[str, Any]:
         """Extract issue information from a dmesg log line"""
-        issue = None
-        line_lower = line.lower()
-        
-        # Disk/Drive hardware errors
-        if any(keyword in line_lower for keyword in ['disk error', 'drive error', 'bad sector', 'i/o error']):
-            severity = 'critical' if 'bad sector' in line_lower else 'high'
-            issue = {
-                'type': 'disk_hardware_error',
-                'severity': severity,
-                'description': f"Hardware disk error detected: {line}",
-                'raw_log': line,
-                'source': 'dmesg'
-            }
-        
-        # NVMe/SSD specific issues
-        elif any(keyword in line_lower for keyword in ['nvme', 'ssd']) and any(error in line_lower for error in ['error', 'fail', 'timeout']):
-            issue = {
-                'type': 'nvme_ssd_error',
-                'severity': 'high',
-                'description': f"NVMe/SSD error detected: {line}",
-                'raw_log': line,
-                'source': 'dmesg'
-            }
-        
-        # Filesystem errors
-        elif any(keyword in line_lower for keyword in ['xfs', 'ext4']) and any(error in line_lower for error in ['error', 'corrupt', 'fail']):
-            issue = {
-                'type': 'filesystem_error',
-                'severity': 'high',
-                'description': f"Filesystem error detected: {line}",
-                'raw_log': line,
-                'source': 'dmesg'
-            }
-        
-        # I/O timeout issues
-        elif 'timeout' in line_lower and any(keyword in line_lower for keyword in ['i/o', 'io', 'disk', 'drive']):
-            issue = {
-                'type': 'io_timeout',
-                'severity': 'medium',
-                'description': f"I/O timeout detected: {line}",
-                'raw_log': line,
-                'source': 'dmesg'
-            }
-        
-        # Controller/SCSI/SATA issues
-        elif any(keyword in line_lower for keyword in ['controller', 'scsi', 'sata']) and any(error in line_lower for error in ['error', 'fail', 'reset']):
-            issue = {
-                'type': 'controller_error',
-                'severity': 'high',
-                'description': f"Storage controller error detected: {line}",
-                'raw_log': line,
-                'source': 'dmesg'
-            }
-        
-        return issue
+        issues = get_log_classifier().issues(line.strip(), 'dmesg')
+        return issues[0] if issues else None
     
     def _parse_journal_issues(self) -> List[Dict[str, Any]]:
-        """Parse systemd journal logs to identify storage and service issues"""
+        """Parse systemd journal logs of every node to identify storage and service issues"""
         issues = []
         
-        # Parse different journal log types
-        storage_logs = self.collected_data.get('system', {}).get('journal_storage_logs', '')
-        kubelet_logs = self.collected_data.get('system', {}).get('journal_kubelet_logs', '')
-        boot_logs = self.collected_data.get('system', {}).get('journal_boot_logs', '')
-        
-        # Parse storage-related journal logs
-        if storage_logs:
-            issues.extend(self._extract_journal_storage_issues(storage_logs))
-        
-        # Parse kubelet service logs
-        if kubelet_logs:
-            issues.extend(self._extract_journal_kubelet_issues(kubelet_logs))
-        
-        # Parse boot-time hardware detection issues
-        if boot_logs:
-            issues.extend(self._extract_journal_boot_issues(boot_logs))
+        # Storage-related entries, kubelet service logs and boot-time hardware detection
+        for log_key, extract in [('journal_storage_logs', self._extract_journal_storage_issues),
+                                 ('journal_kubelet_logs', self._extract_journal_kubelet_issues),
+                                 ('journal_boot_logs', self._extract_journal_boot_issues)]:
+            for node_key, logs in self._system_log_outputs(log_key):
+                for issue in extract(logs):
+                    issue['node'] = node_key
+                    issues.append(issue)
         
         return issues
     
@@ -1125,34 +969,7 @@ class MetadataParsers(InformationCollectorBase):
         issues = []
         
         try:
-            lines = logs.split('\n')
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                line_lower = line.lower()
-                
-                # Storage service failures
-                if any(keyword in line_lower for keyword in ['failed', 'error', 'timeout']) and any(service in line_lower for service in ['mount', 'umount', 'filesystem']):
-                    issues.append({
-                        'type': 'storage_service_error',
-                        'severity': 'high',
-                        'description': f"Storage service error: {line}",
-                        'raw_log': line,
-                        'source': 'journal_storage'
-                    })
-                
-                # Disk/drive detection issues
-                elif any(keyword in line_lower for keyword in ['disk', 'drive', 'nvme', 'ssd']) and 'detected' in line_lower:
-                    issues.append({
-                        'type': 'hardware_detection',
-                        'severity': 'low',
-                        'description': f"Hardware detection event: {line}",
-                        'raw_log': line,
-                        'source': 'journal_storage'
-                    })
-        
+            issues = get_log_classifier().issues(logs, 'journal_storage')
         except Exception as e:
             logging.warning(f"Error parsing journal storage issues: {e}")
         
@@ -1163,34 +980,7 @@ class MetadataParsers(InformationCollectorBase):
         issues = []
         
         try:
-            lines = logs.split('\n')
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                line_lower = line.lower()
-                
-                # Volume mount/attach failures
-                if any(keyword in line_lower for keyword in ['volume', 'mount', 'attach']) and any(error in line_lower for error in ['failed', 'error', 'timeout']):
-                    issues.append({
-                        'type': 'kubelet_volume_error',
-                        'severity': 'high',
-                        'description': f"Kubelet volume error: {line}",
-                        'raw_log': line,
-                        'source': 'journal_kubelet'
-                    })
-                
-                # CSI driver issues
-                elif 'csi' in line_lower and any(error in line_lower for error in ['failed', 'error', 'timeout']):
-                    issues.append({
-                        'type': 'csi_driver_error',
-                        'severity': 'high',
-                        'description': f"CSI driver error: {line}",
-                        'raw_log': line,
-                        'source': 'journal_kubelet'
-                    })
-        
+            issues = get_log_classifier().issues(logs, 'journal_kubelet')
         except Exception as e:
             logging.warning(f"Error parsing journal kubelet issues: {e}")
         
@@ -1201,34 +991,7 @@ class MetadataParsers(InformationCollectorBase):
         issues = []
         
         try:
-            lines = logs.split('\n')
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                line_lower = line.lower()
-                
-                # Hardware initialization failures
-                if any(keyword in line_lower for keyword in ['failed to initialize', 'hardware error', 'device not found']):
-                    issues.append({
-                        'type': 'boot_hardware_error',
-                        'severity': 'critical',
-                        'description': f"Boot-time hardware error: {line}",
-                        'raw_log': line,
-                        'source': 'journal_boot'
-                    })
-                
-                # Drive/controller detection issues
-                elif any(keyword in line_lower for keyword in ['drive', 'controller', 'nvme', 'ssd']) and any(issue in line_lower for issue in ['not found', 'failed', 'error']):
-                    issues.append({
-                        'type': 'boot_storage_detection',
-                        'severity': 'high',
-                        'description': f"Boot-time storage detection issue: {line}",
-                        'raw_log': line,
-                        'source': 'journal_boot'
-                    })
-        
+            issues = get_log_classifier().issues(logs, 'journal_boot')
         except Exception as e:
             logging.warning(f"Error parsing journal boot issues: {e}")
         
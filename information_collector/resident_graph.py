@@ -0,0 +1,712 @@
+"""
+Resident Knowledge Graph
+
+Keeps a cluster-wide Knowledge Graph of Pods, PVCs, PVs, Nodes and the CSI
+Baremetal Drives, Volumes, LVGs and AvailableCapacities current between
+investigations. The service lists every resource once, then applies watch
+events incrementally, tracking the resourceVersion of each resource type so a
+watch resumes where the previous one stopped. An expired resourceVersion
+(410 Gone) or the periodic resync triggers a relist of that resource type.
+
+Investigations take a consistent snapshot of the graph instead of rebuilding
+the topology from scratch. The service only holds topology and entity
+attributes; issues are still derived by each investigation.
+
+Events come from a source with two methods, so the service can run against the
+Kubernetes API, a local fake API server or a recorded event stream:
+    list(kind) -> list object ({'metadata': {'resourceVersion'}, 'items': [...]})
+    watch(kind, resource_version, timeout_seconds) -> iterable of watch events
+        ({'type': 'ADDED' | 'MODIFIED' | 'DELETED' | 'BOOKMARK' | 'ERROR', 'object': {...}})
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from knowledge_graph import KnowledgeGraph
+from knowledge_graph.snapshot import dumps_snapshot, loads_snapshot
+from tools.kubernetes.backend import KubernetesAPIBackend, get_kubernetes_backend, resolve_resource
+
+logger = logging.getLogger(__name__)
+
+# Global resident Knowledge Graph instance
+_resident_graph = None
+_resident_graph_lock = threading.Lock()
+
+# Resource types in bootstrap order: relationship targets are listed before their sources
+RESIDENT_KINDS = ('node', 'csibmnode', 'drive', 'lvg', 'ac', 'pv', 'volume', 'pvc', 'pod')
+
+# Resource types whose relationships depend on the CSI Baremetal node UUID -> hostname map
+_NODE_RESOLVED_KINDS = ('drive', 'lvg', 'ac')
+
+# Attributes set by the add_gnode_* methods themselves
+_BASE_ATTRIBUTES = ('entity_type', 'gnode_subtype', 'name', 'namespace', 'uuid')
+
+HTTP_GONE = 410
+
+# One entity: node ID, KnowledgeGraph add method, its positional arguments, attributes,
+# and the (source, target, relationship) edges the object implies
+Entity = Tuple[str, str, Tuple, Dict[str, Any], List[Tuple[str, str, str]]]
+
+
+def _is_drive_uuid(location: str) -> bool:
+    """Check if a CSI location is a Drive UUID rather than an LVG name"""
+    return isinstance(location, str) and len(location) == 36 and location.count('-') == 4
+
+
+def _present(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop unset values, so attributes missing from an object are not stored"""
+    return {key: value for key, value in values.items() if value not in (None, '', [], {})}
+
+
+def _pod_entity(obj: Dict[str, Any], node_names: Dict[str, str]) -> Entity:
+    """Pod with its PVC claims and the node it is scheduled on"""
+    metadata, spec, status = obj.get('metadata', {}), obj.get('spec', {}), obj.get('status', {})
+    name, namespace = metadata['name'], metadata.get('namespace', 'default')
+    node_id = f"gnode:Pod:{namespace}/{name}"
+    container_statuses = status.get('containerStatuses') or []
+    security_context = spec.get('securityContext') or {}
+    attributes = {
+        'Phase': status.get('phase', 'Unknown'),
+        'RestartCount': container_statuses[0].get('restartCount', 0) if container_statuses else 0,
+        'SecurityContext': security_context,
+        'fsGroup': security_context.get('fsGroup'),
+    }
+    edges = []
+    for volume in spec.get('volumes') or []:
+        claim = (volume.get('persistentVolumeClaim') or {}).get('claimName')
+        if claim:
+            edges.append((node_id, f"gnode:PVC:{namespace}/{claim}", 'uses'))
+    node_name = spec.get('nodeName')
+    if node_name:
+        attributes['node_name'] = node_name
+        edges.append((node_id, f"gnode:Node:{node_name}", 'located_on'))
+        edges.append((f"gnode:Node:{node_name}", node_id, 'related_to'))
+    return node_id, 'add_gnode_pod', (name, namespace), attributes, edges
+
+
+def _pvc_entity(obj: Dict[str, Any], node_names: Dict[str, str]) -> Entity:
+    """PVC with its bound PV and CSI Volume"""
+    metadata, spec, status = obj.get('metadata', {}), obj.get('spec', {}), obj.get('status', {})
+    name, namespace = metadata['name'], metadata.get('namespace', 'default')
+    node_id = f"gnode:PVC:{namespace}/{name}"
+    access_modes = status.get('accessModes') or []
+    attributes = {
+        'AccessModes': access_modes[0] if access_modes else '',
+        'StorageSize': ((spec.get('resources') or {}).get('requests') or {}).get('storage', ''),
+        'VolumeMode': spec.get('volumeMode', 'Filesystem'),
+        'Phase': status.get('phase', 'Unknown'),
+        **_present({'storageClass': spec.get('storageClassName')}),
+    }
+    edges = []
+    volume_name = spec.get('volumeName')
+    if volume_name:
+        # CSI Baremetal names the Volume custom resource after the PV
+        edges.append((node_id, f"gnode:PV:{volume_name}", 'bound_to'))
+        edges.append((node_id, f"gnode:Volume:{namespace}/{volume_name}", 'bound_to'))
+    return node_id, 'add_gnode_pvc', (name, namespace), attributes, edges
+
+
+def _pv_entity(obj: Dict[str, Any], node_names: Dict[str, str]) -> Entity:
+    """PV; CSI Baremetal PVs are linked to drives by their Volume"""
+    metadata, spec, status = obj.get('metadata', {}), obj.get('spec', {}), obj.get('status', {})
+    name = metadata['name']
+    disk_path = (spec.get('local') or spec.get('hostPath') or {}).get('path', '')
+    node_affinity = ''
+    terms = ((spec.get('nodeAffinity') or {}).get('required') or {}).get('nodeSelectorTerms') or []
+    for expression in (terms[0].get('matchExpressions') or []) if terms else []:
+        if expression.get('key') == 'kubernetes.io/hostname' and expression.get('operator') == 'In':
+            node_affinity = (expression.get('values') or [''])[0]
+            break
+    attributes = {
+        'Phase': status.get('phase', 'Unknown'),
+        'ReclaimPolicy': spec.get('persistentVolumeReclaimPolicy', 'Unknown'),
+        'AccessModes': spec.get('accessModes') or [],
+        'Capacity': (spec.get('capacity') or {}).get('storage', ''),
+        'diskPath': disk_path,
+        'nodeAffinity': node_affinity,
+        **_present({'storageClass': spec.get('storageClassName')}),
+    }
+    return f"gnode:PV:{name}", 'add_gnode_pv', (name,), attributes, []
+
+
+def _node_entity(obj: Dict[str, Any], node_names: Dict[str, str]) -> Entity:
+    """Cluster node with addresses, resources and conditions"""
+    metadata, status = obj.get('metadata', {}), obj.get('status', {})
+    name = metadata['name']
+    attributes = {}
+    for address in status.get('addresses') or []:
+        if address.get('type') in ('InternalIP', 'Hostname'):
+            attributes[address['type']] = address.get('address', '')
+    allocatable = status.get('allocatable') or {}
+    capacity = status.get('capacity') or {}
+    attributes.update(_present({
+        'AllocatableCPU': allocatable.get('cpu'),
+        'AllocatableMemory': allocatable.get('memory'),
+        'AllocatableStorage': allocatable.get('ephemeral-storage'),
+        'CapacityCPU': capacity.get('cpu'),
+        'CapacityMemory': capacity.get('memory'),
+        'CapacityStorage': capacity.get('ephemeral-storage'),
+    }))
+    for condition in status.get('conditions') or []:
+        if condition.get('type') in ('Ready', 'DiskPressure', 'MemoryPressure', 'PIDPressure', 'NetworkUnavailable'):
+            attributes[condition['type']] = str(condition.get('status', '')).lower() == 'true'
+    return f"gnode:Node:{name}", 'add_gnode_node', (name,), attributes, []
+
+
+def _drive_entity(obj: Dict[str, Any], node_names: Dict[str, str]) -> Entity:
+    """CSI Baremetal Drive located on its node"""
+    spec = obj.get('spec', {})
+    uuid = spec.get('UUID') or obj['metadata']['name']
+    node_id = f"gnode:Drive:{uuid}"
+    attributes = _present({field: spec.get(field) for field in
+                           ('Health', 'Status', 'Path', 'Usage', 'Size', 'Type', 'SerialNumber', 'NodeId')})
+    edges = []
+    if spec.get('NodeId'):
+        # Drives name their node by CSI Baremetal node UUID
+        host = node_names.get(spec['NodeId'], spec['NodeId'])
+        attributes['NodeName'] = host
+        edges.append((node_id, f"gnode:Node:{host}", 'located_on'))
+        edges.append((f"gnode:Node:{host}", node_id, 'related_to'))
+    return node_id, 'add_gnode_drive', (uuid,), attributes, edges
+
+
+def _lvg_entity(obj: Dict[str, Any], node_names: Dict[str, str]) -> Entity:
+    """CSI Baremetal LogicalVolumeGroup containing its drives"""
+    spec = obj.get('spec', {})
+    name = obj['metadata']['name']
+    node_id = f"gnode:LVG:{name}"
+    locations = [location for location in spec.get('Locations') or [] if _is_drive_uuid(location)]
+    attributes = {'Health': spec.get('Health', 'UNKNOWN'), 'drive_uuids': locations}
+    if spec.get('Node'):
+        attributes['NodeName'] = node_names.get(spec['Node'], spec['Node'])
+    edges = [(node_id, f"gnode:Drive:{location}", 'contains') for location in locations]
+    return node_id, 'add_gnode_lvg', (name,), attributes, edges
+
+
+def _ac_entity(obj: Dict[str, Any], node_names: Dict[str, str]) -> Entity:
+    """CSI Baremetal AvailableCapacity available on its node"""
+    spec = obj.get('spec', {})
+    name = obj['metadata']['name']
+    node_id = f"gnode:AC:{name}"
+    attributes = {
+        'size': spec.get('Size', ''),
+        'storage_class': spec.get('storageClass', spec.get('StorageClass', '')),
+        'location': spec.get('Location', ''),
+    }
+    edges = []
+    if spec.get('NodeId'):
+        edges.append((node_id, f"gnode:Node:{node_names.get(spec['NodeId'], spec['NodeId'])}", 'available_on'))
+    return node_id, 'add_gnode_ac', (name,), attributes, edges
+
+
+def _volume_entity(obj: Dict[str, Any], node_names: Dict[str, str]) -> Entity:
+    """CSI Baremetal Volume bound to its drive or LVG; the PV maps to the drive"""
+    metadata, spec = obj.get('metadata', {}), obj.get('spec', {})
+    name, namespace = metadata['name'], metadata.get('namespace', 'default')
+    node_id = f"gnode:Volume:{namespace}/{name}"
+    attributes = _present({field: spec.get(field) for field in
+                           ('CSIStatus', 'Health', 'Id', 'Location', 'LocationType', 'Mode', 'NodeId',
+                            'OperationalStatus', 'Owners', 'Size', 'StorageClass', 'Type', 'Usage')})
+    edges = []
+    location = spec.get('Location')
+    if _is_drive_uuid(location):
+        edges.append((node_id, f"gnode:Drive:{location}", 'bound_to'))
+        edges.append((f"gnode:PV:{name}", f"gnode:Drive:{location}", 'maps_to'))
+    elif location:
+        edges.append((node_id, f"gnode:LVG:{location}", 'bound_to'))
+    return node_id, 'add_gnode_volume', (name, namespace), attributes, edges
+
+
+# Resource type -> mapper from an API object to its entity
+_ENTITY_MAPPERS: Dict[str, Callable[[Dict[str, Any], Dict[str, str]], Entity]] = {
+    'pod': _pod_entity,
+    'pvc': _pvc_entity,
+    'pv': _pv_entity,
+    'node': _node_entity,
+    'drive': _drive_entity,
+    'lvg': _lvg_entity,
+    'ac': _ac_entity,
+    'volume': _volume_entity,
+}
+
+
+def _object_key(obj: Dict[str, Any]) -> str:
+    """Namespace-qualified object name"""
+    metadata = obj.get('metadata', {})
+    namespace = metadata.get('namespace')
+    return f"{namespace}/{metadata['name']}" if namespace else metadata['name']
+
+
+class ResidentKnowledgeGraph:
+    """Cluster-wide Knowledge Graph bootstrapped once and kept current by watch events"""
+
+    def __init__(self, source, kinds: Iterable[str] = RESIDENT_KINDS, watch_timeout_seconds: int = 300,
+                 resync_seconds: float = 3600, retry_seconds: float = 5, graph_backend: str = 'networkx'):
+        """
+        Initialize the resident graph; nothing is listed until bootstrap() or start()
+
+        Args:
+            source: Event source providing list() and watch()
+            kinds: Resource types to mirror
+            watch_timeout_seconds: Server-side timeout of each watch request
+            resync_seconds: Relist each resource type at most this often (0 disables)
+            retry_seconds: Wait before watching again after an error or an empty watch
+            graph_backend: KnowledgeGraph storage, "networkx" or "compact"
+        """
+        self.source = source
+        self.kinds = tuple(kinds)
+        self.watch_timeout_seconds = watch_timeout_seconds
+        self.resync_seconds = resync_seconds
+        self.retry_seconds = retry_seconds
+
+        self.kg = KnowledgeGraph(backend=graph_backend)
+        self.synced = False
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+        self._resource_versions: Dict[str, Optional[str]] = {kind: None for kind in self.kinds}
+        self._listed_at: Dict[str, float] = {}
+        # Per resource type: object key -> (node ID, object resourceVersion)
+        self._objects: Dict[str, Dict[str, Tuple[Optional[str], Optional[str]]]] = {kind: {} for kind in self.kinds}
+        # Objects of the node-resolved types, kept to relink them when the CSI node map changes
+        self._resolved_objects: Dict[str, Dict[str, Dict[str, Any]]] = {kind: {} for kind in _NODE_RESOLVED_KINDS}
+        self._node_names: Dict[str, str] = {}
+
+        # Wanted edges: owner node ID -> edges, edge -> owners, node ID -> edges touching it.
+        # An edge is in the graph while it has an owner and both of its nodes exist.
+        self._owned_edges: Dict[str, Set[Tuple[str, str, str]]] = {}
+        self._edge_owners: Dict[Tuple[str, str, str], Set[str]] = {}
+        self._edges_by_node: Dict[str, Set[Tuple[str, str, str]]] = {}
+
+        self._snapshot_data: Optional[Tuple[int, bytes]] = None
+        self._frozen_snapshot: Optional[Tuple[int, KnowledgeGraph]] = None
+        self.stats = {'events_applied': 0, 'resyncs': 0, 'watch_errors': 0,
+                      'snapshot_hits': 0, 'snapshot_misses': 0}
+
+    # Lifecycle
+
+    def bootstrap(self):
+        """List every resource type and build the graph"""
+        for kind in self.kinds:
+            self.resync(kind)
+        self.synced = True
+        logger.info(f"Resident Knowledge Graph bootstrapped: {self.kg.graph.number_of_nodes()} nodes, "
+                    f"{self.kg.graph.number_of_edges()} edges")
+
+    def start(self):
+        """Bootstrap if needed and watch every resource type in background threads"""
+        if not self.synced:
+            self.bootstrap()
+        self._stop.clear()
+        for kind in self.kinds:
+            thread = threading.Thread(target=self._watch_loop, args=(kind,),
+                                      name=f"resident-kg-{kind}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 5):
+        """
+        Stop the watch threads
+
+        Args:
+            timeout: Seconds to wait for each thread; a thread blocked in a watch
+                request exits when the request returns
+        """
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _watch_loop(self, kind: str):
+        """Watch one resource type until stopped, relisting when due"""
+        while not self._stop.is_set():
+            applied = 0
+            try:
+                if self.resync_seconds and time.monotonic() - self._listed_at.get(kind, 0) >= self.resync_seconds:
+                    self.resync(kind)
+                applied = self.sync_once(kind)
+            except Exception as e:
+                self.stats['watch_errors'] += 1
+                logger.warning(f"Resident Knowledge Graph watch of {kind} failed: {e}")
+            if not applied:
+                self._stop.wait(self.retry_seconds)
+
+    # Synchronization
+
+    def resync(self, kind: str):
+        """
+        Relist one resource type, replacing its entities and resetting its resourceVersion
+
+        Args:
+            kind: Resource type
+        """
+        listing = self.source.list(kind)
+        items = listing.get('items') or []
+        with self._lock:
+            present = {_object_key(obj) for obj in items}
+            for key in [key for key in self._objects[kind] if key not in present]:
+                self._delete(kind, key)
+            for obj in items:
+                self._upsert(kind, obj)
+            self._resource_versions[kind] = (listing.get('metadata') or {}).get('resourceVersion')
+            self._listed_at[kind] = time.monotonic()
+            self.stats['resyncs'] += 1
+        logger.debug(f"Resident Knowledge Graph listed {len(items)} {kind} objects")
+
+    def sync_once(self, kind: str) -> int:
+        """
+        Run one watch request for a resource type and apply its events
+
+        Args:
+            kind: Resource type
+
+        Returns:
+            int: Number of events applied
+        """
+        applied = 0
+        for event in self.source.watch(kind, self._resource_versions[kind], self.watch_timeout_seconds):
+            if self._stop.is_set():
+                break
+            if event.get('type') == 'ERROR':
+                status = event.get('object') or {}
+                if status.get('code') == HTTP_GONE:
+                    logger.info(f"Resident Knowledge Graph resourceVersion of {kind} expired, relisting")
+                    self.resync(kind)
+                else:
+                    self.stats['watch_errors'] += 1
+                    logger.warning(f"Resident Knowledge Graph watch of {kind} returned an error: {status}")
+                break
+            self.apply_event(kind, event)
+            applied += 1
+        return applied
+
+    def apply_event(self, kind: str, event: Dict[str, Any]):
+        """
+        Apply one watch event and record its resourceVersion
+
+        Args:
+            kind: Resource type
+            event: Watch event with 'type' and 'object'
+        """
+        obj = event.get('object') or {}
+        event_type = event.get('type')
+        with self._lock:
+            if event_type in ('ADDED', 'MODIFIED'):
+                self._upsert(kind, obj)
+            elif event_type == 'DELETED':
+                self._delete(kind, _object_key(obj))
+            resource_version = (obj.get('metadata') or {}).get('resourceVersion')
+            if resource_version:
+                self._resource_versions[kind] = resource_version
+            self.stats['events_applied'] += 1
+
+    def _upsert(self, kind: str, obj: Dict[str, Any]):
+        """Add or update the entity of an object; unchanged objects are skipped"""
+        key = _object_key(obj)
+        resource_version = obj.get('metadata', {}).get('resourceVersion')
+        known = self._objects[kind].get(key)
+        if known is not None and resource_version and known[1] == resource_version:
+            return
+
+        if kind == 'csibmnode':
+            hostname = ((obj.get('spec') or {}).get('Addresses') or {}).get('Hostname')
+            uuid = (obj.get('spec') or {}).get('UUID') or obj['metadata']['name']
+            self._objects[kind][key] = (None, resource_version)
+            if hostname and self._node_names.get(uuid) != hostname:
+                self._node_names[uuid] = hostname
+                self._relink_resolved()
+            return
+
+        node_id, add_method, args, attributes, edges = _ENTITY_MAPPERS[kind](obj, self._node_names)
+        is_new = not self.kg.graph.has_node(node_id)
+        if not is_new:
+            # Attributes dropped from the object must not linger in the graph
+            current = self.kg.graph.nodes[node_id]
+            for stale in [name for name in current if name not in attributes and name not in _BASE_ATTRIBUTES]:
+                del current[stale]
+        getattr(self.kg, add_method)(*args, **attributes)
+        self._objects[kind][key] = (node_id, resource_version)
+        if kind in self._resolved_objects:
+            self._resolved_objects[kind][key] = obj
+
+        self._set_owned_edges(node_id, edges)
+        if is_new:
+            for edge in self._edges_by_node.get(node_id, ()):
+                self._materialize(edge)
+
+    def _delete(self, kind: str, key: str):
+        """Remove the entity of a deleted object; edges it owned are released"""
+        known = self._objects[kind].pop(key, None)
+        if kind in self._resolved_objects:
+            self._resolved_objects[kind].pop(key, None)
+        if known is None or known[0] is None:
+            return
+        node_id = known[0]
+        self._set_owned_edges(node_id, [])
+        # Edges other objects want to this node come back if it is re-added
+        self.kg.remove_node(node_id)
+
+    def _relink_resolved(self):
+        """Recompute the edges of objects that name their node by CSI Baremetal UUID"""
+        for kind, objects in self._resolved_objects.items():
+            for obj in objects.values():
+                node_id, _, _, attributes, edges = _ENTITY_MAPPERS[kind](obj, self._node_names)
+                if 'NodeName' in attributes:
+                    self.kg.graph.nodes[node_id]['NodeName'] = attributes['NodeName']
+                    self.kg.mark_changed()
+                self._set_owned_edges(node_id, edges)
+
+    def _set_owned_edges(self, owner: str, edges: Iterable[Tuple[str, str, str]]):
+        """Replace the edges wanted by an owner, adding and removing graph edges as needed"""
+        new_edges = set(edges)
+        old_edges = self._owned_edges.pop(owner, set())
+        for edge in old_edges - new_edges:
+            owners = self._edge_owners.get(edge)
+            owners.discard(owner)
+            if owners:
+                continue
+            del self._edge_owners[edge]
+            for node_id in edge[:2]:
+                touching = self._edges_by_node.get(node_id)
+                touching.discard(edge)
+                if not touching:
+                    del self._edges_by_node[node_id]
+            source_id, target_id, relationship = edge
+            if self.kg.graph.has_edge(source_id, target_id) and \
+                    self.kg.graph.edges[source_id, target_id].get('relationship') == relationship:
+                self.kg.remove_relationship(source_id, target_id)
+        for edge in new_edges - old_edges:
+            self._edge_owners.setdefault(edge, set()).add(owner)
+            for node_id in edge[:2]:
+                self._edges_by_node.setdefault(node_id, set()).add(edge)
+            self._materialize(edge)
+        if new_edges:
+            self._owned_edges[owner] = new_edges
+
+    def _materialize(self, edge: Tuple[str, str, str]):
+        """Add a wanted edge once both of its nodes exist"""
+        source_id, target_id, relationship = edge
+        graph = self.kg.graph
+        if graph.has_node(source_id) and graph.has_node(target_id) and \
+                graph.get_edge_data(source_id, target_id, {}).get('relationship') != relationship:
+            self.kg.add_relationship(source_id, target_id, relationship)
+
+    # Snapshots
+
+    def snapshot(self, read_only: bool = True) -> KnowledgeGraph:
+        """
+        Take a consistent snapshot of the graph
+
+        Read-only snapshots are frozen and shared by all callers until the graph
+        changes; a writable snapshot is a private copy the caller may extend.
+
+        Args:
+            read_only: Return the shared frozen snapshot instead of a private copy
+
+        Returns:
+            KnowledgeGraph: Snapshot of the resident graph
+        """
+        with self._lock:
+            version = self.kg.version
+            if self._snapshot_data is None or self._snapshot_data[0] != version:
+                self.stats['snapshot_misses'] += 1
+                self._snapshot_data = (version, dumps_snapshot(self.kg, 'none'))
+            else:
+                self.stats['snapshot_hits'] += 1
+            data = self._snapshot_data[1]
+            if not read_only:
+                return loads_snapshot(data)
+            if self._frozen_snapshot is None or self._frozen_snapshot[0] != version:
+                frozen = loads_snapshot(data)
+                frozen.freeze()
+                self._frozen_snapshot = (version, frozen)
+            return self._frozen_snapshot[1]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get synchronization statistics
+
+        Returns:
+            Dict[str, Any]: Event, resync and snapshot counters, graph size and version,
+                and the tracked resourceVersion of each resource type
+        """
+        with self._lock:
+            lookups = self.stats['snapshot_hits'] + self.stats['snapshot_misses']
+            return {
+                **self.stats,
+                'snapshot_hit_rate': self.stats['snapshot_hits'] / lookups if lookups else 0.0,
+                'synced': self.synced,
+                'version': self.kg.version,
+                'nodes': self.kg.graph.number_of_nodes(),
+                'edges': self.kg.graph.number_of_edges(),
+                'resource_versions': dict(self._resource_versions),
+            }
+
+
+class KubernetesWatchSource:
+    """Event source listing and watching resources through the shared Kubernetes API client"""
+
+    def __init__(self, backend: KubernetesAPIBackend):
+        """
+        Initialize the source
+
+        Args:
+            backend: Kubernetes API backend whose clients are reused
+        """
+        self.backend = backend
+
+    def _list_call(self, kind: str) -> Tuple[Callable, Tuple]:
+        """Cluster-wide list function and arguments of a resource type"""
+        spec = resolve_resource(kind)
+        if spec.api == 'custom':
+            group, version = spec.api_version.split('/', 1)
+            return self.backend.custom_objects.list_cluster_custom_object, (group, version, spec.plural)
+        if spec.namespaced:
+            return getattr(self.backend.core_v1, f"list_{spec.method[len('namespaced_'):]}_for_all_namespaces"), ()
+        return getattr(self.backend.core_v1, f"list_{spec.method}"), ()
+
+    def list(self, kind: str) -> Dict[str, Any]:
+        """List all objects of a resource type as a plain list object"""
+        method, args = self._list_call(kind)
+        kwargs = {'_request_timeout': self.backend.request_timeout}
+        if resolve_resource(kind).api == 'custom':
+            return method(*args, **kwargs)
+        # Typed APIs: ask for the raw JSON to skip model deserialization
+        return json.loads(method(*args, _preload_content=False, **kwargs).data)
+
+    def watch(self, kind: str, resource_version: Optional[str], timeout_seconds: int) -> Iterable[Dict[str, Any]]:
+        """Watch a resource type from a resourceVersion, yielding plain watch events"""
+        from kubernetes import watch
+
+        method, args = self._list_call(kind)
+        try:
+            for event in watch.Watch().stream(method, *args, resource_version=resource_version,
+                                              timeout_seconds=timeout_seconds, allow_watch_bookmarks=True):
+                yield {'type': event['type'], 'object': event['raw_object']}
+        except self.backend._api_exception as e:
+            if e.status != HTTP_GONE:
+                raise
+            yield {'type': 'ERROR', 'object': {'kind': 'Status', 'code': HTTP_GONE, 'reason': 'Expired'}}
+
+
+class RecordedEventSource:
+    """
+    Event source replaying a recorded cluster: one list object and an event stream per resource type
+
+    A watch returns the recorded events newer than the requested resourceVersion;
+    resourceVersions are compared as integers. A recorded ERROR event is returned
+    once, so a replayed 410 Gone exercises the relist path.
+    """
+
+    def __init__(self, lists: Dict[str, Dict[str, Any]] = None, events: Dict[str, List[Dict[str, Any]]] = None):
+        """
+        Initialize the source
+
+        Args:
+            lists: Resource type -> list object returned by list()
+            events: Resource type -> watch events, in order
+        """
+        self.lists = lists or {}
+        self.events = events or {}
+        self.calls = {'list': 0, 'watch': 0}
+
+    @classmethod
+    def from_file(cls, path: str) -> 'RecordedEventSource':
+        """
+        Load a recording saved as JSON ({"lists": {...}, "events": {...}})
+
+        Args:
+            path: Recording file path
+
+        Returns:
+            RecordedEventSource: Source replaying the recording
+        """
+        with open(path) as f:
+            recording = json.load(f)
+        return cls(recording.get('lists'), recording.get('events'))
+
+    def list(self, kind: str) -> Dict[str, Any]:
+        """Return the recorded list object of a resource type"""
+        self.calls['list'] += 1
+        return self.lists.get(kind, {'metadata': {'resourceVersion': '0'}, 'items': []})
+
+    def watch(self, kind: str, resource_version: Optional[str], timeout_seconds: int) -> Iterable[Dict[str, Any]]:
+        """Return the recorded events after a resourceVersion"""
+        self.calls['watch'] += 1
+        since = int(resource_version or 0)
+        events = self.events.get(kind, [])
+        for event in list(events):
+            if event.get('type') == 'ERROR':
+                events.remove(event)
+                yield event
+                return
+            if int(event['object']['metadata'].get('resourceVersion', 0)) > since:
+                yield event
+
+
+def initialize_resident_graph(config_data: Dict[str, Any] = None) -> Optional[ResidentKnowledgeGraph]:
+    """
+    Initialize and start the global resident Knowledge Graph when enabled
+
+    The `troubleshoot.resident_knowledge_graph.enabled` setting turns the service
+    on; it needs the Kubernetes API backend.
+
+    Args:
+        config_data: Configuration data from config.yaml
+
+    Returns:
+        Optional[ResidentKnowledgeGraph]: The running service, or None if disabled or unavailable
+    """
+    global _resident_graph
+
+    settings = ((config_data or {}).get('troubleshoot', {}) or {}).get('resident_knowledge_graph', {}) or {}
+    if not settings.get('enabled', False):
+        return None
+
+    with _resident_graph_lock:
+        if _resident_graph is not None:
+            return _resident_graph
+
+        backend = get_kubernetes_backend()
+        if not isinstance(backend, KubernetesAPIBackend):
+            logger.warning("Resident Knowledge Graph needs the Kubernetes API backend; not started")
+            return None
+
+        service = ResidentKnowledgeGraph(
+            KubernetesWatchSource(backend),
+            watch_timeout_seconds=settings.get('watch_timeout_seconds', 300),
+            resync_seconds=settings.get('resync_seconds', 3600),
+            retry_seconds=settings.get('retry_seconds', 5),
+            graph_backend=settings.get('graph_backend', 'networkx'))
+        try:
+            service.start()
+        except Exception as e:
+            logger.warning(f"Resident Knowledge Graph bootstrap failed: {e}")
+            service.stop()
+            return None
+        _resident_graph = service
+        return _resident_graph
+
+
+def get_resident_graph() -> Optional[ResidentKnowledgeGraph]:
+    """
+    Get the global resident Knowledge Graph
+
+    Returns:
+        Optional[ResidentKnowledgeGraph]: The running service, or None if not started
+    """
+    return _resident_graph
+
+
+def close_resident_graph():
+    """Stop the global resident Knowledge Graph and reset it"""
+    global _resident_graph
+
+    with _resident_graph_lock:
+        if _resident_graph is not None:
+            _resident_graph.stop()
+            _resident_graph = None
@@ -0,0 +1,72 @@
+"""
+Structured Output Loading
+
+Fast parsing for machine-consumed kubectl output. JSON is parsed with orjson
+when it is installed and with the standard library otherwise; YAML, when it
+cannot be avoided, is parsed with PyYAML's libyaml-backed CSafeLoader.
+"""
+
+import json
+import logging
+from typing import Any, Dict
+
+import yaml
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    JSON_BACKEND = 'orjson'
+except ImportError:  # pragma: no cover - depends on the environment
+    _json_loads = json.loads
+    JSON_BACKEND = 'json'
+
+# libyaml is optional in PyYAML builds; SafeLoader is the pure-Python fallback
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Output formats the collector can request for machine-parsed kubectl output
+OUTPUT_FORMATS = ('json', 'yaml')
+DEFAULT_OUTPUT_FORMAT = 'json'
+
+
+def is_json_output(output: str) -> bool:
+    """Check whether tool output is a JSON document rather than YAML"""
+    return isinstance(output, str) and output.lstrip()[:1] in ('{', '[')
+
+
+def load_structured(output: str) -> Any:
+    """
+    Parse kubectl JSON or YAML output
+
+    Args:
+        output: Raw tool output
+
+    Returns:
+        Any: Parsed document, or None for empty output
+    """
+    if not output:
+        return None
+    if is_json_output(output):
+        try:
+            return _json_loads(output)
+        except ValueError:
+            # A YAML flow sequence/mapping that is not valid JSON
+            pass
+    return yaml.load(output, Loader=YAML_LOADER)
+
+
+def get_output_format(config_data: Dict[str, Any] = None) -> str:
+    """
+    Get the output format the collector requests for machine-parsed kubectl output
+
+    Args:
+        config_data: Configuration data from config.yaml
+
+    Returns:
+        str: 'json' or 'yaml'
+    """
+    troubleshoot_config = (config_data or {}).get('troubleshoot', {}) or {}
+    output_format = str(troubleshoot_config.get('collection_output_format', DEFAULT_OUTPUT_FORMAT)).lower()
+    if output_format not in OUTPUT_FORMATS:
+        logging.warning(f"Unsupported collection_output_format '{output_format}', using {DEFAULT_OUTPUT_FORMAT}")
+        output_format = DEFAULT_OUTPUT_FORMAT
+    return output_format
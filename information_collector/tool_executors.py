@@ -4,11 +4,12 @@ Tool Executors
 Contains methods for executing different categories of diagnostic tools.
 """
 
-import yaml
 import string
 import logging
+import threading
 from typing import Dict, List, Any
 from .base import InformationCollectorBase
+from tools.core.log_classifier import get_log_classifier
 
 # Import LangGraph tools
 from tools import (
@@ -18,12 +19,22 @@ from tools import (
     df_command, lsblk_command, dmesg_command, journalctl_command
 )
 
+# Services whose journal entries are collected per node
+CSI_SERVICES = ['csi-baremetal-node', 'csi-baremetal-controller', 'kubelet']
+
+# Journal lines fetched per service unit
+SERVICE_LOG_LINES = 50
+
 
 class ToolExecutors(InformationCollectorBase):
     """Tool execution methods for different diagnostic categories"""
     
     async def _execute_pod_discovery_tools(self, target_pod: str, target_namespace: str):
         """Execute pod discovery tools"""
+        self._collect_pod_discovery_data(target_pod, target_namespace)
+    
+    def _collect_pod_discovery_data(self, target_pod: str, target_namespace: str):
+        """Collect target pod details, description and logs"""
         logging.info(f"Executing pod discovery tools for {target_namespace}/{target_pod}")
         
         # Get pod information
@@ -32,7 +43,7 @@ class ToolExecutors(InformationCollectorBase):
                 'resource_type': 'pod',
                 'resource_name': target_pod,
                 'namespace': target_namespace,
-                'output_format': 'yaml'
+                'output_format': self.output_format
             },
             'kubectl_get_pod', 'Get target pod details'
         )
@@ -62,6 +73,10 @@ class ToolExecutors(InformationCollectorBase):
     
     async def _execute_volume_chain_tools(self, volume_chain: Dict[str, List[str]], target_volume_path: str = 'default'):
         """Execute volume chain discovery tools"""
+        self._collect_volume_chain_data(volume_chain, target_volume_path)
+    
+    def _collect_volume_chain_data(self, volume_chain: Dict[str, List[str]], target_volume_path: str = 'default'):
+        """Collect get/describe output for each resource in the volume chain"""
         logging.info("Executing volume chain discovery tools")
 
         # Initialize describe data container if not exists
@@ -76,7 +91,7 @@ class ToolExecutors(InformationCollectorBase):
                     'resource_type': 'pod',
                     'resource_name': pod_name,
                     'namespace': pod_namespace,
-                    'output_format': 'yaml'
+                    'output_format': self.output_format
                 },
                 'kubectl_get_pods', 'Get pod information'
             )
@@ -102,7 +117,7 @@ class ToolExecutors(InformationCollectorBase):
                     'resource_type': 'pvc',
                     'resource_name': pvc_name,
                     'namespace': pvc_namespace,
-                    'output_format': 'yaml'
+                    'output_format': self.output_format
                 },
                 'kubectl_get_pvcs', 'Get PVC information'
             )
@@ -128,7 +143,7 @@ class ToolExecutors(InformationCollectorBase):
                     'resource_type': 'pv',
                     'resource_name': pv_name,
                     'namespace': target_volume_path,
-                    'output_format': 'yaml'
+                    'output_format': self.output_format
                 },
                 'kubectl_get_pvs', 'Get PV information'
             )
@@ -153,7 +168,7 @@ class ToolExecutors(InformationCollectorBase):
                     'resource_type': 'volume',
                     'resource_name': volume_name,
                     'namespace': target_volume_path,
-                    'output_format': 'yaml'
+                    'output_format': self.output_format
                 },
                 'kubectl_get_volume', 'Get volume information'
             )
@@ -179,7 +194,7 @@ class ToolExecutors(InformationCollectorBase):
                     'resource_type': 'lvg',
                     'resource_name': lvg_name,
                     'namespace': target_volume_path,
-                    'output_format': 'yaml'
+                    'output_format': self.output_format
                 },
                 'kubectl_get_lvg', 'Get LVG information'
             )
@@ -204,7 +219,7 @@ class ToolExecutors(InformationCollectorBase):
                 kubectl_get, {
                     'resource_type': 'drive',
                     'resource_name': drive_name,
-                    'output_format': 'yaml'
+                    'output_format': self.output_format
                 },
                 'kubectl_get_drive', 'Get drive information'
             )
@@ -228,7 +243,7 @@ class ToolExecutors(InformationCollectorBase):
                 kubectl_get, {
                     'resource_type': 'node',
                     'resource_name': node_name,
-                    'output_format': 'yaml'
+                    'output_format': 'yaml'  # node names are extracted line by line
                 },
                 'kubectl_get_node', 'Get node information'
             )
@@ -252,7 +267,7 @@ class ToolExecutors(InformationCollectorBase):
                 kubectl_get, {
                     'resource_type': 'StorageClass',
                     'resource_name': sc_name,
-                    'output_format': 'yaml'
+                    'output_format': self.output_format
                 },
                 'kubectl_get_StorageClass', 'Get StorageClass information'
             )
@@ -270,12 +285,16 @@ class ToolExecutors(InformationCollectorBase):
     
     async def _execute_csi_baremetal_tools(self, drives: List[str]):
         """Execute CSI Baremetal discovery tools"""
+        self._collect_csi_baremetal_data()
+    
+    def _collect_csi_baremetal_data(self):
+        """List all CSI Baremetal drives, nodes, capacities, LVGs and volumes"""
         logging.info("Executing CSI Baremetal discovery tools")
         
         # Get drives
         drives_output = self._execute_tool_with_validation(
             kubectl_get_drive, {
-                'output_format': 'yaml'
+                'output_format': self.output_format
             },
             'kubectl_get_drive', 'Get CSI Baremetal drive status and health'
         )
@@ -284,7 +303,7 @@ class ToolExecutors(InformationCollectorBase):
         # Get CSI Baremetal nodes
         csibm_nodes_output = self._execute_tool_with_validation(
             kubectl_get_csibmnode, {
-                'output_format': 'yaml'
+                'output_format': self.output_format
             },
             'kubectl_get_csibmnode', 'Get CSI Baremetal node mapping'
         )
@@ -293,7 +312,7 @@ class ToolExecutors(InformationCollectorBase):
         # Get available capacity
         ac_output = self._execute_tool_with_validation(
             kubectl_get_availablecapacity, {
-                'output_format': 'yaml'
+                'output_format': self.output_format
             },
             'kubectl_get_availablecapacity', 'Get available capacity information'
         )
@@ -302,7 +321,7 @@ class ToolExecutors(InformationCollectorBase):
         # Get logical volume groups
         lvg_output = self._execute_tool_with_validation(
             kubectl_get_logicalvolumegroup, {
-                'output_format': 'yaml'
+                'output_format': self.output_format
             },
             'kubectl_get_logicalvolumegroup', 'Get LVG health and drive associations'
         )
@@ -312,7 +331,7 @@ class ToolExecutors(InformationCollectorBase):
         volumes_output = self._execute_tool_with_validation(
             kubectl_get, {
                 'resource_type': 'volume',
-                'output_format': 'yaml'
+                'output_format': self.output_format
             },
             'kubectl_get_volumes', 'Get CSI Baremetal volume information with location mapping'
         )
@@ -322,87 +341,156 @@ class ToolExecutors(InformationCollectorBase):
         """Execute node and system discovery tools"""
         logging.info("Executing node and system discovery tools")
         
-        # Get nodes
+        self._collect_cluster_nodes()
+        
+        # Execute system commands on each node in the list
+        for node_name in nodes:
+            self._collect_node_system_data(node_name)
+    
+    def _collect_cluster_nodes(self):
+        """Collect the Kubernetes node listing"""
         nodes_output = self._execute_tool_with_validation(
             kubectl_get, {
                 'resource_type': 'node',
-                'output_format': 'yaml'
+                'output_format': 'yaml'  # node names are extracted line by line
             },
             'kubectl_get_nodes', 'Get node status and health'
         )
         self.collected_data['kubernetes']['nodes'] = nodes_output
+    
+    def _collect_node_system_data(self, node_name: str):
+        """Collect disk usage, block devices, kernel and journal logs from one node"""
+        logging.info(f"Executing system tools on node: {node_name}")
+        node_key = node_name.replace('.', '_').replace('-', '_')
         
-        # Execute system commands on each node in the list
-        for node_name in nodes:
-            logging.info(f"Executing system tools on node: {node_name}")
-            node_key = node_name.replace('.', '_').replace('-', '_')
-            
-            # Initialize node-specific data structure if not exists
-            if 'system' not in self.collected_data:
-                self.collected_data['system'] = {}
-            if node_key not in self.collected_data['system']:
-                self.collected_data['system'][node_key] = {}
+        # Initialize node-specific data structure if not exists
+        # (setdefault keeps this safe when nodes are collected concurrently)
+        self.collected_data.setdefault('system', {}).setdefault(node_key, {})
+        
+        # Get disk usage
+        df_output = self._execute_tool_with_validation(
+            df_command, {
+                'node_name': node_name,
+                'options': '-h'
+            },
+            f'df_command_{node_key}', f'Check disk space usage on {node_name}'
+        )
+        self.collected_data['system'][node_key]['disk_usage'] = df_output
+        
+        # Get block devices
+        lsblk_output = self._execute_tool_with_validation(
+            lsblk_command, {
+                'node_name': node_name,
+                'options': ''
+            },
+            f'lsblk_command_{node_key}', f'List block devices and mount points on {node_name}'
+        )
+        self.collected_data['system'][node_key]['block_devices'] = lsblk_output
+        
+        # Kernel and journal logs are fetched and scanned once per node, then filtered locally
+        node_logs = self._fetch_node_logs(node_name)
+        journal_lines = node_logs['journal_lines']
+        
+        # Enhanced kernel logs with comprehensive storage keywords
+        self.collected_data['system'][node_key]['kernel_logs'] = (
+            node_logs['dmesg_error'] or '\n'.join(node_logs['dmesg_scan'].matching_lines('storage', tail=50)))
+        
+        # Storage-related entries among the most recent journal entries
+        self.collected_data['system'][node_key]['journal_storage_logs'] = (
+            node_logs['journal_error'] or '\n'.join(get_log_classifier().matching_lines(journal_lines[-100:], 'storage')))
+        
+        # Kubelet service logs for volume issues
+        self.collected_data['system'][node_key]['journal_kubelet_logs'] = self._fetch_service_logs(node_name, 'kubelet')
+        
+        # Boot-time logs for hardware detection issues
+        self.collected_data['system'][node_key]['journal_boot_logs'] = (
+            node_logs['journal_error'] or '\n'.join(node_logs['journal_scan'].matching_lines('storage', tail=30)))
+    
+    def _fetch_node_logs(self, node_name: str) -> Dict[str, Any]:
+        """
+        Fetch the kernel ring buffer and current-boot journal of a node once per run
+        
+        Both fetches are bounded to the last node_log_max_lines lines. Concurrent
+        callers for the same node wait for the first fetch instead of repeating it.
+        
+        Args:
+            node_name: Node hostname or IP
             
-            # Get disk usage
-            df_output = self._execute_tool_with_validation(
-                df_command, {
-                    'node_name': node_name,
-                    'options': '-h'
-                },
-                f'df_command_{node_key}', f'Check disk space usage on {node_name}'
-            )
-            self.collected_data['system'][node_key]['disk_usage'] = df_output
+        Returns:
+            Dict[str, Any]: dmesg_lines/journal_lines, their keyword scans dmesg_scan/journal_scan,
+                plus dmesg_error/journal_error holding the tool output when a fetch failed (None otherwise)
+        """
+        with self._node_log_lock:
+            node_lock = self._node_log_locks.setdefault(node_name, threading.Lock())
+        
+        with node_lock:
+            if node_name in self._node_log_cache:
+                return self._node_log_cache[node_name]
             
-            # Get block devices
-            lsblk_output = self._execute_tool_with_validation(
-                lsblk_command, {
-                    'node_name': node_name,
-                    'options': ''
-                },
-                f'lsblk_command_{node_key}', f'List block devices and mount points on {node_name}'
-            )
-            self.collected_data['system'][node_key]['block_devices'] = lsblk_output
+            node_key = node_name.replace('.', '_').replace('-', '_')
+            max_lines = self.node_log_max_lines
             
-            # Enhanced kernel logs with comprehensive storage keywords
-            storage_keywords = "disk|drive|nvme|ssd|hdd|scsi|sata|xfs|ext4|mount|error|fail|i/o|io|sector|slot|bay|controller|csi|volume"
             dmesg_output = self._execute_tool_with_validation(
                 dmesg_command, {
                     'node_name': node_name,
-                    'options': f'| grep -iE "({storage_keywords})" | tail -50'
+                    'options': f'| tail -n {max_lines}'
                 },
-                f'dmesg_command_{node_key}', f'Check kernel logs for storage-related issues on {node_name}'
+                f'dmesg_command_{node_key}', f'Fetch recent kernel logs on {node_name}'
             )
-            self.collected_data['system'][node_key]['kernel_logs'] = dmesg_output
-            
-            # Get systemd journal logs for storage services
-            journal_storage_output = self._execute_tool_with_validation(
+            journal_output = self._execute_tool_with_validation(
                 journalctl_command, {
                     'node_name': node_name,
-                    'options': f'-n 100 --no-pager | grep -iE "({storage_keywords})"'
+                    'options': f'-b -n {max_lines} --no-pager'
                 },
-                f'journalctl_storage_{node_key}', f'Collect storage-related journal logs on {node_name}'
+                f'journalctl_{node_key}', f'Fetch recent journal logs on {node_name}'
             )
-            self.collected_data['system'][node_key]['journal_storage_logs'] = journal_storage_output
             
-            # Get kubelet service logs for volume issues
-            journal_kubelet_output = self._execute_tool_with_validation(
-                journalctl_command, {
-                    'node_name': node_name,
-                    'options': '-u kubelet -n 50 --no-pager'
-                },
-                f'journalctl_kubelet_{node_key}', f'Collect kubelet logs on {node_name}'
-            )
-            self.collected_data['system'][node_key]['journal_kubelet_logs'] = journal_kubelet_output
+            node_logs = {
+                'dmesg_lines': [] if self._is_failed_output(dmesg_output) else dmesg_output.splitlines(),
+                'journal_lines': [] if self._is_failed_output(journal_output) else journal_output.splitlines(),
+                'dmesg_error': dmesg_output if self._is_failed_output(dmesg_output) else None,
+                'journal_error': journal_output if self._is_failed_output(journal_output) else None
+            }
+            # One pass of the shared classifier serves every bucket built from these logs
+            log_classifier = get_log_classifier()
+            node_logs['dmesg_scan'] = log_classifier.scan(node_logs['dmesg_lines'])
+            node_logs['journal_scan'] = log_classifier.scan(node_logs['journal_lines'])
+            self._node_log_cache[node_name] = node_logs
+            return node_logs
+    
+    def _fetch_service_logs(self, node_name: str, service: str) -> str:
+        """
+        Fetch the last journal lines of a systemd unit on a node once per run
+        
+        Unlike the shared journal tail, `journalctl -u` returns the unit's own
+        last lines however chatty the rest of the node is.
+        
+        Args:
+            node_name: Node hostname or IP
+            service: systemd unit name (e.g. kubelet)
             
-            # Get recent boot logs for hardware detection issues
-            journal_boot_output = self._execute_tool_with_validation(
-                journalctl_command, {
-                    'node_name': node_name,
-                    'options': f'-b --no-pager | grep -iE "({storage_keywords})" | tail -30'
-                },
-                f'journalctl_boot_{node_key}', f'Collect boot-time logs on {node_name}'
-            )
-            self.collected_data['system'][node_key]['journal_boot_logs'] = journal_boot_output
+        Returns:
+            str: Tool output of `journalctl -u <service> -n SERVICE_LOG_LINES`
+        """
+        with self._node_log_lock:
+            node_lock = self._node_log_locks.setdefault(node_name, threading.Lock())
+        
+        with node_lock:
+            cache_key = (node_name, service)
+            if cache_key not in self._node_log_cache:
+                node_key = node_name.replace('.', '_').replace('-', '_')
+                self._node_log_cache[cache_key] = self._execute_tool_with_validation(
+                    journalctl_command, {
+                        'node_name': node_name,
+                        'options': f'-u {service} -n {SERVICE_LOG_LINES} --no-pager'
+                    },
+                    f'journalctl_{service}_{node_key}', f'Collect {service} service logs on {node_name}'
+                )
+            return self._node_log_cache[cache_key]
+    
+    def _is_failed_output(self, output: str) -> bool:
+        """Check whether a tool output is an error report rather than command output"""
+        return output.startswith(("Error", "SSH execution failed", "SSH setup error", "Tool execution denied"))
     
     async def _execute_smart_data_tools(self, drives: List[str]):
         """Execute SMART data collection tools for drive health monitoring"""
@@ -410,23 +498,27 @@ class ToolExecutors(InformationCollectorBase):
         
         # Get SMART data for all drives
         for drive_uuid in drives:
-            # Get drive path and node info from CSI Baremetal drive info
-            drive_info = self._get_drive_info_from_uuid(drive_uuid)
-            if drive_info and drive_info.get('path'):
-                node_name = drive_info.get('node')
-                drive_path = drive_info.get('path')
-                
-                smart_output = self._execute_tool_with_validation(
-                    self._execute_smartctl_command, {
-                        'device_path': drive_path,
-                        'options': '-a',
-                        'node_name': node_name
-                    },
-                    f'smartctl_{drive_uuid}', f'Collect SMART data for drive {drive_uuid} on node {node_name}'
-                )
-                if 'smart_data' not in self.collected_data:
-                    self.collected_data['smart_data'] = {}
-                self.collected_data['smart_data'][drive_uuid] = smart_output
+            self._collect_smart_data(drive_uuid)
+    
+    def _collect_smart_data(self, drive_uuid: str):
+        """Collect SMART data for one drive on its node"""
+        # Get drive path and node info from CSI Baremetal drive info
+        drive_info = self._get_drive_info_from_uuid(drive_uuid)
+        if drive_info and drive_info.get('path'):
+            node_name = drive_info.get('node')
+            drive_path = drive_info.get('path')
+            
+            smart_output = self._execute_tool_with_validation(
+                self._execute_smartctl_command, {
+                    'device_path': drive_path,
+                    'options': '-a',
+                    'node_name': node_name
+                },
+                f'smartctl_{drive_uuid}', f'Collect SMART data for drive {drive_uuid} on node {node_name}'
+            )
+            if 'smart_data' not in self.collected_data:
+                self.collected_data['smart_data'] = {}
+            self.collected_data['smart_data'][drive_uuid] = smart_output
     
     def _get_drive_info_from_uuid(self, drive_uuid: str) -> Dict[str, str]:
         """Extract drive information from CSI Baremetal drive information
@@ -440,25 +532,10 @@ class ToolExecutors(InformationCollectorBase):
         drive_info = {'path': None, 'node': None, 'serial': None}
         drives_output = self.collected_data.get('csi_baremetal', {}).get('drives', '')
         
-        if drives_output and drive_uuid in drives_output:
+        if drives_output:
             try:
-                # Parse the YAML output
-                drives_data = yaml.safe_load(drives_output)
-                
-                # Find the drive with matching UUID
-                target_drive = None
-                if isinstance(drives_data, dict) and 'items' in drives_data and isinstance(drives_data['items'], list):
-                    # List of drives case
-                    for drive in drives_data['items']:
-                        if drive.get('metadata', {}).get('name') == drive_uuid:
-                            target_drive = drive
-                            break
-                elif isinstance(drives_data, list):
-                    # Direct list of drives
-                    for drive in drives_data:
-                        if drive.get('metadata', {}).get('name') == drive_uuid:
-                            target_drive = drive
-                            break
+                # Look up the drive in the parsed cluster snapshot
+                target_drive = self.cluster_snapshot.get('drives', drive_uuid)
                 
                 if target_drive:
                     # Extract drive information from the spec
@@ -529,58 +606,28 @@ class ToolExecutors(InformationCollectorBase):
         """Execute enhanced log analysis tools for comprehensive storage issue detection"""
         logging.info("Executing enhanced log analysis tools")
         
-        # Enhanced dmesg analysis with more specific patterns
-        enhanced_dmesg_patterns = [
-            "nvme.*error",
-            "ssd.*fail",
-            "disk.*timeout",
-            "scsi.*error",
-            "ata.*error",
-            "bad.*sector",
-            "i/o.*error",
-            "filesystem.*error",
-            "mount.*fail",
-            "csi.*error"
-        ]
-        
         # Execute enhanced log analysis on each node
         for node_name in nodes:
-            logging.info(f"Executing enhanced log analysis on node: {node_name}")
-            node_key = node_name.replace('.', '_').replace('-', '_')
-            
-            # Initialize node-specific data structure if not exists
-            if 'enhanced_logs' not in self.collected_data:
-                self.collected_data['enhanced_logs'] = {}
-            if node_key not in self.collected_data['enhanced_logs']:
-                self.collected_data['enhanced_logs'][node_key] = {}
-            
-            # Process each dmesg pattern
-            for pattern in enhanced_dmesg_patterns:
-                pattern_key = pattern.replace(".*", "_")
-                dmesg_output = self._execute_tool_with_validation(
-                    dmesg_command, {
-                        'node_name': node_name,
-                        'options': f'| grep -iE "{pattern}" | tail -20'
-                    },
-                    f'dmesg_{pattern_key}_{node_key}', f'Check kernel logs for {pattern} issues on {node_name}'
-                )
-                self.collected_data['enhanced_logs'][node_key][f'dmesg_{pattern_key}'] = dmesg_output
-            
-            # Enhanced journal analysis for CSI and storage services
-            csi_services = ['csi-baremetal-node', 'csi-baremetal-controller', 'kubelet']
-            
-            # Initialize service_logs if not exists
-            if 'service_logs' not in self.collected_data:
-                self.collected_data['service_logs'] = {}
-            if node_key not in self.collected_data['service_logs']:
-                self.collected_data['service_logs'][node_key] = {}
-            
-            for service in csi_services:
-                journal_output = self._execute_tool_with_validation(
-                    journalctl_command, {
-                        'node_name': node_name,
-                        'options': f'-u {service} -n 50 --no-pager'
-                    },
-                    f'journalctl_{service}_{node_key}', f'Collect {service} service logs on {node_name}'
-                )
-                self.collected_data['service_logs'][node_key][service] = journal_output
+            self._collect_node_enhanced_logs(node_name)
+    
+    def _collect_node_enhanced_logs(self, node_name: str):
+        """Bucket the node's kernel logs by issue pattern and collect each CSI service's journal"""
+        logging.info(f"Executing enhanced log analysis on node: {node_name}")
+        node_key = node_name.replace('.', '_').replace('-', '_')
+        node_logs = self._fetch_node_logs(node_name)
+        
+        # Initialize node-specific data structure if not exists
+        self.collected_data.setdefault('enhanced_logs', {}).setdefault(node_key, {})
+        
+        # Classify kernel logs into one bucket per pattern (nvme.*error, bad.*sector, ...)
+        pattern_buckets = node_logs['dmesg_scan'].buckets('dmesg_patterns', tail=20)
+        for pattern_key, lines in pattern_buckets.items():
+            self.collected_data['enhanced_logs'][node_key][f'dmesg_{pattern_key}'] = (
+                node_logs['dmesg_error'] or '\n'.join(lines))
+        
+        # Initialize service_logs if not exists
+        self.collected_data.setdefault('service_logs', {}).setdefault(node_key, {})
+        
+        # Enhanced journal analysis for CSI and storage services
+        for service in CSI_SERVICES:
+            self.collected_data['service_logs'][node_key][service] = self._fetch_service_logs(node_name, service)
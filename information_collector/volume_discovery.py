@@ -4,11 +4,11 @@ Volume Dependency Discovery
 Handles discovery of volume dependency chains starting from target pods.
 """
 
-import yaml
 import logging
 import time
 from typing import Dict, List, Any
 from .base import InformationCollectorBase
+from .structured_output import load_structured
 
 # Import LangGraph tools
 from tools import kubectl_get
@@ -50,7 +50,7 @@ class VolumeDiscovery(InformationCollectorBase):
                         'resource_type': 'pod',
                         'resource_name': target_pod,
                         'namespace': target_namespace,
-                        'output_format': 'yaml'
+                        'output_format': self.output_format
                     },
                     'kubectl_get_pod', f'Get details for target pod {target_pod}'
                 )
@@ -58,8 +58,8 @@ class VolumeDiscovery(InformationCollectorBase):
                 # Parse pod output to find PVCs using yaml package
                 if pod_output and not pod_output.startswith("Error:"):
                     try:
-                        # Parse the YAML output
-                        pod_data = yaml.safe_load(pod_output)
+                        # Parse the JSON/YAML output
+                        pod_data = load_structured(pod_output)
                         
                         # Extract PVC names from pod spec
                         if pod_data:
@@ -97,15 +97,15 @@ class VolumeDiscovery(InformationCollectorBase):
                             'resource_type': 'pvc',
                             'resource_name': pvc_name,
                             'namespace': target_namespace,
-                            'output_format': 'yaml'
+                            'output_format': self.output_format
                         },
                         'kubectl_get_pvc', f'Get PVC details for {pvc_name}'
                     )
                     
                     if pvc_output and not pvc_output.startswith("Error:"):
                         try:
-                            # Parse the YAML output
-                            pvc_data = yaml.safe_load(pvc_output)
+                            # Parse the JSON/YAML output
+                            pvc_data = load_structured(pvc_output)
                             
                             if pvc_data:
                                 # Extract PV name
@@ -139,15 +139,15 @@ class VolumeDiscovery(InformationCollectorBase):
                         kubectl_get, {
                             'resource_type': 'pv',
                             'resource_name': pv_name,
-                            'output_format': 'yaml'
+                            'output_format': self.output_format
                         },
                         'kubectl_get_pv', f'Get PV details for {pv_name}'
                     )
 
                     if pv_output and not pv_output.startswith("Error:"):
                         try:
-                            # Parse the YAML output
-                            pv_data = yaml.safe_load(pv_output)
+                            # Parse the JSON/YAML output
+                            pv_data = load_structured(pv_output)
                             
                             if pv_data:
                                 # Extract node affinity
@@ -188,15 +188,15 @@ class VolumeDiscovery(InformationCollectorBase):
                             'resource_type': 'volume',
                             'namespace': target_namespace,
                             'resource_name': pv_name,
-                            'output_format': 'yaml'
+                            'output_format': self.output_format
                         },
                         'kubectl_get_volume', f'Get Volume details for {pv_name}'
                     )
                     
                     if vol_output and not vol_output.startswith("error:") and not vol_output.startswith("Error:"):
                         try:
-                            # Parse the YAML output
-                            vol_data = yaml.safe_load(vol_output)
+                            # Parse the JSON/YAML output
+                            vol_data = load_structured(vol_output)
                             
                             if vol_data:
                                 # Handle both direct object and list of items
@@ -248,14 +248,14 @@ class VolumeDiscovery(InformationCollectorBase):
                                     'resource_type': 'lvg',
                                     'namespace': target_namespace,
                                     'resource_name': lvg_name,
-                                    'output_format': 'yaml'
+                                    'output_format': self.output_format
                                 },
                                 'kubectl_get_lvg', f'Get LVG details for {lvg_name}'
                             )
                             if lvg_output and not lvg_output.startswith("Error:"):
                                 try:
-                                    # Parse the YAML output
-                                    lvg_data = yaml.safe_load(lvg_output)
+                                    # Parse the JSON/YAML output
+                                    lvg_data = load_structured(lvg_output)
                                     
                                     if lvg_data:
                                         # Handle both direct object and list of items
@@ -7,5 +7,6 @@ and fix plan generation in the CSI Baremetal driver troubleshooting system.
 """
 
 from .knowledge_graph import KnowledgeGraph
+from .snapshot import save_snapshot, load_snapshot, read_snapshot_info
 
-__all__ = ['KnowledgeGraph']
+__all__ = ['KnowledgeGraph', 'save_snapshot', 'load_snapshot', 'read_snapshot_info']
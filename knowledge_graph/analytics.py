@@ -0,0 +1,217 @@
+"""
+Sparse-Matrix Knowledge Graph Analytics
+
+Exports the Pod -> PVC -> PV -> Drive -> Node storage chain of a KnowledgeGraph
+as integer-indexed SciPy sparse matrices and computes the fan-out patterns with
+vectorized operations, for fleet-wide graphs that cover the whole cluster:
+    pods per drive              (Pod x PVC) @ (PVC x PV) @ (PV x Drive), counting paths
+    unhealthy drives per node   (Drive x Node)^T @ unhealthy drive indicator
+    blast radius per node       distinct pods scheduled on the node or using a drive on it
+KnowledgeGraph.analyze_issues() uses it in the "sparse" analytics mode. NumPy and
+SciPy are optional (pip install .[analytics]); without them the graph keeps the
+dict-based analysis, which returns the same entries.
+"""
+
+from typing import Any, Dict, List
+
+from .knowledge_graph import UNHEALTHY_DRIVE_STATES, KnowledgeGraph
+
+try:
+    import numpy as np
+    from scipy import sparse
+    SPARSE_ANALYTICS_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+    sparse = None
+    SPARSE_ANALYTICS_AVAILABLE = False
+
+
+class ChainMatrices:
+    """
+    Integer-indexed storage chain of a Knowledge Graph
+
+    Row and column i of each matrix is the i-th node ID of the matching list;
+    the lists keep the graph's insertion order. Matrices are CSR with int32 entries.
+    """
+
+    def __init__(self, kg: KnowledgeGraph):
+        """
+        Export the storage chain of a Knowledge Graph
+
+        Args:
+            kg: Knowledge Graph
+        """
+        subtypes = kg._nodes_by_subtype
+        self.pods = list(subtypes.get('Pod', {}))
+        self.pvcs = list(subtypes.get('PVC', {}))
+        self.pvs = list(subtypes.get('PV', {}))
+        self.drives = list(subtypes.get('Drive', {}))
+        self.nodes = list(subtypes.get('Node', {}))
+
+        self.pod_pvc = self._relationship(kg, 'uses', self.pods, self.pvcs)
+        self.pvc_pv = self._relationship(kg, 'bound_to', self.pvcs, self.pvs)
+        self.pv_drive = self._relationship(kg, 'maps_to', self.pvs, self.drives)
+        self.drive_node = self._relationship(kg, 'located_on', self.drives, self.nodes)
+
+        # Pods are placed by their node_name attribute, as KnowledgeGraph.pods_by_node() does
+        node_index = {}
+        for i, node_id in enumerate(self.nodes):
+            node_index.setdefault(kg.graph.nodes[node_id].get('name'), i)
+        placed = [(i, node_index[name]) for i, name in
+                  enumerate(kg.graph.nodes[pod_id].get('node_name') for pod_id in self.pods) if name in node_index]
+        self.pod_node = self._matrix(placed, len(self.pods), len(self.nodes))
+
+        self.unhealthy_drives = np.fromiter(
+            (kg.graph.nodes[drive_id].get('Health') in UNHEALTHY_DRIVE_STATES for drive_id in self.drives),
+            dtype=bool, count=len(self.drives))
+        self.unhealthy_nodes = np.fromiter(
+            (not kg.graph.nodes[node_id].get('Ready', True) or bool(kg.graph.nodes[node_id].get('DiskPressure', False))
+             for node_id in self.nodes), dtype=bool, count=len(self.nodes))
+
+    @staticmethod
+    def _matrix(pairs: List[tuple], rows: int, columns: int):
+        if not pairs:
+            return sparse.csr_matrix((rows, columns), dtype=np.int32)
+        row, column = np.array(pairs, dtype=np.int64).T
+        return sparse.csr_matrix((np.ones(len(pairs), dtype=np.int32), (row, column)), shape=(rows, columns))
+
+    @classmethod
+    def _relationship(cls, kg: KnowledgeGraph, relationship: str, sources: List[str], targets: List[str]):
+        """Adjacency matrix of one relationship between two node lists"""
+        successors = kg._successors_by_relationship.get(relationship, {})
+        target_index = {node_id: i for i, node_id in enumerate(targets)}
+        pairs = [(i, target_index[target]) for i, source in enumerate(sources)
+                 for target in successors.get(source, ()) if target in target_index]
+        return cls._matrix(pairs, len(sources), len(targets))
+
+    def pod_drive_paths(self):
+        """Pod x Drive matrix holding the number of Pod -> PVC -> PV -> Drive paths"""
+        return (self.pod_pvc @ self.pvc_pv @ self.pv_drive).tocsc()
+
+    def unhealthy_drives_per_node(self):
+        """Number of SUSPECT or BAD drives located on each node"""
+        return self.drive_node.T @ self.unhealthy_drives.astype(np.int32)
+
+    def node_dependents(self):
+        """Node x Pod boolean matrix: the pod is scheduled on the node or uses a drive located on it"""
+        reach = self.pod_node + self.pod_drive_paths().tocsr() @ self.drive_node
+        return (reach.T > 0).tocsr()
+
+
+def chain_matrices(kg: KnowledgeGraph) -> ChainMatrices:
+    """
+    Export the storage chain of a Knowledge Graph, memoized until the graph changes
+
+    Args:
+        kg: Knowledge Graph
+
+    Returns:
+        ChainMatrices: Integer-indexed chain matrices
+    """
+    return kg._memoized('chain_matrices', kg.version, lambda: ChainMatrices(kg))
+
+
+def _column_pods(paths, pods: List[str], column: int) -> List[str]:
+    """Pods of one Pod x Drive column, each repeated once per path, in pod order"""
+    start, end = paths.indptr[column], paths.indptr[column + 1]
+    return [pods[i] for i in np.repeat(paths.indices[start:end], paths.data[start:end])]
+
+
+def pods_by_unhealthy_drive(kg: KnowledgeGraph) -> Dict[str, List[str]]:
+    """
+    Trace every SUSPECT or BAD drive to the pods that use it
+
+    Args:
+        kg: Knowledge Graph
+
+    Returns:
+        Dict[str, List[str]]: Drive node ID -> pod node IDs (one entry per path, in pod order)
+            for every unhealthy drive, in drive order
+    """
+    matrices = chain_matrices(kg)
+    paths = matrices.pod_drive_paths()
+    paths.sort_indices()
+    return {matrices.drives[column]: _column_pods(paths, matrices.pods, column)
+            for column in np.flatnonzero(matrices.unhealthy_drives)}
+
+
+def pods_by_unhealthy_node(kg: KnowledgeGraph) -> Dict[str, List[str]]:
+    """
+    Group the pods scheduled on every node that is not Ready or has DiskPressure
+
+    Args:
+        kg: Knowledge Graph
+
+    Returns:
+        Dict[str, List[str]]: Node node ID -> pod node IDs in pod order, for unhealthy
+            nodes with pods, in node order
+    """
+    matrices = chain_matrices(kg)
+    placed = matrices.pod_node.tocsc()
+    placed.sort_indices()
+    pods_by_node = {}
+    for column in np.flatnonzero(matrices.unhealthy_nodes):
+        pods = placed.indices[placed.indptr[column]:placed.indptr[column + 1]]
+        if len(pods):
+            pods_by_node[matrices.nodes[column]] = [matrices.pods[i] for i in pods]
+    return pods_by_node
+
+
+def identify_fanout_patterns(kg: KnowledgeGraph) -> List[Dict[str, Any]]:
+    """
+    Find the storage fan-out patterns of a Knowledge Graph with sparse matrix products
+
+    Returns the entries of KnowledgeGraph._identify_fanout_patterns():
+    multiple_pods_same_drive for drives reached by more than one Pod -> Drive path,
+    multiple_unhealthy_drives_same_node for nodes with several SUSPECT or BAD drives,
+    and node_blast_radius for unhealthy nodes or nodes with unhealthy drives that
+    have dependent pods. Pod lists are in pod order; drives with several pods are
+    ordered by their first pod, nodes by node order.
+
+    Args:
+        kg: Knowledge Graph
+
+    Returns:
+        List[Dict[str, Any]]: Pattern entries
+    """
+    matrices = chain_matrices(kg)
+    patterns = []
+
+    paths = matrices.pod_drive_paths()
+    paths.sort_indices()
+    path_counts = np.asarray(paths.sum(axis=0)).ravel()
+    shared = np.flatnonzero(path_counts > 1)
+    first_pod = paths.indices[paths.indptr[shared]]
+    for column in shared[np.lexsort((shared, first_pod))]:
+        patterns.append({
+            'type': 'multiple_pods_same_drive',
+            'description': f"Multiple pods ({path_counts[column]}) using the same drive",
+            'drive': matrices.drives[column],
+            'pods': _column_pods(paths, matrices.pods, column)
+        })
+
+    unhealthy_counts = matrices.unhealthy_drives_per_node()
+    drive_node = matrices.drive_node.tocsc()
+    for column in np.flatnonzero(unhealthy_counts > 1):
+        drives = drive_node.indices[drive_node.indptr[column]:drive_node.indptr[column + 1]]
+        patterns.append({
+            'type': 'multiple_unhealthy_drives_same_node',
+            'description': f"Multiple unhealthy drives ({unhealthy_counts[column]}) on the same node",
+            'node': matrices.nodes[column],
+            'drives': [matrices.drives[i] for i in np.sort(drives[matrices.unhealthy_drives[drives]])]
+        })
+
+    dependents = matrices.node_dependents()
+    dependents.sort_indices()
+    for row in np.flatnonzero(matrices.unhealthy_nodes | (unhealthy_counts > 0)):
+        pods = dependents.indices[dependents.indptr[row]:dependents.indptr[row + 1]]
+        if len(pods):
+            patterns.append({
+                'type': 'node_blast_radius',
+                'description': f"{len(pods)} pods depend on a node with unhealthy drives or node conditions",
+                'node': matrices.nodes[row],
+                'unhealthy_drives': int(unhealthy_counts[row]),
+                'pods': [matrices.pods[i] for i in pods]
+            })
+
+    return patterns
@@ -0,0 +1,415 @@
+"""
+Compact Directed Graph Backend
+
+A memory-lean stand-in for the networkx.DiGraph used by KnowledgeGraph, for
+cluster-wide graphs with hundreds of thousands of nodes. Select it with
+KnowledgeGraph(backend='compact').
+
+Node IDs are interned once and mapped to integers; every edge is one 64-bit
+integer in the source's successor array and one in the target's predecessor
+array, packing the neighbour index with a relationship code:
+    packed = neighbour << RELATIONSHIP_BITS | relationship code
+Relationship names are an enum grown on first use (KNOWN_RELATIONSHIPS are
+pre-registered). No per-edge attribute dict exists unless an edge carries
+attributes besides its relationship.
+
+Only the part of the networkx.DiGraph API used by this code base is provided:
+nodes/edges views, has_node/has_edge, add/remove node and edge, successors,
+predecessors, in_edges/out_edges, get_edge_data and the counts. Edge data
+returned by the views is a fresh dict; change edges with add_edge. Node
+attribute dicts are the stored ones, as with networkx.
+"""
+
+import sys
+from array import array
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import networkx as nx
+
+# Bits of a packed adjacency entry holding the relationship code
+RELATIONSHIP_BITS = 16
+_RELATIONSHIP_MASK = (1 << RELATIONSHIP_BITS) - 1
+
+# Relationships registered up front, in code order after None (edges without a relationship)
+KNOWN_RELATIONSHIPS = (
+    'uses', 'bound_to', 'maps_to', 'located_on', 'contains', 'available_on', 'related_to',
+    'affinity_to', 'runs_on', 'uses_storage_class', 'describes', 'described_by', 'connected_to',
+)
+
+
+class _NodeView:
+    """graph.nodes: node ID -> attribute dict, iterable, callable with data=True"""
+
+    def __init__(self, graph: 'CompactDiGraph'):
+        self._graph = graph
+
+    def __getitem__(self, node_id: str) -> Dict[str, Any]:
+        return self._graph._attrs[self._graph._index[node_id]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._graph._index)
+
+    def __len__(self) -> int:
+        return len(self._graph._index)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._graph._index
+
+    def __call__(self, data: Any = False, default: Any = None):
+        attrs = self._graph._attrs
+        if data is True:
+            return ((node_id, attrs[i]) for node_id, i in self._graph._index.items())
+        if data is False:
+            return iter(self._graph._index)
+        return ((node_id, attrs[i].get(data, default)) for node_id, i in self._graph._index.items())
+
+
+class _EdgeView:
+    """graph.edges: (source, target) -> edge data, iterable, callable with data=True or an attribute name"""
+
+    def __init__(self, graph: 'CompactDiGraph'):
+        self._graph = graph
+
+    def __getitem__(self, edge: Tuple[str, str]) -> Dict[str, Any]:
+        data = self._graph.get_edge_data(*edge)
+        if data is None:
+            raise KeyError(f"The edge {edge} is not in the graph.")
+        return data
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        return (edge[:2] for edge in self._graph._iter_edges(None, False))
+
+    def __len__(self) -> int:
+        return self._graph._edge_count
+
+    def __contains__(self, edge: object) -> bool:
+        return isinstance(edge, tuple) and len(edge) == 2 and self._graph.has_edge(*edge)
+
+    def __call__(self, nbunch: str = None, data: Any = False, default: Any = None):
+        nodes = None if nbunch is None else [nbunch]
+        return self._graph._iter_edges(nodes, data, default)
+
+
+class _RelationshipNeighbours:
+    """Neighbours over one relationship: node ID -> tuple of neighbour IDs in edge insertion order"""
+
+    def __init__(self, graph: 'CompactDiGraph', code: int, outgoing: bool):
+        self._index = graph._index
+        self._ids = graph._ids
+        self._adjacency = graph._succ if outgoing else graph._pred
+        self._code = code
+
+    def get(self, node_id: str, default: Any = None):
+        i = self._index.get(node_id)
+        if i is None:
+            return default
+        packed_entries = self._adjacency[i]
+        if not packed_entries:
+            return default
+        code = self._code
+        if len(packed_entries) == 1:
+            packed = packed_entries[0]
+            return (self._ids[packed >> RELATIONSHIP_BITS],) if packed & _RELATIONSHIP_MASK == code else default
+        ids = self._ids
+        neighbours = tuple([ids[packed >> RELATIONSHIP_BITS] for packed in packed_entries
+                            if packed & _RELATIONSHIP_MASK == code])
+        return neighbours if neighbours else default
+
+    def __getitem__(self, node_id: str):
+        neighbours = self.get(node_id)
+        if neighbours is None:
+            raise KeyError(node_id)
+        return neighbours
+
+    def __contains__(self, node_id: object) -> bool:
+        return self.get(node_id) is not None
+
+
+class _RelationshipAdjacency:
+    """Read-only relationship -> node -> neighbours mapping, as KnowledgeGraph keeps for networkx"""
+
+    def __init__(self, graph: 'CompactDiGraph', outgoing: bool):
+        self._graph = graph
+        self._outgoing = outgoing
+
+    def get(self, relationship: str, default: Any = None):
+        code = self._graph._relationship_codes.get(relationship)
+        if code is None:
+            return default
+        return _RelationshipNeighbours(self._graph, code, self._outgoing)
+
+    def __getitem__(self, relationship: str) -> _RelationshipNeighbours:
+        neighbours = self.get(relationship)
+        if neighbours is None:
+            raise KeyError(relationship)
+        return neighbours
+
+    def __contains__(self, relationship: object) -> bool:
+        return relationship in self._graph._relationship_codes
+
+    def __iter__(self) -> Iterator[str]:
+        return (relationship for relationship in self._graph._relationships if relationship is not None)
+
+
+class CompactDiGraph:
+    """Directed graph with interned integer node IDs, relationship codes and array-backed adjacency"""
+
+    def __init__(self):
+        self.graph: Dict[str, Any] = {}
+        self._ids: List[Optional[str]] = []
+        self._index: Dict[str, int] = {}
+        self._attrs: List[Optional[Dict[str, Any]]] = []
+        self._succ: List[Optional[array]] = []
+        self._pred: List[Optional[array]] = []
+        self._relationships: List[Optional[str]] = [None]
+        self._relationship_codes: Dict[Optional[str], int] = {None: 0}
+        for relationship in KNOWN_RELATIONSHIPS:
+            self._relationship_code(relationship)
+        # Attributes of the rare edges carrying more than a relationship: (source, target) -> dict
+        self._edge_attrs: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        self._edge_count = 0
+        self.nodes = _NodeView(self)
+        self.edges = _EdgeView(self)
+        self.successors_by_relationship = _RelationshipAdjacency(self, outgoing=True)
+        self.predecessors_by_relationship = _RelationshipAdjacency(self, outgoing=False)
+
+    def _relationship_code(self, relationship: Optional[str]) -> int:
+        code = self._relationship_codes.get(relationship)
+        if code is None:
+            code = len(self._relationships)
+            if code > _RELATIONSHIP_MASK:
+                raise ValueError(f"Too many relationship types (at most {_RELATIONSHIP_MASK})")
+            self._relationships.append(relationship)
+            self._relationship_codes[sys.intern(relationship) if isinstance(relationship, str)
+                                     else relationship] = code
+        return code
+
+    def _node_index(self, node_id: str) -> int:
+        i = self._index.get(node_id)
+        if i is None:
+            raise nx.NetworkXError(f"The node {node_id} is not in the digraph.")
+        return i
+
+    def _ensure_node(self, node_id: str) -> int:
+        i = self._index.get(node_id)
+        if i is None:
+            node_id = sys.intern(node_id) if type(node_id) is str else node_id
+            i = len(self._ids)
+            self._ids.append(node_id)
+            self._index[node_id] = i
+            self._attrs.append({})
+            self._succ.append(None)
+            self._pred.append(None)
+        return i
+
+    @staticmethod
+    def _find(packed_entries: Optional[array], neighbour: int) -> int:
+        """Position of the entry for neighbour in an adjacency array, or -1"""
+        if packed_entries:
+            for position, packed in enumerate(packed_entries):
+                if packed >> RELATIONSHIP_BITS == neighbour:
+                    return position
+        return -1
+
+    # Nodes
+
+    def add_node(self, node_id: str, **attr):
+        self._attrs[self._ensure_node(node_id)].update(attr)
+
+    def has_node(self, node_id: str) -> bool:
+        return node_id in self._index
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def number_of_nodes(self) -> int:
+        return len(self._index)
+
+    def remove_node(self, node_id: str):
+        i = self._node_index(node_id)
+        for packed in list(self._succ[i] or ()):
+            self._remove_edge(i, packed >> RELATIONSHIP_BITS)
+        for packed in list(self._pred[i] or ()):
+            self._remove_edge(packed >> RELATIONSHIP_BITS, i)
+        del self._index[node_id]
+        self._ids[i] = None
+        self._attrs[i] = None
+        self._succ[i] = None
+        self._pred[i] = None
+
+    # Edges
+
+    def add_edge(self, source_id: str, target_id: str, **attr):
+        relationship = attr.pop('relationship', None)
+        code = self._relationship_code(relationship)
+        u = self._ensure_node(source_id)
+        v = self._ensure_node(target_id)
+        position = self._find(self._succ[u], v)
+        if position >= 0:
+            # networkx keeps one edge per pair and updates its attributes
+            self._succ[u][position] = v << RELATIONSHIP_BITS | code
+            self._pred[v][self._find(self._pred[v], u)] = u << RELATIONSHIP_BITS | code
+        else:
+            if self._succ[u] is None:
+                self._succ[u] = array('q')
+            if self._pred[v] is None:
+                self._pred[v] = array('q')
+            self._succ[u].append(v << RELATIONSHIP_BITS | code)
+            self._pred[v].append(u << RELATIONSHIP_BITS | code)
+            self._edge_count += 1
+        if attr:
+            self._edge_attrs.setdefault((u, v), {}).update(attr)
+
+    def has_edge(self, source_id: str, target_id: str) -> bool:
+        u = self._index.get(source_id)
+        v = self._index.get(target_id)
+        return u is not None and v is not None and self._find(self._succ[u], v) >= 0
+
+    def get_edge_data(self, source_id: str, target_id: str, default: Any = None) -> Any:
+        u = self._index.get(source_id)
+        v = self._index.get(target_id)
+        if u is None or v is None:
+            return default
+        position = self._find(self._succ[u], v)
+        if position < 0:
+            return default
+        return self._edge_data(u, v, self._succ[u][position] & _RELATIONSHIP_MASK)
+
+    def _edge_data(self, u: int, v: int, code: int) -> Dict[str, Any]:
+        relationship = self._relationships[code]
+        data = {} if relationship is None else {'relationship': relationship}
+        extra = self._edge_attrs.get((u, v)) if self._edge_attrs else None
+        if extra:
+            data.update(extra)
+        return data
+
+    def remove_edge(self, source_id: str, target_id: str):
+        u = self._index.get(source_id)
+        v = self._index.get(target_id)
+        if u is None or v is None or self._find(self._succ[u], v) < 0:
+            raise nx.NetworkXError(f"The edge {source_id}-{target_id} not in graph.")
+        self._remove_edge(u, v)
+
+    def _remove_edge(self, u: int, v: int):
+        del self._succ[u][self._find(self._succ[u], v)]
+        del self._pred[v][self._find(self._pred[v], u)]
+        self._edge_attrs.pop((u, v), None)
+        self._edge_count -= 1
+
+    def number_of_edges(self) -> int:
+        return self._edge_count
+
+    def successors(self, node_id: str) -> Iterator[str]:
+        ids = self._ids
+        return (ids[packed >> RELATIONSHIP_BITS] for packed in self._succ[self._node_index(node_id)] or ())
+
+    def predecessors(self, node_id: str) -> Iterator[str]:
+        ids = self._ids
+        return (ids[packed >> RELATIONSHIP_BITS] for packed in self._pred[self._node_index(node_id)] or ())
+
+    def _edge_value(self, u: int, v: int, code: int, data: Any, default: Any):
+        if data is True:
+            return self._edge_data(u, v, code)
+        if data == 'relationship' and not self._edge_attrs:
+            relationship = self._relationships[code]
+            return default if relationship is None else relationship
+        return self._edge_data(u, v, code).get(data, default)
+
+    def _iter_edges(self, nodes: Optional[List[str]], data: Any, default: Any = None):
+        ids = self._ids
+        sources = range(len(ids)) if nodes is None else [self._index[n] for n in nodes if n in self._index]
+        for u in sources:
+            for packed in self._succ[u] or ():
+                v = packed >> RELATIONSHIP_BITS
+                if data is False:
+                    yield ids[u], ids[v]
+                else:
+                    yield ids[u], ids[v], self._edge_value(u, v, packed & _RELATIONSHIP_MASK, data, default)
+
+    def out_edges(self, node_id: str = None, data: Any = False, default: Any = None):
+        return self._iter_edges(None if node_id is None else [node_id], data, default)
+
+    def in_edges(self, node_id: str, data: Any = False, default: Any = None):
+        v = self._index.get(node_id)
+        if v is None:
+            return iter(())
+        ids = self._ids
+        if data is False:
+            return ((ids[packed >> RELATIONSHIP_BITS], node_id) for packed in self._pred[v] or ())
+        return ((ids[packed >> RELATIONSHIP_BITS], node_id,
+                 self._edge_value(packed >> RELATIONSHIP_BITS, v, packed & _RELATIONSHIP_MASK, data, default))
+                for packed in self._pred[v] or ())
+
+    def shortest_path(self, source_id: str, target_id: str) -> List[str]:
+        """
+        Shortest directed path by breadth-first search, as networkx.shortest_path
+
+        Raises:
+            networkx.NodeNotFound: source or target is not in the graph
+            networkx.NetworkXNoPath: target is not reachable from source
+        """
+        if source_id not in self._index or target_id not in self._index:
+            raise nx.NodeNotFound(f"Either source {source_id} or target {target_id} is not in G")
+        source, target = self._index[source_id], self._index[target_id]
+        parent = {source: None}
+        queue = deque([source])
+        while queue and target not in parent:
+            u = queue.popleft()
+            for packed in self._succ[u] or ():
+                v = packed >> RELATIONSHIP_BITS
+                if v not in parent:
+                    parent[v] = u
+                    queue.append(v)
+        if target not in parent:
+            raise nx.NetworkXNoPath(f"No path between {source_id} and {target_id}.")
+        path = []
+        node = target
+        while node is not None:
+            path.append(self._ids[node])
+            node = parent[node]
+        return path[::-1]
+
+    # Snapshots
+
+    def to_state(self) -> Dict[str, Any]:
+        """Plain-data state for pickling: lists, dicts, strings and bytes only"""
+        return {
+            'graph': self.graph,
+            'ids': self._ids,
+            'attrs': self._attrs,
+            'succ': [packed.tobytes() if packed else None for packed in self._succ],
+            'pred': [packed.tobytes() if packed else None for packed in self._pred],
+            'relationships': self._relationships,
+            'edge_attrs': self._edge_attrs,
+            'edge_count': self._edge_count,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'CompactDiGraph':
+        """Rebuild a graph from to_state() data"""
+        graph = cls()
+        graph.graph.update(state['graph'])
+        graph._ids = state['ids']
+        graph._index = {node_id: i for i, node_id in enumerate(graph._ids) if node_id is not None}
+        graph._attrs = state['attrs']
+        for field in ('succ', 'pred'):
+            arrays = []
+            for data in state[field]:
+                packed = None
+                if data:
+                    packed = array('q')
+                    packed.frombytes(data)
+                arrays.append(packed)
+            setattr(graph, f"_{field}", arrays)
+        graph._relationships = state['relationships']
+        graph._relationship_codes = {relationship: code for code, relationship in enumerate(graph._relationships)}
+        graph._edge_attrs = state['edge_attrs']
+        graph._edge_count = state['edge_count']
+        return graph
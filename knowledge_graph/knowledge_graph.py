@@ -9,43 +9,266 @@ and fix plan generation in the CSI Baremetal driver troubleshooting system.
 
 import logging
 import networkx as nx
-from typing import Dict, List, Any, Optional, Tuple
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 import json
 
+from .compact_graph import CompactDiGraph
+
 # Configure logger for knowledge graph operations
 kg_logger = logging.getLogger('knowledge_graph')
 kg_logger.setLevel(logging.INFO)
 # Don't propagate to root logger to avoid console output
 kg_logger.propagate = False
 
+# Entity table name -> gnode subtype of its nodes
+ENTITY_TABLES = {
+    'pods': 'Pod',
+    'pvcs': 'PVC',
+    'pvs': 'PV',
+    'drives': 'Drive',
+    'nodes': 'Node',
+    'storage_classes': 'StorageClass',
+    'lvgs': 'LVG',
+    'acs': 'AC',
+    'volumes': 'Volume',
+    'system_entities': 'System',
+    'cluster_nodes': 'ClusterNode',
+    'historical_experiences': 'HistoricalExperience'
+}
+
+# Node attributes describing the graph node rather than the entity
+_GRAPH_ATTRIBUTES = ('entity_type', 'gnode_subtype')
+
+# Relationships followed from a Pod or PVC down its storage chain, and the subtypes kept on it
+VOLUME_CHAIN_RELATIONSHIPS = ('uses', 'bound_to', 'maps_to', 'contains', 'located_on')
+VOLUME_CHAIN_SUBTYPES = ('Pod', 'PVC', 'PV', 'Volume', 'LVG', 'Drive', 'Node')
+
+# Drive health values reported as root causes and counted by the fan-out patterns
+UNHEALTHY_DRIVE_STATES = ('SUSPECT', 'BAD')
+
+# analyze_issues engines: dict-based loops, or sparse matrix products (needs NumPy and SciPy)
+ANALYTICS_MODES = ('python', 'sparse')
+
+# Graph storage: networkx.DiGraph, or CompactDiGraph with integer IDs and array adjacency
+GRAPH_BACKENDS = ('networkx', 'compact')
+
+
+class EntityTable(Mapping):
+    """
+    Read-only view of the nodes of one gnode subtype, keyed by node ID
+    
+    Attributes live only on the graph nodes; each lookup returns a new dict
+    of the node's entity attributes.
+    """
+    
+    def __init__(self, kg: 'KnowledgeGraph', gnode_subtype: str):
+        self._kg = kg
+        self._gnode_subtype = gnode_subtype
+    
+    def _node_ids(self) -> Dict[str, None]:
+        return self._kg._nodes_by_subtype.get(self._gnode_subtype, {})
+    
+    def __getitem__(self, node_id: str) -> Dict[str, Any]:
+        if node_id not in self._node_ids():
+            raise KeyError(node_id)
+        return {key: value for key, value in self._kg.graph.nodes[node_id].items() if key not in _GRAPH_ATTRIBUTES}
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._node_ids()))
+    
+    def __len__(self) -> int:
+        return len(self._node_ids())
+    
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._node_ids()
+
 
 class KnowledgeGraph:
     """
     Knowledge Graph for organizing diagnostic data and relationships
     """
     
-    def __init__(self):
-        """Initialize the Knowledge Graph"""
-        self.graph = nx.DiGraph()
+    def __init__(self, backend: str = 'networkx'):
+        """
+        Initialize the Knowledge Graph
+        
+        Args:
+            backend: Graph storage, "networkx" or "compact" (knowledge_graph/compact_graph.py),
+                which needs a fraction of the memory on cluster-wide graphs
+        """
+        if backend not in GRAPH_BACKENDS:
+            raise ValueError(f"Unknown graph backend '{backend}', expected one of {', '.join(GRAPH_BACKENDS)}")
+        self.backend = backend
+        self.graph = nx.DiGraph() if backend == 'networkx' else CompactDiGraph()
+        # Entity tables are views over the graph nodes, which hold the only copy of the attributes
         self.entities = {
-            'gnodes': {
-                'pods': {},
-                'pvcs': {},
-                'pvs': {},
-                'drives': {},
-                'nodes': {},
-                'storage_classes': {},
-                'lvgs': {},
-                'acs': {},
-                'volumes': {},
-                'system_entities': {},
-                'cluster_nodes': {},
-                'historical_experiences': {}
-            }
+            'gnodes': {table: EntityTable(self, gnode_subtype) for table, gnode_subtype in ENTITY_TABLES.items()}
         }
         self.issues = []
+        
+        # Secondary indexes kept up to date by the add_gnode_* methods
+        self._nodes_by_subtype: Dict[str, Dict[str, None]] = {}
+        self._nodes_by_name: Dict[Tuple[str, str], Dict[str, None]] = {}
+        self._nodes_by_uuid: Dict[str, Dict[str, None]] = {}
+        self._nodes_by_namespace: Dict[str, Dict[str, None]] = {}
+        self._index_keys: Dict[str, Tuple] = {}
+        self._node_order: Dict[str, int] = {}
+        
+        # Adjacency per relationship type, in both directions: relationship -> node -> neighbours.
+        # The compact graph answers these lookups from its own arrays.
+        if backend == 'compact':
+            self._successors_by_relationship = self.graph.successors_by_relationship
+            self._predecessors_by_relationship = self.graph.predecessors_by_relationship
+        else:
+            self._successors_by_relationship: Dict[str, Dict[str, Dict[str, None]]] = {}
+            self._predecessors_by_relationship: Dict[str, Dict[str, Dict[str, None]]] = {}
+        
+        # Issue indexes kept up to date by add_issue, in insertion order
+        self._issues_by_severity: Dict[str, List[Dict]] = {}
+        self._issues_by_type: Dict[str, List[Dict]] = {}
+        self._issues_by_node: Dict[str, List[Dict]] = {}
+        
+        # Mutation counter; memoized analyses are valid for one version only
+        self.version = 0
+        self.frozen = False
+        self.analytics_mode = 'python'
+        self._memo: Dict[str, Tuple[Any, Any]] = {}
+        self._memo_stats: Dict[str, Dict[str, int]] = {}
         kg_logger.info("Knowledge Graph initialized")
     
+    def mark_changed(self):
+        """
+        Record a mutation of the graph, invalidating memoized analyses
+        
+        The add_* methods call this themselves; code that edits self.graph
+        directly must call it afterwards.
+        """
+        self.version += 1
+    
+    def set_analytics_mode(self, mode: str) -> str:
+        """
+        Choose the engine of analyze_issues()
+        
+        "sparse" computes the fan-out patterns and the pods of unhealthy drives with
+        sparse matrix products (knowledge_graph/analytics.py), which pays off on
+        cluster-wide graphs. Both modes return the same entries. Without NumPy and
+        SciPy the graph stays in "python" mode.
+        
+        Args:
+            mode: "python" or "sparse"
+            
+        Returns:
+            str: The mode in effect
+        """
+        if mode not in ANALYTICS_MODES:
+            raise ValueError(f"Unknown analytics mode '{mode}', expected one of {', '.join(ANALYTICS_MODES)}")
+        if mode == 'sparse':
+            from .analytics import SPARSE_ANALYTICS_AVAILABLE
+            if not SPARSE_ANALYTICS_AVAILABLE:
+                kg_logger.warning("Sparse analytics needs numpy and scipy; using python analytics")
+                mode = 'python'
+        self.analytics_mode = mode
+        return mode
+    
+    def freeze(self):
+        """
+        Make the graph read-only
+        
+        Any later add_* or remove_* call raises networkx.NetworkXError. Analyses
+        stay available and are still memoized.
+        """
+        nx.freeze(self.graph)
+        self.frozen = True
+    
+    def _check_mutable(self):
+        """Raise if the graph was frozen"""
+        if self.frozen:
+            raise nx.NetworkXError("Frozen Knowledge Graph can't be modified")
+    
+    def _memoized(self, name: str, key: Any, compute):
+        """
+        Return the memoized result of an analysis, computing it on a miss
+        
+        Args:
+            name: Analysis name, used for the cache statistics
+            key: Cache key; a result is reused only while the key is unchanged
+            compute: Callable producing the result
+            
+        Returns:
+            Any: Memoized or freshly computed result
+        """
+        stats = self._memo_stats.setdefault(name, {'hits': 0, 'misses': 0})
+        cached = self._memo.get(name)
+        if cached is not None and cached[0] == key:
+            stats['hits'] += 1
+            return cached[1]
+        stats['misses'] += 1
+        result = compute()
+        self._memo[name] = (key, result)
+        return result
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics of the memoized analyses
+        
+        Returns:
+            Dict[str, Any]: Graph version and, per analysis, hits, misses and hit rate
+        """
+        analyses = {}
+        for name, counts in self._memo_stats.items():
+            lookups = counts['hits'] + counts['misses']
+            analyses[name] = {**counts, 'hit_rate': counts['hits'] / lookups if lookups else 0.0}
+        return {'version': self.version, 'analyses': analyses}
+    
+    def _index_node(self, node_id: str):
+        """
+        Add or refresh a node in the subtype, name, UUID and namespace indexes
+        
+        Index values are insertion-ordered dicts used as sets, so lookups keep
+        the order in which nodes were first added; a re-added node keeps its
+        positions unless its subtype, name, UUID or namespace changed.
+        
+        Args:
+            node_id: Node ID just added or updated by an add_gnode_* method
+        """
+        attrs = self.graph.nodes[node_id]
+        subtype = attrs.get('gnode_subtype')
+        name = attrs.get('name')
+        uuid = attrs.get('uuid')
+        namespace = attrs.get('namespace')
+        keys = (subtype,
+                (subtype, name) if isinstance(name, str) else None,
+                uuid if isinstance(uuid, str) and uuid else None,
+                namespace if isinstance(namespace, str) and namespace else None)
+        
+        previous = self._index_keys.get(node_id)
+        if previous != keys:
+            self._unindex_node(node_id)
+            self._nodes_by_subtype.setdefault(subtype, {})[node_id] = None
+            if keys[1]:
+                self._nodes_by_name.setdefault(keys[1], {})[node_id] = None
+            if keys[2]:
+                self._nodes_by_uuid.setdefault(keys[2], {})[node_id] = None
+            if keys[3]:
+                self._nodes_by_namespace.setdefault(keys[3], {})[node_id] = None
+            self._index_keys[node_id] = keys
+        # The version increases with every mutation, so it orders nodes by first insertion
+        self._node_order.setdefault(node_id, self.version)
+        self.mark_changed()
+    
+    def _unindex_node(self, node_id: str):
+        """Remove a node from the secondary indexes"""
+        keys = self._index_keys.pop(node_id, None)
+        if keys is None:
+            return
+        for index, key in zip((self._nodes_by_subtype, self._nodes_by_name,
+                               self._nodes_by_uuid, self._nodes_by_namespace), keys):
+            if key is not None and key in index:
+                index[key].pop(node_id, None)
+                if not index[key]:
+                    del index[key]
+    
     def add_gnode_pod(self, name: str, namespace: str, **attributes) -> str:
         """
         Add a Pod node to the knowledge graph
@@ -65,11 +288,7 @@ class KnowledgeGraph:
                            name=name,
                            namespace=namespace,
                            **attributes)
-        self.entities['gnodes']['pods'][node_id] = {
-            'name': name,
-            'namespace': namespace,
-            **attributes
-        }
+        self._index_node(node_id)
         kg_logger.debug(f"Added Pod node: {node_id}")
         return node_id
     
@@ -92,11 +311,7 @@ class KnowledgeGraph:
                            name=name,
                            namespace=namespace,
                            **attributes)
-        self.entities['gnodes']['pvcs'][node_id] = {
-            'name': name,
-            'namespace': namespace,
-            **attributes
-        }
+        self._index_node(node_id)
         kg_logger.debug(f"Added PVC node: {node_id}")
         return node_id
     
@@ -117,10 +332,7 @@ class KnowledgeGraph:
                            gnode_subtype="PV",
                            name=name,
                            **attributes)
-        self.entities['gnodes']['pvs'][node_id] = {
-            'name': name,
-            **attributes
-        }
+        self._index_node(node_id)
         kg_logger.debug(f"Added PV node: {node_id}")
         return node_id
     
@@ -141,10 +353,7 @@ class KnowledgeGraph:
                            gnode_subtype="Drive",
                            uuid=uuid,
                            **attributes)
-        self.entities['gnodes']['drives'][node_id] = {
-            'uuid': uuid,
-            **attributes
-        }
+        self._index_node(node_id)
         kg_logger.debug(f"Added Drive node: {node_id}")
         return node_id
     
@@ -165,10 +374,7 @@ class KnowledgeGraph:
                            gnode_subtype="Node",
                            name=name,
                            **attributes)
-        self.entities['gnodes']['nodes'][node_id] = {
-            'name': name,
-            **attributes
-        }
+        self._index_node(node_id)
         kg_logger.debug(f"Added Node node: {node_id}")
         return node_id
     
@@ -189,10 +395,7 @@ class KnowledgeGraph:
                            gnode_subtype="StorageClass",
                            name=name,
                            **attributes)
-        self.entities['gnodes']['storage_classes'][node_id] = {
-            'name': name,
-            **attributes
-        }
+        self._index_node(node_id)
         kg_logger.debug(f"Added StorageClass node: {node_id}")
         return node_id
     
@@ -213,10 +416,7 @@ class KnowledgeGraph:
                            gnode_subtype="LVG",
                            name=name,
                            **attributes)
-        self.entities['gnodes']['lvgs'][node_id] = {
-            'name': name,
-            **attributes
-        }
+        self._index_node(node_id)
         kg_logger.debug(f"Added LVG node: {node_id}")
         return node_id
     
@@ -237,10 +437,7 @@ class KnowledgeGraph:
                            gnode_subtype="AC",
                            name=name,
                            **attributes)
-        self.entities['gnodes']['acs'][node_id] = {
-            'name': name,
-            **attributes
-        }
+        self._index_node(node_id)
         kg_logger.debug(f"Added AC node: {node_id}")
         return node_id
     
@@ -263,11 +460,7 @@ class KnowledgeGraph:
                            name=name,
                            namespace=namespace,
                            **attributes)
-        self.entities['gnodes']['volumes'][node_id] = {
-            'name': name,
-            'namespace': namespace,
-            **attributes
-        }
+        self._index_node(node_id)
         kg_logger.debug(f"Added Volume node: {node_id}")
         return node_id
     
@@ -290,11 +483,7 @@ class KnowledgeGraph:
                            name=entity_name,
                            subtype=entity_subtype,
                            **attributes)
-        self.entities['gnodes']['system_entities'][node_id] = {
-            'name': entity_name,
-            'subtype': entity_subtype,
-            **attributes
-        }
+        self._index_node(node_id)
         kg_logger.debug(f"Added System entity node: {node_id}")
         return node_id
 
@@ -315,10 +504,7 @@ class KnowledgeGraph:
                            gnode_subtype="ClusterNode",
                            name=name,
                            **attributes)
-        self.entities['gnodes']['cluster_nodes'][node_id] = {
-            'name': name,
-            **attributes
-        }
+        self._index_node(node_id)
         kg_logger.debug(f"Added ClusterNode node: {node_id}")
         return node_id
         
@@ -393,12 +579,7 @@ class KnowledgeGraph:
         
         self.graph.add_node(node_id, **node_attrs)
         
-        # Add to entities dictionary
-        self.entities['gnodes']['historical_experiences'][node_id] = {
-            'experience_id': experience_id,
-            **node_attrs
-        }
-        
+        self._index_node(node_id)
         kg_logger.debug(f"Added HistoricalExperience node: {node_id}")
         return node_id
     
@@ -412,37 +593,118 @@ class KnowledgeGraph:
             relationship: Type of relationship
             **attributes: Additional edge attributes
         """
+        self._check_mutable()
+        if self.backend == 'compact':
+            self.graph.add_edge(source_id, target_id, relationship=relationship, **attributes)
+            self.mark_changed()
+            kg_logger.debug(f"Added relationship: {source_id} --{relationship}--> {target_id}")
+            return
+        if self.graph.has_edge(source_id, target_id):
+            # Re-adding an edge with another relationship replaces the old one
+            previous = self.graph.edges[source_id, target_id].get('relationship')
+            if previous != relationship:
+                self._unindex_edge(source_id, target_id, previous)
         self.graph.add_edge(source_id, target_id,
                            relationship=relationship,
                            **attributes)
+        self._successors_by_relationship.setdefault(relationship, {}).setdefault(source_id, {})[target_id] = None
+        self._predecessors_by_relationship.setdefault(relationship, {}).setdefault(target_id, {})[source_id] = None
+        self.mark_changed()
         kg_logger.debug(f"Added relationship: {source_id} --{relationship}--> {target_id}")
     
-    def add_issue(self, node_id: str, issue_type: str, description: str, severity: str = "medium"):
+    def _unindex_edge(self, source_id: str, target_id: str, relationship: str):
+        """Remove an edge from the per-relationship adjacency"""
+        if self.backend == 'compact':
+            return
+        for adjacency, node_id, neighbour in ((self._successors_by_relationship, source_id, target_id),
+                                              (self._predecessors_by_relationship, target_id, source_id)):
+            neighbours = adjacency.get(relationship, {}).get(node_id)
+            if neighbours is not None:
+                neighbours.pop(neighbour, None)
+    
+    def remove_relationship(self, source_id: str, target_id: str):
+        """
+        Remove the relationship edge between two nodes, if there is one
+        
+        Args:
+            source_id: Source node ID
+            target_id: Target node ID
+        """
+        self._check_mutable()
+        if not self.graph.has_edge(source_id, target_id):
+            return
+        self._unindex_edge(source_id, target_id, self.graph.edges[source_id, target_id].get('relationship'))
+        self.graph.remove_edge(source_id, target_id)
+        self.mark_changed()
+        kg_logger.debug(f"Removed relationship: {source_id} --> {target_id}")
+    
+    def remove_node(self, node_id: str):
         """
-        Add an issue to a node and the issues list
+        Remove a node together with its edges, its issues and its index entries
+        
+        Args:
+            node_id: Node ID to remove
+        """
+        self._check_mutable()
+        if not self.graph.has_node(node_id):
+            return
+        if self.backend == 'networkx':
+            for source_id, _, relationship in self.graph.in_edges(node_id, data='relationship'):
+                self._unindex_edge(source_id, node_id, relationship)
+            for _, target_id, relationship in self.graph.out_edges(node_id, data='relationship'):
+                self._unindex_edge(node_id, target_id, relationship)
+            for adjacency in (self._successors_by_relationship, self._predecessors_by_relationship):
+                for neighbours_by_node in adjacency.values():
+                    neighbours_by_node.pop(node_id, None)
+        self._unindex_node(node_id)
+        self._node_order.pop(node_id, None)
+        self.graph.remove_node(node_id)
+        
+        removed = self._issues_by_node.pop(node_id, None)
+        if removed:
+            self.issues = [issue for issue in self.issues if issue['node_id'] != node_id]
+            for index, field in ((self._issues_by_severity, 'severity'), (self._issues_by_type, 'type')):
+                for key in {issue[field] for issue in removed}:
+                    remaining = [issue for issue in index[key] if issue['node_id'] != node_id]
+                    if remaining:
+                        index[key] = remaining
+                    else:
+                        del index[key]
+        
+        self.mark_changed()
+        kg_logger.debug(f"Removed node: {node_id}")
+    
+    def add_issue(self, node_id: str, issue_type: str, description: str, severity: str = "medium",
+                  details: Dict[str, Any] = None):
+        """
+        Add an issue to the issues list and the per-node issue index
+        
+        The issue dict is stored once; get_issues_by_node() returns the issues of a node.
         
         Args:
             node_id: Node ID where the issue was found
             issue_type: Type of issue (e.g., "permission", "disk_health", "configuration")
             description: Description of the issue
             severity: Issue severity (low, medium, high, critical)
+            details: Optional extra fields, e.g. count/first_seen/last_seen of aggregated log issues
         """
+        self._check_mutable()
         issue = {
             'node_id': node_id,
             'type': issue_type,
             'description': description,
             'severity': severity
         }
+        if details:
+            issue.update({key: value for key, value in details.items() if key not in issue})
         
-        # Add to issues list
+        # Add to issues list and indexes
         self.issues.append(issue)
+        self._issues_by_severity.setdefault(severity, []).append(issue)
+        self._issues_by_type.setdefault(issue_type, []).append(issue)
+        self._issues_by_node.setdefault(node_id, []).append(issue)
         
-        # Add to node attributes
-        if self.graph.has_node(node_id):
-            current_issues = self.graph.nodes[node_id].get('issues', [])
-            current_issues.append(issue)
-            self.graph.nodes[node_id]['issues'] = current_issues
-        
+        self.mark_changed()
         kg_logger.info(f"Added {severity} severity issue to {node_id}: {description}")
     
     def get_issues_by_severity(self, severity: str) -> List[Dict]:
@@ -455,7 +717,40 @@ class KnowledgeGraph:
         Returns:
             List[Dict]: List of issues
         """
-        return [issue for issue in self.issues if issue['severity'] == severity]
+        return list(self._issues_by_severity.get(severity, ()))
+    
+    def get_issues_by_type(self, issue_type: str) -> List[Dict]:
+        """
+        Get all issues of a specific type
+        
+        Args:
+            issue_type: Issue type to filter by
+            
+        Returns:
+            List[Dict]: List of issues
+        """
+        return list(self._issues_by_type.get(issue_type, ()))
+    
+    def get_issues_by_node(self, node_id: str) -> List[Dict]:
+        """
+        Get all issues added to a node
+        
+        Args:
+            node_id: Node ID
+            
+        Returns:
+            List[Dict]: List of issues
+        """
+        return list(self._issues_by_node.get(node_id, ()))
+    
+    def count_issues_by_type(self) -> Dict[str, int]:
+        """
+        Count issues per type
+        
+        Returns:
+            Dict[str, int]: Issue type -> number of issues, in order of first occurrence
+        """
+        return {issue_type: len(issues) for issue_type, issues in self._issues_by_type.items()}
     
     def get_all_issues(self) -> List[Dict]:
         """
@@ -464,8 +759,18 @@ class KnowledgeGraph:
         Returns:
             List[Dict]: List of all issues sorted by severity
         """
+        return list(self._memoized('get_all_issues', self.version, self._sorted_issues))
+    
+    def _sorted_issues(self) -> List[Dict]:
+        """Issues in stable severity order, concatenated from the severity index"""
         severity_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
-        return sorted(self.issues, key=lambda x: severity_order.get(x['severity'], 4))
+        if not self._issues_by_severity.keys() <= severity_order.keys():
+            # Unknown severities share the last rank in insertion order
+            return sorted(self.issues, key=lambda x: severity_order.get(x['severity'], 4))
+        issues = []
+        for severity in severity_order:
+            issues.extend(self._issues_by_severity.get(severity, ()))
+        return issues
     
     def find_nodes_by_type(self, gnode_subtype: str) -> List[str]:
         """
@@ -477,8 +782,78 @@ class KnowledgeGraph:
         Returns:
             List[str]: List of node IDs
         """
-        return [node_id for node_id, attrs in self.graph.nodes(data=True) 
-                if attrs.get('entity_type') == 'gnode' and attrs.get('gnode_subtype') == gnode_subtype]
+        return list(self._nodes_by_subtype.get(gnode_subtype, ()))
+    
+    def count_nodes_by_type(self, gnode_subtype: str) -> int:
+        """
+        Count nodes of a specific gnode subtype without building a list
+        
+        Args:
+            gnode_subtype: Subtype of gnode to count
+            
+        Returns:
+            int: Number of nodes
+        """
+        return len(self._nodes_by_subtype.get(gnode_subtype, ()))
+    
+    def find_nodes_by_name(self, gnode_subtype: str, name: str) -> List[str]:
+        """
+        Find nodes of a gnode subtype by name (Pods and PVCs may share names across namespaces)
+        
+        Args:
+            gnode_subtype: Subtype of gnode to find
+            name: Entity name
+            
+        Returns:
+            List[str]: List of node IDs
+        """
+        return list(self._nodes_by_name.get((gnode_subtype, name), ()))
+    
+    def find_nodes_by_uuid(self, uuid: str) -> List[str]:
+        """
+        Find nodes carrying a UUID attribute (Drives, and any entity added with a uuid)
+        
+        Args:
+            uuid: Entity UUID
+            
+        Returns:
+            List[str]: List of node IDs
+        """
+        return list(self._nodes_by_uuid.get(uuid, ()))
+    
+    def find_nodes_by_namespace(self, namespace: str, gnode_subtype: str = None) -> List[str]:
+        """
+        Find namespaced nodes (Pods, PVCs, Volumes) of a namespace
+        
+        Args:
+            namespace: Kubernetes namespace
+            gnode_subtype: Optional subtype to filter by
+            
+        Returns:
+            List[str]: List of node IDs
+        """
+        node_ids = self._nodes_by_namespace.get(namespace, ())
+        if gnode_subtype is None:
+            return list(node_ids)
+        return [node_id for node_id in node_ids if self._index_keys[node_id][0] == gnode_subtype]
+    
+    def find_node_id(self, gnode_subtype: str, name_or_uuid: str) -> Optional[str]:
+        """
+        Resolve an entity name or UUID to a node ID of the given subtype
+        
+        Args:
+            gnode_subtype: Subtype of gnode (Pod, Drive, ...)
+            name_or_uuid: Entity name or UUID
+            
+        Returns:
+            Optional[str]: First matching node ID, or None if not found
+        """
+        for node_id in self._nodes_by_name.get((gnode_subtype, name_or_uuid), ()):
+            return node_id
+        for node_id in self._nodes_by_uuid.get(name_or_uuid, ()):
+            if self._index_keys[node_id][0] == gnode_subtype:
+                return node_id
+        return None
     
     def find_connected_nodes(self, node_id: str, relationship: str = None) -> List[str]:
         """
@@ -491,13 +866,36 @@ class KnowledgeGraph:
         Returns:
             List[str]: List of connected node IDs
         """
-        connected = []
+        if relationship is not None:
+            return list(self._successors_by_relationship.get(relationship, {}).get(node_id, ()))
         if self.graph.has_node(node_id):
-            for target in self.graph.successors(node_id):
-                edge_data = self.graph.edges[node_id, target]
-                if relationship is None or edge_data.get('relationship') == relationship:
-                    connected.append(target)
-        return connected
+            return list(self.graph.successors(node_id))
+        return []
+    
+    def find_predecessor_nodes(self, node_id: str, relationship: str = None) -> List[str]:
+        """
+        Find nodes with an edge to a given node (reverse of find_connected_nodes)
+        
+        Args:
+            node_id: Target node ID
+            relationship: Optional relationship type to filter by
+            
+        Returns:
+            List[str]: List of source node IDs
+        """
+        if relationship is not None:
+            return list(self._predecessors_by_relationship.get(relationship, {}).get(node_id, ()))
+        if self.graph.has_node(node_id):
+            return list(self.graph.predecessors(node_id))
+        return []
+    
+    def _predecessors_of_type(self, node_id: str, relationship: str, gnode_subtype: str) -> List[str]:
+        """Predecessors over one relationship restricted to a subtype, in node insertion order"""
+        sources = self._predecessors_by_relationship.get(relationship, {}).get(node_id, ())
+        subtype_nodes = self._nodes_by_subtype.get(gnode_subtype, {})
+        if len(sources) == 1:
+            return [source for source in sources if source in subtype_nodes]
+        return sorted((source for source in sources if source in subtype_nodes), key=self._node_order.__getitem__)
     
     def find_path(self, source_id: str, target_id: str) -> Optional[List[str]]:
         """
@@ -511,6 +909,8 @@ class KnowledgeGraph:
             Optional[List[str]]: Path as list of node IDs, or None if no path exists
         """
         try:
+            if self.backend == 'compact':
+                return self.graph.shortest_path(source_id, target_id)
             return nx.shortest_path(self.graph, source_id, target_id)
         except nx.NetworkXNoPath:
             return None
@@ -519,9 +919,18 @@ class KnowledgeGraph:
         """
         Analyze issues in the knowledge graph to identify patterns and root causes
         
+        The result is memoized until the graph changes. Each call returns a
+        fresh top-level dict and lists; the root cause and pattern entries are shared.
+        
         Returns:
             Dict[str, Any]: Analysis results
         """
+        analysis = self._memoized('analyze_issues', (self.version, self.analytics_mode), self._analyze_issues)
+        return {key: value.copy() if isinstance(value, (dict, list)) else value
+                for key, value in analysis.items()}
+    
+    def _analyze_issues(self) -> Dict[str, Any]:
+        """Compute analyze_issues from the issue indexes"""
         analysis = {
             'total_issues': len(self.issues),
             'issues_by_severity': {},
@@ -533,19 +942,17 @@ class KnowledgeGraph:
         
         # Count issues by severity
         for severity in ['critical', 'high', 'medium', 'low']:
-            analysis['issues_by_severity'][severity] = len(self.get_issues_by_severity(severity))
+            analysis['issues_by_severity'][severity] = len(self._issues_by_severity.get(severity, ()))
         
         # Count issues by type
-        for issue in self.issues:
-            issue_type = issue['type']
-            analysis['issues_by_type'][issue_type] = analysis['issues_by_type'].get(issue_type, 0) + 1
+        analysis['issues_by_type'] = self.count_issues_by_type()
         
-        # Count affected entities by type
-        for issue in self.issues:
-            node_id = issue['node_id']
+        # Count affected entities by type; nodes are keyed in order of their first issue,
+        # so entity types appear in the same order as when counting issue by issue
+        for node_id, node_issues in self._issues_by_node.items():
             if self.graph.has_node(node_id):
                 entity_type = self.graph.nodes[node_id].get('entity_type', 'unknown')
-                analysis['affected_entities'][entity_type] = analysis['affected_entities'].get(entity_type, 0) + 1
+                analysis['affected_entities'][entity_type] = analysis['affected_entities'].get(entity_type, 0) + len(node_issues)
         
         # Identify potential root causes
         analysis['potential_root_causes'] = self._identify_root_causes()
@@ -565,12 +972,21 @@ class KnowledgeGraph:
         """
         root_causes = []
         
+        # Affected pods of every drive and node, each computed in one pass
+        if self.analytics_mode == 'sparse':
+            from .analytics import pods_by_unhealthy_drive, pods_by_unhealthy_node
+            pods_by_drive = pods_by_unhealthy_drive(self)
+            pods_by_node = pods_by_unhealthy_node(self)
+        else:
+            pods_by_drive = self.pods_by_drive()
+            pods_by_node = self.pods_by_node()
+        
         # Check for drive health issues
         for drive_id in self.find_nodes_by_type('Drive'):
             drive_attrs = self.graph.nodes[drive_id]
-            if drive_attrs.get('Health') in ['SUSPECT', 'BAD']:
+            if drive_attrs.get('Health') in UNHEALTHY_DRIVE_STATES:
                 # Find all affected pods through the chain: Drive -> PV -> PVC -> Pod
-                affected_pods = self._trace_drive_to_pods(drive_id)
+                affected_pods = pods_by_drive.get(drive_id, [])
                 root_causes.append({
                     'type': 'disk_health',
                     'severity': 'high',
@@ -583,7 +999,7 @@ class KnowledgeGraph:
         for node_id in self.find_nodes_by_type('Node'):
             node_attrs = self.graph.nodes[node_id]
             if not node_attrs.get('Ready', True) or node_attrs.get('DiskPressure', False):
-                affected_pods = self._trace_node_to_pods(node_id)
+                affected_pods = pods_by_node.get(node_id, [])
                 root_causes.append({
                     'type': 'node_health',
                     'severity': 'high',
@@ -593,7 +1009,7 @@ class KnowledgeGraph:
                 })
         
         # Check for permission issues
-        permission_issues = [issue for issue in self.issues if issue['type'] == 'permission']
+        permission_issues = self.get_issues_by_type('permission')
         if permission_issues:
             root_causes.append({
                 'type': 'permission',
@@ -612,16 +1028,51 @@ class KnowledgeGraph:
         Returns:
             List[Dict]: List of identified patterns
         """
+        if self.analytics_mode == 'sparse':
+            from .analytics import identify_fanout_patterns
+            patterns = identify_fanout_patterns(self)
+        else:
+            patterns = self._identify_fanout_patterns()
+        
+        # Pattern: Same error across multiple pods
+        error_to_pods = {}
+        for issue in self._issues_by_type.get('pod_error', ()):
+            error_desc = issue['description']
+            if error_desc not in error_to_pods:
+                error_to_pods[error_desc] = []
+            error_to_pods[error_desc].append(issue['node_id'])
+        
+        for error_desc, pod_ids in error_to_pods.items():
+            if len(pod_ids) > 1:
+                patterns.append({
+                    'type': 'same_error_multiple_pods',
+                    'description': f"Same error across {len(pod_ids)} pods: {error_desc}",
+                    'pods': pod_ids
+                })
+        
+        return patterns
+    
+    def _identify_fanout_patterns(self) -> List[Dict]:
+        """
+        Identify storage fan-out patterns: pods sharing a drive, nodes with several
+        unhealthy drives and the pods depending on troubled nodes
+        
+        Returns:
+            List[Dict]: multiple_pods_same_drive, multiple_unhealthy_drives_same_node
+                and node_blast_radius patterns
+        """
         patterns = []
         
-        # Pattern: Multiple pods affected by same drive
+        # Pattern: Multiple pods affected by same drive (Pod -uses-> PVC -bound_to-> PV -maps_to-> Drive)
         drive_to_pods = {}
-        for pod_id in self.find_nodes_by_type('Pod'):
-            drives = self._trace_pod_to_drives(pod_id)
-            for drive_id in drives:
-                if drive_id not in drive_to_pods:
-                    drive_to_pods[drive_id] = []
-                drive_to_pods[drive_id].append(pod_id)
+        uses = self._successors_by_relationship.get('uses', {})
+        bound_to = self._successors_by_relationship.get('bound_to', {})
+        maps_to = self._successors_by_relationship.get('maps_to', {})
+        for pod_id in self._nodes_by_subtype.get('Pod', {}):
+            for pvc_id in uses.get(pod_id, ()):
+                for pv_id in bound_to.get(pvc_id, ()):
+                    for drive_id in maps_to.get(pv_id, ()):
+                        drive_to_pods.setdefault(drive_id, []).append(pod_id)
         
         for drive_id, pod_ids in drive_to_pods.items():
             if len(pod_ids) > 1:
@@ -632,21 +1083,48 @@ class KnowledgeGraph:
                     'pods': pod_ids
                 })
         
-        # Pattern: Same error across multiple pods
-        error_to_pods = {}
-        for issue in self.issues:
-            if issue['type'] == 'pod_error':
-                error_desc = issue['description']
-                if error_desc not in error_to_pods:
-                    error_to_pods[error_desc] = []
-                error_to_pods[error_desc].append(issue['node_id'])
+        # Drives per node (Drive -located_on-> Node), and the unhealthy ones
+        node_nodes = self._nodes_by_subtype.get('Node', {})
+        located_on = self._successors_by_relationship.get('located_on', {})
+        drives_by_node: Dict[str, List[str]] = {}
+        unhealthy_by_node: Dict[str, List[str]] = {}
+        for drive_id in self._nodes_by_subtype.get('Drive', {}):
+            unhealthy = self.graph.nodes[drive_id].get('Health') in UNHEALTHY_DRIVE_STATES
+            for node_id in located_on.get(drive_id, ()):
+                if node_id in node_nodes:
+                    drives_by_node.setdefault(node_id, []).append(drive_id)
+                    if unhealthy:
+                        unhealthy_by_node.setdefault(node_id, []).append(drive_id)
+        
+        # Pattern: Several unhealthy drives on the same node
+        for node_id in node_nodes:
+            unhealthy_drives = unhealthy_by_node.get(node_id, [])
+            if len(unhealthy_drives) > 1:
+                patterns.append({
+                    'type': 'multiple_unhealthy_drives_same_node',
+                    'description': f"Multiple unhealthy drives ({len(unhealthy_drives)}) on the same node",
+                    'node': node_id,
+                    'drives': unhealthy_drives
+                })
         
-        for error_desc, pod_ids in error_to_pods.items():
-            if len(pod_ids) > 1:
+        # Pattern: Blast radius of troubled nodes, the pods scheduled on them or using their drives
+        pods_by_drive = self.pods_by_drive()
+        pods_by_node = self.pods_by_node()
+        for node_id in node_nodes:
+            node_attrs = self.graph.nodes[node_id]
+            unhealthy_node = not node_attrs.get('Ready', True) or bool(node_attrs.get('DiskPressure', False))
+            if not unhealthy_node and node_id not in unhealthy_by_node:
+                continue
+            pods = dict.fromkeys(pods_by_node.get(node_id, ()))
+            for drive_id in drives_by_node.get(node_id, ()):
+                pods.update(dict.fromkeys(pods_by_drive.get(drive_id, ())))
+            if pods:
                 patterns.append({
-                    'type': 'same_error_multiple_pods',
-                    'description': f"Same error across {len(pod_ids)} pods: {error_desc}",
-                    'pods': pod_ids
+                    'type': 'node_blast_radius',
+                    'description': f"{len(pods)} pods depend on a node with unhealthy drives or node conditions",
+                    'node': node_id,
+                    'unhealthy_drives': len(unhealthy_by_node.get(node_id, ())),
+                    'pods': sorted(pods, key=self._node_order.__getitem__)
                 })
         
         return patterns
@@ -663,19 +1141,47 @@ class KnowledgeGraph:
         """
         pods = []
         
-        # Find PVs that map to this drive
-        for pv_id in self.find_nodes_by_type('PV'):
-            if drive_id in self.find_connected_nodes(pv_id, 'maps_to'):
-                # Find PVCs bound to this PV
-                for pvc_id in self.find_nodes_by_type('PVC'):
-                    if pv_id in self.find_connected_nodes(pvc_id, 'bound_to'):
-                        # Find pods that use this PVC
-                        for pod_id in self.find_nodes_by_type('Pod'):
-                            if pvc_id in self.find_connected_nodes(pod_id, 'uses'):
-                                pods.append(pod_id)
+        # Walk the reverse adjacency: Drive <-maps_to- PV <-bound_to- PVC <-uses- Pod
+        for pv_id in self._predecessors_of_type(drive_id, 'maps_to', 'PV'):
+            for pvc_id in self._predecessors_of_type(pv_id, 'bound_to', 'PVC'):
+                pods.extend(self._predecessors_of_type(pvc_id, 'uses', 'Pod'))
         
         return pods
     
+    def pods_by_drive(self) -> Dict[str, List[str]]:
+        """
+        Trace every drive to the pods that use it in one pass over the PVs
+        
+        Returns:
+            Dict[str, List[str]]: Drive node ID -> pod node IDs, as _trace_drive_to_pods
+                returns them; drives without pods are omitted
+        """
+        drive_pods: Dict[str, List[str]] = {}
+        maps_to = self._successors_by_relationship.get('maps_to', {})
+        bound_from = self._predecessors_by_relationship.get('bound_to', {})
+        used_by = self._predecessors_by_relationship.get('uses', {})
+        drive_nodes = self._nodes_by_subtype.get('Drive', {})
+        pvc_nodes = self._nodes_by_subtype.get('PVC', {})
+        pod_nodes = self._nodes_by_subtype.get('Pod', {})
+        order = self._node_order.__getitem__
+        
+        # PVs are visited in insertion order, PVCs and pods sorted likewise, so each
+        # drive's list matches _trace_drive_to_pods
+        for pv_id in self._nodes_by_subtype.get('PV', {}):
+            drive_ids = [drive_id for drive_id in maps_to.get(pv_id, ()) if drive_id in drive_nodes]
+            if not drive_ids:
+                continue
+            pods = []
+            pvc_ids = [pvc_id for pvc_id in bound_from.get(pv_id, ()) if pvc_id in pvc_nodes]
+            for pvc_id in (sorted(pvc_ids, key=order) if len(pvc_ids) > 1 else pvc_ids):
+                pvc_pods = [pod_id for pod_id in used_by.get(pvc_id, ()) if pod_id in pod_nodes]
+                pods.extend(sorted(pvc_pods, key=order) if len(pvc_pods) > 1 else pvc_pods)
+            if pods:
+                for drive_id in drive_ids:
+                    drive_pods.setdefault(drive_id, []).extend(pods)
+        
+        return drive_pods
+    
     def _trace_pod_to_drives(self, pod_id: str) -> List[str]:
         """
         Trace from a pod to all drives it uses
@@ -700,6 +1206,35 @@ class KnowledgeGraph:
         
         return drives
     
+    def get_volume_chain(self, node_id: str) -> List[str]:
+        """
+        Collect the storage chain below an entity in breadth-first order
+        
+        From a Pod this is Pod -> PVC -> PV/Volume -> LVG/Drive -> Node; a PVC, PV
+        or Volume yields the part of the chain below it.
+        
+        Args:
+            node_id: Node ID where the chain starts
+            
+        Returns:
+            List[str]: Node IDs on the chain, starting with node_id; empty if the node does not exist
+        """
+        if not self.graph.has_node(node_id):
+            return []
+        
+        chain = {node_id: None}
+        frontier = [node_id]
+        while frontier:
+            next_frontier = []
+            for current in frontier:
+                for relationship in VOLUME_CHAIN_RELATIONSHIPS:
+                    for target in self.find_connected_nodes(current, relationship):
+                        if target not in chain and self._index_keys.get(target, (None,))[0] in VOLUME_CHAIN_SUBTYPES:
+                            chain[target] = None
+                            next_frontier.append(target)
+            frontier = next_frontier
+        return list(chain)
+    
     def _trace_node_to_pods(self, node_id: str) -> List[str]:
         """
         Trace from a node to all pods scheduled on it
@@ -710,15 +1245,27 @@ class KnowledgeGraph:
         Returns:
             List[str]: List of pod node IDs
         """
-        pods = []
-        
-        # Find pods with affinity to this node
-        for pod_id in self.find_nodes_by_type('Pod'):
-            pod_attrs = self.graph.nodes[pod_id]
-            if pod_attrs.get('node_name') == self.graph.nodes[node_id].get('name'):
-                pods.append(pod_id)
+        return self.pods_by_node().get(node_id, [])
+    
+    def pods_by_node(self) -> Dict[str, List[str]]:
+        """
+        Group pods by the node they are scheduled on (node_name attribute) in one pass
         
-        return pods
+        Returns:
+            Dict[str, List[str]]: Node node ID -> pod node IDs; nodes without pods are omitted
+        """
+        pods_by_name: Dict[str, List[str]] = {}
+        for pod_id in self._nodes_by_subtype.get('Pod', {}):
+            node_name = self.graph.nodes[pod_id].get('node_name')
+            if node_name is not None:
+                pods_by_name.setdefault(node_name, []).append(pod_id)
+        
+        node_pods = {}
+        for node_id in self._nodes_by_subtype.get('Node', {}):
+            pods = pods_by_name.get(self.graph.nodes[node_id].get('name'))
+            if pods:
+                node_pods[node_id] = list(pods)
+        return node_pods
     
     def generate_fix_plan(self, analysis: Dict[str, Any]) -> List[Dict]:
         """
@@ -730,6 +1277,14 @@ class KnowledgeGraph:
         Returns:
             List[Dict]: Prioritized list of fix actions
         """
+        # Analyses of the same graph version share their root cause and pattern entries,
+        # so comparing the keys short-circuits on identity
+        key = (self.version, tuple(analysis['potential_root_causes']), tuple(analysis['issue_patterns']))
+        fix_plan = self._memoized('generate_fix_plan', key, lambda: self._generate_fix_plan(analysis))
+        return [dict(step) for step in fix_plan]
+    
+    def _generate_fix_plan(self, analysis: Dict[str, Any]) -> List[Dict]:
+        """Compute generate_fix_plan for an analysis"""
         fix_plan = []
         
         # Process root causes by severity
@@ -806,23 +1361,28 @@ class KnowledgeGraph:
         Returns:
             Dict[str, Any]: Summary information
         """
+        summary = self._memoized('get_summary', self.version, self._summary)
+        return {**summary, 'entity_counts': dict(summary['entity_counts'])}
+    
+    def _summary(self) -> Dict[str, Any]:
+        """Compute get_summary from the node and issue indexes"""
         summary = {
             'total_nodes': self.graph.number_of_nodes(),
             'total_edges': self.graph.number_of_edges(),
             'entity_counts': {},
             'total_issues': len(self.issues),
-            'critical_issues': len(self.get_issues_by_severity('critical')),
-            'high_issues': len(self.get_issues_by_severity('high')),
-            'medium_issues': len(self.get_issues_by_severity('medium')),
-            'low_issues': len(self.get_issues_by_severity('low'))
+            'critical_issues': len(self._issues_by_severity.get('critical', ())),
+            'high_issues': len(self._issues_by_severity.get('high', ())),
+            'medium_issues': len(self._issues_by_severity.get('medium', ())),
+            'low_issues': len(self._issues_by_severity.get('low', ()))
         }
         
         # Count entities by type
         for entity_type in ['Pod', 'PVC', 'PV', 'Drive', 'Node', 'StorageClass', 'LVG', 'AC', 'Volume', 'System', 'ClusterNode', 'HistoricalExperience']:
-            summary['entity_counts'][entity_type] = len(self.find_nodes_by_type(entity_type))
+            summary['entity_counts'][entity_type] = self.count_nodes_by_type(entity_type)
         
         # Add historical experience count specifically 
-        summary['historical_experience_count'] = len(self.find_nodes_by_type('HistoricalExperience'))
+        summary['historical_experience_count'] = self.count_nodes_by_type('HistoricalExperience')
         
         return summary
     
@@ -974,8 +1534,8 @@ class KnowledgeGraph:
                             if node_attrs.get('DiskPressure', False):
                                 status_indicators.append('⚠️ Disk Pressure')
                         elif entity_type == 'Pod':
-                            if 'issues' in node_attrs and node_attrs['issues']:
-                                status_indicators.append(f"⚠️ {len(node_attrs['issues'])} issues")
+                            if self._issues_by_node.get(node_id):
+                                status_indicators.append(f"⚠️ {len(self._issues_by_node[node_id])} issues")
                             if node_attrs.get('Phase') == 'Running':
                                 status_indicators.append('✅ Running')
                             elif node_attrs.get('Phase') == 'Pending':
@@ -1014,8 +1574,8 @@ class KnowledgeGraph:
                         elif entity_type == 'System':
                             subtype = node_attrs.get('subtype', 'unknown')
                             status_indicators.append(f'🔧 {subtype}')
-                            if 'issues' in node_attrs and node_attrs['issues']:
-                                status_indicators.append(f"⚠️ {len(node_attrs['issues'])} issues")
+                            if self._issues_by_node.get(node_id):
+                                status_indicators.append(f"⚠️ {len(self._issues_by_node[node_id])} issues")
                         
                         status_str = ' | '.join(status_indicators) if status_indicators else '⚪ No status'
                         output.append(f"  • {name} - {status_str}")
@@ -1092,12 +1652,8 @@ class KnowledgeGraph:
             output.append("\n⚠️  ISSUES BREAKDOWN:")
             output.append("-" * 40)
             
-            issues_by_severity = {
-                'critical': [i for i in self.issues if i['severity'] == 'critical'],
-                'high': [i for i in self.issues if i['severity'] == 'high'],
-                'medium': [i for i in self.issues if i['severity'] == 'medium'],
-                'low': [i for i in self.issues if i['severity'] == 'low']
-            }
+            issues_by_severity = {severity: self._issues_by_severity.get(severity, [])
+                                  for severity in ('critical', 'high', 'medium', 'low')}
             
             severity_icons = {
                 'critical': '🔴',
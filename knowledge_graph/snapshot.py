@@ -0,0 +1,232 @@
+"""
+Knowledge Graph Snapshots
+
+Saves a KnowledgeGraph to a compact binary file and loads it back without
+re-parsing tool output, so troubleshooting workers and replays can start from
+the graph built in Phase 0.
+
+File layout:
+    magic (6 bytes) | schema version (uint16) | compression (uint8) |
+    header length (uint32) | JSON header | payload
+
+The JSON header holds counts and the creation time and can be read without
+decoding the payload. The payload is a pickle (protocol 5) of plain data only:
+the networkx node and adjacency dicts, the issues and the secondary indexes,
+so nothing is recomputed on load. Graphs on the compact backend store its
+integer ID list and packed adjacency arrays instead, and no relationship
+adjacency dicts. The entity tables are views over the nodes and are not stored.
+Loading refuses any pickled class outside a small allow-list.
+"""
+
+import datetime
+import gc
+import io
+import json
+import lzma
+import pickle
+import struct
+import zlib
+from typing import Any, Dict, Tuple
+
+import networkx as nx
+
+from .compact_graph import CompactDiGraph
+from .knowledge_graph import KnowledgeGraph, kg_logger
+
+SNAPSHOT_MAGIC = b'KGSNAP'
+SNAPSHOT_SCHEMA_VERSION = 2
+
+_PREAMBLE = struct.Struct('>6sHBI')
+
+# Compression name -> (id stored in the file, compress, decompress)
+_COMPRESSION = {
+    'none': (0, lambda data: data, lambda data: data),
+    'zlib': (1, lambda data: zlib.compress(data, 1), zlib.decompress),
+    'lzma': (2, lambda data: lzma.compress(data, preset=1), lzma.decompress),
+}
+_COMPRESSION_BY_ID = {code: name for name, (code, _, _) in _COMPRESSION.items()}
+
+# KnowledgeGraph attributes stored besides the networkx graph; memoized analyses are not
+_STATE_FIELDS = (
+    'issues', 'version',
+    '_nodes_by_subtype', '_nodes_by_name', '_nodes_by_uuid', '_nodes_by_namespace',
+    '_index_keys', '_node_order',
+    '_successors_by_relationship', '_predecessors_by_relationship',
+    '_issues_by_severity', '_issues_by_type', '_issues_by_node',
+)
+
+# Fields the compact backend answers from its own arrays
+_COMPACT_DERIVED_FIELDS = ('_successors_by_relationship', '_predecessors_by_relationship')
+
+# Classes that may appear in node attributes besides builtin containers and scalars
+_ALLOWED_CLASSES = {
+    ('datetime', 'datetime'): datetime.datetime,
+    ('datetime', 'date'): datetime.date,
+    ('datetime', 'timedelta'): datetime.timedelta,
+    ('datetime', 'timezone'): datetime.timezone,
+}
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """Unpickler that only resolves the allow-listed classes"""
+
+    def find_class(self, module: str, name: str):
+        try:
+            return _ALLOWED_CLASSES[(module, name)]
+        except KeyError:
+            raise ValueError(f"Knowledge Graph snapshot references disallowed class {module}.{name}") from None
+
+
+def dumps_snapshot(kg: KnowledgeGraph, compression: str = 'zlib') -> bytes:
+    """
+    Serialize a Knowledge Graph to snapshot bytes
+
+    Args:
+        kg: Knowledge Graph to serialize
+        compression: 'none', 'zlib' or 'lzma'
+
+    Returns:
+        bytes: Snapshot
+    """
+    if compression not in _COMPRESSION:
+        raise ValueError(f"Unsupported snapshot compression: {compression}")
+    code, compress, _ = _COMPRESSION[compression]
+
+    if kg.backend == 'compact':
+        state = {field: getattr(kg, field) for field in _STATE_FIELDS if field not in _COMPACT_DERIVED_FIELDS}
+        state['graph'] = kg.graph.to_state()
+    else:
+        state = {field: getattr(kg, field) for field in _STATE_FIELDS}
+        # The successor and predecessor dicts share their edge attribute dicts, and the issue
+        # indexes share the issue dicts; one pickle keeps that
+        state['graph'] = (kg.graph.graph, kg.graph._node, kg.graph._succ, kg.graph._pred)
+    payload = compress(pickle.dumps(state, protocol=5))
+
+    header = json.dumps({
+        'nodes': kg.graph.number_of_nodes(),
+        'edges': kg.graph.number_of_edges(),
+        'issues': len(kg.issues),
+        'version': kg.version,
+        'backend': kg.backend,
+        'created_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }).encode('utf-8')
+    return _PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_SCHEMA_VERSION, code, len(header)) + header + payload
+
+
+def _split_snapshot(data: bytes) -> Tuple[Dict[str, Any], str, memoryview]:
+    """Validate the preamble and return the header, compression name and payload"""
+    if len(data) < _PREAMBLE.size:
+        raise ValueError("Not a Knowledge Graph snapshot: file too short")
+    magic, schema_version, code, header_length = _PREAMBLE.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Not a Knowledge Graph snapshot: bad magic")
+    if schema_version != SNAPSHOT_SCHEMA_VERSION:
+        raise ValueError(f"Unsupported Knowledge Graph snapshot schema version {schema_version} "
+                         f"(expected {SNAPSHOT_SCHEMA_VERSION})")
+    if code not in _COMPRESSION_BY_ID:
+        raise ValueError(f"Unsupported snapshot compression id {code}")
+    header_end = _PREAMBLE.size + header_length
+    header = json.loads(bytes(data[_PREAMBLE.size:header_end]))
+    header['schema_version'] = schema_version
+    header['compression'] = _COMPRESSION_BY_ID[code]
+    return header, header['compression'], memoryview(data)[header_end:]
+
+
+def loads_snapshot(data: bytes) -> KnowledgeGraph:
+    """
+    Rebuild a Knowledge Graph from snapshot bytes
+
+    Args:
+        data: Snapshot produced by dumps_snapshot
+
+    Returns:
+        KnowledgeGraph: Graph with the saved nodes, edges, issues and indexes
+    """
+    header, compression, payload = _split_snapshot(data)
+    raw = _COMPRESSION[compression][2](payload)
+
+    # Unpickling creates hundreds of thousands of containers; collection passes would only slow it down
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        state = _SnapshotUnpickler(io.BytesIO(raw)).load()
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    # Snapshots written before the compact backend existed have no backend entry
+    backend = header.get('backend', 'networkx')
+    kg = KnowledgeGraph(backend=backend)
+    if backend == 'compact':
+        kg.graph = CompactDiGraph.from_state(state.pop('graph'))
+        kg._successors_by_relationship = kg.graph.successors_by_relationship
+        kg._predecessors_by_relationship = kg.graph.predecessors_by_relationship
+    else:
+        graph_attrs, nodes, succ, pred = state.pop('graph')
+        graph = nx.DiGraph()
+        graph.graph.update(graph_attrs)
+        # networkx resets its cached views when these are assigned
+        graph._node = nodes
+        graph._adj = succ
+        graph._pred = pred
+        kg.graph = graph
+    for field in _STATE_FIELDS:
+        if field in state:
+            setattr(kg, field, state[field])
+
+    kg_logger.info(f"Knowledge Graph loaded from snapshot: {header['nodes']} nodes, "
+                   f"{header['edges']} edges, {header['issues']} issues")
+    return kg
+
+
+def save_snapshot(kg: KnowledgeGraph, path: str, compression: str = 'zlib') -> Dict[str, Any]:
+    """
+    Save a Knowledge Graph snapshot to a file
+
+    Args:
+        kg: Knowledge Graph to save
+        path: Output file path
+        compression: 'none', 'zlib' or 'lzma'
+
+    Returns:
+        Dict[str, Any]: Snapshot header (counts, version, creation time, compression) and size in bytes
+    """
+    data = dumps_snapshot(kg, compression)
+    with open(path, 'wb') as f:
+        f.write(data)
+    info = _split_snapshot(data)[0]
+    info['size_bytes'] = len(data)
+    kg_logger.info(f"Knowledge Graph snapshot saved to {path} ({len(data)} bytes, {compression})")
+    return info
+
+
+def load_snapshot(path: str) -> KnowledgeGraph:
+    """
+    Load a Knowledge Graph from a snapshot file
+
+    Args:
+        path: Snapshot file path
+
+    Returns:
+        KnowledgeGraph: Loaded graph
+    """
+    with open(path, 'rb') as f:
+        return loads_snapshot(f.read())
+
+
+def read_snapshot_info(path: str) -> Dict[str, Any]:
+    """
+    Read a snapshot's header without decoding the graph
+
+    Args:
+        path: Snapshot file path
+
+    Returns:
+        Dict[str, Any]: Node, edge and issue counts, graph version, graph backend
+            (absent in older files), creation time, schema version and compression
+    """
+    with open(path, 'rb') as f:
+        preamble = f.read(_PREAMBLE.size)
+        if len(preamble) == _PREAMBLE.size:
+            preamble += f.read(_PREAMBLE.unpack(preamble)[3])
+    return _split_snapshot(preamble)[0]
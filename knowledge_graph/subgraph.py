@@ -0,0 +1,147 @@
+"""
+Token-Budgeted Subgraph Extraction
+
+Selects the part of a KnowledgeGraph that is most relevant to a troubleshooting
+target and fits a token budget, so the LLM context stays bounded on noisy clusters.
+
+Every node near the seeds, carrying issues, or holding historical experience is
+scored with small integers:
+    proximity   2 * (max_hops + 1 - hops) within max_hops of a seed (undirected)
+    severity    critical 8, high 6, medium 3, low 1 for the worst issue of the node
+    recency     0..2 by the position of the node's newest issue in the issue list
+    experience  6 for HistoricalExperience nodes
+Scores are bucket sorted and nodes are taken greedily, best first, while their
+estimated tokens still fit. Ties keep discovery order (seeds, then breadth-first).
+All steps are linear in the nodes, edges and issues visited.
+"""
+
+import json
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, List
+
+from .knowledge_graph import KnowledgeGraph, kg_logger
+
+SEVERITY_SCORES = {'critical': 8, 'high': 6, 'medium': 3, 'low': 1}
+RECENCY_LEVELS = 3
+HISTORICAL_EXPERIENCE_SCORE = 6
+DEFAULT_MAX_HOPS = 3
+
+
+def estimate_tokens(value: Any) -> int:
+    """
+    Estimate the LLM tokens of a value serialized as JSON (about 4 characters per token)
+
+    Args:
+        value: JSON-serializable value; other objects are serialized with str()
+
+    Returns:
+        int: Estimated token count
+    """
+    return (len(json.dumps(value, default=str)) + 3) // 4
+
+
+def score_nodes(kg: KnowledgeGraph, seeds: Iterable[str], max_hops: int = DEFAULT_MAX_HOPS) -> Dict[str, int]:
+    """
+    Score the nodes relevant to the seeds by distance, issue severity and recency
+
+    Args:
+        kg: Knowledge Graph
+        seeds: Node IDs of the troubleshooting target, e.g. the pod with the error
+        max_hops: Nodes farther than this from every seed get no proximity score
+
+    Returns:
+        Dict[str, int]: Node ID -> positive score, in discovery order
+    """
+    graph = kg.graph
+    frontier = [seed for seed in dict.fromkeys(seeds) if graph.has_node(seed)]
+    distance = {seed: 0 for seed in frontier}
+    hops = 0
+    while frontier and hops < max_hops:
+        hops += 1
+        next_frontier = []
+        for node_id in frontier:
+            for neighbor in chain(graph.successors(node_id), graph.predecessors(node_id)):
+                if neighbor not in distance:
+                    distance[neighbor] = hops
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    scores = {node_id: 2 * (max_hops + 1 - hops) for node_id, hops in distance.items()}
+
+    # Worst severity and newest issue position per node, in one pass over the issues
+    severity: Dict[str, int] = {}
+    newest: Dict[str, int] = {}
+    for position, issue in enumerate(kg.issues):
+        node_id = issue['node_id']
+        severity[node_id] = max(severity.get(node_id, 0), SEVERITY_SCORES.get(issue['severity'], 0))
+        newest[node_id] = position
+    total_issues = len(kg.issues)
+    for node_id, position in newest.items():
+        if graph.has_node(node_id):
+            recency = RECENCY_LEVELS * position // total_issues
+            scores[node_id] = scores.get(node_id, 0) + severity[node_id] + recency
+
+    for node_id in kg.find_nodes_by_type('HistoricalExperience'):
+        scores[node_id] = scores.get(node_id, 0) + HISTORICAL_EXPERIENCE_SCORE
+
+    return {node_id: score for node_id, score in scores.items() if score > 0}
+
+
+def extract_subgraph(kg: KnowledgeGraph, seeds: Iterable[str], token_budget: int,
+                     format_node: Callable[[str], Dict[str, Any]],
+                     max_hops: int = DEFAULT_MAX_HOPS,
+                     node_tokens: Callable[[Dict[str, Any]], int] = estimate_tokens) -> Dict[str, Any]:
+    """
+    Extract the best-scoring subgraph that fits a token budget
+
+    A node is added with its relationships to nodes already selected; it is
+    skipped when that does not fit the remaining budget, and smaller nodes
+    with lower scores may still be added.
+
+    Args:
+        kg: Knowledge Graph
+        seeds: Node IDs of the troubleshooting target
+        token_budget: Tokens available for nodes and relationships
+        format_node: Builds the context entry of a node ID
+        max_hops: Proximity radius around the seeds
+        node_tokens: Estimates the tokens of one formatted node entry
+
+    Returns:
+        Dict[str, Any]: nodes (formatted entries in selection order), node_ids, relationships,
+            estimated_tokens, token_budget, nodes_considered and nodes_dropped
+    """
+    scores = score_nodes(kg, seeds, max_hops)
+    buckets: List[List[str]] = [[] for _ in range(max(scores.values(), default=0) + 1)]
+    for node_id, score in scores.items():
+        buckets[score].append(node_id)
+
+    graph = kg.graph
+    selected: Dict[str, None] = {}
+    nodes = []
+    relationships = []
+    used = 0
+    for bucket in reversed(buckets):
+        for node_id in bucket:
+            entry = format_node(node_id)
+            edges = [{"source": source, "target": target, "type": data.get('relationship', 'connected_to')}
+                     for source, target, data in chain(graph.out_edges(node_id, data=True),
+                                                       graph.in_edges(node_id, data=True))
+                     if (target if source == node_id else source) in selected]
+            cost = node_tokens(entry) + estimate_tokens(edges)
+            if used + cost > token_budget:
+                continue
+            used += cost
+            selected[node_id] = None
+            nodes.append(entry)
+            relationships.extend(edges)
+
+    kg_logger.info(f"Extracted subgraph: {len(selected)}/{len(scores)} nodes, "
+                   f"~{used} of {token_budget} tokens")
+    return {
+        "nodes": nodes,
+        "node_ids": list(selected),
+        "relationships": relationships,
+        "estimated_tokens": used,
+        "token_budget": token_budget,
+        "nodes_considered": len(scores),
+        "nodes_dropped": len(scores) - len(selected)
+    }
@@ -37,6 +37,7 @@ from tools.core.knowledge_graph import (
     kg_get_summary,
     kg_analyze_issues,
     kg_print_graph,
+    kg_batch_query,
     # Entity ID helper tools
     kg_get_entity_of_pod,
     kg_get_entity_of_pvc,
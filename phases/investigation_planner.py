@@ -48,7 +48,7 @@ class InvestigationPlanner:
         validate_knowledge_graph(self.kg, self.__class__.__name__)
         
         # Initialize components
-        self.kg_context_builder = KGContextBuilder(knowledge_graph)
+        self.kg_context_builder = KGContextBuilder(knowledge_graph, config_data)
         self.tool_registry_builder = ToolRegistryBuilder()
         self.llm_plan_generator = LLMPlanGenerator(config_data)
         self.rule_based_plan_generator = RuleBasedPlanGenerator(knowledge_graph)
@@ -9,6 +9,7 @@ for consumption by the Investigation Planner and LLM.
 import logging
 from typing import Dict, List, Any, Set
 from knowledge_graph import KnowledgeGraph
+from knowledge_graph.subgraph import DEFAULT_MAX_HOPS, estimate_tokens, extract_subgraph
 from phases.utils import validate_knowledge_graph
 
 logger = logging.getLogger(__name__)
@@ -21,15 +22,20 @@ class KGContextBuilder:
     to provide context for investigation planning.
     """
     
-    def __init__(self, knowledge_graph):
+    def __init__(self, knowledge_graph, config_data: Dict[str, Any] = None):
         """
         Initialize the Knowledge Graph Context Builder
         
         Args:
             knowledge_graph: KnowledgeGraph instance from Phase 0
+            config_data: Configuration data; plan_phase.kg_context_token_budget bounds the
+                context size (unbounded when unset or 0)
         """
         self.kg = knowledge_graph
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        plan_config = (config_data or {}).get('plan_phase', {})
+        self.token_budget = plan_config.get('kg_context_token_budget')
+        self.max_hops = plan_config.get('kg_context_max_hops', DEFAULT_MAX_HOPS)
         
         # Validate knowledge_graph is a KnowledgeGraph instance
         validate_knowledge_graph(self.kg, self.__class__.__name__)
@@ -48,6 +54,8 @@ class KGContextBuilder:
         """
         # Extract relevant nodes and relationships from Knowledge Graph
         target_entities = self.identify_target_entities(pod_name, namespace)
+        if self.token_budget:
+            return self._prepare_budgeted_context(target_entities)
         issues_analysis = self.analyze_existing_issues()
         
         # Format Knowledge Graph data for LLM
@@ -131,6 +139,52 @@ class KGContextBuilder:
         
         return kg_context
     
+    def _prepare_budgeted_context(self, target_entities: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Prepare the Knowledge Graph context from the subgraph that best fits the token budget
+        
+        Nodes are ranked by distance from the target pod, issue severity and recency;
+        the summary is always included and counted against the budget.
+        
+        Args:
+            target_entities: Target entities from identify_target_entities
+            
+        Returns:
+            Dict[str, Any]: Structured Knowledge Graph context with a "subgraph" report
+        """
+        summary = self.kg.get_summary()
+        subgraph = extract_subgraph(
+            self.kg, [target_entities["pod"]], max(0, self.token_budget - estimate_tokens(summary)),
+            self.format_node_for_llm, self.max_hops, node_tokens=self._context_tokens)
+        
+        selected = set(subgraph["node_ids"])
+        kg_context = {
+            "nodes": subgraph["nodes"],
+            "relationships": subgraph["relationships"],
+            # Issues of the selected nodes, keeping the severity order of get_all_issues
+            "issues": [issue for issue in self.kg.get_all_issues() if issue['node_id'] in selected],
+            "historical_experiences": [node for node in subgraph["nodes"]
+                                       if node["type"] == "HistoricalExperience"],
+            "summary": summary,
+            "subgraph": {key: subgraph[key] for key in
+                         ("estimated_tokens", "token_budget", "nodes_considered", "nodes_dropped")}
+        }
+        kg_context["subgraph"]["estimated_tokens"] += estimate_tokens(summary)
+        kg_context["subgraph"]["token_budget"] = self.token_budget
+        
+        self.logger.info(f"Knowledge Graph context: {len(selected)} nodes, "
+                         f"~{kg_context['subgraph']['estimated_tokens']} of {self.token_budget} tokens, "
+                         f"{subgraph['nodes_dropped']} relevant nodes dropped")
+        return kg_context
+    
+    @staticmethod
+    def _context_tokens(node: Dict[str, Any]) -> int:
+        """Tokens a formatted node adds to the context, counting the copies of its issues and experience"""
+        tokens = estimate_tokens(node) + estimate_tokens(node.get("issues", []))
+        if node.get("type") == "HistoricalExperience":
+            tokens += estimate_tokens(node)
+        return tokens
+    
     def format_node_for_llm(self, node_id: str) -> Dict[str, Any]:
         """
         Format a node for LLM consumption
@@ -150,7 +204,7 @@ class KGContextBuilder:
             "type": node_attrs.get("gnode_subtype", "unknown"),
             "attributes": {k: v for k, v in node_attrs.items() 
                           if k not in ["gnode_subtype", "issues"]},
-            "issues": node_attrs.get("issues", [])
+            "issues": self.kg.get_issues_by_node(node_id)
         }
     
     def analyze_existing_issues(self) -> Dict[str, Any]:
@@ -185,6 +239,7 @@ class KGContextBuilder:
             "total_count": len(issues),
             "entities_with_issues": []
         }
+        seen_entities = set()
         
         for issue in issues:
             severity = issue.get('severity', 'unknown')
@@ -201,7 +256,8 @@ class KGContextBuilder:
             issue_analysis["by_type"][issue_type].append(issue)
             
             # Track entities with issues
-            if node_id and node_id not in issue_analysis["entities_with_issues"]:
+            if node_id and node_id not in seen_entities:
+                seen_entities.add(node_id)
                 issue_analysis["entities_with_issues"].append(node_id)
         
         return issue_analysis
@@ -19,7 +19,7 @@ from langchain_core.messages import SystemMessage, HumanMessage
 from tools.core.mcp_adapter import get_mcp_adapter
 
 from tools.diagnostics.hardware import xfs_repair_check  # Importing the xfs_repair_check tool
-from phases.utils import format_historical_experiences_from_collected_info, handle_exception
+from phases.utils import format_historical_experiences_from_collected_info, graph_run_config, handle_exception
 
 logger = logging.getLogger(__name__)
 
@@ -169,7 +169,7 @@ If the issue can be resolved automatically:
             # Run graph with timeout
             try:
                 response = await asyncio.wait_for(
-                    graph.ainvoke(formatted_query, config={"recursion_limit": 100}),
+                    graph.ainvoke(formatted_query, config=graph_run_config(timeout_seconds)),
                     timeout=timeout_seconds
                 )
                 self.console.print("[green]Analysis complete![/green]")
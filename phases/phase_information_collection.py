@@ -13,6 +13,7 @@ from rich.console import Console
 from rich.panel import Panel
 
 from information_collector import ComprehensiveInformationCollector
+from knowledge_graph import save_snapshot
 from phases.utils import handle_exception
 
 logger = logging.getLogger(__name__)
@@ -68,6 +69,7 @@ class InformationCollectionPhase:
             # Format collected data into expected structure
             collected_info = self._format_collected_data(collection_result, knowledge_graph)
             
+            self._save_knowledge_graph_snapshot(knowledge_graph)
             self._print_knowledge_graph_summary(knowledge_graph)
             
             return collected_info
@@ -100,6 +102,25 @@ class InformationCollectionPhase:
             "knowledge_graph": knowledge_graph
         }
     
+    def _save_knowledge_graph_snapshot(self, knowledge_graph: Any) -> None:
+        """
+        Save the Knowledge Graph snapshot configured under troubleshoot.knowledge_graph_snapshot
+        
+        Args:
+            knowledge_graph: Knowledge Graph instance
+        """
+        snapshot_config = (self.config_data.get('troubleshoot', {}) or {}).get('knowledge_graph_snapshot', {}) or {}
+        path = snapshot_config.get('path')
+        if not path or knowledge_graph is None:
+            return
+        
+        try:
+            info = save_snapshot(knowledge_graph, path, snapshot_config.get('compression', 'zlib'))
+            self.logger.info(f"Knowledge Graph snapshot saved to {path}: {info['nodes']} nodes, "
+                             f"{info['edges']} edges, {info['size_bytes']} bytes")
+        except Exception as e:
+            handle_exception("_save_knowledge_graph_snapshot", e, self.logger)
+    
     def _create_empty_collected_info(self, error_msg: str) -> Dict[str, Any]:
         """
         Create empty collected info structure with error message
@@ -15,7 +15,7 @@ from langgraph.graph import StateGraph
 from tools.core.mcp_adapter import get_mcp_adapter
 from phases.llm_factory import LLMFactory
 from tools.diagnostics.hardware import xfs_repair_check  # Importing the xfs_repair_check tool
-from phases.utils import format_historical_experiences_from_collected_info, handle_exception
+from phases.utils import format_historical_experiences_from_collected_info, graph_run_config, handle_exception
 
 logger = logging.getLogger(__name__)
 
@@ -80,7 +80,7 @@ class RemediationPhase:
             # Run graph with timeout
             try:
                 response = await asyncio.wait_for(
-                    graph.ainvoke(formatted_query, config={"recursion_limit": 100}),
+                    graph.ainvoke(formatted_query, config=graph_run_config(timeout_seconds)),
                     timeout=timeout_seconds
                 )
                 self.console.print("[green]Remediation complete![/green]")
@@ -239,7 +239,7 @@ HISTORICAL EXPERIENCE:
             # Run graph with timeout
             try:
                 response = await asyncio.wait_for(
-                    graph.ainvoke(formatted_query, config={"recursion_limit": 100}),
+                    graph.ainvoke(formatted_query, config=graph_run_config(timeout_seconds)),
                     timeout=timeout_seconds
                 )
                 self.console.print("[green]Remediation complete![/green]")
@@ -23,11 +23,14 @@ from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import BaseTool
 
 from phases.llm_factory import LLMFactory
-from phases.utils import handle_exception, format_json_safely, generate_basic_fallback_plan
+from phases.utils import handle_exception, format_json_safely, generate_basic_fallback_plan, graph_run_config
 from tools.core.mcp_adapter import get_mcp_adapter
 from knowledge_graph import KnowledgeGraph
 from troubleshooting.execute_tool_node import ExecuteToolNode
 from troubleshooting.strategies import ExecutionType
+from troubleshooting.tool_memo import ToolResultMemo
+from troubleshooting.resource_scheduler import initialize_resource_scheduler
+from tools.core.deadline import load_tool_timeouts
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -358,7 +361,10 @@ class PlanPhaseReActGraph:
             parallel_tools=parallel_tools,
             serial_tools=serial_tools,
             handle_tool_errors=True,
-            messages_key="messages"
+            messages_key="messages",
+            tool_memo=ToolResultMemo(self.config_data),
+            resource_scheduler=initialize_resource_scheduler(self.config_data),
+            tool_timeouts=load_tool_timeouts(self.config_data)
         )
         
         # Create a hook manager for console output
@@ -722,9 +728,11 @@ async def run_plan_phase_react(pod_name: str, namespace: str, volume_path: str,
             "knowledge_graph": None  # Knowledge graph information is now in messages
         }
         
-        # Run the graph
+        # Run the graph; its tool calls are cut short by the plan phase budget
         logger.info("Running Plan Phase ReAct graph")
-        final_state = graph.invoke(initial_state)
+        timeout_seconds = ((config_data or {}).get('plan_phase', {}) or {}).get('timeout_seconds', 1800)
+        # recursion_limit stays at LangGraph's default of 25, as before the deadline was passed
+        final_state = graph.invoke(initial_state, config=graph_run_config(timeout_seconds, recursion_limit=25))
         
         # Extract the investigation plan
         investigation_plan = react_graph.extract_plan_from_state(final_state)
@@ -7,8 +7,11 @@ of the troubleshooting process to reduce code duplication and improve maintainab
 """
 
 import logging
+import time
 from typing import Dict, List, Any, Optional
 
+from tools.core.deadline import TOOL_DEADLINE_KEY
+
 logger = logging.getLogger(__name__)
 
 
@@ -139,6 +142,27 @@ Step F2: Search for any Drive entities | Tool: kg_get_related_entities(entity_ty
     return basic_plan
 
 
+def graph_run_config(timeout_seconds: float, recursion_limit: int = 100) -> Dict[str, Any]:
+    """
+    Build the RunnableConfig for a phase graph run with a time budget
+
+    The phase deadline travels in the configurable section down to every
+    ExecuteToolNode, which cuts each tool call's timeout short so no call
+    outlives the phase.
+
+    Args:
+        timeout_seconds: Phase budget in seconds
+        recursion_limit: LangGraph recursion limit
+
+    Returns:
+        Dict[str, Any]: Config for graph.ainvoke
+    """
+    return {
+        "recursion_limit": recursion_limit,
+        "configurable": {TOOL_DEADLINE_KEY: time.monotonic() + timeout_seconds},
+    }
+
+
 def handle_exception(func_name: str, exception: Exception, logger_instance: Optional[logging.Logger] = None) -> str:
     """
     Standardized exception handling with proper logging
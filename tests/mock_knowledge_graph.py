@@ -3,10 +3,12 @@
 Mock Knowledge Graph implementation for testing and demonstration purposes
 """
 
-from typing import Dict, Any, List, Optional, Set, Tuple
+from typing import Dict, Any, Iterable, List, NamedTuple, Optional, Set, Tuple
 import networkx as nx
 import json
 
+from knowledge_graph import KnowledgeGraph
+
 class MockKnowledgeGraph:
     """
     Mock implementation of the Knowledge Graph for testing and demonstration
@@ -626,3 +628,61 @@ def create_mock_knowledge_graph():
         MockKnowledgeGraph: Mock Knowledge Graph instance
     """
     return MockKnowledgeGraph()
+
+
+class VolumeChain(NamedTuple):
+    """A pod using a PVC bound to a PV; pvc, pv and drive are optional"""
+    pod: str
+    namespace: str
+    node_name: Optional[str] = None
+    pvc: Optional[str] = None
+    pv: Optional[str] = None
+    drive: Optional[str] = None
+
+
+def build_knowledge_graph(nodes: Dict[str, Dict[str, Any]] = None,
+                          drives: Dict[str, Dict[str, Any]] = None,
+                          located_on: Dict[str, str] = None,
+                          chains: Iterable[VolumeChain] = (),
+                          issues: Iterable[Tuple] = (),
+                          backend: str = 'networkx',
+                          maps_to: Dict[str, Any] = None) -> KnowledgeGraph:
+    """
+    Build a real KnowledgeGraph for tests from a compact description
+
+    Entities are added in argument order: nodes, drives, drive locations, volume
+    chains (pod -> uses -> PVC -> bound_to -> PV -> maps_to -> drive), issues.
+
+    Args:
+        nodes: Node name -> attributes
+        drives: Drive UUID -> attributes
+        located_on: Drive UUID -> name of the node it is located on
+        chains: Pods and the volumes they use
+        issues: (gnode ID, issue type, description, severity[, details])
+        backend: KnowledgeGraph backend
+        maps_to: Attributes of the PV -> drive relationships
+
+    Returns:
+        KnowledgeGraph: The graph
+    """
+    kg = KnowledgeGraph(backend=backend)
+    for name, attributes in (nodes or {}).items():
+        kg.add_gnode_node(name, **attributes)
+    for uuid, attributes in (drives or {}).items():
+        kg.add_gnode_drive(uuid, **attributes)
+    for uuid, node_name in (located_on or {}).items():
+        kg.add_relationship(f"gnode:Drive:{uuid}", f"gnode:Node:{node_name}", 'located_on')
+    for chain in chains:
+        pod_attributes = {'node_name': chain.node_name} if chain.node_name else {}
+        pod = kg.add_gnode_pod(chain.pod, chain.namespace, **pod_attributes)
+        if chain.pvc:
+            pvc = kg.add_gnode_pvc(chain.pvc, chain.namespace)
+            kg.add_relationship(pod, pvc, 'uses')
+            if chain.pv:
+                pv = kg.add_gnode_pv(chain.pv)
+                kg.add_relationship(pvc, pv, 'bound_to')
+                if chain.drive:
+                    kg.add_relationship(pv, f"gnode:Drive:{chain.drive}", 'maps_to', **(maps_to or {}))
+    for node_id, issue_type, description, severity, *details in issues:
+        kg.add_issue(node_id, issue_type, description, severity, *details)
+    return kg
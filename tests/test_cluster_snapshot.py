@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for the parse-once cluster snapshot behind the Phase 0 metadata parsers.
+"""
+
+import os
+import sys
+
+import yaml
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from information_collector.cluster_snapshot import ClusterSnapshot
+from information_collector.metadata_parsers import MetadataParsers
+
+
+def _drives_yaml(count):
+    return yaml.safe_dump({
+        'apiVersion': 'v1',
+        'kind': 'List',
+        'items': [{
+            'kind': 'Drive',
+            'metadata': {'name': f"drive-{i:04d}"},
+            'spec': {'Health': 'GOOD' if i % 2 else 'BAD', 'NodeId': f"node-{i % 3}",
+                     'Path': f"/dev/sd{i}", 'Size': 1000 + i}
+        } for i in range(count)]
+    })
+
+
+def _make_parsers(csi_data):
+    parsers = MetadataParsers.__new__(MetadataParsers)
+    parsers.collected_data = {'csi_baremetal': csi_data}
+    parsers.cluster_snapshot = ClusterSnapshot(parsers.collected_data)
+    return parsers
+
+
+def test_listing_is_parsed_once_for_many_lookups():
+    """Per-drive parsing reuses one parsed listing"""
+    parsers = _make_parsers({'drives': _drives_yaml(50)})
+
+    for i in range(50):
+        info = parsers._parse_comprehensive_drive_info(f"drive-{i:04d}")
+        assert info['Path'] == f"/dev/sd{i}"
+        assert info['NodeId'] == f"node-{i % 3}"
+
+    assert parsers.cluster_snapshot.stats['parses'] == 1
+
+
+def test_indexes_by_node_storage_class_and_location():
+    """Secondary indexes cover node, storage class and location fields"""
+    snapshot = ClusterSnapshot({'csi_baremetal': {
+        'drives': _drives_yaml(6),
+        'available_capacity': yaml.safe_dump({'items': [
+            {'metadata': {'name': 'ac-1'}, 'spec': {'storageClass': 'HDD', 'location': 'drive-0001', 'NodeId': 'node-1'}},
+            {'metadata': {'name': 'ac-2'}, 'spec': {'storageClass': 'SSD', 'location': 'drive-0002', 'NodeId': 'node-2'}},
+        ]}),
+        'lvgs': yaml.safe_dump({'items': [
+            {'metadata': {'name': 'lvg-1'}, 'spec': {'Locations': ['drive-0003', 'drive-0004'], 'Node': 'node-0'}},
+        ]}),
+    }})
+
+    assert [d['metadata']['name'] for d in snapshot.by_node('drives', 'node-0')] == ['drive-0000', 'drive-0003']
+    assert [ac['metadata']['name'] for ac in snapshot.by_storage_class('available_capacity', 'SSD')] == ['ac-2']
+    assert snapshot.by_location('lvgs', 'drive-0004')[0]['metadata']['name'] == 'lvg-1'
+    assert snapshot.get('drives', 'missing') is None
+
+
+def test_replaced_output_is_reparsed():
+    """A listing replaced in collected_data invalidates its index"""
+    parsers = _make_parsers({'drives': _drives_yaml(2)})
+    assert parsers.cluster_snapshot.get('drives', 'drive-0001') is not None
+
+    parsers.collected_data['csi_baremetal']['drives'] = _drives_yaml(5)
+
+    assert parsers.cluster_snapshot.get('drives', 'drive-0004') is not None
+    assert parsers.cluster_snapshot.stats['parses'] == 2
+
+
+def test_unparseable_output_uses_text_fallback():
+    """Parse errors surface to the caller so the line-based fallback runs"""
+    parsers = _make_parsers({'drives': "name: drive-x\n  Health: SUSPECT\n: ["})
+
+    info = parsers._parse_comprehensive_drive_info('drive-x')
+
+    assert info['Health'] == 'SUSPECT'
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for the Phase 0 collection task graph scheduler.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from information_collector.collection_scheduler import CollectionScheduler, API_SERVER, node_resource
+
+
+class Recorder:
+    """Records task order and peak concurrency per resource"""
+
+    def __init__(self):
+        self.order = []
+        self.active = {}
+        self.peak = {}
+        self._lock = threading.Lock()
+
+    def task(self, name, resource=None, delay=0.05):
+        def run():
+            with self._lock:
+                self.order.append(name)
+                self.active[resource] = self.active.get(resource, 0) + 1
+                self.peak[resource] = max(self.peak.get(resource, 0), self.active[resource])
+            time.sleep(delay)
+            with self._lock:
+                self.active[resource] -= 1
+        return run
+
+
+def _scheduler(**settings):
+    return CollectionScheduler({'troubleshoot': {'collection_scheduler': settings}})
+
+
+def test_independent_tasks_overlap():
+    """API listing and node SSH collection run at the same time"""
+    recorder = Recorder()
+    scheduler = _scheduler()
+    scheduler.add_task('csi_baremetal', recorder.task('csi', delay=0.2), resources=[API_SERVER])
+    scheduler.add_task('node_system:n1', recorder.task('n1', delay=0.2), resources=[node_resource('n1')])
+
+    start = time.monotonic()
+    timings = asyncio.run(scheduler.run())
+
+    assert time.monotonic() - start < 0.35
+    assert timings['csi_baremetal']['status'] == 'completed'
+    assert timings['node_system:n1']['duration_seconds'] >= 0.2
+
+
+def test_dependencies_and_resource_limits():
+    """Dependents wait for their dependencies and limits cap concurrency"""
+    recorder = Recorder()
+    scheduler = _scheduler(api_server_concurrency=2, per_node_concurrency=1)
+    for i in range(5):
+        scheduler.add_task(f'api:{i}', recorder.task(f'api:{i}', API_SERVER), resources=[API_SERVER])
+    for i in range(3):
+        scheduler.add_task(f'ssh:{i}', recorder.task(f'ssh:{i}', 'n1'), resources=[node_resource('n1')])
+    scheduler.add_task('smart:d1', recorder.task('smart:d1', 'n1'), depends_on=['api:0', 'api:4'],
+                       resources=lambda: [node_resource('n1')])
+
+    asyncio.run(scheduler.run())
+
+    assert recorder.peak[API_SERVER] == 2
+    assert recorder.peak['n1'] == 1
+    assert recorder.order.index('smart:d1') > recorder.order.index('api:4')
+
+
+def test_timeouts_and_failures_are_recorded():
+    """A slow or failing task is reported without blocking the others"""
+    def fail():
+        raise RuntimeError("ssh unreachable")
+
+    scheduler = _scheduler(task_timeouts={'slow': 0.05})
+    scheduler.add_task('slow:n1', time.sleep, (0.5,))
+    scheduler.add_task('broken', fail)
+    scheduler.add_task('after', lambda: None, depends_on=['slow:n1', 'broken'])
+
+    timings = asyncio.run(scheduler.run())
+
+    assert timings['slow:n1']['status'] == 'timeout'
+    assert timings['broken']['status'] == 'failed'
+    assert timings['after']['status'] == 'completed'
+    assert len(scheduler.errors()) == 2
+
+
+def test_invalid_graphs_are_rejected():
+    """Unknown dependencies and cycles fail before anything runs"""
+    scheduler = _scheduler()
+    scheduler.add_task('a', lambda: None, depends_on=['b'])
+    scheduler.add_task('b', lambda: None, depends_on=['a'])
+
+    with pytest.raises(ValueError):
+        asyncio.run(scheduler.run())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for the storage fan-out patterns and the sparse-matrix analytics mode of the Knowledge Graph.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from knowledge_graph import KnowledgeGraph
+from tests.mock_knowledge_graph import VolumeChain, build_knowledge_graph
+
+
+def _graph():
+    """Three pods on worker-1 sharing drive d1, two bad drives on worker-1 and a NotReady worker-2"""
+    placement = [('d1', 'worker-1'), ('d1', 'worker-1'), ('d3', 'worker-2'), ('d4', 'worker-3'), ('d1', 'worker-1')]
+    return build_knowledge_graph(
+        nodes={'worker-1': {'Ready': True}, 'worker-2': {'Ready': False}, 'worker-3': {'Ready': True}},
+        drives={'d1': {'Health': 'BAD'}, 'd2': {'Health': 'SUSPECT'}, 'd3': {'Health': 'GOOD'},
+                'd4': {'Health': 'GOOD'}},
+        located_on={'d1': 'worker-1', 'd2': 'worker-1', 'd3': 'worker-2', 'd4': 'worker-3'},
+        chains=[VolumeChain(f'app-{i}', 'prod', node_name, f'data-{i}', f'pv-{i}', drive)
+                for i, (drive, node_name) in enumerate(placement)],
+        issues=[('gnode:Drive:d1', 'disk_health', 'Drive health issue: BAD', 'critical'),
+                ('gnode:Node:worker-2', 'node_not_ready', 'Node worker-2 is not ready', 'critical')])
+
+
+def _patterns(analysis, pattern_type):
+    return [pattern for pattern in analysis['issue_patterns'] if pattern['type'] == pattern_type]
+
+
+def test_fanout_patterns():
+    """Shared drives, nodes with several unhealthy drives and the blast radius of troubled nodes are reported"""
+    analysis = _graph().analyze_issues()
+
+    shared = _patterns(analysis, 'multiple_pods_same_drive')
+    assert [(p['drive'], p['pods']) for p in shared] == [
+        ('gnode:Drive:d1', ['gnode:Pod:prod/app-0', 'gnode:Pod:prod/app-1', 'gnode:Pod:prod/app-4'])]
+
+    unhealthy = _patterns(analysis, 'multiple_unhealthy_drives_same_node')
+    assert [(p['node'], p['drives']) for p in unhealthy] == [
+        ('gnode:Node:worker-1', ['gnode:Drive:d1', 'gnode:Drive:d2'])]
+
+    blast = {p['node']: p for p in _patterns(analysis, 'node_blast_radius')}
+    assert set(blast) == {'gnode:Node:worker-1', 'gnode:Node:worker-2'}
+    assert blast['gnode:Node:worker-1']['unhealthy_drives'] == 2
+    assert blast['gnode:Node:worker-1']['pods'] == [
+        'gnode:Pod:prod/app-0', 'gnode:Pod:prod/app-1', 'gnode:Pod:prod/app-4']
+    assert blast['gnode:Node:worker-2']['pods'] == ['gnode:Pod:prod/app-2']
+
+
+def test_sparse_mode_matches_python_mode():
+    """Sparse matrix analytics return the same root causes and patterns as the dict-based analysis"""
+    pytest.importorskip('scipy')
+    kg = _graph()
+    expected = kg.analyze_issues()
+
+    assert kg.set_analytics_mode('sparse') == 'sparse'
+    analysis = kg.analyze_issues()
+
+    assert analysis['issue_patterns'] == expected['issue_patterns']
+    assert analysis['potential_root_causes'] == expected['potential_root_causes']
+    assert kg.generate_fix_plan(analysis) == kg.generate_fix_plan(expected)
+    assert kg.get_cache_stats()['analyses']['analyze_issues']['misses'] == 2
+
+
+def test_chain_matrices_count_paths():
+    """The exported Pod x Drive product counts every Pod -> PVC -> PV -> Drive path"""
+    pytest.importorskip('scipy')
+    from knowledge_graph.analytics import chain_matrices
+
+    kg = _graph()
+    pvc = kg.add_gnode_pvc('extra', 'prod')
+    kg.add_relationship('gnode:Pod:prod/app-0', pvc, 'uses')
+    kg.add_relationship(pvc, 'gnode:PV:pv-0', 'bound_to')
+
+    matrices = chain_matrices(kg)
+    assert chain_matrices(kg) is matrices
+    paths = matrices.pod_drive_paths()
+    assert paths.shape == (5, 4)
+    assert paths[matrices.pods.index('gnode:Pod:prod/app-0'), 0] == 2
+    assert list(matrices.unhealthy_drives_per_node()) == [2, 0, 0]
+
+
+def test_unknown_analytics_mode_is_rejected():
+    """Only the python and sparse engines exist"""
+    with pytest.raises(ValueError):
+        KnowledgeGraph().set_analytics_mode('gpu')
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the batched Knowledge Graph query tool and volume chain traversal.
+"""
+
+import json
+import os
+import sys
+
+import yaml
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.core.knowledge_graph import initialize_knowledge_graph, kg_batch_query, kg_get_entity_info
+from tools.registry import get_knowledge_graph_tools, get_phase1_tools
+from tests.mock_knowledge_graph import VolumeChain, build_knowledge_graph
+
+
+def _graph():
+    """One pod whose PVC is bound to a PV on a drive and to an LVG-backed volume"""
+    kg = build_knowledge_graph(
+        nodes={'worker-1': {'Ready': True}}, drives={'d1': {'Health': 'BAD'}}, located_on={'d1': 'worker-1'},
+        chains=[VolumeChain('web', 'prod', 'worker-1', 'data-web', 'pv-1', 'd1'), VolumeChain('other', 'prod')],
+        issues=[('gnode:Drive:d1', 'disk_health', 'Drive health is BAD', 'high')])
+    lvg = kg.add_gnode_lvg('lvg-1')
+    volume = kg.add_gnode_volume('vol-1', 'prod')
+    kg.add_relationship('gnode:PVC:prod/data-web', volume, 'bound_to')
+    kg.add_relationship(volume, lvg, 'bound_to')
+    kg.add_relationship(lvg, 'gnode:Drive:d1', 'contains')
+    kg.add_relationship('gnode:Node:worker-1', 'gnode:Drive:d1', 'related_to')
+    return kg
+
+
+def test_volume_chain_follows_storage_relationships():
+    """The chain covers PVC, PV, Volume, LVG, Drive and Node but not unrelated pods"""
+    kg = _graph()
+
+    assert kg.get_volume_chain('gnode:Pod:prod/web') == [
+        'gnode:Pod:prod/web', 'gnode:PVC:prod/data-web', 'gnode:PV:pv-1', 'gnode:Volume:prod/vol-1',
+        'gnode:Drive:d1', 'gnode:LVG:lvg-1', 'gnode:Node:worker-1']
+    assert kg.get_volume_chain('gnode:PV:pv-1') == ['gnode:PV:pv-1', 'gnode:Drive:d1', 'gnode:Node:worker-1']
+    assert kg.get_volume_chain('gnode:Pod:prod/missing') == []
+
+
+def test_batch_query_matches_single_entity_info():
+    """Each batched entry equals the kg_get_entity_info result; duplicates and misses are reported once"""
+    initialize_knowledge_graph(_graph())
+
+    result = json.loads(kg_batch_query.invoke({
+        'entities': ['gnode:Drive:d1', 'Node:worker-1', 'Drive:d1', 'PV:missing', 'no-type'],
+    }))
+
+    assert [entity['node_id'] for entity in result['entities']] == ['gnode:Drive:d1', 'gnode:Node:worker-1']
+    assert result['entities'][0] == json.loads(kg_get_entity_info.invoke({'entity_type': 'Drive', 'id': 'd1'}))
+    assert result['entities'][0]['issues'][0]['type'] == 'disk_health'
+    assert result['not_found'] == ['PV:missing', 'no-type']
+    assert result['volume_chain'] is None
+
+
+def test_batch_query_expands_volume_chain():
+    """A volume chain selector returns every entity on the chain in one response"""
+    initialize_knowledge_graph(_graph())
+
+    result = json.loads(kg_batch_query.invoke({
+        'entities': ['Node:worker-1'],
+        'volume_chain': 'Pod:prod/web',
+        'include_relationships': False,
+    }))
+
+    assert result['volume_chain'][0] == 'gnode:Pod:prod/web'
+    assert [entity['node_id'] for entity in result['entities']] == ['gnode:Node:worker-1'] + [
+        node_id for node_id in result['volume_chain'] if node_id != 'gnode:Node:worker-1']
+    assert result['entities'][1]['entity_type'] == 'Pod'
+    assert 'incoming_relationships' not in result['entities'][1]
+    assert result['total_count'] == 7
+
+
+def test_batch_query_is_registered_as_parallel_tool():
+    """The tool is available in Phase 1 and listed as parallel-safe"""
+    assert kg_batch_query in get_knowledge_graph_tools()
+    assert kg_batch_query in get_phase1_tools()
+    config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config.yaml')
+    with open(config_path) as f:
+        assert 'kg_batch_query' in yaml.safe_load(f)['tools']['parallel']
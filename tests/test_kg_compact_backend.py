@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the compact Knowledge Graph backend with interned integer node IDs and array adjacency.
+"""
+
+import os
+import sys
+
+import networkx as nx
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from knowledge_graph import KnowledgeGraph
+from knowledge_graph.compact_graph import CompactDiGraph
+from knowledge_graph.snapshot import dumps_snapshot, loads_snapshot
+from tools.core import knowledge_graph as kg_tools
+from tests.mock_knowledge_graph import VolumeChain, build_knowledge_graph
+
+
+def _graph(backend):
+    """Two pods on a BAD drive of a NotReady node, a third pod on a healthy drive"""
+    return build_knowledge_graph(
+        nodes={'worker-1': {'Ready': False}},
+        drives={'d1': {'Health': 'BAD', 'Path': '/dev/sdb'}, 'd2': {'Health': 'GOOD'}},
+        located_on={'d1': 'worker-1', 'd2': 'worker-1'},
+        chains=[VolumeChain(f'app-{i}', 'prod', 'worker-1', f'data-{i}', f'pv-{i}', drive)
+                for i, drive in enumerate(('d1', 'd1', 'd2'))],
+        issues=[('gnode:Drive:d1', 'disk_health', 'Drive health issue: BAD', 'critical'),
+                ('gnode:Node:worker-1', 'node_not_ready', 'Node worker-1 is not ready', 'critical')],
+        backend=backend, maps_to={'source': 'csi'})
+
+
+def _views(kg):
+    pod = 'gnode:Pod:prod/app-0'
+    return {
+        'nodes': list(kg.graph.nodes(data=True)),
+        'edges': list(kg.graph.edges(data=True)),
+        'in_edges': list(kg.graph.in_edges('gnode:Node:worker-1', data='relationship')),
+        'connected': kg.find_connected_nodes('gnode:PV:pv-0', 'maps_to'),
+        'predecessors': kg.find_predecessor_nodes('gnode:Drive:d1', 'maps_to'),
+        'path': kg.find_path(pod, 'gnode:Node:worker-1'),
+        'no_path': kg.find_path('gnode:Node:worker-1', pod),
+        'chain': kg.get_volume_chain(pod),
+        'analysis': kg.analyze_issues(),
+        'export': kg.export_graph(),
+    }
+
+
+def test_compact_backend_matches_networkx():
+    """Graph views, traversals, analysis and export are the same on both backends"""
+    expected, compact = _graph('networkx'), _graph('compact')
+    assert isinstance(compact.graph, CompactDiGraph)
+    assert _views(compact) == _views(expected)
+    assert compact.graph.edges['gnode:PV:pv-0', 'gnode:Drive:d1'] == {'relationship': 'maps_to', 'source': 'csi'}
+
+    for kg in (expected, compact):
+        kg.add_relationship('gnode:PVC:prod/data-2', 'gnode:PV:pv-2', 'related_to')
+        kg.remove_relationship('gnode:Drive:d2', 'gnode:Node:worker-1')
+        kg.remove_node('gnode:PV:pv-1')
+    assert _views(compact) == _views(expected)
+    assert compact.graph.number_of_edges() == expected.graph.number_of_edges() == 8
+
+    kg_tools.initialize_knowledge_graph(compact)
+    info = kg_tools.kg_get_entity_info.invoke({'entity_type': 'Drive', 'id': 'd1'})
+    assert 'gnode:PV:pv-0' in info
+
+
+def test_compact_snapshot_and_freeze():
+    """Compact graphs round-trip through snapshots, keep their backend and can be frozen"""
+    kg = _graph('compact')
+    loaded = loads_snapshot(dumps_snapshot(kg))
+
+    assert loaded.backend == 'compact'
+    assert _views(loaded) == _views(kg)
+    loaded.add_relationship('gnode:Pod:prod/app-2', 'gnode:Node:worker-1', 'runs_on')
+    assert loaded.find_connected_nodes('gnode:Pod:prod/app-2', 'runs_on') == ['gnode:Node:worker-1']
+    assert kg.find_connected_nodes('gnode:Pod:prod/app-2', 'runs_on') == []
+
+    loaded.freeze()
+    with pytest.raises(nx.NetworkXError):
+        loaded.add_relationship('gnode:Pod:prod/app-0', 'gnode:Node:worker-1', 'runs_on')
+    with pytest.raises(ValueError):
+        KnowledgeGraph(backend='igraph')
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests for the Knowledge Graph subtype, name, UUID and namespace indexes.
+"""
+
+import json
+import os
+import sys
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.core.knowledge_graph import initialize_knowledge_graph, kg_find_path, kg_get_entity_info
+from tests.mock_knowledge_graph import VolumeChain, build_knowledge_graph
+
+DRIVE_UUID = '2a96dfec-47db-449d-9789-0d81660c2c4d'
+
+
+def _graph():
+    kg = build_knowledge_graph(nodes={'worker-1': {'uuid': 'node-uuid-1'}}, drives={DRIVE_UUID: {'Health': 'GOOD'}},
+                               chains=[VolumeChain('web', 'default'), VolumeChain('web', 'prod')])
+    kg.add_gnode_pvc('data', 'prod')
+    kg.add_gnode_system_entity('kernel', 'logs')
+    return kg
+
+
+def test_indexes_follow_add_gnode_methods():
+    """Lookups by subtype, name, UUID and namespace use the indexes"""
+    kg = _graph()
+
+    assert kg.find_nodes_by_type('Pod') == ['gnode:Pod:default/web', 'gnode:Pod:prod/web']
+    assert kg.count_nodes_by_type('System') == 1
+    assert kg.find_nodes_by_name('Pod', 'web') == ['gnode:Pod:default/web', 'gnode:Pod:prod/web']
+    assert kg.find_nodes_by_uuid(DRIVE_UUID) == [f'gnode:Drive:{DRIVE_UUID}']
+    assert kg.find_node_id('Node', 'node-uuid-1') == 'gnode:Node:worker-1'
+    assert kg.find_node_id('Drive', 'node-uuid-1') is None
+    assert kg.find_nodes_by_namespace('prod') == ['gnode:Pod:prod/web', 'gnode:PVC:prod/data']
+    assert kg.find_nodes_by_namespace('prod', 'PVC') == ['gnode:PVC:prod/data']
+    assert kg.get_summary()['entity_counts']['Pod'] == 2
+
+
+def test_re_adding_a_node_refreshes_its_index_entries():
+    """Updating a node's uuid moves it in the UUID index without duplicates"""
+    kg = _graph()
+    kg.add_gnode_node('worker-1', uuid='node-uuid-2')
+
+    assert kg.find_nodes_by_uuid('node-uuid-1') == []
+    assert kg.find_node_id('Node', 'node-uuid-2') == 'gnode:Node:worker-1'
+    assert kg.find_nodes_by_type('Node') == ['gnode:Node:worker-1']
+
+
+def test_tools_resolve_names_and_uuids():
+    """KG tools accept a name or UUID instead of the full node ID"""
+    kg = _graph()
+    kg.add_relationship('gnode:Pod:prod/web', 'gnode:PVC:prod/data', 'uses')
+    initialize_knowledge_graph(kg)
+
+    info = json.loads(kg_get_entity_info.invoke({'entity_type': 'Drive', 'id': DRIVE_UUID}))
+    assert info['node_id'] == f'gnode:Drive:{DRIVE_UUID}'
+
+    path = json.loads(kg_find_path.invoke({'source_entity_type': 'Pod', 'source_id': 'prod/web',
+                                           'target_entity_type': 'PVC', 'target_id': 'data'}))
+    assert path['path_exists'] and path['path_length'] == 1
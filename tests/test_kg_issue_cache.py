@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for the Knowledge Graph issue indexes, mutation version and memoized analyses.
+"""
+
+import os
+import sys
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tests.mock_knowledge_graph import VolumeChain, build_knowledge_graph
+
+
+def _graph():
+    pod = 'gnode:Pod:default/pod-1'
+    return build_knowledge_graph(
+        drives={'d1': {'Health': 'BAD'}}, chains=[VolumeChain('pod-1', 'default')],
+        issues=[(pod, 'permission', 'Permission denied', 'medium'),
+                ('gnode:Drive:d1', 'disk_health', 'Drive is BAD', 'critical'),
+                (pod, 'pod_error', 'I/O error', 'unknown'),
+                (pod, 'pod_error', 'Mount failed', 'high')])
+
+
+def test_issue_indexes():
+    """Issues are looked up by severity, type and node without scanning"""
+    kg = _graph()
+
+    assert [issue['description'] for issue in kg.get_all_issues()] == \
+        ['Drive is BAD', 'Mount failed', 'Permission denied', 'I/O error']
+    assert [issue['description'] for issue in kg.get_issues_by_type('pod_error')] == ['I/O error', 'Mount failed']
+    assert len(kg.get_issues_by_node('gnode:Pod:default/pod-1')) == 3
+    assert kg.get_issues_by_severity('low') == []
+    assert kg.count_issues_by_type() == {'permission': 1, 'disk_health': 1, 'pod_error': 2}
+
+
+def test_analyses_are_memoized_until_the_graph_changes():
+    """Repeated calls hit the cache; any mutation bumps the version and recomputes"""
+    kg = _graph()
+    analysis = kg.analyze_issues()
+    kg.generate_fix_plan(analysis)
+
+    assert kg.analyze_issues() == analysis
+    assert kg.generate_fix_plan(kg.analyze_issues()) == kg.generate_fix_plan(analysis)
+    stats = kg.get_cache_stats()['analyses']
+    assert stats['analyze_issues'] == {'hits': 2, 'misses': 1, 'hit_rate': 2 / 3}
+    assert stats['generate_fix_plan']['hits'] == 2
+
+    version = kg.version
+    kg.add_issue('gnode:Drive:d1', 'permission', 'Read-only mount', 'low')
+    assert kg.version == version + 1
+    assert kg.analyze_issues()['total_issues'] == 5
+    assert kg.get_summary()['low_issues'] == 1
+    assert kg.get_cache_stats()['analyses']['analyze_issues']['misses'] == 2
+
+
+def test_memoized_results_are_not_shared_with_callers():
+    """Mutating a returned result does not corrupt the cache"""
+    kg = _graph()
+
+    kg.analyze_issues()['potential_root_causes'].clear()
+    kg.get_all_issues().clear()
+    kg.get_summary()['entity_counts']['Pod'] = 99
+
+    assert kg.analyze_issues()['potential_root_causes']
+    assert len(kg.get_all_issues()) == 4
+    assert kg.get_summary()['entity_counts']['Pod'] == 1
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for saving and loading binary Knowledge Graph snapshots.
+"""
+
+import os
+import pickle
+import sys
+
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from knowledge_graph import KnowledgeGraph, load_snapshot, read_snapshot_info, save_snapshot
+from knowledge_graph.snapshot import SNAPSHOT_MAGIC, SNAPSHOT_SCHEMA_VERSION, _PREAMBLE, dumps_snapshot, loads_snapshot
+from tests.mock_knowledge_graph import VolumeChain, build_knowledge_graph
+
+
+def _graph():
+    return build_knowledge_graph(
+        nodes={'worker-1': {'Ready': False}}, drives={'d1': {'Health': 'BAD', 'Path': '/dev/sdb'}},
+        chains=[VolumeChain('pod-1', 'default', 'worker-1', 'pvc-1', 'pv-1', 'd1')],
+        issues=[('gnode:Drive:d1', 'disk_health', 'Drive is BAD', 'critical', {'count': 3}),
+                ('gnode:Pod:default/pod-1', 'permission', 'Permission denied', 'medium')],
+        maps_to={'source': 'csi'})
+
+
+@pytest.mark.parametrize('compression', ['none', 'zlib', 'lzma'])
+def test_round_trip(tmp_path, compression):
+    """Nodes, edges, issues, entity tables and lookups survive a save and load"""
+    kg = _graph()
+    path = str(tmp_path / 'kg.snap')
+
+    info = save_snapshot(kg, path, compression)
+    loaded = load_snapshot(path)
+
+    assert info['nodes'] == 5 and info['edges'] == 3 and info['compression'] == compression
+    assert dict(loaded.graph.nodes(data=True)) == dict(kg.graph.nodes(data=True))
+    assert list(loaded.graph.edges(data=True)) == list(kg.graph.edges(data=True))
+    assert loaded.issues == kg.issues and loaded.entities == kg.entities
+    assert loaded.analyze_issues() == kg.analyze_issues()
+    assert loaded.find_node_id('Drive', 'd1') == 'gnode:Drive:d1'
+    assert loaded.find_predecessor_nodes('gnode:Drive:d1', 'maps_to') == ['gnode:PV:pv-1']
+    # Issues stay shared between the issue list and the per-node index
+    assert loaded.get_issues_by_node('gnode:Drive:d1')[0] is loaded.issues[0]
+
+
+def test_loaded_graph_stays_mutable():
+    """A loaded graph keeps its indexes and version up to date"""
+    loaded = loads_snapshot(dumps_snapshot(_graph()))
+    version = loaded.version
+
+    pod = loaded.add_gnode_pod('pod-2', 'default')
+    loaded.add_relationship(pod, 'gnode:PVC:default/pvc-1', 'uses')
+
+    assert loaded.version > version
+    assert loaded.find_nodes_by_type('Pod') == ['gnode:Pod:default/pod-1', pod]
+    assert loaded.pods_by_drive() == {'gnode:Drive:d1': ['gnode:Pod:default/pod-1', pod]}
+
+
+def test_invalid_snapshots_are_rejected(tmp_path):
+    """Foreign files, other schema versions and pickled classes fail to load"""
+    data = dumps_snapshot(_graph(), 'none')
+    path = tmp_path / 'kg.snap'
+    path.write_bytes(data)
+    assert read_snapshot_info(str(path))['issues'] == 2
+
+    with pytest.raises(ValueError, match='bad magic'):
+        loads_snapshot(b'{"nodes": {}}' + data)
+    with pytest.raises(ValueError, match='schema version'):
+        loads_snapshot(data[:6] + b'\x00\x63' + data[8:])
+
+    forged = _PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_SCHEMA_VERSION, 0, 2) + b'{}' + pickle.dumps(KnowledgeGraph)
+    with pytest.raises(ValueError, match='disallowed class'):
+        loads_snapshot(forged)
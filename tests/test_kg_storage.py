@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tests for single attribute storage in the Knowledge Graph: entity table views and per-node issue references.
+"""
+
+import os
+import sys
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from knowledge_graph import KnowledgeGraph
+
+
+def test_entity_tables_are_views_over_nodes():
+    """Entity tables reflect the node attributes without holding a copy"""
+    kg = KnowledgeGraph()
+    drive = kg.add_gnode_drive('d1', Health='GOOD', Path='/dev/sdb')
+    kg.add_gnode_pod('pod-1', 'default')
+
+    drives = kg.entities['gnodes']['drives']
+    assert dict(drives) == {drive: {'uuid': 'd1', 'Health': 'GOOD', 'Path': '/dev/sdb'}}
+    assert 'gnode:Pod:default/pod-1' in kg.entities['gnodes']['pods']
+    assert len(kg.entities['gnodes']['pvs']) == 0
+
+    kg.add_gnode_drive('d1', Health='BAD')
+    assert drives[drive]['Health'] == 'BAD'
+    assert drives[drive]['Path'] == '/dev/sdb'
+
+
+def test_issues_are_referenced_not_copied_into_nodes():
+    """Issues live in the issue list; nodes are mapped to them by the per-node index"""
+    kg = KnowledgeGraph()
+    pod = kg.add_gnode_pod('pod-1', 'default')
+    kg.add_issue(pod, 'pod_error', 'I/O error', 'high')
+
+    assert 'issues' not in kg.graph.nodes[pod]
+    assert kg.get_issues_by_node(pod)[0] is kg.issues[0]
+    assert kg.get_issues_by_node('gnode:Pod:default/other') == []
+
+
+def test_readded_nodes_keep_their_position():
+    """Updating a node does not move it to the end of the type lookups"""
+    kg = KnowledgeGraph()
+    kg.add_gnode_node('worker-1', Ready=True)
+    kg.add_gnode_node('worker-2', Ready=True)
+    kg.add_gnode_node('worker-1', Ready=False)
+
+    assert kg.find_nodes_by_type('Node') == ['gnode:Node:worker-1', 'gnode:Node:worker-2']
+    assert list(kg.entities['gnodes']['nodes']) == ['gnode:Node:worker-1', 'gnode:Node:worker-2']
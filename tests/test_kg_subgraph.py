@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for token-budgeted subgraph extraction and the bounded plan-phase Knowledge Graph context.
+"""
+
+import os
+import sys
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from knowledge_graph.subgraph import estimate_tokens, extract_subgraph, score_nodes
+from phases.kg_context_builder import KGContextBuilder
+from tests.mock_knowledge_graph import VolumeChain, build_knowledge_graph
+
+
+def _graph(noisy_pods: int = 0):
+    """Target pod on a bad drive, an unrelated critical node and optional noisy pods with issues"""
+    kg = build_knowledge_graph(
+        nodes={'worker-1': {'Ready': True}, 'worker-9': {'Ready': False}}, drives={'d1': {'Health': 'BAD'}},
+        located_on={'d1': 'worker-1'}, chains=[VolumeChain('web', 'prod', 'worker-1', 'data-web', 'pv-1', 'd1')],
+        issues=[('gnode:Drive:d1', 'disk_health', 'Drive health is BAD', 'high'),
+                ('gnode:Node:worker-9', 'node_health', 'Node not ready', 'critical')])
+    for i in range(noisy_pods):
+        noisy = kg.add_gnode_pod(f'noisy-{i}', 'batch', description='x' * 200)
+        kg.add_issue(noisy, 'pod_error', f'CrashLoopBackOff {i}', 'medium')
+    kg.add_gnode_historical_experience('exp-1', phenomenon='I/O error on BAD drive')
+    return kg
+
+
+def _format(kg):
+    return lambda node_id: {"id": node_id, "attributes": dict(kg.graph.nodes[node_id])}
+
+
+def test_scores_rank_by_distance_severity_and_recency():
+    """The target chain and severe issues outrank noise; unrelated nodes without issues are not scored"""
+    kg = _graph(noisy_pods=3)
+    kg.add_gnode_pod('idle', 'batch')
+    scores = score_nodes(kg, ['gnode:Pod:prod/web'], max_hops=3)
+
+    assert scores['gnode:Pod:prod/web'] == 8
+    assert scores['gnode:Drive:d1'] == 2 + 6 + 0
+    assert scores['gnode:Node:worker-9'] == 8 + 0
+    assert scores['gnode:Pod:batch/noisy-2'] == 3 + 2
+    assert scores['gnode:Pod:batch/noisy-0'] == 3 + 1
+    assert scores['gnode:HistoricalExperience:exp-1'] == 6
+    assert 'gnode:Pod:batch/idle' not in scores
+
+
+def test_extraction_respects_token_budget():
+    """Best-scoring nodes are kept until the budget is used; relationships only join selected nodes"""
+    kg = _graph(noisy_pods=50)
+    unbounded = extract_subgraph(kg, ['gnode:Pod:prod/web'], 10 ** 9, _format(kg))
+    assert unbounded['nodes_dropped'] == 0
+
+    budget = 300
+    subgraph = extract_subgraph(kg, ['gnode:Pod:prod/web'], budget, _format(kg))
+    assert 0 < subgraph['estimated_tokens'] <= budget
+    assert subgraph['node_ids'][:2] == ['gnode:Pod:prod/web', 'gnode:Drive:d1']
+    assert subgraph['nodes_dropped'] == subgraph['nodes_considered'] - len(subgraph['node_ids']) > 0
+    selected = set(subgraph['node_ids'])
+    assert all(edge['source'] in selected and edge['target'] in selected for edge in subgraph['relationships'])
+    assert subgraph['estimated_tokens'] >= sum(estimate_tokens(node) for node in subgraph['nodes'])
+
+
+def test_context_builder_bounds_plan_context():
+    """With a budget the context keeps the target chain, reports its size and drops noise"""
+    kg = _graph(noisy_pods=200)
+    unbounded = KGContextBuilder(kg).prepare_kg_context('web', 'prod', '/data')
+    assert 'subgraph' not in unbounded
+    assert len(unbounded['issues']) == 202
+
+    builder = KGContextBuilder(kg, {'plan_phase': {'kg_context_token_budget': 2000}})
+    context = builder.prepare_kg_context('web', 'prod', '/data')
+
+    node_ids = [node['id'] for node in context['nodes']]
+    assert node_ids[:3] == ['gnode:Pod:prod/web', 'gnode:Drive:d1', 'gnode:Node:worker-9']
+    assert {'gnode:PVC:prod/data-web', 'gnode:PV:pv-1', 'gnode:Drive:d1'} <= set(node_ids)
+    assert context['subgraph']['estimated_tokens'] <= 2000
+    assert context['subgraph']['nodes_dropped'] > 0
+    assert [issue['severity'] for issue in context['issues'][:2]] == ['critical', 'high']
+    assert {issue['node_id'] for issue in context['issues']} <= set(node_ids)
+    assert {'source': 'gnode:PVC:prod/data-web', 'target': 'gnode:PV:pv-1', 'type': 'bound_to'} in context['relationships']
+    assert [node['id'] for node in context['historical_experiences']] == ['gnode:HistoricalExperience:exp-1']
+    assert len(context['issues']) < len(unbounded['issues'])
+    # Only the JSON skeleton around the counted entries is outside the estimate
+    assert estimate_tokens(context) < 2000 * 1.1
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Tests for per-relationship reverse adjacency and batch pod tracing in the Knowledge Graph.
+"""
+
+import os
+import sys
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tests.mock_knowledge_graph import VolumeChain, build_knowledge_graph
+
+
+def _graph():
+    """Two pods share a drive through separate PVC/PV chains; a third pod sits on a bad node"""
+    return build_knowledge_graph(
+        nodes={'worker-1': {'Ready': False}}, drives={'d1': {'Health': 'BAD'}},
+        chains=[VolumeChain(f'pod-{i}', 'default', 'worker-1' if i == 2 else 'worker-2', f'pvc-{i}', f'pv-{i}',
+                            'd1' if i < 2 else None) for i in range(3)])
+
+
+def test_reverse_adjacency_per_relationship():
+    """Predecessors and successors are looked up per relationship type"""
+    kg = _graph()
+
+    assert kg.find_predecessor_nodes('gnode:Drive:d1', 'maps_to') == ['gnode:PV:pv-0', 'gnode:PV:pv-1']
+    assert kg.find_connected_nodes('gnode:Pod:default/pod-0', 'uses') == ['gnode:PVC:default/pvc-0']
+    assert kg.find_connected_nodes('gnode:Pod:default/pod-0', 'bound_to') == []
+
+    # Re-adding an edge with another relationship moves it between the adjacency maps
+    kg.add_relationship('gnode:PV:pv-1', 'gnode:Drive:d1', 'located_on')
+    assert kg.find_predecessor_nodes('gnode:Drive:d1', 'maps_to') == ['gnode:PV:pv-0']
+    assert kg.find_predecessor_nodes('gnode:Drive:d1') == ['gnode:PV:pv-0', 'gnode:PV:pv-1']
+
+
+def test_batch_tracing_matches_single_traces():
+    """pods_by_drive and pods_by_node agree with the per-entity traces"""
+    kg = _graph()
+
+    assert kg.pods_by_drive() == {'gnode:Drive:d1': ['gnode:Pod:default/pod-0', 'gnode:Pod:default/pod-1']}
+    assert kg._trace_drive_to_pods('gnode:Drive:d1') == kg.pods_by_drive()['gnode:Drive:d1']
+    assert kg.pods_by_node() == {'gnode:Node:worker-1': ['gnode:Pod:default/pod-2']}
+
+
+def test_analyze_issues_uses_batch_traces():
+    """Root causes list affected pods and patterns group pods sharing a drive"""
+    analysis = _graph().analyze_issues()
+
+    root_causes = {cause['source']: cause for cause in analysis['potential_root_causes']}
+    assert root_causes['gnode:Drive:d1']['affected_pods'] == ['gnode:Pod:default/pod-0', 'gnode:Pod:default/pod-1']
+    assert root_causes['gnode:Node:worker-1']['affected_pods'] == ['gnode:Pod:default/pod-2']
+    assert analysis['issue_patterns'][0]['type'] == 'multiple_pods_same_drive'
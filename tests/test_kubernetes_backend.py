@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Tests for the Kubernetes API backend behind kubectl_get / kubectl_describe.
+
+Fake API objects stand in for the kubernetes client so the backend's resource
+resolution, kubectl-compatible output and kubectl fallback can be checked
+without a cluster.
+"""
+
+import json
+import os
+import sys
+
+import yaml
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.kubernetes.backend import KubernetesAPIBackend, resolve_resource, format_describe
+
+
+class FakeApiException(Exception):
+    """Stand-in for kubernetes.client.rest.ApiException"""
+
+    def __init__(self, status, reason, body=None):
+        super().__init__(reason)
+        self.status = status
+        self.reason = reason
+        self.body = body
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.data = json.dumps(payload).encode()
+
+
+class FakeCoreV1Api:
+    def __init__(self):
+        self.calls = []
+
+    def read_namespaced_pod(self, name, namespace, **kwargs):
+        self.calls.append(('read_namespaced_pod', name, namespace))
+        if name == 'missing':
+            raise FakeApiException(404, 'NotFound', json.dumps({'reason': 'NotFound', 'message': 'gone'}))
+        return FakeResponse({'metadata': {'name': name, 'namespace': namespace, 'uid': 'u1'},
+                             'spec': {'nodeName': 'worker-1'}})
+
+    def list_event_for_all_namespaces(self, field_selector=None, **kwargs):
+        return FakeResponse({'items': [{'type': 'Warning', 'reason': 'DriveHealthFailure',
+                                        'message': 'drive health is BAD', 'source': {'component': 'csi-baremetal'}}]})
+
+    def list_namespaced_event(self, namespace, field_selector=None, **kwargs):
+        return FakeResponse({'items': [{'type': 'Warning', 'reason': 'FailedMount',
+                                        'message': 'I/O error', 'source': {'component': 'kubelet'}}]})
+
+
+class FakeCustomObjectsApi:
+    def __init__(self):
+        self.calls = []
+
+    def get_cluster_custom_object(self, group, version, plural, name, **kwargs):
+        self.calls.append((group, version, plural, name))
+        return {'metadata': {'name': name, 'uid': 'u2'}, 'spec': {'Health': 'BAD', 'NodeId': 'worker-1'}}
+
+    def list_cluster_custom_object(self, group, version, plural, **kwargs):
+        self.calls.append((group, version, plural))
+        if kwargs.get('_headers', {}).get('Accept', '').startswith('application/json;as=Table'):
+            return FakeResponse({'kind': 'Table', 'columnDefinitions': [
+                {'name': 'Name', 'priority': 0}, {'name': 'Health', 'priority': 0},
+                {'name': 'Path', 'priority': 1}, {'name': 'Usage', 'priority': 1}],
+                'rows': [{'cells': ['drive-1', 'GOOD', '/dev/sda', None]},
+                         {'cells': ['drive-20', 'BAD', '/dev/sdb', 'IN_USE']}]})
+        return {'kind': 'DriveList', 'items': [{'metadata': {'name': 'drive-1'},
+                                                'spec': {'Health': 'GOOD', 'Path': '/dev/sda'}}]}
+
+
+class FakeFallback:
+    def __init__(self):
+        self.calls = []
+
+    def get(self, *args):
+        self.calls.append(('get',) + args)
+        return "kubectl table output"
+
+    def describe(self, *args):
+        self.calls.append(('describe',) + args)
+        return "kubectl describe output"
+
+
+def _make_backend():
+    backend = KubernetesAPIBackend.__new__(KubernetesAPIBackend)
+    backend.fallback = FakeFallback()
+    backend.stats = {'api_calls': 0, 'fallback_calls': 0, 'api_errors': 0}
+    backend.request_timeout = 5
+    backend.core_v1 = FakeCoreV1Api()
+    backend.storage_v1 = None
+    backend.custom_objects = FakeCustomObjectsApi()
+    backend._api_exception = FakeApiException
+    return backend
+
+
+def test_resolve_resource_aliases():
+    """kubectl names, plurals and short names resolve to API resources"""
+    assert resolve_resource('po').kind == 'Pod'
+    assert resolve_resource('StorageClass').plural == 'storageclasses'
+    assert resolve_resource('lvg').plural == 'logicalvolumegroups'
+    assert resolve_resource('csibmnode').api_version == 'csi-baremetal.dell.com/v1'
+    assert resolve_resource('nodes.csi-baremetal.dell.com').api == 'custom'
+    assert resolve_resource('deployment') is None
+
+
+def test_get_pod_yaml_matches_kubectl_shape():
+    """Single objects carry apiVersion and kind like kubectl output"""
+    backend = _make_backend()
+
+    output = yaml.safe_load(backend.get('pod', 'test-pod', 'default', 'yaml'))
+
+    assert output['apiVersion'] == 'v1'
+    assert output['kind'] == 'Pod'
+    assert output['spec']['nodeName'] == 'worker-1'
+    assert backend.core_v1.calls == [('read_namespaced_pod', 'test-pod', 'default')]
+
+
+def test_list_drives_uses_custom_objects_api():
+    """CSI Baremetal CRD lists come from CustomObjectsApi as a kubectl List"""
+    backend = _make_backend()
+
+    output = json.loads(backend.get('drive', None, None, 'json'))
+
+    assert output['kind'] == 'List'
+    assert output['items'][0]['kind'] == 'Drive'
+    assert output['items'][0]['apiVersion'] == 'csi-baremetal.dell.com/v1'
+    assert backend.custom_objects.calls == [('csi-baremetal.dell.com', 'v1', 'drives')]
+
+
+def test_wide_output_uses_server_side_table():
+    """-o wide is rendered from the API server's Table, with the wide-only columns"""
+    backend = _make_backend()
+
+    output = backend.get('drive', None, None, 'wide')
+
+    assert output.splitlines() == [
+        'NAME       HEALTH   PATH       USAGE',
+        'drive-1    GOOD     /dev/sda   <none>',
+        'drive-20   BAD      /dev/sdb   IN_USE',
+    ]
+    assert backend.fallback.calls == []
+
+
+def test_other_formats_fall_back_to_kubectl():
+    """Formats the API backend cannot render are served by kubectl"""
+    backend = _make_backend()
+
+    assert backend.get('drive', None, None, 'custom-columns=NAME:.metadata.name') == "kubectl table output"
+    assert backend.get('deployment', 'web', 'default', 'yaml') == "kubectl table output"
+    assert backend.stats['fallback_calls'] == 2
+
+
+def test_not_found_is_reported_like_kubectl():
+    """A 404 is reported as a kubectl-style server error"""
+    backend = _make_backend()
+
+    output = backend.get('pod', 'missing', 'default', 'yaml')
+
+    assert output.startswith('Error: Error from server (NotFound): pods "missing" not found')
+    assert backend.fallback.calls == []
+
+
+def test_describe_crd_includes_events():
+    """Describe output of a CSI Baremetal object lists its fields and its events"""
+    backend = _make_backend()
+
+    output = backend.describe('drive', 'drive-1')
+
+    assert 'Name:         drive-1' in output
+    assert 'Node Id:  worker-1' in output
+    assert 'DriveHealthFailure' in output
+    assert backend.fallback.calls == []
+
+
+def test_describe_builtin_kinds_use_kubectl():
+    """Pods, PVCs, PVs and nodes keep kubectl's typed describers"""
+    backend = _make_backend()
+
+    assert backend.describe('pod', 'test-pod', 'default') == "kubectl describe output"
+    assert backend.describe('pvc', 'data', 'default') == "kubectl describe output"
+    assert backend.core_v1.calls == []
+
+
+def test_format_describe_without_events():
+    """Objects without events report <none>"""
+    output = format_describe({'apiVersion': 'v1', 'kind': 'Node', 'metadata': {'name': 'n1'}}, [])
+    assert output.endswith("Events:       <none>\n")
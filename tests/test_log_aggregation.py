@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for aggregating repeated log-based issues before they reach the Knowledge Graph.
+"""
+
+import asyncio
+import os
+import sys
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from information_collector.knowledge_builder import KnowledgeBuilder
+from information_collector.log_aggregation import LogIssueAggregator, log_template, summarize_log_lines
+from knowledge_graph.knowledge_graph import KnowledgeGraph
+
+
+def test_templates_normalize_variable_tokens():
+    """Timestamps, PIDs, sectors and addresses vary; device names do not"""
+    assert log_template("[Thu Oct 16 10:00:01 2025] nvme0n1: I/O error, sector 81920 op 0x0") == \
+        ('Thu Oct 16 10:00:01 2025', 'nvme0n1: I/O error, sector <num> op <hex>')
+    assert log_template("[ 1234.567890] sd 0:0:1:0: [sdb] timeout") == ('1234.567890', 'sd <num>:<num>:<num>:<num>: [sdb] timeout')
+    assert log_template("Oct 16 10:00:01 worker-1 kubelet[812]: MountVolume failed for pvc-2a96dfec-47db-449d-9789-0d81660c2c4d") == \
+        ('Oct 16 10:00:01', 'kubelet[<pid>]: MountVolume failed for pvc-<uuid>')
+    assert summarize_log_lines(["[1.0] nvme0: reset 1", "[2.0] nvme0: reset 2", "[3.0] nvme1: reset 3"]) == \
+        "nvme0: reset <num> (x2)\nnvme1: reset <num>"
+
+
+def test_aggregator_counts_and_tracks_first_last_seen():
+    """Repeated lines collapse into one issue per node and template"""
+    aggregator = LogIssueAggregator()
+    for second in range(1000):
+        line = f"[Thu Oct 16 10:{second // 60:02d}:{second % 60:02d} 2025] nvme0: I/O error, sector {second * 8}"
+        aggregator.add({'type': 'disk_hardware_error', 'severity': 'high', 'source': 'dmesg', 'raw_log': line,
+                        'description': f"Hardware disk error detected: {line}"}, node='worker_1')
+    aggregator.add({'type': 'disk_hardware_error', 'severity': 'critical', 'source': 'dmesg',
+                    'raw_log': "nvme0: I/O error, sector 7", 'description': "x: nvme0: I/O error, sector 7"}, node='worker_1')
+
+    issues = aggregator.issues()
+
+    assert len(issues) == 1 and aggregator.lines_seen == 1001
+    assert issues[0]['count'] == 1001
+    assert issues[0]['severity'] == 'critical'
+    assert issues[0]['first_seen'] == 'Thu Oct 16 10:00:00 2025'
+    assert issues[0]['last_seen'] == 'Thu Oct 16 10:16:39 2025'
+    assert issues[0]['description'] == ("Hardware disk error detected: nvme0: I/O error, sector <num> "
+                                        "(1001 occurrences, first seen Thu Oct 16 10:00:00 2025, "
+                                        "last seen Thu Oct 16 10:16:39 2025) on node worker_1")
+
+
+def test_only_aggregated_issues_reach_the_knowledge_graph():
+    """Per-node kernel logs become one KG issue per template with its count"""
+    dmesg = "\n".join(f"[{i}.000000] nvme nvme0: I/O error on queue {i % 4}" for i in range(500))
+    builder = KnowledgeBuilder.__new__(KnowledgeBuilder)
+    builder.collected_data = {'errors': [], 'system': {
+        'worker_1': {'kernel_logs': dmesg, 'journal_kubelet_logs': "Oct 16 10:00:01 worker-1 kubelet[1]: csi timeout"},
+        'worker_2': {'kernel_logs': "[1.000000] nvme nvme0: I/O error on queue 1"},
+    }}
+    builder.knowledge_graph = KnowledgeGraph()
+
+    asyncio.run(builder._add_log_based_issues())
+
+    kernel_issues = [issue for issue in builder.knowledge_graph.issues if issue['node_id'] == 'gnode:System:kernel']
+    assert [(issue['node'], issue['count']) for issue in kernel_issues] == [('worker_1', 500), ('worker_2', 1)]
+    assert builder.collected_data['log_analysis']['total_log_lines'] == 502
+    assert builder.collected_data['log_analysis']['total_issues'] == 3
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared one-pass log classifier.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from information_collector.metadata_parsers import MetadataParsers
+from tools.core.log_classifier import DISK_ERROR_KEYWORDS, LogClassifier, LogRule, get_log_classifier
+
+
+def test_rules_follow_priority_and_escalation():
+    """The first matching rule of a set wins and escalation keywords raise severity"""
+    parsers = MetadataParsers.__new__(MetadataParsers)
+
+    assert parsers._extract_dmesg_issue("  sd 0:0:0:0: [sda] Bad Sector at 1234  ") == {
+        'type': 'disk_hardware_error',
+        'severity': 'critical',
+        'description': "Hardware disk error detected: sd 0:0:0:0: [sda] Bad Sector at 1234",
+        'raw_log': "sd 0:0:0:0: [sda] Bad Sector at 1234",
+        'source': 'dmesg'
+    }
+    assert parsers._extract_dmesg_issue("nvme0: I/O error on queue 3")['type'] == 'disk_hardware_error'
+    assert parsers._extract_dmesg_issue("nvme0: controller timeout")['type'] == 'nvme_ssd_error'
+    assert parsers._extract_dmesg_issue("usb 1-1: new device") is None
+
+    kubelet_issues = parsers._extract_journal_kubelet_issues(
+        "MountVolume.SetUp failed for volume pvc-1\n\nSynced pod\ncsi driver timeout")
+    assert [issue['type'] for issue in kubelet_issues] == ['kubelet_volume_error', 'csi_driver_error']
+    assert kubelet_issues[1]['source'] == 'journal_kubelet'
+
+
+def test_overlapping_and_ordered_keywords():
+    """Keywords overlapping a longer match are found and sequences respect order"""
+    classifier = LogClassifier({
+        'errors': [LogRule('ata', [['ata error']]), LogRule('sata', [['sata']])],
+        'patterns': [LogRule('nvme_error', sequence=['nvme', 'error']), LogRule('io', [['i/o']])],
+    })
+    scan = classifier.scan(["SATA error on port 1", "error from nvme0", "nvme0 I/O error"])
+
+    assert scan.matching_lines('errors') == ["SATA error on port 1"]
+    assert scan.first_matches('errors')[0][1].name == 'ata'
+    assert scan.buckets('patterns') == {'nvme_error': ["nvme0 I/O error"], 'io': ["nvme0 I/O error"]}
+
+    with pytest.raises(KeyError):
+        scan.buckets('unknown')
+
+
+def test_shared_classifier_matches_keyword_scan():
+    """The disk error rule set selects the same lines as a per-line keyword scan"""
+    lines = ["ata1.00: failed command: READ FPDMA QUEUED", "eth0: link up", "Sense Key : Medium Error",
+             "EXT4-fs (sdb1): mounted", "mce: [Hardware Error]: ECC error", ""]
+    expected = [line for line in lines if any(keyword.lower() in line.lower() for keyword in DISK_ERROR_KEYWORDS)]
+
+    assert get_log_classifier().matching_lines('\n'.join(lines), 'disk_errors') == expected
+    assert get_log_classifier() is get_log_classifier()
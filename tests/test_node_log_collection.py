@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for fetching node logs once and classifying them locally in Phase 0.
+"""
+
+import os
+import sys
+import threading
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from information_collector.tool_executors import ToolExecutors
+from tools.core.log_classifier import get_log_classifier
+
+DMESG = "\n".join([
+    "[Thu Oct 16 10:00:01 2025] nvme nvme0: I/O error on queue 3",
+    "[Thu Oct 16 10:00:02 2025] usb 1-1: new device",
+    "[Thu Oct 16 10:00:03 2025] XFS (sdb1): Filesystem error detected",
+    "[Thu Oct 16 10:00:04 2025] sd 0:0:0:0: [sda] Bad Sector at 1234",
+])
+
+JOURNAL = "\n".join([
+    "Oct 16 10:00:01 worker-1 kubelet[812]: MountVolume.SetUp failed for volume pvc-1",
+    "Oct 16 10:00:02 worker-1 systemd[1]: Started Session 5.",
+    "Oct 16 10:00:03 worker-1 csi-baremetal-node[99]: drive health check error",
+    "Oct 16 10:00:04 worker-1 kubelet[812]: Synced pod",
+])
+
+
+def _make_executor():
+    executor = ToolExecutors.__new__(ToolExecutors)
+    executor.collected_data = {'system': {}, 'tool_outputs': {}, 'errors': []}
+    executor.node_log_max_lines = 5000
+    executor._node_log_cache = {}
+    executor._node_log_locks = {}
+    executor._node_log_lock = threading.Lock()
+    executor.calls = []
+
+    def fake_execute(tool_func, tool_args, tool_name, purpose):
+        executor.calls.append((tool_name, tool_args['options']))
+        if tool_name.startswith('dmesg'):
+            return DMESG
+        if tool_args['options'].startswith('-u '):
+            unit = tool_args['options'].split()[1]
+            return "\n".join(line for line in JOURNAL.splitlines() if f" {unit}[" in line)
+        return JOURNAL
+
+    executor._execute_tool_with_validation = fake_execute
+    return executor
+
+
+def test_node_logs_are_fetched_once_per_node():
+    """System and enhanced collection share one dmesg, one journal and one fetch per service"""
+    executor = _make_executor()
+
+    executor._collect_node_system_data('worker-1')
+    executor._collect_node_enhanced_logs('worker-1')
+
+    log_calls = [call for call in executor.calls if not call[0].startswith(('df_', 'lsblk_'))]
+    assert log_calls == [('dmesg_command_worker_1', '| tail -n 5000'),
+                         ('journalctl_worker_1', '-b -n 5000 --no-pager'),
+                         ('journalctl_kubelet_worker_1', '-u kubelet -n 50 --no-pager'),
+                         ('journalctl_csi-baremetal-node_worker_1', '-u csi-baremetal-node -n 50 --no-pager'),
+                         ('journalctl_csi-baremetal-controller_worker_1',
+                          '-u csi-baremetal-controller -n 50 --no-pager')]
+    assert executor.collected_data['system']['worker_1']['journal_kubelet_logs'] == \
+        executor.collected_data['service_logs']['worker_1']['kubelet']
+
+
+def test_local_classification_matches_grep_buckets():
+    """Per-pattern buckets contain the lines grep would select; service buckets come from journalctl -u"""
+    executor = _make_executor()
+
+    executor._collect_node_enhanced_logs('worker-1')
+
+    buckets = executor.collected_data['enhanced_logs']['worker_1']
+    assert buckets['dmesg_nvme_error'] == DMESG.splitlines()[0]
+    assert buckets['dmesg_filesystem_error'] == DMESG.splitlines()[2]
+    assert buckets['dmesg_bad_sector'] == DMESG.splitlines()[3]
+    assert buckets['dmesg_scsi_error'] == ''
+
+    services = executor.collected_data['service_logs']['worker_1']
+    assert services['kubelet'].splitlines() == [JOURNAL.splitlines()[0], JOURNAL.splitlines()[3]]
+    assert services['csi-baremetal-node'] == JOURNAL.splitlines()[2]
+    assert services['csi-baremetal-controller'] == ''
+
+
+def test_local_filters_apply_tail():
+    """Only the last matches are kept, as with `| tail -n`"""
+    lines = [f"DISK error {i}" for i in range(10)]
+    assert get_log_classifier().matching_lines(lines, 'storage', tail=3) == lines[-3:]
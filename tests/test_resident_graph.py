@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Tests for the resident Knowledge Graph kept current by watch events, replayed from a recorded event stream.
+"""
+
+import os
+import sys
+
+import networkx as nx
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from information_collector.resident_graph import RecordedEventSource, ResidentKnowledgeGraph
+
+DRIVE_UUID = '2a96dfec-47db-449d-9789-0d81660c2c4d'
+CSI_NODE_UUID = '9b3e1c55-0d7f-4a62-a1b2-3c4d5e6f7a8b'
+
+
+def _obj(name, resource_version, namespace=None, spec=None, status=None):
+    metadata = {'name': name, 'resourceVersion': str(resource_version)}
+    if namespace:
+        metadata['namespace'] = namespace
+    return {'metadata': metadata, 'spec': spec or {}, 'status': status or {}}
+
+
+def _listing(resource_version, *items):
+    return {'metadata': {'resourceVersion': str(resource_version)}, 'items': list(items)}
+
+
+def _pod(name, resource_version, claim='pvc-1'):
+    return _obj(name, resource_version, 'default', spec={
+        'nodeName': 'worker-1',
+        'volumes': [{'name': 'data', 'persistentVolumeClaim': {'claimName': claim}}]},
+        status={'phase': 'Running'})
+
+
+def _drive(resource_version, health='GOOD'):
+    return _obj(DRIVE_UUID, resource_version, spec={
+        'UUID': DRIVE_UUID, 'Health': health, 'Path': '/dev/sdb', 'NodeId': CSI_NODE_UUID})
+
+
+def _recording():
+    return {
+        'node': _listing(10, _obj('worker-1', 3, status={'conditions': [{'type': 'Ready', 'status': 'True'}]})),
+        'csibmnode': _listing(10, _obj('csibmnode-1', 4, spec={
+            'UUID': CSI_NODE_UUID, 'Addresses': {'Hostname': 'worker-1'}})),
+        'drive': _listing(10, _drive(5)),
+        'pv': _listing(10, _obj('pvc-abc', 6, status={'phase': 'Bound'})),
+        'volume': _listing(10, _obj('pvc-abc', 7, 'default', spec={'Location': DRIVE_UUID, 'Health': 'GOOD'})),
+        'pvc': _listing(10, _obj('pvc-1', 8, 'default', spec={'volumeName': 'pvc-abc'},
+                                 status={'phase': 'Bound', 'accessModes': ['ReadWriteOnce']})),
+        'pod': _listing(10, _pod('app-0', 9)),
+    }
+
+
+def test_bootstrap_builds_topology_and_read_only_snapshots():
+    """Listing once links pods to drives and nodes; read-only snapshots are frozen and shared"""
+    service = ResidentKnowledgeGraph(RecordedEventSource(_recording()))
+    service.bootstrap()
+
+    snapshot = service.snapshot()
+    drive = f"gnode:Drive:{DRIVE_UUID}"
+    assert snapshot.pods_by_drive() == {drive: ['gnode:Pod:default/app-0']}
+    assert snapshot.find_connected_nodes(drive, 'located_on') == ['gnode:Node:worker-1']
+    assert snapshot.graph.nodes[drive]['NodeName'] == 'worker-1'
+    assert service.get_stats()['resource_versions']['pod'] == '10'
+
+    with pytest.raises(nx.NetworkXError):
+        snapshot.add_issue(drive, 'disk_health', 'Drive is BAD', 'critical')
+    with pytest.raises(nx.NetworkXError):
+        snapshot.add_gnode_pod('other', 'default')
+    assert service.snapshot() is snapshot
+
+    copy = service.snapshot(read_only=False)
+    copy.add_issue(drive, 'disk_health', 'Drive is BAD', 'critical')
+    assert service.kg.issues == [] and service.get_stats()['snapshot_hits'] == 2
+
+
+def test_watch_events_update_the_graph_incrementally():
+    """Modified, added and deleted objects are applied in place; earlier snapshots stay unchanged"""
+    source = RecordedEventSource(_recording(), {
+        'drive': [{'type': 'MODIFIED', 'object': _drive(11, health='BAD')}],
+        'pod': [{'type': 'ADDED', 'object': _pod('app-1', 12, claim='pvc-2')},
+                {'type': 'DELETED', 'object': _pod('app-0', 13)},
+                {'type': 'BOOKMARK', 'object': {'metadata': {'resourceVersion': '14'}}}],
+        'pvc': [{'type': 'ADDED', 'object': _obj('pvc-2', 15, 'default', spec={'volumeName': 'pvc-abc'})}],
+    })
+    service = ResidentKnowledgeGraph(source)
+    service.bootstrap()
+    before = service.snapshot()
+
+    assert service.sync_once('drive') == 1 and service.sync_once('pod') == 3 and service.sync_once('pvc') == 1
+
+    drive = f"gnode:Drive:{DRIVE_UUID}"
+    assert service.kg.graph.nodes[drive]['Health'] == 'BAD'
+    assert not service.kg.graph.has_node('gnode:Pod:default/app-0')
+    # The pod arrived before its PVC; the edge is added once the PVC exists
+    assert service.kg.pods_by_drive() == {drive: ['gnode:Pod:default/app-1']}
+    assert service.get_stats()['resource_versions']['pod'] == '14'
+    assert service.sync_once('pod') == 0
+
+    assert before.graph.nodes[drive]['Health'] == 'GOOD'
+    assert before.pods_by_drive() == {drive: ['gnode:Pod:default/app-0']}
+    assert service.snapshot() is not before
+
+
+def test_expired_resource_version_triggers_relist():
+    """A 410 Gone watch error relists the resource type and drops objects that disappeared"""
+    recording = _recording()
+    source = RecordedEventSource(recording, {'pod': [{'type': 'ERROR', 'object': {'code': 410}}]})
+    service = ResidentKnowledgeGraph(source)
+    service.bootstrap()
+
+    recording['pod'] = _listing(20, _pod('app-2', 19))
+    assert service.sync_once('pod') == 0
+
+    assert service.kg.find_nodes_by_type('Pod') == ['gnode:Pod:default/app-2']
+    assert service.get_stats()['resource_versions']['pod'] == '20'
+    assert source.calls['list'] == len(service.kinds) + 1
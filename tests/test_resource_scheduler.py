@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Tests for resource-aware scheduling of tool calls in ExecuteToolNode.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.core.deadline import deadline_scope
+from troubleshooting.execute_tool_node import ExecuteToolNode
+from troubleshooting.resource_scheduler import ResourceScheduler
+from troubleshooting.single_flight import SingleFlight
+
+running = {}
+overlaps = []
+lock = threading.Lock()
+
+
+def _track(resource):
+    with lock:
+        running[resource] = running.get(resource, 0) + 1
+        overlaps.append(sum(running.values()))
+        assert running[resource] == 1, f"{resource} used concurrently"
+    time.sleep(0.2)
+    with lock:
+        running[resource] -= 1
+
+
+@tool
+def fio_performance_test(node_name: str, device_path: str, runtime: int = 10) -> str:
+    """Benchmark a device"""
+    _track(f"{node_name}:{device_path}")
+    return f"fio {node_name} {device_path} {runtime}"
+
+
+@tool
+def legacy_check(target: str) -> str:
+    """A serial tool without a resource declaration"""
+    _track('legacy')
+    return f"checked {target}"
+
+
+@pytest.mark.parametrize('run_async', [False, True])
+def test_calls_on_different_resources_overlap(run_async):
+    """Benchmarks of different nodes run together, the same device and the serial lane one at a time"""
+    overlaps.clear()
+    scheduler = ResourceScheduler()
+    node = ExecuteToolNode([fio_performance_test, legacy_check], set(), {'fio_performance_test', 'legacy_check'},
+                           single_flight=SingleFlight(), resource_scheduler=scheduler)
+    calls = [('c1', 'fio_performance_test', {'node_name': 'n1', 'device_path': '/dev/sda'}),
+             ('c2', 'fio_performance_test', {'node_name': 'n2', 'device_path': '/dev/sda'}),
+             ('c3', 'fio_performance_test', {'node_name': 'n1', 'device_path': '/dev/sda', 'runtime': 5}),
+             ('c4', 'legacy_check', {'target': 'a'}),
+             ('c5', 'legacy_check', {'target': 'b'})]
+    message = {'messages': [AIMessage(content='', tool_calls=[{'name': name, 'args': args, 'id': call_id}
+                                                              for call_id, name, args in calls])]}
+
+    started = time.monotonic()
+    outputs = asyncio.run(node.ainvoke(message)) if run_async else node.invoke(message)
+    elapsed = time.monotonic() - started
+
+    assert [m.tool_call_id for m in outputs['messages']] == ['c1', 'c2', 'c3', 'c4', 'c5']
+    assert outputs['messages'][2].content == 'fio n1 /dev/sda 5'
+    assert max(overlaps) == 3
+    assert elapsed < 0.55
+    stats = scheduler.get_stats()
+    assert stats['grants'] == 5 and stats['waits'] == 2 and stats['held'] == {}
+
+
+def test_claims_and_limits():
+    """Claims are named from the arguments; exclusive claims take every slot of the resource"""
+    scheduler = ResourceScheduler({'tools': {'scheduler': {
+        'limits': {'node': 3},
+        'resources': {'custom_probe': [{'resource': 'node', 'args': ['host']}]}}}})
+
+    assert scheduler.claims_for('fsck_check', {'node_name': 'n1', 'device_path': '/dev/sdb'}) == [
+        ('device:n1:/dev/sdb', 2), ('node:n1', 1)]
+    assert scheduler.claims_for('run_volume_io_test', {'pod_name': 'app', 'namespace': None}) == [
+        ('api_server', 1), ('pod:default/app', 2)]
+    assert scheduler.claims_for('custom_probe', {'host': 'n2'}) == [('node:n2', 1)]
+    assert scheduler.claims_for('kg_get_summary', {}) == []
+    assert scheduler.claims_for('unknown_tool', {}, parallel=True) == []
+    assert scheduler.claims_for('unknown_tool', {}) == [('serial', 1)]
+
+    # A node with three slots holds three shared claims, a fourth waits for a release
+    claims = scheduler.claims_for('custom_probe', {'host': 'n2'})
+    for _ in range(3):
+        scheduler.acquire(claims)
+    waiter = threading.Thread(target=scheduler.acquire, args=(claims,))
+    waiter.start()
+    waiter.join(0.1)
+    assert waiter.is_alive()
+    scheduler.release(claims)
+    waiter.join(1)
+    assert not waiter.is_alive()
+    assert scheduler.get_stats()['held'] == {'node:n2': 3}
+
+
+@pytest.mark.parametrize('run_async', [False, True])
+def test_exclusive_claims_are_not_starved(run_async):
+    """A waiting fsck gets its device although smartctl-like shared claims keep arriving"""
+    scheduler = ResourceScheduler()
+    shared = [('device:n1:/dev/sdb', 1)]
+    exclusive = scheduler.claims_for('fsck_check', {'node_name': 'n1', 'device_path': '/dev/sdb'})
+    stop = threading.Event()
+
+    def stream():
+        while not stop.is_set():
+            scheduler.acquire(shared)
+            time.sleep(0.05)
+            scheduler.release(shared)
+
+    streams = [threading.Thread(target=stream) for _ in range(3)]
+    for thread in streams:
+        thread.start()
+    time.sleep(0.1)
+
+    started = time.monotonic()
+    try:
+        # Fail rather than hang if the claim starves
+        with deadline_scope(5):
+            if run_async:
+                asyncio.run(scheduler.acquire_async(exclusive))
+            else:
+                scheduler.acquire(exclusive)
+        waited = time.monotonic() - started
+        scheduler.release(exclusive)
+    finally:
+        stop.set()
+        for thread in streams:
+            thread.join()
+
+    assert waited < 1
+    assert scheduler.get_stats()['held'] == {}
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests for the read-only kubectl result cache shared across phases.
+"""
+
+import os
+import sys
+import time
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.kubernetes.result_cache import KubectlResultCache
+
+
+def _loader(calls, value="apiVersion: v1\nkind: Pod\n"):
+    def load():
+        calls.append(1)
+        return value
+    return load
+
+
+def test_repeated_get_is_served_from_cache():
+    """Aliased resource types and ignored namespaces share one entry"""
+    cache = KubectlResultCache()
+    calls = []
+
+    cache.get_or_load('get', 'pod', 'test-pod', 'default', 'yaml', _loader(calls))
+    cache.get_or_load('get', 'pods', 'test-pod', None, 'yaml', _loader(calls))
+    cache.get_or_load('get', 'pv', 'pv-1', '/dev/sda', 'yaml', _loader(calls))
+    cache.get_or_load('get', 'persistentvolume', 'pv-1', None, 'yaml', _loader(calls))
+
+    assert len(calls) == 2
+    stats = cache.get_stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 2
+    assert stats['hit_rate'] == 0.5
+
+
+def test_entries_expire_after_ttl():
+    """Entries past their per-resource TTL are reloaded"""
+    cache = KubectlResultCache({'tools': {'result_cache': {'ttl_seconds': {'pods': 0.01}}}})
+    calls = []
+
+    cache.get_or_load('get', 'pod', 'test-pod', 'default', 'yaml', _loader(calls))
+    time.sleep(0.02)
+    cache.get_or_load('get', 'pod', 'test-pod', 'default', 'yaml', _loader(calls))
+
+    assert len(calls) == 2
+    assert cache.get_stats()['expirations'] == 1
+
+
+def test_lru_eviction_bounds_size():
+    """The least recently used entry is evicted when the cache is full"""
+    cache = KubectlResultCache({'tools': {'result_cache': {'max_entries': 2}}})
+    calls = []
+
+    cache.get_or_load('get', 'drive', 'd1', None, 'yaml', _loader(calls))
+    cache.get_or_load('get', 'drive', 'd2', None, 'yaml', _loader(calls))
+    cache.get_or_load('get', 'drive', 'd1', None, 'yaml', _loader(calls))
+    cache.get_or_load('get', 'drive', 'd3', None, 'yaml', _loader(calls))
+    cache.get_or_load('get', 'drive', 'd1', None, 'yaml', _loader(calls))
+
+    assert len(calls) == 3
+    assert cache.get_stats()['evictions'] == 1
+    assert cache.get_stats()['size'] == 2
+
+
+def test_errors_are_not_cached_and_invalidation_clears():
+    """Error output is never cached and invalidate drops all entries"""
+    cache = KubectlResultCache()
+    calls = []
+
+    cache.get_or_load('get', 'pod', 'p', 'default', 'yaml', _loader(calls, "Error: not found"))
+    cache.get_or_load('get', 'pod', 'p', 'default', 'yaml', _loader(calls))
+    cache.invalidate(reason='kubectl_delete')
+    cache.get_or_load('get', 'pod', 'p', 'default', 'yaml', _loader(calls))
+
+    assert len(calls) == 3
+    assert cache.get_stats()['invalidations'] == 1
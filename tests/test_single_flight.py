@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tests for sharing one execution among identical concurrent tool calls.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from unittest import mock
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.core.deadline import ToolTimeout, deadline_scope
+from troubleshooting.execute_tool_node import ExecuteToolNode
+from troubleshooting.single_flight import SingleFlight
+
+calls = []
+
+
+@tool
+def slow_probe(node_name: str) -> str:
+    """Probe a node slowly"""
+    calls.append(node_name)
+    time.sleep(0.2)
+    return f"probed {node_name}"
+
+
+def _node(single_flight, hooks):
+    node = ExecuteToolNode([slow_probe], {'slow_probe'}, set(), single_flight=single_flight)
+    node.register_before_call_hook(lambda name, args, call_type: None)
+    node.register_after_call_hook(lambda name, args, result, call_type: hooks.append(call_type))
+    return node
+
+
+def _message(*tool_calls):
+    return {'messages': [AIMessage(content='', tool_calls=[{'name': 'slow_probe', 'args': {'node_name': node_name},
+                                                            'id': call_id} for call_id, node_name in tool_calls])]}
+
+
+@pytest.mark.parametrize('run_async', [False, True])
+def test_duplicate_calls_in_one_turn_share_an_execution(run_async):
+    """The same call emitted twice runs once; both tool_call_ids get a ToolMessage"""
+    calls.clear()
+    hooks = []
+    single_flight = SingleFlight()
+    node = _node(single_flight, hooks)
+    message = _message(('c1', 'worker-1'), ('c2', 'worker-1'), ('c3', 'worker-2'))
+
+    outputs = asyncio.run(node.ainvoke(message)) if run_async else node.invoke(message)
+    by_id = {m.tool_call_id: m for m in outputs['messages']}
+
+    assert sorted(calls) == ['worker-1', 'worker-2']
+    assert set(by_id) == {'c1', 'c2', 'c3'}
+    assert by_id['c1'].content == by_id['c2'].content == 'probed worker-1'
+    assert [by_id[i].response_metadata.get('shared', False) for i in ('c1', 'c2')].count(True) == 1
+    assert hooks.count('Scheduled, shared') == 1
+    assert single_flight.get_stats() == {'executions': 2, 'shared': 1, 'in_flight': 0}
+
+
+def test_concurrent_graphs_share_an_execution():
+    """Two nodes, like the plan phase and Phase 1 graphs, coalesce an identical call"""
+    calls.clear()
+    single_flight = SingleFlight()
+    nodes = [_node(single_flight, []), _node(single_flight, [])]
+    results = {}
+
+    def run(i):
+        results[i] = nodes[i].invoke(_message((f"n{i}", 'worker-3')))['messages'][0]
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ['worker-3']
+    assert {m.tool_call_id for m in results.values()} == {'n0', 'n1'}
+    assert single_flight.get_stats()['shared'] == 1
+
+    # Once landed, the next identical call runs again
+    nodes[0].invoke(_message(('n2', 'worker-3')))
+    assert calls == ['worker-3', 'worker-3']
+
+
+def test_cancelled_leader_leaves_followers_to_run_the_call():
+    """A cancelled leader or follower does not fail the other callers of the key, nor a follower's deadline"""
+    single_flight = SingleFlight()
+    runs = []
+
+    async def probe():
+        runs.append('worker-4')
+        await asyncio.sleep(0.2)
+        return 'probed worker-4'
+
+    async def run():
+        leader = asyncio.create_task(single_flight.do_async('k', probe))
+        await asyncio.sleep(0.05)
+        follower = asyncio.create_task(single_flight.do_async('k', probe))
+        await asyncio.sleep(0.05)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert await follower == ('probed worker-4', False)
+
+        leader = asyncio.create_task(single_flight.do_async('k', probe))
+        await asyncio.sleep(0.05)
+        follower = asyncio.create_task(single_flight.do_async('k', probe))
+        await asyncio.sleep(0.05)
+        follower.cancel()
+        assert await leader == ('probed worker-4', False)
+
+        # A follower stops waiting at its own deadline
+        leader = asyncio.create_task(single_flight.do_async('k', probe))
+        await asyncio.sleep(0.05)
+        with deadline_scope(0.05), pytest.raises(ToolTimeout):
+            await single_flight.do_async('k', probe)
+        assert await leader == ('probed worker-4', False)
+
+    asyncio.run(run())
+    assert len(runs) == 4
+    assert single_flight.get_stats()['in_flight'] == 0
+
+
+@tool
+async def slow_scan(node_name: str) -> str:
+    """Scan a node slowly"""
+    calls.append(node_name)
+    await asyncio.sleep(0.3)
+    return f"scanned {node_name}"
+
+
+def test_timed_out_leader_is_not_shared():
+    """A caller with more time runs the call itself when the leader's timeout expires"""
+    calls.clear()
+    single_flight = SingleFlight()
+    hurried = ExecuteToolNode([slow_scan], {'slow_scan'}, set(), single_flight=single_flight,
+                              tool_timeouts={'default': 0.1})
+    patient = ExecuteToolNode([slow_scan], {'slow_scan'}, set(), single_flight=single_flight,
+                              tool_timeouts={'default': 60})
+
+    def message(call_id):
+        return {'messages': [AIMessage(content='', tool_calls=[
+            {'name': 'slow_scan', 'args': {'node_name': 'worker-5'}, 'id': call_id}])]}
+
+    async def run():
+        first = asyncio.create_task(hurried.ainvoke(message('h1')))
+        await asyncio.sleep(0.05)
+        return await asyncio.gather(first, patient.ainvoke(message('p1')))
+
+    with mock.patch('troubleshooting.execute_tool_node.DEADLINE_GRACE_SECONDS', 0):
+        hurried_out, patient_out = asyncio.run(run())
+    assert hurried_out['messages'][0].response_metadata['timed_out']
+    assert patient_out['messages'][0].content == 'scanned worker-5'
+    assert calls == ['worker-5', 'worker-5']
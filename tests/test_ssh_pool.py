@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Tests for the pooled SSH transport used by the diagnostic tools.
+
+A fake SSH client stands in for paramiko so the pool's reuse, health check,
+idle eviction and channel limit behaviour can be verified without a node.
+"""
+
+import os
+import socket
+import sys
+import threading
+import time
+
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.core.deadline import ToolTimeout, deadline_scope
+from tools.core.ssh_pool import SSHConnectionPool
+
+
+class FakeChannel:
+    """Minimal stand-in for paramiko.Channel; a hanging channel never reaches EOF"""
+
+    def __init__(self, stdout, stderr=b"", hang=False, stream=0):
+        self.stdout = stdout
+        self.stderr = stderr
+        self.hang = hang
+        self.stream = stream
+        self.timeout = None
+        self.closed = False
+
+    def settimeout(self, timeout):
+        self.timeout = timeout
+
+    def recv(self, size):
+        if self.stdout:
+            chunk, self.stdout = self.stdout, b""
+            return chunk
+        if self.stream:
+            # One line every 0.1 s, like dd status=progress
+            time.sleep(0.1)
+            self.stream -= 1
+            return b"."
+        if self.hang:
+            time.sleep(self.timeout)
+            raise socket.timeout()
+        return b""
+
+    def recv_stderr_ready(self):
+        return bool(self.stderr)
+
+    def recv_stderr(self, size):
+        chunk, self.stderr = self.stderr, b""
+        return chunk
+
+    def close(self):
+        self.closed = True
+
+
+class FakeStream:
+    def __init__(self, channel):
+        self.channel = channel
+
+
+class FakeTransport:
+    """Minimal stand-in for paramiko.Transport"""
+
+    def __init__(self):
+        self.active = True
+        self.keepalive = None
+
+    def is_active(self):
+        return self.active
+
+    def is_authenticated(self):
+        return True
+
+    def set_keepalive(self, interval):
+        self.keepalive = interval
+
+    def send_ignore(self):
+        if not self.active:
+            raise EOFError("transport closed")
+
+
+class FakeSSHClient:
+    """Minimal stand-in for paramiko.SSHClient"""
+
+    instances = []
+
+    def __init__(self, command_delay=0.0):
+        self.transport = FakeTransport()
+        self.channels = []
+        self.command_delay = command_delay
+        self.connected_to = None
+        self.closed = False
+        self.concurrent = 0
+        self.max_concurrent = 0
+        self._lock = threading.Lock()
+        FakeSSHClient.instances.append(self)
+
+    def connect(self, hostname, **kwargs):
+        self.connected_to = hostname
+        self.connect_kwargs = kwargs
+
+    def get_transport(self):
+        return self.transport
+
+    def exec_command(self, command, timeout=None):
+        with self._lock:
+            self.concurrent += 1
+            self.max_concurrent = max(self.max_concurrent, self.concurrent)
+        time.sleep(self.command_delay)
+        with self._lock:
+            self.concurrent -= 1
+        channel = FakeChannel(f"{self.connected_to}: {command}".encode(), hang=command.startswith("hang"),
+                              stream=10 if command.startswith("stream") else 0)
+        self.channels.append(channel)
+        return None, FakeStream(channel), FakeStream(channel)
+
+    def close(self):
+        self.closed = True
+        self.transport.active = False
+
+
+def _make_pool(pool_config=None, command_delay=0.0):
+    FakeSSHClient.instances = []
+    config_data = {'troubleshoot': {'ssh': {'pool': pool_config or {}}}}
+    return SSHConnectionPool(config_data, client_factory=lambda: FakeSSHClient(command_delay))
+
+
+def test_connection_is_reused_per_node():
+    """Repeated commands on a node share one connection"""
+    pool = _make_pool()
+
+    for _ in range(5):
+        output, error = pool.execute("node-a", "df -h")
+        assert output == "node-a: df -h"
+        assert error == ""
+    pool.execute("node-b", "lsblk")
+
+    assert len(FakeSSHClient.instances) == 2
+    assert pool.stats['connections_created'] == 2
+    assert pool.stats['connections_reused'] == 4
+    assert FakeSSHClient.instances[0].transport.keepalive == 30
+
+
+def test_configured_key_is_used_and_no_password_is_built_in():
+    """The key from config.yaml authenticates; a password is only sent when configured"""
+    FakeSSHClient.instances = []
+    ssh_config = {'key_path': '~/.ssh/id_ed25519', 'password': 'secret'}
+    pool = SSHConnectionPool({'troubleshoot': {'ssh': ssh_config}}, client_factory=FakeSSHClient)
+    pool.execute("node-a", "true")
+    assert FakeSSHClient.instances[0].connect_kwargs['key_filename'].endswith('/.ssh/id_ed25519')
+    assert 'password' not in FakeSSHClient.instances[0].connect_kwargs
+
+    pool = _make_pool()
+    pool.execute("node-a", "true")
+    assert pool.password is None
+    assert not {'password', 'key_filename'} & set(FakeSSHClient.instances[0].connect_kwargs)
+
+
+def test_unhealthy_connection_is_replaced():
+    """A dead transport is discarded and a new connection is opened"""
+    pool = _make_pool()
+
+    pool.execute("node-a", "uptime")
+    FakeSSHClient.instances[0].transport.active = False
+    pool.execute("node-a", "uptime")
+
+    assert len(FakeSSHClient.instances) == 2
+    assert FakeSSHClient.instances[0].closed
+    assert pool.stats['health_check_failures'] == 1
+
+
+def test_idle_connections_are_evicted():
+    """Connections idle past the timeout are closed"""
+    pool = _make_pool({'idle_timeout_seconds': 0})
+
+    pool.execute("node-a", "uptime")
+    time.sleep(0.01)
+
+    assert pool.evict_idle() == 1
+    assert FakeSSHClient.instances[0].closed
+    assert pool.get_stats()['open_connections'] == 0
+
+
+def test_concurrent_channels_are_capped():
+    """No more than max_channels_per_node commands run at once on a node"""
+    pool = _make_pool({'max_channels_per_node': 2}, command_delay=0.05)
+    pool.execute("node-a", "warmup")
+
+    threads = [threading.Thread(target=pool.execute, args=("node-a", "dmesg")) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(FakeSSHClient.instances) == 1
+    assert FakeSSHClient.instances[0].max_concurrent == 2
+
+
+def test_deadline_closes_the_channel_and_keeps_partial_output():
+    """A command running past the tool deadline returns its output so far; the connection stays pooled"""
+    pool = _make_pool()
+
+    started = time.monotonic()
+    with deadline_scope(0.3):
+        with pytest.raises(ToolTimeout) as raised:
+            pool.execute("node-a", "hang df -h")
+    assert time.monotonic() - started < 2
+
+    client = FakeSSHClient.instances[0]
+    assert raised.value.partial_output == "node-a: hang df -h"
+    assert client.channels[0].closed and not client.closed
+
+    # Without a deadline scope the command timeout raises an ordinary socket.timeout
+    with pytest.raises(socket.timeout):
+        pool.execute("node-a", "hang dmesg", timeout=0.2)
+    assert pool.execute("node-a", "uptime") == ("node-a: uptime", "")
+
+
+def test_idle_timeout_only_bounds_silence():
+    """A command streaming output for longer than the idle timeout completes; a silent one is given up"""
+    pool = _make_pool()
+
+    output, _ = pool.execute("node-a", "stream dd", idle_timeout=0.3)
+    assert output == "node-a: stream dd" + "." * 10
+
+    with pytest.raises(socket.timeout):
+        pool.execute("node-a", "hang dd", idle_timeout=0.3)
+
+
+if __name__ == "__main__":
+    test_connection_is_reused_per_node()
+    test_unhealthy_connection_is_replaced()
+    test_idle_connections_are_evicted()
+    test_concurrent_channels_are_capped()
+    test_deadline_closes_the_channel_and_keeps_partial_output()
+    test_idle_timeout_only_bounds_silence()
+    print("All SSH pool tests passed")
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Tests for JSON collection output and the fast structured-output loader.
+"""
+
+import json
+import os
+import sys
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from information_collector.cluster_snapshot import ClusterSnapshot
+from information_collector.knowledge_builder import KnowledgeBuilder
+from information_collector.structured_output import get_output_format, load_structured
+
+DRIVE_UUID = '2a96dfec-47db-449d-9789-0d81660c2c4d'
+
+
+def test_load_structured_detects_format():
+    """JSON and YAML output parse to the same document"""
+    document = {'kind': 'List', 'items': [{'metadata': {'name': 'd1'}}]}
+
+    assert load_structured(json.dumps(document)) == document
+    assert load_structured("kind: List\nitems:\n- metadata:\n    name: d1\n") == document
+    assert load_structured('') is None
+
+
+def test_output_format_from_config():
+    """JSON is the default and unknown formats fall back to it"""
+    assert get_output_format({}) == 'json'
+    assert get_output_format({'troubleshoot': {'collection_output_format': 'YAML'}}) == 'yaml'
+    assert get_output_format({'troubleshoot': {'collection_output_format': 'wide'}}) == 'json'
+
+
+def test_json_listings_feed_parsers_and_builders():
+    """Parsers that used to scan YAML lines also understand JSON listings"""
+    builder = KnowledgeBuilder.__new__(KnowledgeBuilder)
+    builder.collected_data = {'csi_baremetal': {
+        'drives': json.dumps({'items': [{'kind': 'Drive', 'metadata': {'name': DRIVE_UUID},
+                                         'spec': {'Health': 'GOOD', 'Path': '/dev/sdb', 'NodeId': 'n1'}}]}),
+        'volumes': json.dumps({'items': [{'metadata': {'name': 'pvc-1'},
+                                          'spec': {'Location': 'lvg-1', 'LocationType': 'LVG'}}]}),
+        'lvgs': json.dumps({'items': [{'metadata': {'name': 'lvg-1'},
+                                       'spec': {'Locations': [DRIVE_UUID], 'Health': 'GOOD'}}]}),
+    }}
+    builder.cluster_snapshot = ClusterSnapshot(builder.collected_data)
+
+    assert builder._parse_volume_locations(builder.collected_data['csi_baremetal']['volumes']) == {'pvc-1': 'lvg-1'}
+    assert builder._get_relevant_drive_uuids() == {DRIVE_UUID}
+    assert builder._parse_comprehensive_drive_info(DRIVE_UUID)['Path'] == '/dev/sdb'
+    assert builder._drive_info_from_spec({'Health': 'GOOD', 'NodeId': 'n1', 'Size': 10}) == \
+        {'Health': 'GOOD', 'NodeName': 'n1', 'Size': '10'}
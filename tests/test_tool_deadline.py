@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tests for per-tool deadlines, process group cleanup and partial results.
+"""
+
+import asyncio
+import os
+import socket
+import sys
+import time
+from unittest import mock
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.core.config import execute_command
+from tools.core.deadline import TOOL_DEADLINE_KEY, ToolTimeout, deadline_scope, note_partial_output, run_subprocess
+from troubleshooting.execute_tool_node import ExecuteToolNode
+from troubleshooting.resource_scheduler import ResourceScheduler
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # A killed child not yet reaped by init is a zombie
+    with open(f"/proc/{pid}/stat") as f:
+        return f.read().split(')')[-1].split()[0] != 'Z'
+
+
+def test_run_subprocess_kills_the_process_group():
+    """On expiry the command and its children are killed and the output so far is kept"""
+    started = time.monotonic()
+    with deadline_scope(0.5):
+        with pytest.raises(ToolTimeout) as raised:
+            run_subprocess(['sh', '-c', 'sleep 30 & echo $!; echo partial; wait'], text=True)
+    assert time.monotonic() - started < 3
+
+    child_pid, partial = raised.value.partial_output.splitlines()
+    assert partial == 'partial'
+    time.sleep(0.1)
+    assert not _alive(int(child_pid))
+
+    # The tightest deadline wins, and without one the command runs to completion
+    with deadline_scope(60), deadline_scope(0.2), pytest.raises(ToolTimeout):
+        run_subprocess(['sleep', '5'])
+    assert run_subprocess(['echo', 'done'], text=True).stdout == 'done\n'
+
+
+@tool
+def stuck_df(node_name: str) -> str:
+    """A df that hangs on a wedged mount after printing its first line"""
+    return execute_command(['sh', '-c', f'echo "Filesystem on {node_name}"; sleep 30'])
+
+
+@pytest.mark.parametrize('run_async', [False, True])
+def test_timed_out_call_returns_partial_output(run_async):
+    """A stuck call ends at the phase deadline with its partial output, other calls are unaffected"""
+    node = ExecuteToolNode([stuck_df], {'stuck_df'}, set(), tool_timeouts={'default': 60})
+    message = {'messages': [AIMessage(content='', tool_calls=[
+        {'name': 'stuck_df', 'args': {'node_name': 'worker-1'}, 'id': 'c1'}])]}
+    config = {'configurable': {TOOL_DEADLINE_KEY: time.monotonic() + 0.5}}
+
+    started = time.monotonic()
+    outputs = asyncio.run(node.ainvoke(message, config)) if run_async else node.invoke(message, config)
+    assert time.monotonic() - started < 3
+
+    response = outputs['messages'][0]
+    assert response.tool_call_id == 'c1'
+    assert response.status == 'error'
+    assert response.response_metadata['timed_out']
+    assert response.content.startswith('Filesystem on worker-1')
+    assert 'partial' in response.content
+    assert node.tool_memo.get_stats()['size'] == 0
+
+
+@tool
+async def flaky_connect(node_name: str) -> str:
+    """Fails at once the way an SSH connect does"""
+    raise socket.timeout(f"connect to {node_name} timed out")
+
+
+@tool
+async def slow_query(node_name: str) -> str:
+    """Never answers"""
+    await asyncio.sleep(30)
+    return node_name
+
+
+@pytest.mark.parametrize('timeouts', [{'default': 60}, {'default': None}])
+def test_tool_errors_are_not_reported_as_timeouts(timeouts):
+    """A TimeoutError raised by the tool itself is its error; only the deadline makes a timed out call"""
+    node = ExecuteToolNode([flaky_connect, slow_query], {'flaky_connect', 'slow_query'}, set(),
+                           tool_timeouts=timeouts)
+    message = {'messages': [AIMessage(content='', tool_calls=[
+        {'name': 'flaky_connect', 'args': {'node_name': 'worker-1'}, 'id': 'c1'}])]}
+
+    response = asyncio.run(node.ainvoke(message))['messages'][0]
+    assert response.status == 'error'
+    assert 'connect to worker-1 timed out' in response.content
+    assert not response.response_metadata.get('timed_out')
+
+    message = {'messages': [AIMessage(content='', tool_calls=[
+        {'name': 'slow_query', 'args': {'node_name': 'worker-1'}, 'id': 'c2'}])]}
+    config = {'configurable': {TOOL_DEADLINE_KEY: time.monotonic()}}
+    with mock.patch('troubleshooting.execute_tool_node.DEADLINE_GRACE_SECONDS', 0.2):
+        response = asyncio.run(node.ainvoke(message, config))['messages'][0]
+    assert response.response_metadata['timed_out']
+
+
+@tool
+async def stuck_stream(node_name: str) -> str:
+    """Streams a line, then hangs without watching the deadline"""
+    note_partial_output(f"Streaming from {node_name}\n")
+    await asyncio.sleep(30)
+    return node_name
+
+
+@tool
+def fio_performance_test(node_name: str, device_path: str) -> str:
+    """Benchmark a device"""
+    return f"fio {node_name} {device_path}"
+
+
+@pytest.mark.parametrize('run_async', [False, True])
+def test_backstop_and_resource_waits_keep_the_deadline(run_async):
+    """A tool that ignores its deadline still reports partial output; waiting for resources counts against it"""
+    scheduler = ResourceScheduler()
+    node = ExecuteToolNode([stuck_stream, fio_performance_test], {'stuck_stream'}, set(),
+                           resource_scheduler=scheduler, tool_timeouts={'default': 0.3})
+
+    def run(name, args):
+        message = {'messages': [AIMessage(content='', tool_calls=[{'name': name, 'args': args, 'id': 'c1'}])]}
+        return (asyncio.run(node.ainvoke(message)) if run_async else node.invoke(message))['messages'][0]
+
+    with mock.patch('troubleshooting.execute_tool_node.DEADLINE_GRACE_SECONDS', 0.1):
+        response = run('stuck_stream', {'node_name': 'worker-1'})
+    assert response.response_metadata['timed_out']
+    assert response.content.startswith('Streaming from worker-1')
+
+    # Another benchmark owns the device past this call's deadline
+    args = {'node_name': 'worker-1', 'device_path': '/dev/sdb'}
+    claims = scheduler.claims_for('fio_performance_test', args)
+    scheduler.acquire(claims)
+    try:
+        started = time.monotonic()
+        response = run('fio_performance_test', args)
+    finally:
+        scheduler.release(claims)
+    assert time.monotonic() - started < 2
+    assert response.response_metadata['timed_out']
+    assert scheduler.get_stats()['held'] == {}
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests for memoizing repeated identical tool calls in ExecuteToolNode.
+"""
+
+import asyncio
+import os
+import sys
+
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from troubleshooting.execute_tool_node import ExecuteToolNode
+from troubleshooting.tool_memo import ToolResultMemo, canonical_args
+
+calls = []
+
+
+@tool
+def kg_get_summary(verbose: bool = None) -> str:
+    """Summarize the Knowledge Graph"""
+    calls.append('kg_get_summary')
+    return "summary"
+
+
+@tool
+def kubectl_get_drive(drive_uuid: str = None, output_format: str = "yaml") -> str:
+    """Get drives"""
+    calls.append('kubectl_get_drive')
+    return f"drives {drive_uuid} {len(calls)}"
+
+
+@tool
+def kubectl_apply(yaml_content: str) -> str:
+    """Apply a manifest"""
+    calls.append('kubectl_apply')
+    return "applied"
+
+
+def _node(policies=None):
+    hooks = []
+    memo = ToolResultMemo({'tools': {'memoization': {'policies': policies or {}}}})
+    node = ExecuteToolNode([kg_get_summary, kubectl_get_drive, kubectl_apply],
+                           {'kg_get_summary', 'kubectl_get_drive'}, {'kubectl_apply'}, tool_memo=memo)
+    node.register_before_call_hook(lambda name, args, call_type: None)
+    node.register_after_call_hook(lambda name, args, result, call_type: hooks.append((name, call_type)))
+    return node, hooks
+
+
+def _step(node, *tool_calls, run_async=False):
+    message = AIMessage(content='', tool_calls=[{'name': name, 'args': args, 'id': call_id}
+                                                 for call_id, name, args in tool_calls])
+    if run_async:
+        return asyncio.run(node.ainvoke({'messages': [message]}))['messages']
+    return node.invoke({'messages': [message]})['messages']
+
+
+def test_repeated_calls_are_answered_from_memo():
+    """Identical calls in later steps reuse the result under their own tool_call_id and are marked cached"""
+    calls.clear()
+    node, hooks = _node()
+
+    first = _step(node, ('c1', 'kg_get_summary', {}), ('c2', 'kubectl_get_drive', {'drive_uuid': 'd1'}))
+    again = _step(node, ('c3', 'kg_get_summary', {'verbose': None}),
+                  ('c4', 'kubectl_get_drive', {'output_format': 'yaml', 'drive_uuid': 'd1'}))
+    other = _step(node, ('c5', 'kubectl_get_drive', {'drive_uuid': 'd2'}), run_async=True)
+
+    assert sorted(calls) == ['kg_get_summary', 'kubectl_get_drive', 'kubectl_get_drive']
+    first, again = ({m.name: m for m in messages} for messages in (first, again))
+    assert {name: m.content for name, m in again.items()} == {name: m.content for name, m in first.items()}
+    assert {name: m.tool_call_id for name, m in again.items()} == {'kg_get_summary': 'c3', 'kubectl_get_drive': 'c4'}
+    assert all(m.response_metadata['cached'] for m in again.values())
+    assert not first['kg_get_summary'].response_metadata.get('cached')
+    assert other[0].content.startswith('drives d2')
+    assert ('kg_get_summary', 'Scheduled, cached') in hooks
+    assert node.tool_memo.get_stats()['hits'] == 2
+
+
+def test_never_policy_and_mutating_tools():
+    """Tools with the never policy always run, and a mutating tool drops the memo"""
+    calls.clear()
+    node, _ = _node(policies={'kg_get_summary': 'never'})
+
+    _step(node, ('c1', 'kg_get_summary', {}), ('c2', 'kubectl_get_drive', {}))
+    _step(node, ('c3', 'kg_get_summary', {}), ('c4', 'kubectl_apply', {'yaml_content': 'x'}))
+    _step(node, ('c5', 'kubectl_get_drive', {}))
+
+    assert sorted(calls) == ['kg_get_summary', 'kg_get_summary', 'kubectl_apply', 'kubectl_get_drive', 'kubectl_get_drive']
+    assert node.tool_memo.get_stats()['invalidations'] == 1
+    assert canonical_args({'b': 1, 'a': None, 'state': {}}, exclude=['state']) == '{"b":1}'
+
+
+
+@tool
+def mount_command(node_name: str) -> str:
+    """List mounts; the first call loses the SSH connection"""
+    calls.append('mount_command')
+    return "mounts" if calls.count('mount_command') > 1 else "SSH execution failed: connection reset"
+
+
+@tool
+def fsck_check(node_name: str, device_path: str, check_only: bool = True) -> str:
+    """Check a filesystem"""
+    calls.append('fsck_check')
+    return "clean"
+
+
+def test_failures_and_node_repairs_are_not_memoized():
+    """A failed call runs again, and a repair drops the memoized node state but not the cluster state"""
+    calls.clear()
+    node = ExecuteToolNode([mount_command, fsck_check, kubectl_get_drive],
+                           {'mount_command', 'kubectl_get_drive'}, {'fsck_check'}, tool_memo=ToolResultMemo())
+    mount = ('mount_command', {'node_name': 'worker-1'})
+    fsck = ('fsck_check', {'node_name': 'worker-1', 'device_path': '/dev/sdb1'})
+
+    _step(node, ('c1', *mount), ('c2', 'kubectl_get_drive', {}))
+    _step(node, ('c3', *mount), ('c4', 'kubectl_get_drive', {}))
+    _step(node, ('c5', *mount))
+    assert calls.count('mount_command') == 2
+
+    # A read-only check keeps the memo, a repair drops the node state
+    _step(node, ('c6', *fsck))
+    _step(node, ('c7', *mount))
+    assert calls.count('mount_command') == 2
+    _step(node, ('c8', fsck[0], {**fsck[1], 'check_only': False}))
+    _step(node, ('c9', *mount), ('c10', 'kubectl_get_drive', {}))
+    assert calls.count('mount_command') == 3
+    assert calls.count('kubectl_get_drive') == 1
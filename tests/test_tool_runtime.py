@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared tool thread pool, background event loop and dispatch table.
+"""
+
+import os
+import sys
+import threading
+
+from langchain_core.messages import AIMessage
+from langchain_core.tools import StructuredTool
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from troubleshooting.execute_tool_node import ExecuteToolNode
+from troubleshooting.tool_runtime import get_tool_executor, get_tool_loop
+
+threads = []
+
+
+def _probe(value: int) -> str:
+    """Record the calling thread"""
+    threads.append(threading.current_thread().name)
+    return str(value)
+
+
+async def _aprobe(value: int) -> str:
+    """Record the thread running the coroutine"""
+    threads.append(threading.current_thread().name)
+    return str(value)
+
+
+def _step(node, name, values):
+    return node.invoke({'messages': [AIMessage(content='', tool_calls=[
+        {'name': name, 'args': {'value': value}, 'id': f"{name}-{value}"} for value in values])]})['messages']
+
+
+def test_dispatch_table_and_shared_runtime():
+    """Sync tools run on the shared pool, async-only tools on the background loop, across steps"""
+    threads.clear()
+    node = ExecuteToolNode([StructuredTool.from_function(func=_probe, name='probe'),
+                            StructuredTool.from_function(coroutine=_aprobe, name='aprobe')],
+                           {'probe', 'aprobe'}, set())
+
+    assert node.tool_is_async_only == {'probe': False, 'aprobe': True}
+
+    assert [m.content for m in _step(node, 'probe', [1, 2])] == ['1', '2']
+    assert [m.content for m in _step(node, 'aprobe', [3, 4])] == ['3', '4']
+    assert [m.content for m in _step(node, 'aprobe', [5])] == ['5']
+
+    assert all(name.startswith('tool-call') for name in threads[:2])
+    assert threads[2:] == ['tool-event-loop'] * 3
+    assert get_tool_executor() is get_tool_executor()
+    assert get_tool_loop().is_running()
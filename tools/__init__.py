@@ -39,7 +39,8 @@ from tools.core.knowledge_graph import (
     kg_find_path,
     kg_get_summary,
     kg_analyze_issues,
-    kg_print_graph
+    kg_print_graph,
+    kg_batch_query
 )
 
 # Import all individual tools for backward compatibility
@@ -105,6 +106,7 @@ __all__ = [
     'kg_get_summary',
     'kg_analyze_issues',
     'kg_print_graph',
+    'kg_batch_query',
     
     # Kubernetes core tools
     'kubectl_get',
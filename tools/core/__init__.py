@@ -5,6 +5,9 @@ Core utilities for the troubleshooting tools.
 This module contains:
 - config: Global configuration management and command utilities
 - knowledge_graph: Knowledge Graph tools and management
+- ssh_pool: Pooled SSH connections shared by the diagnostic tools
+- deadline: Per-call deadlines for tool subprocesses and SSH commands
+- log_classifier: Shared one-pass keyword classifier for kernel and journal logs
 """
 
 from tools.core.config import (
@@ -14,6 +17,28 @@ from tools.core.config import (
     execute_command
 )
 
+from tools.core.deadline import (
+    ToolTimeout,
+    deadline_scope,
+    note_partial_output,
+    partial_output,
+    remaining,
+    run_subprocess
+)
+
+from tools.core.ssh_pool import (
+    SSHConnectionPool,
+    initialize_ssh_pool,
+    get_ssh_pool,
+    close_ssh_pool
+)
+
+from tools.core.log_classifier import (
+    LogRule,
+    LogClassifier,
+    get_log_classifier
+)
+
 from tools.core.knowledge_graph import (
     initialize_knowledge_graph,
     get_knowledge_graph,
@@ -23,7 +48,8 @@ from tools.core.knowledge_graph import (
     kg_find_path,
     kg_get_summary,
     kg_analyze_issues,
-    kg_print_graph
+    kg_print_graph,
+    kg_batch_query
 )
 
 __all__ = [
@@ -33,6 +59,25 @@ __all__ = [
     'validate_command',
     'execute_command',
     
+    # Tool call deadlines
+    'ToolTimeout',
+    'deadline_scope',
+    'note_partial_output',
+    'partial_output',
+    'remaining',
+    'run_subprocess',
+    
+    # SSH connection pool
+    'SSHConnectionPool',
+    'initialize_ssh_pool',
+    'get_ssh_pool',
+    'close_ssh_pool',
+    
+    # Log classification
+    'LogRule',
+    'LogClassifier',
+    'get_log_classifier',
+    
     # Knowledge Graph management
     'initialize_knowledge_graph',
     'get_knowledge_graph',
@@ -44,5 +89,6 @@ __all__ = [
     'kg_find_path',
     'kg_get_summary',
     'kg_analyze_issues',
-    'kg_print_graph'
+    'kg_print_graph',
+    'kg_batch_query'
 ]
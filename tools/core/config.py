@@ -10,6 +10,8 @@ import logging
 import subprocess
 from typing import Dict, List, Any, Optional, Tuple
 
+from tools.core.deadline import run_subprocess
+
 # Global variables
 INTERACTIVE_MODE = False  # To be set by the caller
 CONFIG_DATA = None  # To be set by the caller with configuration
@@ -92,7 +94,7 @@ def execute_command(command_list: List[str], purpose: str = "none", requires_app
     # Execute command
     try:
         logging.info(f"Executing command: {command_display_str}")
-        result = subprocess.run(command_list, shell=False, check=True, 
+        result = run_subprocess(command_list, shell=False, check=True, 
                                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
                                universal_newlines=True)
         output = result.stdout
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Deadlines for tool calls.
+
+ExecuteToolNode runs every tool call inside a deadline scope: the tool's own
+timeout, cut short by what is left of the phase budget. The deadline lives in a
+context variable, so the subprocess and SSH helpers deep inside a tool see it
+without any tool signature changing:
+    run_subprocess()      subprocess.run replacement; on expiry kills the whole
+                          process group and keeps the output read so far
+    remaining(default)    seconds left, e.g. for the SSH pool's command timeout
+On expiry they raise ToolTimeout carrying the partial output, and record it in
+the scope so the caller that gave up on the tool can report it too:
+    partial_output()      output the tool's helpers have produced so far
+Outside a deadline scope (e.g. the Phase 0 collectors) nothing changes.
+"""
+
+import os
+import signal
+import subprocess
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Union
+
+# Configurable key of a RunnableConfig holding the phase deadline (time.monotonic())
+TOOL_DEADLINE_KEY = "tool_deadline"
+
+# Seconds a tool may run when config.yaml does not say otherwise
+DEFAULT_TOOL_TIMEOUT_SECONDS = 300
+DEFAULT_TOOL_TIMEOUTS = {
+    'fio_performance_test': 900,
+    'run_disk_readonly_test': 900,
+    'test_disk_io_performance': 900,
+    'detect_disk_jitter': 900,
+    'run_volume_stress_test': 900,
+    'test_volume_io_performance': 900,
+    'monitor_volume_latency': 900,
+}
+
+# Seconds allowed for a killed process group to close its pipes
+_KILL_GRACE_SECONDS = 5
+
+_deadline: ContextVar[Optional[float]] = ContextVar('tool_deadline', default=None)
+
+# One-element list shared by a scope and its nested scopes, holding the latest partial
+# output; it is a mutable box so tool threads running in a copy of the context update it
+_partial: ContextVar[Optional[List[Union[str, bytes, bytearray]]]] = ContextVar('tool_partial_output',
+                                                                                default=None)
+
+
+class ToolTimeout(BaseException):
+    """
+    A tool call ran past its deadline
+
+    Like asyncio.CancelledError it derives from BaseException, so the
+    `except Exception` blocks of tool wrappers do not turn it into an error string.
+    """
+
+    def __init__(self, timeout: float, partial_output: str = ""):
+        """
+        Args:
+            timeout: Seconds the call was given
+            partial_output: Output produced before the deadline
+        """
+        super().__init__(f"Timed out after {timeout:.1f}s")
+        self.timeout = timeout
+        self.partial_output = partial_output
+
+
+def load_tool_timeouts(config_data: Dict[str, Any] = None) -> Dict[str, Optional[float]]:
+    """
+    Per-tool timeouts from config.yaml (tools.timeouts), over the built-in ones
+
+    Args:
+        config_data: Configuration data from config.yaml
+
+    Returns:
+        Dict[str, Optional[float]]: Tool name -> seconds, plus 'default'; None means no limit
+    """
+    timeouts = ((config_data or {}).get('tools', {}) or {}).get('timeouts', {}) or {}
+    return {'default': DEFAULT_TOOL_TIMEOUT_SECONDS, **DEFAULT_TOOL_TIMEOUTS, **timeouts}
+
+
+@contextmanager
+def deadline_scope(timeout: Optional[float]):
+    """
+    Run the block with a deadline timeout seconds from now, or the enclosing one if sooner
+
+    Args:
+        timeout: Seconds; None keeps the enclosing deadline
+    """
+    deadline = _deadline.get()
+    if timeout is not None:
+        own = time.monotonic() + max(0.0, timeout)
+        deadline = own if deadline is None else min(deadline, own)
+    token = _deadline.set(deadline)
+    partial_token = _partial.set([""]) if _partial.get() is None else None
+    try:
+        yield deadline
+    finally:
+        if partial_token is not None:
+            _partial.reset(partial_token)
+        _deadline.reset(token)
+
+
+def in_deadline_scope() -> bool:
+    """Whether the caller runs under a deadline"""
+    return _deadline.get() is not None
+
+
+def remaining(default: Optional[float] = None) -> Optional[float]:
+    """
+    Seconds left before the current deadline
+
+    Args:
+        default: Timeout to use when it is shorter, or when there is no deadline
+
+    Returns:
+        Optional[float]: Seconds, never negative; None if there is neither a deadline nor a default
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return default
+    left = max(0.0, deadline - time.monotonic())
+    return left if default is None else min(left, default)
+
+
+def note_partial_output(output: Union[str, bytes, bytearray]):
+    """
+    Record the output of the current call so far
+
+    Args:
+        output: Output text; a bytearray that keeps growing is read when needed
+    """
+    box = _partial.get()
+    if box is not None:
+        box[0] = output
+
+
+def partial_output() -> str:
+    """Output recorded by the current call so far, for a ToolTimeout raised on its behalf"""
+    box = _partial.get()
+    if box is None:
+        return ""
+    output = box[0]
+    return _text(bytes(output) if isinstance(output, bytearray) else output)
+
+
+def _kill_process_group(process: subprocess.Popen):
+    """Kill a process started with start_new_session and everything it spawned"""
+    try:
+        if hasattr(os, 'killpg'):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
+
+
+def _text(output: Union[str, bytes, None]) -> str:
+    if isinstance(output, bytes):
+        return output.decode('utf-8', errors='replace')
+    return output or ""
+
+
+def run_subprocess(cmd: List[str], input: Optional[str] = None, check: bool = False,
+                   timeout: Optional[float] = None, **kwargs) -> subprocess.CompletedProcess:
+    """
+    subprocess.run that honours the current deadline
+
+    The command runs in a new session. If the deadline passes, the whole process
+    group is killed so no child is left behind, and ToolTimeout carries the
+    stdout read so far. Without a deadline or timeout it behaves like subprocess.run.
+
+    Args:
+        cmd: Command as a list of strings
+        input: Data sent to stdin
+        check: Raise CalledProcessError on a non-zero exit code
+        timeout: Seconds, if shorter than the current deadline
+        **kwargs: Passed to subprocess.Popen (e.g. text=True)
+
+    Returns:
+        subprocess.CompletedProcess: Exit code, stdout and stderr
+    """
+    timeout = remaining(timeout)
+    kwargs.setdefault('stdout', subprocess.PIPE)
+    kwargs.setdefault('stderr', subprocess.PIPE)
+    if input is not None:
+        kwargs['stdin'] = subprocess.PIPE
+
+    with subprocess.Popen(cmd, start_new_session=True, **kwargs) as process:
+        try:
+            stdout, stderr = process.communicate(input, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _kill_process_group(process)
+            try:
+                stdout, stderr = process.communicate(timeout=_KILL_GRACE_SECONDS)
+            except subprocess.TimeoutExpired:
+                # A child that left the group still holds the pipes; give up on its output
+                stdout, stderr = "", ""
+            if not in_deadline_scope():
+                raise subprocess.TimeoutExpired(cmd, timeout, stdout, stderr)
+            note_partial_output(_text(stdout))
+            raise ToolTimeout(timeout, _text(stdout))
+        except BaseException:
+            _kill_process_group(process)
+            raise
+
+    if check and process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, cmd, stdout, stderr)
+    return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
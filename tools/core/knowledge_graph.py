@@ -8,7 +8,7 @@ including entity queries, relationship analysis, and issue management.
 
 import json
 import logging
-from typing import Any
+from typing import Any, Dict, List, Optional, Tuple
 from langchain_core.tools import tool
 
 # Configure logger for knowledge graph tools
@@ -64,58 +64,48 @@ def get_knowledge_graph() -> 'KnowledgeGraph':
     
     return KNOWLEDGE_GRAPH
 
-@tool
-def kg_get_entity_info(entity_type: str, id: str) -> str:
+def _resolve_node_id(kg: 'KnowledgeGraph', entity_type: str, id: str) -> Optional[str]:
     """
-    Get detailed information about an entity in the Knowledge Graph
+    Resolve an entity ID, name or UUID to a node ID
     
     Args:
-        entity_type: Type of entity (Pod, PVC, PV, Drive, Node, etc.)
-        id: ID or name of the entity. Can be provided in two formats:
-           Examples: "gnode:Pod:default/nginx-pod", "gnode:PV:pv-00001", "gnode:Drive:drive-sda"
-           
-           Entity ID formats:
-           - Pod: "gnode:Pod:<namespace>/<name>" (example: "gnode:Pod:default/test-pod-1-0")
-           - PVC: "gnode:PVC:<namespace>/<name>" (example: "gnode:PVC:default/test-pvc-1")
-           - PV: "gnode:PV:<name>" (example: "gnode:PV:pv-test-123")
-           - Drive: "gnode:Drive:<uuid>" (example: "gnode:Drive:a1b2c3d4-e5f6")
-           - Node: "gnode:Node:<name>" (example: "gnode:Node:kind-control-plane")
-           - StorageClass: "gnode:StorageClass:<name>" (example: "gnode:StorageClass:csi-baremetal-sc")
-           - LVG: "gnode:LVG:<name>" (example: "gnode:LVG:lvg-1")
-           - AC: "gnode:AC:<name>" (example: "gnode:AC:ac-node1-ssd")
-           - Volume: "gnode:Volume:<namespace>/<name>" (example: "gnode:Volume:default/vol-1")
-           - System: "gnode:System:<entity_name>" (example: "gnode:System:kernel")
-           - ClusterNode: "gnode:ClusterNode:<name>" (example: "gnode:ClusterNode:worker-1")
-           - HistoricalExperience: "gnode:HistoricalExperience:<experience_id>" (example: "gnode:HistoricalExperience:exp-001")
+        kg: Knowledge Graph instance
+        entity_type: Entity subtype (Pod, Drive, ...)
+        id: Full node ID ("gnode:Pod:default/nginx"), name or UUID
         
     Returns:
-        str: JSON serialized entity details with attributes and relationships
+        Optional[str]: Node ID, or None if no entity matches
     """
-    kg = get_knowledge_graph()
-    
-    # Construct the full node_id if only name was provided
-    if ':' not in id:
-        node_id = f"gnode:{entity_type}:{id}"
-    else:
-        node_id = id
-    
-    # Check if node exists in graph
-    if not kg.graph.has_node(node_id):
-        # Try to find by name or uuid attribute
-        found = False
-        for n_id, attrs in kg.graph.nodes(data=True):
-            if (attrs.get('entity_type') == entity_type and 
-                (attrs.get('name') == id or attrs.get('uuid') == id)):
-                node_id = n_id
-                found = True
-                break
-        
-        if not found:
-            return json.dumps({"error": f"Entity not found: gnode:{entity_type}:{id}"})
+    node_id = id if ':' in id else f"gnode:{entity_type}:{id}"
+    if kg.graph.has_node(node_id):
+        return node_id
+    return kg.find_node_id(entity_type, id)
+
+def _entity_details(kg: 'KnowledgeGraph', node_id: str, entity_type: str,
+                    include_relationships: bool = True) -> Dict[str, Any]:
+    """
+    Build the kg_get_entity_info result for a resolved node
     
+    Args:
+        kg: Knowledge Graph instance
+        node_id: Existing node ID
+        entity_type: Entity subtype reported back to the caller
+        include_relationships: Whether to list incoming and outgoing relationships
+        
+    Returns:
+        Dict[str, Any]: Entity attributes, relationships and issues
+    """
     # Get node attributes
     node_attrs = dict(kg.graph.nodes[node_id])
     
+    if not include_relationships:
+        return {
+            "node_id": node_id,
+            "entity_type": entity_type,
+            "attributes": node_attrs,
+            "issues": kg.get_issues_by_node(node_id)
+        }
+    
     # Get incoming and outgoing relationships
     incoming_edges = []
     outgoing_edges = []
@@ -149,10 +139,46 @@ def kg_get_entity_info(entity_type: str, id: str) -> str:
         "attributes": node_attrs,
         "incoming_relationships": incoming_edges,
         "outgoing_relationships": outgoing_edges,
-        "issues": node_attrs.get('issues', [])
+        "issues": kg.get_issues_by_node(node_id)
     }
     
-    return json.dumps(result, indent=2)
+    return result
+
+@tool
+def kg_get_entity_info(entity_type: str, id: str) -> str:
+    """
+    Get detailed information about an entity in the Knowledge Graph
+    
+    Args:
+        entity_type: Type of entity (Pod, PVC, PV, Drive, Node, etc.)
+        id: ID or name of the entity. Can be provided in two formats:
+           Examples: "gnode:Pod:default/nginx-pod", "gnode:PV:pv-00001", "gnode:Drive:drive-sda"
+           
+           Entity ID formats:
+           - Pod: "gnode:Pod:<namespace>/<name>" (example: "gnode:Pod:default/test-pod-1-0")
+           - PVC: "gnode:PVC:<namespace>/<name>" (example: "gnode:PVC:default/test-pvc-1")
+           - PV: "gnode:PV:<name>" (example: "gnode:PV:pv-test-123")
+           - Drive: "gnode:Drive:<uuid>" (example: "gnode:Drive:a1b2c3d4-e5f6")
+           - Node: "gnode:Node:<name>" (example: "gnode:Node:kind-control-plane")
+           - StorageClass: "gnode:StorageClass:<name>" (example: "gnode:StorageClass:csi-baremetal-sc")
+           - LVG: "gnode:LVG:<name>" (example: "gnode:LVG:lvg-1")
+           - AC: "gnode:AC:<name>" (example: "gnode:AC:ac-node1-ssd")
+           - Volume: "gnode:Volume:<namespace>/<name>" (example: "gnode:Volume:default/vol-1")
+           - System: "gnode:System:<entity_name>" (example: "gnode:System:kernel")
+           - ClusterNode: "gnode:ClusterNode:<name>" (example: "gnode:ClusterNode:worker-1")
+           - HistoricalExperience: "gnode:HistoricalExperience:<experience_id>" (example: "gnode:HistoricalExperience:exp-001")
+        
+    Returns:
+        str: JSON serialized entity details with attributes and relationships
+    """
+    kg = get_knowledge_graph()
+    
+    # Resolve the full node_id, or a name/uuid through the Knowledge Graph indexes
+    node_id = _resolve_node_id(kg, entity_type, id)
+    if node_id is None:
+        return json.dumps({"error": f"Entity not found: gnode:{entity_type}:{id}"})
+    
+    return json.dumps(_entity_details(kg, node_id, entity_type), indent=2)
 
 @tool
 def kg_get_related_entities(entity_type: str, id: str, relationship_type: str = None, max_depth: int = 1) -> str:
@@ -185,25 +211,10 @@ def kg_get_related_entities(entity_type: str, id: str, relationship_type: str =
     """
     kg = get_knowledge_graph()
     
-    # Construct the full node_id if only name was provided
-    if ':' not in id:
-        node_id = f"gnode:{entity_type}:{id}"
-    else:
-        node_id = id
-    
-    # Check if node exists in graph
-    if not kg.graph.has_node(node_id):
-        # Try to find by name or uuid attribute
-        found = False
-        for n_id, attrs in kg.graph.nodes(data=True):
-            if (attrs.get('entity_type') == entity_type and 
-                (attrs.get('name') == id or attrs.get('uuid') == id)):
-                node_id = n_id
-                found = True
-                break
-        
-        if not found:
-            return json.dumps({"error": f"Entity not found: gnode:{entity_type}:{id}"})
+    # Resolve the full node_id, or a name/uuid through the Knowledge Graph indexes
+    node_id = _resolve_node_id(kg, entity_type, id)
+    if node_id is None:
+        return json.dumps({"error": f"Entity not found: gnode:{entity_type}:{id}"})
     
     # Find related entities recursively up to max_depth
     related_entities = []
@@ -232,7 +243,7 @@ def kg_get_related_entities(entity_type: str, id: str, relationship_type: str =
                     },
                     "attributes": {k: v for k, v in target_attrs.items() 
                                 if k not in ['entity_type', 'name', 'issues']},
-                    "issues": target_attrs.get('issues', [])
+                    "issues": kg.get_issues_by_node(target)
                 }
                 related_entities.append(entity)
                 visited.add(target)
@@ -260,7 +271,7 @@ def kg_get_related_entities(entity_type: str, id: str, relationship_type: str =
                     },
                     "attributes": {k: v for k, v in source_attrs.items() 
                                 if k not in ['entity_type', 'name', 'issues']},
-                    "issues": source_attrs.get('issues', [])
+                    "issues": kg.get_issues_by_node(source)
                 }
                 related_entities.append(entity)
                 visited.add(source)
@@ -300,8 +311,7 @@ def kg_get_all_issues(severity: str = None, issue_type: str = None) -> str:
     
     # Get all issues based on filters
     if severity and issue_type:
-        issues = [issue for issue in kg.issues 
-                 if issue['severity'] == severity and issue['type'] == issue_type]
+        issues = [issue for issue in kg.get_issues_by_type(issue_type) if issue['severity'] == severity]
     elif severity == 'primary':
         critical_issues = kg.get_issues_by_severity("critical")
         high_issues = kg.get_issues_by_severity("high")
@@ -309,7 +319,7 @@ def kg_get_all_issues(severity: str = None, issue_type: str = None) -> str:
     elif severity:
         issues = kg.get_issues_by_severity(severity)
     elif issue_type:
-        issues = [issue for issue in kg.issues if issue['type'] == issue_type]
+        issues = kg.get_issues_by_type(issue_type)
     else:
         issues = kg.get_all_issues()
     
@@ -382,22 +392,12 @@ def kg_find_path(source_entity_type: str, source_id: str,
     source_node_id = f"gnode:{source_entity_type}:{source_id}"
     target_node_id = f"gnode:{target_entity_type}:{target_id}"
     
-    # Check if nodes exist
+    # Check if nodes exist, otherwise look them up by name or uuid
     if not kg.graph.has_node(source_node_id):
-        # Try to find by name or uuid
-        for n_id, attrs in kg.graph.nodes(data=True):
-            if (attrs.get('entity_type') == source_entity_type and 
-                (attrs.get('name') == source_id or attrs.get('uuid') == source_id)):
-                source_node_id = n_id
-                break
+        source_node_id = kg.find_node_id(source_entity_type, source_id) or source_node_id
     
     if not kg.graph.has_node(target_node_id):
-        # Try to find by name or uuid
-        for n_id, attrs in kg.graph.nodes(data=True):
-            if (attrs.get('entity_type') == target_entity_type and 
-                (attrs.get('name') == target_id or attrs.get('uuid') == target_id)):
-                target_node_id = n_id
-                break
+        target_node_id = kg.find_node_id(target_entity_type, target_id) or target_node_id
     
     # Return error if either node is not found
     if not kg.graph.has_node(source_node_id):
@@ -489,10 +489,7 @@ def kg_get_summary() -> str:
     summary = kg.get_summary()
     
     # Enhance with issue types distribution
-    issue_types = {}
-    for issue in kg.issues:
-        issue_type = issue['type']
-        issue_types[issue_type] = issue_types.get(issue_type, 0) + 1
+    issue_types = kg.count_issues_by_type()
     
     # Use a safer way to get current timestamp
     from datetime import datetime
@@ -554,6 +551,82 @@ def kg_print_graph(include_details: bool = True, include_issues: bool = True) ->
         include_relationships=True
     )
 
+def _parse_entity_ref(ref: str) -> Optional[Tuple[str, str]]:
+    """
+    Split an entity reference into (entity_type, id)
+    
+    Args:
+        ref: "gnode:<Type>:<id>" node ID or "<Type>:<id>" where id is the ID suffix, name or UUID
+        
+    Returns:
+        Optional[Tuple[str, str]]: (entity_type, id), or None if the reference has no type
+    """
+    if ref.startswith('gnode:'):
+        parts = ref.split(':', 2)
+        return (parts[1], ref) if len(parts) == 3 else None
+    if ':' not in ref:
+        return None
+    entity_type, entity_id = ref.split(':', 1)
+    return entity_type, entity_id
+
+@tool
+def kg_batch_query(entities: List[str] = None, volume_chain: str = None,
+                   include_relationships: bool = True) -> str:
+    """
+    Get detailed information about several entities in the Knowledge Graph in one call
+    
+    Use this instead of calling kg_get_entity_info once per entity, e.g. for the
+    Pod, PVC, PV, Drive and Node of one volume chain.
+    
+    Args:
+        entities: Optional list of entity references, each either a full node ID or "<Type>:<id>"
+                 where id is the ID suffix, name or UUID of the entity.
+                 Examples: ["gnode:Pod:default/nginx-pod", "PVC:default/data-nginx", "Drive:a1b2c3d4-e5f6", "Node:worker-1"]
+        volume_chain: Optional reference to a Pod or PVC, in the same format. Adds every entity on its
+                      storage chain: Pod -> PVC -> PV/Volume -> LVG/Drive -> Node.
+                      Example: "Pod:default/nginx-pod"
+        include_relationships: Whether to include incoming and outgoing relationships of each entity
+        
+    Returns:
+        str: JSON serialized entity details in request order (duplicates removed), the volume chain
+             node IDs, and the references that could not be resolved
+    """
+    kg = get_knowledge_graph()
+    
+    results = {}
+    not_found = []
+    
+    def resolve(ref: str) -> Optional[str]:
+        parsed = _parse_entity_ref(ref)
+        node_id = _resolve_node_id(kg, *parsed) if parsed else None
+        if node_id is None:
+            not_found.append(ref)
+        return node_id
+    
+    for ref in entities or []:
+        node_id = resolve(ref)
+        if node_id is not None and node_id not in results:
+            results[node_id] = _entity_details(kg, node_id, _parse_entity_ref(ref)[0], include_relationships)
+    
+    chain = None
+    if volume_chain:
+        root_id = resolve(volume_chain)
+        if root_id is not None:
+            chain = kg.get_volume_chain(root_id)
+            for node_id in chain:
+                if node_id not in results:
+                    entity_type = kg.graph.nodes[node_id].get('gnode_subtype', 'Unknown')
+                    results[node_id] = _entity_details(kg, node_id, entity_type, include_relationships)
+    
+    result = {
+        "entities": list(results.values()),
+        "total_count": len(results),
+        "volume_chain": chain,
+        "not_found": not_found
+    }
+    
+    return json.dumps(result, indent=2)
+
 @tool
 def kg_list_entity_types() -> str:
     """
@@ -614,8 +687,8 @@ def kg_list_entities(entity_type: str = None) -> str:
             "node_id": node_id,
             "entity_type": node_entity_type,
             "name": attrs.get('name', node_id.split(':')[-1]),
-            "has_issues": bool(attrs.get('issues', [])),
-            "issue_count": len(attrs.get('issues', [])),
+            "has_issues": bool(kg.get_issues_by_node(node_id)),
+            "issue_count": len(kg.get_issues_by_node(node_id)),
             "key_attributes": {k: v for k, v in attrs.items() 
                              if k not in ['entity_type', 'name', 'issues'] 
                              and not isinstance(v, (dict, list)) 
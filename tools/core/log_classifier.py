@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Shared log classification engine for kernel and journal logs.
+
+Rule sets describe log lines by keyword: a rule matches a line when the line
+contains one keyword of every group in `all_of` and, optionally, the keywords
+of `sequence` in that order (like grep 'nvme.*error'). All keywords of all rule
+sets are compiled into one regular expression, so a buffer is lowercased and
+scanned once; rules are then evaluated only for the lines that had hits.
+"""
+
+import re
+import threading
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+# Keywords selecting storage-related kernel and journal log lines
+STORAGE_KEYWORDS = [
+    "disk", "drive", "nvme", "ssd", "hdd", "scsi", "sata", "xfs", "ext4", "mount",
+    "error", "fail", "i/o", "io", "sector", "slot", "bay", "controller", "csi", "volume"
+]
+
+# Keywords of disk-related errors searched in system logs
+DISK_ERROR_KEYWORDS = [
+    "I/O error", "read error", "write error", "sector error",
+    "disk failure", "drive failure", "bad sector", "failed command",
+    "ata error", "scsi error", "medium error", "sense key",
+    "timeout", "reset", "offline", "uncorrectable", "ECC"
+]
+
+# Ordered keyword pairs bucketing kernel logs by issue pattern
+DMESG_PATTERNS = [
+    ("nvme", "error"),
+    ("ssd", "fail"),
+    ("disk", "timeout"),
+    ("scsi", "error"),
+    ("ata", "error"),
+    ("bad", "sector"),
+    ("i/o", "error"),
+    ("filesystem", "error"),
+    ("mount", "fail"),
+    ("csi", "error"),
+]
+
+
+class LogRule:
+    """A named keyword condition on a single log line"""
+
+    def __init__(self, name: str, all_of: Sequence[Sequence[str]] = (), sequence: Sequence[str] = (),
+                 severity: str = 'medium', description: str = '', escalate: Dict[str, str] = None):
+        """
+        Initialize a log rule
+
+        Args:
+            name: Rule name, used as the issue type or bucket name
+            all_of: Keyword groups; the line must contain one keyword of every group
+            sequence: Keywords that must appear in this order on the line
+            severity: Severity of issues reported by this rule
+            description: Issue description prefix, followed by the log line
+            escalate: Keyword -> severity overrides (e.g. 'bad sector' -> critical)
+        """
+        self.name = name
+        self.all_of = [tuple(keyword.lower() for keyword in group) for group in all_of]
+        self.sequence = tuple(keyword.lower() for keyword in sequence)
+        self.severity = severity
+        self.description = description
+        self.escalate = {keyword.lower(): level for keyword, level in (escalate or {}).items()}
+
+    def keywords(self) -> Iterable[str]:
+        """All keywords the rule refers to"""
+        for group in self.all_of:
+            yield from group
+        yield from self.sequence
+        yield from self.escalate
+
+
+class _CompiledRule:
+    """A rule with its keyword groups reduced to bitmasks of one classifier"""
+
+    def __init__(self, rule: LogRule, bits: Dict[str, int]):
+        self.rule = rule
+        self.group_masks = [_mask(group, bits) for group in rule.all_of]
+        self.sequence_mask = _mask(rule.sequence, bits) if rule.sequence else 0
+        self.sequence_regex = re.compile('.*'.join(re.escape(keyword) for keyword in rule.sequence))
+        self.escalate = [(bits[keyword], level) for keyword, level in rule.escalate.items()]
+
+    def matches(self, mask: int, line: str) -> bool:
+        """Check the rule against one line's keyword mask (and the line, for sequences)"""
+        for group_mask in self.group_masks:
+            if not mask & group_mask:
+                return False
+        if self.sequence_mask:
+            if mask & self.sequence_mask != self.sequence_mask:
+                return False
+            return self.sequence_regex.search(line.lower()) is not None
+        return True
+
+    def severity_for(self, mask: int) -> str:
+        """Severity for a matching line, honouring escalation keywords"""
+        for bit, level in self.escalate:
+            if mask & bit:
+                return level
+        return self.rule.severity
+
+
+def _mask(keywords: Iterable[str], bits: Dict[str, int]) -> int:
+    """Bitmask with the bits of the given keywords set"""
+    mask = 0
+    for keyword in keywords:
+        mask |= bits[keyword]
+    return mask
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """
+    Regex alternation of keywords shaped as a trie, e.g. 'd(?:isk|rive)'
+
+    The regex engine branches on one character per step instead of retrying
+    every keyword at every offset, and greedy optional tails prefer the
+    longest keyword.
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+class LogScan:
+    """Keyword hits of one scanned log buffer, evaluated against any rule set"""
+
+    def __init__(self, classifier: 'LogClassifier', lines: List[str], masks: Dict[int, int]):
+        self.classifier = classifier
+        self.lines = lines
+        self.masks = masks
+
+    def _matches(self, rule_set: str, first_only: bool):
+        compiled = self.classifier.compiled_rules(rule_set)
+        required = 0
+        for rule in compiled:
+            # A line can only match if it has a keyword of the rule's first group
+            required |= rule.group_masks[0] if rule.group_masks else rule.sequence_mask
+        for index, mask in self.masks.items():
+            if not mask & required:
+                continue
+            line = self.lines[index]
+            for rule in compiled:
+                if rule.matches(mask, line):
+                    yield index, mask, rule
+                    if first_only:
+                        break
+
+    def first_matches(self, rule_set: str) -> List[Tuple[str, LogRule, str]]:
+        """
+        Classify each line by the first rule of the set it matches
+
+        Returns:
+            List[Tuple[str, LogRule, str]]: (line, rule, severity) in log order
+        """
+        return [(self.lines[index], rule.rule, rule.severity_for(mask))
+                for index, mask, rule in self._matches(rule_set, first_only=True)]
+
+    def buckets(self, rule_set: str, tail: int = None) -> Dict[str, List[str]]:
+        """
+        Lines matching each rule of the set; a line can land in several buckets
+
+        Args:
+            rule_set: Rule set name
+            tail: Keep only the last lines of each bucket, like `| tail -n`
+
+        Returns:
+            Dict[str, List[str]]: Rule name -> matching lines in log order
+        """
+        buckets = {rule.name: [] for rule in self.classifier.rules(rule_set)}
+        for index, _, rule in self._matches(rule_set, first_only=False):
+            buckets[rule.rule.name].append(self.lines[index])
+        if tail:
+            buckets = {name: lines[-tail:] for name, lines in buckets.items()}
+        return buckets
+
+    def matching_lines(self, rule_set: str, tail: int = None) -> List[str]:
+        """Lines matching any rule of the set, like `grep -iE ... | tail -n tail`"""
+        lines = [self.lines[index] for index, _, _ in self._matches(rule_set, first_only=True)]
+        return lines[-tail:] if tail else lines
+
+    def issues(self, rule_set: str, source: str = None) -> List[Dict[str, str]]:
+        """
+        Issues reported by the first matching rule of each line
+
+        Lines are stripped, as the metadata parsers do.
+
+        Args:
+            rule_set: Rule set name
+            source: Issue source (defaults to the rule set name)
+
+        Returns:
+            List[Dict[str, str]]: Issues with type, severity, description, raw_log and source
+        """
+        issues = []
+        for line, rule, severity in self.first_matches(rule_set):
+            line = line.strip()
+            issues.append({
+                'type': rule.name,
+                'severity': severity,
+                'description': f"{rule.description}: {line}",
+                'raw_log': line,
+                'source': source or rule_set
+            })
+        return issues
+
+
+class LogClassifier:
+    """
+    Compiles rule sets into one combined keyword regex and classifies log buffers in one pass
+    """
+
+    def __init__(self, rule_sets: Dict[str, List[LogRule]]):
+        """
+        Initialize the classifier
+
+        Args:
+            rule_sets: Rule set name -> rules in priority order
+        """
+        self.rule_sets = {name: list(rules) for name, rules in rule_sets.items()}
+        keywords = sorted({keyword for rules in self.rule_sets.values() for rule in rules
+                           for keyword in rule.keywords()})
+        if not keywords:
+            raise ValueError("Log classifier needs at least one keyword")
+
+        bits = {keyword: 1 << index for index, keyword in enumerate(keywords)}
+        self._compiled = {name: [_CompiledRule(rule, bits) for rule in rules]
+                          for name, rules in self.rule_sets.items()}
+
+        # A zero-width lookahead reports every start offset, so overlapping keywords
+        # ('sata' and 'ata error') are all found. At each offset the longest keyword
+        # matches; the shorter keywords that are its prefixes occur there too.
+        # Newlines are matched as well so findall() yields the line breaks in order.
+        first_chars = ''.join(sorted({keyword[0] for keyword in keywords} | {'\n'}))
+        self._regex = re.compile(f"(?=[{re.escape(first_chars)}])(?=(\n|{_trie_pattern(keywords)}))")
+        self._implied = {keyword: _mask([other for other in keywords if keyword.startswith(other)], bits)
+                         for keyword in keywords}
+
+    def rules(self, rule_set: str) -> List[LogRule]:
+        """Rules of a set, raising KeyError for unknown sets"""
+        if rule_set not in self.rule_sets:
+            raise KeyError(f"Unknown log rule set: {rule_set}")
+        return self.rule_sets[rule_set]
+
+    def compiled_rules(self, rule_set: str) -> List[_CompiledRule]:
+        """Rules of a set reduced to this classifier's keyword bitmasks"""
+        self.rules(rule_set)
+        return self._compiled[rule_set]
+
+    def scan(self, logs: Union[str, Sequence[str]]) -> LogScan:
+        """
+        Scan a log buffer once for all keywords of all rule sets
+
+        Args:
+            logs: Log text or list of lines
+
+        Returns:
+            LogScan: Per-line keyword hits, evaluated per rule set on demand
+        """
+        if isinstance(logs, str):
+            text = logs
+            lines = text.split('\n')
+        else:
+            lines = list(logs)
+            text = '\n'.join(lines)
+
+        masks: Dict[int, int] = {}
+        implied = self._implied
+        line, mask = 0, 0
+        for keyword in self._regex.findall(text.lower()):
+            if keyword == '\n':
+                if mask:
+                    masks[line] = mask
+                    mask = 0
+                line += 1
+            else:
+                mask |= implied[keyword]
+        if mask:
+            masks[line] = mask
+        return LogScan(self, lines, masks)
+
+    def issues(self, logs: Union[str, Sequence[str]], rule_set: str, source: str = None) -> List[Dict[str, str]]:
+        """Scan logs and report issues of one rule set"""
+        return self.scan(logs).issues(rule_set, source)
+
+    def matching_lines(self, logs: Union[str, Sequence[str]], rule_set: str, tail: int = None) -> List[str]:
+        """Scan logs and return lines matching any rule of one set"""
+        return self.scan(logs).matching_lines(rule_set, tail)
+
+
+def _default_rule_sets() -> Dict[str, List[LogRule]]:
+    """Built-in rule sets shared by the information collector and diagnostic tools"""
+    return {
+        'dmesg': [
+            LogRule('disk_hardware_error', [['disk error', 'drive error', 'bad sector', 'i/o error']],
+                    severity='high', escalate={'bad sector': 'critical'},
+                    description="Hardware disk error detected"),
+            LogRule('nvme_ssd_error', [['nvme', 'ssd'], ['error', 'fail', 'timeout']],
+                    severity='high', description="NVMe/SSD error detected"),
+            LogRule('filesystem_error', [['xfs', 'ext4'], ['error', 'corrupt', 'fail']],
+                    severity='high', description="Filesystem error detected"),
+            LogRule('io_timeout', [['timeout'], ['i/o', 'io', 'disk', 'drive']],
+                    severity='medium', description="I/O timeout detected"),
+            LogRule('controller_error', [['controller', 'scsi', 'sata'], ['error', 'fail', 'reset']],
+                    severity='high', description="Storage controller error detected"),
+        ],
+        'journal_storage': [
+            LogRule('storage_service_error', [['failed', 'error', 'timeout'], ['mount', 'umount', 'filesystem']],
+                    severity='high', description="Storage service error"),
+            LogRule('hardware_detection', [['disk', 'drive', 'nvme', 'ssd'], ['detected']],
+                    severity='low', description="Hardware detection event"),
+        ],
+        'journal_kubelet': [
+            LogRule('kubelet_volume_error', [['volume', 'mount', 'attach'], ['failed', 'error', 'timeout']],
+                    severity='high', description="Kubelet volume error"),
+            LogRule('csi_driver_error', [['csi'], ['failed', 'error', 'timeout']],
+                    severity='high', description="CSI driver error"),
+        ],
+        'journal_boot': [
+            LogRule('boot_hardware_error', [['failed to initialize', 'hardware error', 'device not found']],
+                    severity='critical', description="Boot-time hardware error"),
+            LogRule('boot_storage_detection', [['drive', 'controller', 'nvme', 'ssd'], ['not found', 'failed', 'error']],
+                    severity='high', description="Boot-time storage detection issue"),
+        ],
+        'disk_errors': [
+            LogRule('disk_error', [DISK_ERROR_KEYWORDS], severity='high', description="Disk error"),
+        ],
+        'storage': [
+            LogRule('storage', [STORAGE_KEYWORDS], severity='low', description="Storage event"),
+        ],
+        'dmesg_patterns': [
+            LogRule('_'.join(pattern), sequence=pattern, description="Kernel log pattern")
+            for pattern in DMESG_PATTERNS
+        ],
+    }
+
+
+_log_classifier = None
+_log_classifier_lock = threading.Lock()
+
+
+def get_log_classifier() -> LogClassifier:
+    """
+    Get the shared classifier compiled from the built-in rule sets
+
+    Returns:
+        LogClassifier: Process-wide classifier instance
+    """
+    global _log_classifier
+    if _log_classifier is None:
+        with _log_classifier_lock:
+            if _log_classifier is None:
+                _log_classifier = LogClassifier(_default_rule_sets())
+    return _log_classifier
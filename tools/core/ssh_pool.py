@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+Pooled SSH transport for the troubleshooting tools.
+
+This module keeps one long-lived paramiko connection per node and shares it
+across every diagnostic tool call. Connections are kept alive with SSH
+keepalives, health-checked before reuse, evicted after sitting idle, and the
+number of concurrent channels opened on a node is capped.
+"""
+
+import atexit
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from tools.core.deadline import ToolTimeout, in_deadline_scope, note_partial_output, remaining
+
+logger = logging.getLogger(__name__)
+
+# Global SSH connection pool instance
+_ssh_pool = None
+_ssh_pool_lock = threading.Lock()
+
+# Defaults used when config.yaml does not provide a value
+DEFAULT_SSH_USER = "root"
+DEFAULT_CONNECT_TIMEOUT = 30
+DEFAULT_COMMAND_TIMEOUT = 60
+DEFAULT_KEEPALIVE_SECONDS = 30
+DEFAULT_IDLE_TIMEOUT_SECONDS = 300
+DEFAULT_MAX_CHANNELS_PER_NODE = 4
+DEFAULT_HEALTH_CHECK_INTERVAL_SECONDS = 60
+
+# Bytes per channel read, and the longest a read blocks before stderr is drained
+_READ_CHUNK = 32768
+_READ_SLICE_SECONDS = 1.0
+
+
+class PooledSSHConnection:
+    """
+    A single pooled SSH connection to one node
+
+    Tracks usage timestamps and limits the number of channels that may be
+    open on the underlying transport at the same time.
+    """
+
+    def __init__(self, node_name: str, client: Any, max_channels: int):
+        """
+        Initialize a pooled connection
+
+        Args:
+            node_name: Node hostname or IP
+            client: Connected paramiko SSHClient
+            max_channels: Maximum number of concurrent channels on this connection
+        """
+        self.node_name = node_name
+        self.client = client
+        self.channels = threading.BoundedSemaphore(max_channels)
+        self.created_at = time.time()
+        self.last_used = self.created_at
+        self.last_health_check = self.created_at
+        self.active_channels = 0
+        self.commands_executed = 0
+
+    def is_active(self) -> bool:
+        """
+        Check whether the underlying transport is still usable
+
+        Returns:
+            bool: True if the transport is connected and authenticated
+        """
+        transport = self.client.get_transport() if self.client else None
+        return bool(transport and transport.is_active() and transport.is_authenticated())
+
+    def probe(self) -> bool:
+        """
+        Actively probe the connection by sending an SSH ignore message
+
+        Returns:
+            bool: True if the probe succeeded
+        """
+        try:
+            transport = self.client.get_transport()
+            if transport is None or not transport.is_active():
+                return False
+            transport.send_ignore()
+            self.last_health_check = time.time()
+            return True
+        except Exception as e:
+            logger.debug(f"SSH health probe failed for {self.node_name}: {e}")
+            return False
+
+    def close(self):
+        """Close the underlying SSH client"""
+        try:
+            self.client.close()
+        except Exception:
+            pass
+
+
+class SSHConnectionPool:
+    """
+    Process-wide SSH connection pool keyed by node
+
+    Handles connection setup, keepalives, health checks, idle eviction and
+    per-node channel limits for all tools that execute commands over SSH.
+    """
+
+    def __init__(self, config_data: Dict[str, Any] = None,
+                 client_factory: Optional[Callable[[], Any]] = None):
+        """
+        Initialize the SSH connection pool
+
+        Args:
+            config_data: Configuration data from config.yaml
+            client_factory: Optional factory returning a new SSH client (defaults to paramiko.SSHClient)
+        """
+        ssh_config = (config_data or {}).get('troubleshoot', {}).get('ssh', {}) or {}
+        pool_config = ssh_config.get('pool', {}) or {}
+
+        self.user = ssh_config.get('user', DEFAULT_SSH_USER)
+        # Key authentication unless config.yaml sets a password and no key
+        self.password = ssh_config.get('password')
+        key_path = ssh_config.get('key_path')
+        self.key_path = os.path.expanduser(key_path) if key_path else None
+        self.retries = max(1, int(ssh_config.get('retries', 1)))
+        self.retry_backoff_seconds = ssh_config.get('retry_backoff_seconds', 0)
+
+        self.connect_timeout = pool_config.get('connect_timeout_seconds', DEFAULT_CONNECT_TIMEOUT)
+        self.keepalive_seconds = pool_config.get('keepalive_seconds', DEFAULT_KEEPALIVE_SECONDS)
+        self.idle_timeout_seconds = pool_config.get('idle_timeout_seconds', DEFAULT_IDLE_TIMEOUT_SECONDS)
+        self.max_channels_per_node = max(1, int(pool_config.get('max_channels_per_node', DEFAULT_MAX_CHANNELS_PER_NODE)))
+        self.health_check_interval_seconds = pool_config.get(
+            'health_check_interval_seconds', DEFAULT_HEALTH_CHECK_INTERVAL_SECONDS
+        )
+
+        self._client_factory = client_factory
+        self._connections: Dict[str, PooledSSHConnection] = {}
+        self._node_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            'connections_created': 0,
+            'connections_reused': 0,
+            'connections_evicted': 0,
+            'health_check_failures': 0,
+            'commands_executed': 0
+        }
+
+    def _new_client(self) -> Any:
+        """Create a new, unconnected SSH client"""
+        if self._client_factory is not None:
+            return self._client_factory()
+
+        import paramiko
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        return client
+
+    def _connect(self, node_name: str) -> PooledSSHConnection:
+        """
+        Open a new SSH connection to a node, retrying on failure
+
+        Args:
+            node_name: Node hostname or IP
+
+        Returns:
+            PooledSSHConnection: Newly connected pooled connection
+        """
+        connect_kwargs = {
+            'hostname': node_name,
+            'username': self.user,
+            'timeout': self.connect_timeout
+        }
+        if self.key_path:
+            connect_kwargs['key_filename'] = self.key_path
+        elif self.password:
+            connect_kwargs['password'] = self.password
+
+        last_error = None
+        for attempt in range(self.retries):
+            client = self._new_client()
+            try:
+                client.connect(**connect_kwargs)
+                transport = client.get_transport()
+                if transport is not None and self.keepalive_seconds:
+                    transport.set_keepalive(self.keepalive_seconds)
+                self.stats['connections_created'] += 1
+                logger.info(f"Opened pooled SSH connection to {node_name}")
+                return PooledSSHConnection(node_name, client, self.max_channels_per_node)
+            except Exception as e:
+                last_error = e
+                try:
+                    client.close()
+                except Exception:
+                    pass
+                logger.warning(f"SSH connect to {node_name} failed (attempt {attempt + 1}/{self.retries}): {e}")
+                if attempt < self.retries - 1 and self.retry_backoff_seconds:
+                    time.sleep(self.retry_backoff_seconds)
+
+        raise last_error
+
+    def _node_lock(self, node_name: str) -> threading.Lock:
+        """Get the lock serializing connection setup for a node"""
+        with self._lock:
+            if node_name not in self._node_locks:
+                self._node_locks[node_name] = threading.Lock()
+            return self._node_locks[node_name]
+
+    def _is_healthy(self, connection: PooledSSHConnection) -> bool:
+        """
+        Check whether a pooled connection can be reused
+
+        Args:
+            connection: Pooled connection to check
+
+        Returns:
+            bool: True if the connection is healthy
+        """
+        if not connection.is_active():
+            return False
+        if time.time() - connection.last_health_check >= self.health_check_interval_seconds:
+            return connection.probe()
+        return True
+
+    def get_connection(self, node_name: str) -> PooledSSHConnection:
+        """
+        Get a healthy pooled connection for a node, connecting if needed
+
+        Args:
+            node_name: Node hostname or IP
+
+        Returns:
+            PooledSSHConnection: Pooled connection for the node
+        """
+        self.evict_idle()
+
+        with self._node_lock(node_name):
+            connection = self._connections.get(node_name)
+            if connection is not None:
+                if self._is_healthy(connection):
+                    self.stats['connections_reused'] += 1
+                    return connection
+
+                logger.info(f"Pooled SSH connection to {node_name} is unhealthy, reconnecting")
+                self.stats['health_check_failures'] += 1
+                self._discard(node_name, connection)
+
+            connection = self._connect(node_name)
+            with self._lock:
+                self._connections[node_name] = connection
+            return connection
+
+    def execute(self, node_name: str, command: str, timeout: Optional[float] = None,
+                idle_timeout: float = DEFAULT_COMMAND_TIMEOUT) -> Tuple[str, str]:
+        """
+        Execute a command on a node over a pooled connection
+
+        A command may run as long as it keeps producing output: idle_timeout
+        bounds the silence between reads, as paramiko's channel timeout did.
+        The whole command is bounded only by timeout, if given, and the current
+        tool deadline. When that passes the channel is closed, and inside a
+        deadline scope ToolTimeout carries the stdout read so far.
+
+        Args:
+            node_name: Node hostname or IP
+            command: Command to execute
+            timeout: Limit for the whole command in seconds; None leaves it to the tool deadline
+            idle_timeout: Seconds without any output before the command is given up
+
+        Returns:
+            Tuple[str, str]: (stdout, stderr)
+        """
+        timeout = remaining(timeout)
+        connection = self.get_connection(node_name)
+
+        with connection.channels:
+            with self._lock:
+                connection.active_channels += 1
+            try:
+                stdin, stdout, stderr = connection.client.exec_command(command, timeout=idle_timeout)
+                output, error = self._read_channel(stdout.channel, timeout, idle_timeout)
+            except Exception:
+                # A failed channel usually means a broken transport; drop it so the
+                # next call reconnects instead of reusing a dead connection
+                self._discard(node_name, connection)
+                raise
+            finally:
+                with self._lock:
+                    connection.active_channels -= 1
+                    connection.last_used = time.time()
+
+        connection.commands_executed += 1
+        self.stats['commands_executed'] += 1
+        return output, error
+
+    def _read_channel(self, channel: Any, timeout: Optional[float], idle_timeout: float) -> Tuple[str, str]:
+        """
+        Read stdout and stderr of a command until it finishes, falls silent or runs out of time
+
+        Args:
+            channel: paramiko Channel running the command
+            timeout: Seconds for the whole command; None for no limit
+            idle_timeout: Seconds without output on stdout or stderr
+
+        Returns:
+            Tuple[str, str]: (stdout, stderr)
+        """
+        now = time.monotonic()
+        deadline = None if timeout is None else now + timeout
+        idle_deadline = now + idle_timeout
+        output, error = bytearray(), bytearray()
+        # A caller that gives up on the tool reports what has arrived so far
+        note_partial_output(output)
+        stdout_open = True
+        while True:
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                # Closing the channel releases it on the transport; the connection stays pooled
+                channel.close()
+                partial = output.decode('utf-8', errors='replace')
+                if in_deadline_scope():
+                    raise ToolTimeout(timeout, partial)
+                raise socket.timeout(f"Command timed out after {timeout:.1f}s")
+            if now >= idle_deadline:
+                channel.close()
+                raise socket.timeout(f"No output from command for {idle_timeout:.1f}s")
+            wait = min(idle_deadline, deadline if deadline is not None else idle_deadline) - now
+            channel.settimeout(min(wait, _READ_SLICE_SECONDS))
+            try:
+                if stdout_open:
+                    chunk = channel.recv(_READ_CHUNK)
+                    stdout_open = bool(chunk)
+                    output += chunk
+                    received = bool(chunk)
+                    while channel.recv_stderr_ready():
+                        error += channel.recv_stderr(_READ_CHUNK)
+                        received = True
+                else:
+                    chunk = channel.recv_stderr(_READ_CHUNK)
+                    if not chunk:
+                        break
+                    error += chunk
+                    received = True
+            except socket.timeout:
+                continue
+            if received:
+                idle_deadline = time.monotonic() + idle_timeout
+        return output.decode('utf-8'), error.decode('utf-8')
+
+    def _discard(self, node_name: str, connection: PooledSSHConnection):
+        """Remove a connection from the pool and close it"""
+        with self._lock:
+            if self._connections.get(node_name) is connection:
+                del self._connections[node_name]
+        connection.close()
+
+    def evict_idle(self) -> int:
+        """
+        Close connections that have been idle longer than the idle timeout
+
+        Returns:
+            int: Number of evicted connections
+        """
+        now = time.time()
+        with self._lock:
+            idle = [
+                (node_name, connection) for node_name, connection in self._connections.items()
+                if connection.active_channels == 0 and now - connection.last_used > self.idle_timeout_seconds
+            ]
+            for node_name, _ in idle:
+                del self._connections[node_name]
+
+        for node_name, connection in idle:
+            logger.info(f"Evicting idle SSH connection to {node_name}")
+            connection.close()
+        self.stats['connections_evicted'] += len(idle)
+        return len(idle)
+
+    def close_all(self):
+        """Close every pooled connection"""
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+
+        for connection in connections:
+            connection.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics
+
+        Returns:
+            Dict[str, Any]: Counters and the set of currently pooled nodes
+        """
+        with self._lock:
+            nodes = sorted(self._connections.keys())
+        return {**self.stats, 'open_connections': len(nodes), 'nodes': nodes}
+
+
+def initialize_ssh_pool(config_data: Dict[str, Any] = None) -> SSHConnectionPool:
+    """
+    Initialize the global SSH connection pool
+
+    Args:
+        config_data: Configuration data from config.yaml
+
+    Returns:
+        SSHConnectionPool: Global SSH connection pool
+    """
+    global _ssh_pool
+
+    with _ssh_pool_lock:
+        if _ssh_pool is None:
+            _ssh_pool = SSHConnectionPool(config_data)
+            logger.info("SSH connection pool initialized")
+
+    return _ssh_pool
+
+
+def get_ssh_pool() -> SSHConnectionPool:
+    """
+    Get the global SSH connection pool, creating it with defaults if needed
+
+    Returns:
+        SSHConnectionPool: Global SSH connection pool
+    """
+    if _ssh_pool is None:
+        from tools.core.config import CONFIG_DATA
+        return initialize_ssh_pool(CONFIG_DATA)
+    return _ssh_pool
+
+
+def close_ssh_pool():
+    """Close all pooled SSH connections and reset the global pool"""
+    global _ssh_pool
+
+    with _ssh_pool_lock:
+        if _ssh_pool is not None:
+            _ssh_pool.close_all()
+            _ssh_pool = None
+
+
+atexit.register(close_ssh_pool)
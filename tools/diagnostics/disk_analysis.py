@@ -12,6 +12,7 @@ import subprocess
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from langchain_core.tools import tool
+from tools.core.log_classifier import DISK_ERROR_KEYWORDS, get_log_classifier
 from tools.diagnostics.system import journalctl_command, dmesg_command
 
 @tool
@@ -208,16 +209,9 @@ def scan_disk_error_logs(node_name: str, hours_back: int = 24,
                 "/var/log/messages"
             ]
         
-        # Keywords to search for
-        disk_error_keywords = [
-            "I/O error", "read error", "write error", "sector error",
-            "disk failure", "drive failure", "bad sector", "failed command",
-            "ata error", "scsi error", "medium error", "sense key",
-            "timeout", "reset", "offline", "uncorrectable", "ECC"
-        ]
-        
         # Build grep pattern
-        grep_pattern = "|".join(disk_error_keywords)
+        grep_pattern = "|".join(DISK_ERROR_KEYWORDS)
+        log_classifier = get_log_classifier()
         
         # Results storage
         results = []
@@ -262,10 +256,7 @@ def scan_disk_error_logs(node_name: str, hours_back: int = 24,
         journalctl_result = journalctl_command.invoke({'node_name': node_name, 'options': journalctl_options})
         
         # Filter journalctl output for disk errors
-        journalctl_errors = []
-        for line in journalctl_result.split('\n'):
-            if any(keyword.lower() in line.lower() for keyword in disk_error_keywords):
-                journalctl_errors.append(line)
+        journalctl_errors = log_classifier.matching_lines(journalctl_result, 'disk_errors')
         
         # Add journalctl results
         if journalctl_errors:
@@ -287,10 +278,7 @@ def scan_disk_error_logs(node_name: str, hours_back: int = 24,
         dmesg_result = dmesg_command.invoke({'node_name': node_name, 'options': dmesg_options})
         
         # Filter dmesg output for disk errors
-        dmesg_errors = []
-        for line in dmesg_result.split('\n'):
-            if any(keyword.lower() in line.lower() for keyword in disk_error_keywords):
-                dmesg_errors.append(line)
+        dmesg_errors = log_classifier.matching_lines(dmesg_result, 'disk_errors')
         
         # Add dmesg results
         if dmesg_errors:
@@ -93,43 +93,24 @@ def ssh_execute(node_name: str, command: str) -> str:
         str: Command output
     """
     try:
-        import paramiko
-        import os
+        from tools.core.ssh_pool import get_ssh_pool
         
-        # Get SSH configuration from global config (would be passed in real implementation)
-        ssh_user = "root"  # Default, should come from config
-        ssh_key_path = os.path.expanduser("~/.ssh/id_ed25519")  # Default, should come from config
-        
-        # Create SSH client
-        ssh_client = paramiko.SSHClient()
-        ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        # Reuse the pooled connection for this node instead of a new handshake per call
+        ssh_pool = get_ssh_pool()
         
         try:
-            # Connect using SSH key
-            ssh_client.connect(
-                hostname=node_name,
-                username=ssh_user,
-                password='abc123',
-                #key_filename=ssh_key_path,
-                timeout=30
-            )
-            
-            # Execute command
-            stdin, stdout, stderr = ssh_client.exec_command(command, timeout=60)
-            
-            # Get output
-            output = stdout.read().decode('utf-8')
-            error = stderr.read().decode('utf-8')
+            # No fixed limit on the whole command: the tool deadline governs, the pool gives up on silence
+            output, error = ssh_pool.execute(node_name, command)
             
             # Return combined output
             if error:
                 return f"Output:\n{output}\nError:\n{error}"
             return output
             
+        except ImportError:
+            raise
         except Exception as e:
             return f"SSH execution failed: {str(e)}"
-        finally:
-            ssh_client.close()
             
     except ImportError:
         return f"Error: paramiko not available. Install with: pip install paramiko"
@@ -5,8 +5,24 @@ Kubernetes tools for volume troubleshooting.
 This module contains:
 - core: Basic kubectl operations and general Kubernetes resource management
 - csi_baremetal: CSI Baremetal specific tools for custom resources
+- backend: Kubernetes API / kubectl subprocess backends for the read-only tools
+- result_cache: TTL/LRU cache for read-only tool results shared across phases
 """
 
+from tools.kubernetes.backend import (
+    KubernetesAPIBackend,
+    KubectlSubprocessBackend,
+    initialize_kubernetes_backend,
+    get_kubernetes_backend
+)
+
+from tools.kubernetes.result_cache import (
+    KubectlResultCache,
+    initialize_result_cache,
+    get_result_cache,
+    invalidate_after_tool
+)
+
 from tools.kubernetes.core import (
     kubectl_get,
     kubectl_describe,
@@ -27,6 +43,18 @@ from tools.kubernetes.csi_baremetal import (
 )
 
 __all__ = [
+    # Tool backends
+    'KubernetesAPIBackend',
+    'KubectlSubprocessBackend',
+    'initialize_kubernetes_backend',
+    'get_kubernetes_backend',
+    
+    # Result cache
+    'KubectlResultCache',
+    'initialize_result_cache',
+    'get_result_cache',
+    'invalidate_after_tool',
+    
     # Core Kubernetes tools
     'kubectl_get',
     'kubectl_describe',
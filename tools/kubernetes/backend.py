@@ -0,0 +1,608 @@
+#!/usr/bin/env python3
+"""
+Pluggable backends for the read-only kubectl tools.
+
+This module serves `kubectl get` and `kubectl describe` either from a shared,
+connection-pooled Kubernetes API client (including CustomObjectsApi for the
+CSI Baremetal CRDs) or by forking a kubectl process. The API backend falls
+back to kubectl for anything it cannot serve, such as table output formats.
+"""
+
+import json
+import logging
+import os
+import subprocess
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import yaml
+
+from tools.core.deadline import remaining, run_subprocess
+
+logger = logging.getLogger(__name__)
+
+# Global Kubernetes backend instance
+_kubernetes_backend = None
+_kubernetes_backend_lock = threading.Lock()
+
+CSI_BAREMETAL_GROUP = "csi-baremetal.dell.com"
+CSI_BAREMETAL_VERSION = "v1"
+
+
+class ResourceSpec(NamedTuple):
+    """How to reach one resource type through the Kubernetes API"""
+    kind: str
+    api_version: str
+    plural: str
+    namespaced: bool
+    api: str  # 'core', 'storage' or 'custom'
+    method: Optional[str] = None  # Typed API method suffix, e.g. 'namespaced_pod'
+
+
+_CORE_RESOURCES = {
+    'pod': ResourceSpec('Pod', 'v1', 'pods', True, 'core', 'namespaced_pod'),
+    'pvc': ResourceSpec('PersistentVolumeClaim', 'v1', 'persistentvolumeclaims', True, 'core',
+                        'namespaced_persistent_volume_claim'),
+    'pv': ResourceSpec('PersistentVolume', 'v1', 'persistentvolumes', False, 'core', 'persistent_volume'),
+    'node': ResourceSpec('Node', 'v1', 'nodes', False, 'core', 'node'),
+    'namespace': ResourceSpec('Namespace', 'v1', 'namespaces', False, 'core', 'namespace'),
+    'event': ResourceSpec('Event', 'v1', 'events', True, 'core', 'namespaced_event'),
+    'storageclass': ResourceSpec('StorageClass', 'storage.k8s.io/v1', 'storageclasses', False, 'storage',
+                                 'storage_class'),
+    'csidriver': ResourceSpec('CSIDriver', 'storage.k8s.io/v1', 'csidrivers', False, 'storage', 'csi_driver'),
+}
+
+_CSI_API_VERSION = f"{CSI_BAREMETAL_GROUP}/{CSI_BAREMETAL_VERSION}"
+_CSI_RESOURCES = {
+    'drive': ResourceSpec('Drive', _CSI_API_VERSION, 'drives', False, 'custom'),
+    'volume': ResourceSpec('Volume', _CSI_API_VERSION, 'volumes', True, 'custom'),
+    'lvg': ResourceSpec('LogicalVolumeGroup', _CSI_API_VERSION, 'logicalvolumegroups', False, 'custom'),
+    'ac': ResourceSpec('AvailableCapacity', _CSI_API_VERSION, 'availablecapacities', False, 'custom'),
+    'acr': ResourceSpec('AvailableCapacityReservation', _CSI_API_VERSION, 'availablecapacityreservations',
+                        False, 'custom'),
+    'csibmnode': ResourceSpec('Node', _CSI_API_VERSION, 'nodes', False, 'custom'),
+}
+
+# kubectl resource names, plurals and short names mapped to a canonical type
+_RESOURCE_ALIASES = {
+    'pod': 'pod', 'pods': 'pod', 'po': 'pod',
+    'pvc': 'pvc', 'pvcs': 'pvc', 'persistentvolumeclaim': 'pvc', 'persistentvolumeclaims': 'pvc',
+    'pv': 'pv', 'pvs': 'pv', 'persistentvolume': 'pv', 'persistentvolumes': 'pv',
+    'node': 'node', 'nodes': 'node', 'no': 'node',
+    'namespace': 'namespace', 'namespaces': 'namespace', 'ns': 'namespace',
+    'event': 'event', 'events': 'event', 'ev': 'event',
+    'storageclass': 'storageclass', 'storageclasses': 'storageclass', 'sc': 'storageclass',
+    'csidriver': 'csidriver', 'csidrivers': 'csidriver',
+    'drive': 'drive', 'drives': 'drive',
+    'volume': 'volume', 'volumes': 'volume',
+    'lvg': 'lvg', 'lvgs': 'lvg', 'logicalvolumegroup': 'lvg', 'logicalvolumegroups': 'lvg',
+    'ac': 'ac', 'acs': 'ac', 'availablecapacity': 'ac', 'availablecapacities': 'ac',
+    'acr': 'acr', 'acrs': 'acr', 'availablecapacityreservation': 'acr', 'availablecapacityreservations': 'acr',
+    'csibmnode': 'csibmnode', 'csibmnodes': 'csibmnode',
+}
+
+# Output formats the API backend can render without kubectl's table printers
+API_OUTPUT_FORMATS = ('yaml', 'json', 'wide')
+
+# Accept header asking the API server to render a list as a Table: the columns of
+# `kubectl get -o wide`, including a CRD's additionalPrinterColumns
+TABLE_ACCEPT = "application/json;as=Table;v=v1;g=meta.k8s.io"
+
+
+def resolve_resource(resource_type: str) -> Optional[ResourceSpec]:
+    """
+    Resolve a kubectl resource type to its API description
+
+    Args:
+        resource_type: Resource type as passed to kubectl (e.g. pod, pvc, lvg, StorageClass)
+
+    Returns:
+        Optional[ResourceSpec]: Resource description, or None if unknown to the API backend
+    """
+    if not resource_type:
+        return None
+
+    name = resource_type.lower()
+    if name.endswith(f".{CSI_BAREMETAL_GROUP}"):
+        name = name[:-len(CSI_BAREMETAL_GROUP) - 1]
+        canonical = _RESOURCE_ALIASES.get(name)
+        if canonical == 'node':
+            canonical = 'csibmnode'
+        return _CSI_RESOURCES.get(canonical)
+
+    canonical = _RESOURCE_ALIASES.get(name)
+    if canonical is None:
+        return None
+    return _CORE_RESOURCES.get(canonical) or _CSI_RESOURCES.get(canonical)
+
+
+class KubectlSubprocessBackend:
+    """
+    Backend that forks a kubectl process for every call
+    """
+
+    name = "subprocess"
+
+    def get(self, resource_type: str, resource_name: str = None, namespace: str = None,
+            output_format: str = "yaml") -> str:
+        """
+        Execute kubectl get
+
+        Args:
+            resource_type: Type of resource (pod, pvc, pv, node, drive, etc.)
+            resource_name: Name of resource (optional)
+            namespace: Namespace (optional)
+            output_format: Output format (yaml, json, wide, etc.)
+
+        Returns:
+            str: Command output
+        """
+        cmd = ["kubectl", "get", resource_type]
+
+        if resource_name:
+            cmd.append(resource_name)
+
+        if namespace:
+            cmd.extend(["-n", namespace])
+
+        if output_format:
+            cmd.extend(["-o", output_format])
+        else:
+            cmd.append("-o=wide")
+
+        try:
+            result = run_subprocess(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            return result.stdout
+        except subprocess.CalledProcessError as e:
+            return f"Error: {e.stderr}"
+        except Exception as e:
+            return f"Error executing kubectl get {resource_type}: {str(e)}"
+
+    def describe(self, resource_type: str, resource_name: str, namespace: str = None) -> str:
+        """
+        Execute kubectl describe
+
+        Args:
+            resource_type: Type of resource (pod, pvc, pv, node, drive, etc.)
+            resource_name: Name of resource
+            namespace: Namespace (optional)
+
+        Returns:
+            str: Command output
+        """
+        cmd = ["kubectl", "describe", resource_type, resource_name]
+
+        if namespace:
+            cmd.extend(["-n", namespace])
+
+        try:
+            result = run_subprocess(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            return result.stdout
+        except subprocess.CalledProcessError as e:
+            return f"Error: {e.stderr}"
+        except Exception as e:
+            return f"Error executing kubectl describe: {str(e)}"
+
+
+class KubernetesAPIBackend:
+    """
+    Backend that serves kubectl get/describe from a shared Kubernetes API client
+
+    A single ApiClient (and therefore a single urllib3 connection pool) is shared
+    by CoreV1Api, StorageV1Api and CustomObjectsApi for the whole process.
+    Requests it cannot serve are delegated to the kubectl subprocess backend.
+    """
+
+    name = "api"
+
+    def __init__(self, config_data: Dict[str, Any] = None, fallback: KubectlSubprocessBackend = None):
+        """
+        Initialize the API backend and load the cluster configuration
+
+        Args:
+            config_data: Configuration data from config.yaml
+            fallback: Backend used for requests the API backend cannot serve
+        """
+        from kubernetes import client, config
+        from kubernetes.client.rest import ApiException
+
+        k8s_config = (config_data or {}).get('kubernetes', {}) or {}
+        self.fallback = fallback or KubectlSubprocessBackend()
+        self.stats = {'api_calls': 0, 'fallback_calls': 0, 'api_errors': 0}
+
+        configuration = client.Configuration()
+        if 'KUBERNETES_SERVICE_HOST' in os.environ:
+            config.load_incluster_config(client_configuration=configuration)
+            logger.info("Kubernetes API backend using in-cluster configuration")
+        else:
+            config.load_kube_config(client_configuration=configuration)
+            logger.info("Kubernetes API backend using kubeconfig file")
+
+        configuration.connection_pool_maxsize = k8s_config.get('connection_pool_maxsize', 16)
+        self.request_timeout = k8s_config.get('request_timeout_seconds', 60)
+
+        self.api_client = client.ApiClient(configuration)
+        self.core_v1 = client.CoreV1Api(self.api_client)
+        self.storage_v1 = client.StorageV1Api(self.api_client)
+        self.custom_objects = client.CustomObjectsApi(self.api_client)
+        self._api_exception = ApiException
+
+    def _fetch(self, spec: ResourceSpec, resource_name: str = None, namespace: str = None,
+               as_table: bool = False) -> Dict[str, Any]:
+        """
+        Fetch one object or a list of objects as a plain dict
+
+        Args:
+            spec: Resource description
+            resource_name: Name of the object (lists all objects if None)
+            namespace: Namespace for namespaced resources
+            as_table: Ask the API server for a meta.k8s.io Table instead of the objects
+
+        Returns:
+            Dict[str, Any]: Object, list object with populated item kinds, or Table
+        """
+        self.stats['api_calls'] += 1
+        kwargs = {'_request_timeout': remaining(self.request_timeout)}
+        if as_table:
+            kwargs.update(_headers={'Accept': TABLE_ACCEPT}, _preload_content=False)
+
+        if spec.api == 'custom':
+            group, version = spec.api_version.split('/', 1)
+            if spec.namespaced:
+                if resource_name:
+                    data = self.custom_objects.get_namespaced_custom_object(
+                        group, version, namespace, spec.plural, resource_name, **kwargs)
+                else:
+                    data = self.custom_objects.list_namespaced_custom_object(
+                        group, version, namespace, spec.plural, **kwargs)
+            elif resource_name:
+                data = self.custom_objects.get_cluster_custom_object(
+                    group, version, spec.plural, resource_name, **kwargs)
+            else:
+                data = self.custom_objects.list_cluster_custom_object(group, version, spec.plural, **kwargs)
+            return json.loads(data.data) if as_table else data
+
+        # Typed APIs: ask for the raw JSON to skip model deserialization
+        kwargs['_preload_content'] = False
+        api = self.core_v1 if spec.api == 'core' else self.storage_v1
+        verb = 'read' if resource_name else 'list'
+        method = getattr(api, f"{verb}_{spec.method}")
+        args = []
+        if resource_name:
+            args.append(resource_name)
+        if spec.namespaced:
+            args.append(namespace)
+        response = method(*args, **kwargs)
+        return json.loads(response.data)
+
+    def _as_kubectl_object(self, spec: ResourceSpec, data: Dict[str, Any], is_list: bool) -> Dict[str, Any]:
+        """Shape an API response the way kubectl prints it"""
+        if not is_list:
+            data.setdefault('apiVersion', spec.api_version)
+            data.setdefault('kind', spec.kind)
+            return data
+
+        items = data.get('items') or []
+        for item in items:
+            item.setdefault('apiVersion', spec.api_version)
+            item.setdefault('kind', spec.kind)
+        return {
+            'apiVersion': 'v1',
+            'items': items,
+            'kind': 'List',
+            'metadata': {'resourceVersion': ''}
+        }
+
+    def _format_api_error(self, spec: ResourceSpec, resource_name: str, error: Exception) -> str:
+        """Format an ApiException like kubectl's server error output"""
+        status = getattr(error, 'status', None)
+        reason = getattr(error, 'reason', '') or ''
+        message = str(error)
+        try:
+            body = json.loads(getattr(error, 'body', None) or '{}')
+            reason = body.get('reason') or reason
+            message = body.get('message') or message
+        except (TypeError, ValueError):
+            pass
+
+        if status == 404 and resource_name:
+            message = f'{spec.plural} "{resource_name}" not found'
+        return f"Error: Error from server ({reason}): {message}\n"
+
+    def get(self, resource_type: str, resource_name: str = None, namespace: str = None,
+            output_format: str = "yaml") -> str:
+        """
+        Serve kubectl get from the Kubernetes API
+
+        Args:
+            resource_type: Type of resource (pod, pvc, pv, node, drive, etc.)
+            resource_name: Name of resource (optional)
+            namespace: Namespace (optional)
+            output_format: Output format (yaml, json, wide, etc.)
+
+        Returns:
+            str: Output formatted like kubectl
+        """
+        spec = resolve_resource(resource_type)
+        if spec is None or output_format not in API_OUTPUT_FORMATS:
+            self.stats['fallback_calls'] += 1
+            return self.fallback.get(resource_type, resource_name, namespace, output_format)
+
+        namespace = (namespace or 'default') if spec.namespaced else None
+
+        try:
+            data = self._fetch(spec, resource_name, namespace, as_table=output_format == 'wide')
+        except self._api_exception as e:
+            self.stats['api_errors'] += 1
+            if e.status in (401, 403, 404, 422):
+                return self._format_api_error(spec, resource_name, e)
+            logger.warning(f"Kubernetes API get {resource_type} failed, falling back to kubectl: {e}")
+            self.stats['fallback_calls'] += 1
+            return self.fallback.get(resource_type, resource_name, namespace, output_format)
+        except Exception as e:
+            self.stats['api_errors'] += 1
+            logger.warning(f"Kubernetes API get {resource_type} failed, falling back to kubectl: {e}")
+            self.stats['fallback_calls'] += 1
+            return self.fallback.get(resource_type, resource_name, namespace, output_format)
+
+        if output_format == 'wide':
+            return format_table(data)
+        obj = self._as_kubectl_object(spec, data, is_list=not resource_name)
+        if output_format == 'json':
+            return json.dumps(obj, indent=4) + "\n"
+        return yaml.safe_dump(obj, default_flow_style=False, sort_keys=True)
+
+    def _list_events(self, spec: ResourceSpec, obj: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """List events whose involved object is the given object"""
+        metadata = obj.get('metadata', {})
+        selector = f"involvedObject.name={metadata.get('name')}"
+        if metadata.get('uid'):
+            selector += f",involvedObject.uid={metadata['uid']}"
+
+        if spec.namespaced and metadata.get('namespace'):
+            response = self.core_v1.list_namespaced_event(
+                metadata['namespace'], field_selector=selector,
+                _preload_content=False, _request_timeout=remaining(self.request_timeout))
+        else:
+            response = self.core_v1.list_event_for_all_namespaces(
+                field_selector=selector, _preload_content=False, _request_timeout=remaining(self.request_timeout))
+        return json.loads(response.data).get('items', [])
+
+    def describe(self, resource_type: str, resource_name: str, namespace: str = None) -> str:
+        """
+        Serve kubectl describe of CSI Baremetal objects from the Kubernetes API
+
+        kubectl describes custom resources with its generic describer, which this
+        layout reproduces, followed by the object's events. Built-in kinds (pod,
+        pvc, pv, node, ...) have typed describers with sections such as
+        Conditions, Mounts and Allocated resources, so they are served by kubectl.
+
+        Args:
+            resource_type: Type of resource (pod, pvc, pv, node, drive, etc.)
+            resource_name: Name of resource
+            namespace: Namespace (optional)
+
+        Returns:
+            str: Describe-style output
+        """
+        spec = resolve_resource(resource_type)
+        if spec is None or spec.api != 'custom' or not resource_name:
+            self.stats['fallback_calls'] += 1
+            return self.fallback.describe(resource_type, resource_name, namespace)
+
+        namespace = (namespace or 'default') if spec.namespaced else None
+
+        try:
+            obj = self._as_kubectl_object(spec, self._fetch(spec, resource_name, namespace), is_list=False)
+            events = self._list_events(spec, obj)
+        except self._api_exception as e:
+            self.stats['api_errors'] += 1
+            if e.status in (401, 403, 404, 422):
+                return self._format_api_error(spec, resource_name, e)
+            logger.warning(f"Kubernetes API describe {resource_type} failed, falling back to kubectl: {e}")
+            self.stats['fallback_calls'] += 1
+            return self.fallback.describe(resource_type, resource_name, namespace)
+        except Exception as e:
+            self.stats['api_errors'] += 1
+            logger.warning(f"Kubernetes API describe {resource_type} failed, falling back to kubectl: {e}")
+            self.stats['fallback_calls'] += 1
+            return self.fallback.describe(resource_type, resource_name, namespace)
+
+        return format_describe(obj, events)
+
+
+def _title(key: str) -> str:
+    """Convert a camelCase field name to kubectl describe's 'Title Case'"""
+    words = []
+    current = ''
+    for char in key:
+        if char.isupper() and current and not current[-1].isupper():
+            words.append(current)
+            current = char
+        else:
+            current += char
+    if current:
+        words.append(current)
+    return ' '.join(word[:1].upper() + word[1:] for word in words)
+
+
+def _describe_value(lines: List[str], key: str, value: Any, indent: int):
+    """Append a field to describe output, recursing into nested structures"""
+    pad = '  ' * indent
+    if isinstance(value, dict):
+        if not value:
+            return
+        lines.append(f"{pad}{_title(key)}:")
+        for child_key in sorted(value):
+            _describe_value(lines, child_key, value[child_key], indent + 1)
+    elif isinstance(value, list):
+        if not value:
+            return
+        lines.append(f"{pad}{_title(key)}:")
+        for item in value:
+            if isinstance(item, dict):
+                for i, child_key in enumerate(sorted(item)):
+                    child_lines: List[str] = []
+                    _describe_value(child_lines, child_key, item[child_key], indent + 1)
+                    if i == 0 and child_lines:
+                        child_lines[0] = f"{pad}  {child_lines[0].lstrip()}"
+                    lines.extend(child_lines)
+            else:
+                lines.append(f"{pad}  {item}")
+    else:
+        lines.append(f"{pad}{_title(key)}:  {value}")
+
+
+def _format_map(label: str, values: Dict[str, str]) -> List[str]:
+    """Format labels or annotations like kubectl describe"""
+    if not values:
+        return [f"{label:<14}<none>"]
+    lines = []
+    for i, key in enumerate(sorted(values)):
+        prefix = f"{label:<14}" if i == 0 else ' ' * 14
+        separator = '=' if label == 'Labels:' else ': '
+        lines.append(f"{prefix}{key}{separator}{values[key]}")
+    return lines
+
+
+def _event_age(event: Dict[str, Any]) -> str:
+    """Render the age of an event's last occurrence"""
+    timestamp = event.get('lastTimestamp') or event.get('eventTime') or event.get('metadata', {}).get('creationTimestamp')
+    if not timestamp:
+        return '<unknown>'
+    try:
+        seen = datetime.fromisoformat(str(timestamp).replace('Z', '+00:00'))
+        seconds = int((datetime.now(timezone.utc) - seen).total_seconds())
+    except ValueError:
+        return '<unknown>'
+    if seconds < 120:
+        return f"{seconds}s"
+    if seconds < 7200:
+        return f"{seconds // 60}m"
+    if seconds < 172800:
+        return f"{seconds // 3600}h"
+    return f"{seconds // 86400}d"
+
+
+def _table_cell(value: Any) -> str:
+    """Render a Table cell the way kubectl's table printer does"""
+    if value is None:
+        return '<none>'
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(',', ':'))
+    return str(value)
+
+
+def format_table(table: Dict[str, Any]) -> str:
+    """
+    Render a server-side meta.k8s.io Table like `kubectl get -o wide`
+
+    Every column is printed, including the priority ones kubectl only shows in
+    wide output, padded like kubectl's tabwriter.
+
+    Args:
+        table: Table returned for the TABLE_ACCEPT header
+
+    Returns:
+        str: Table text; empty if there are no rows, as kubectl prints nothing on stdout
+    """
+    rows = table.get('rows') or []
+    if not rows:
+        return ""
+
+    lines = [[column.get('name', '').upper() for column in table.get('columnDefinitions') or []]]
+    lines.extend([_table_cell(cell) for cell in row.get('cells') or []] for row in rows)
+    widths = [max(len(line[i]) for line in lines if i < len(line)) for i in range(max(map(len, lines)))]
+    return "".join(
+        "   ".join(cell.ljust(widths[i]) for i, cell in enumerate(line)).rstrip() + "\n" for line in lines)
+
+
+def format_describe(obj: Dict[str, Any], events: List[Dict[str, Any]]) -> str:
+    """
+    Render an object and its events in kubectl's generic describe layout
+
+    Args:
+        obj: Kubernetes object as a dict
+        events: Events involving the object
+
+    Returns:
+        str: Describe-style text
+    """
+    metadata = obj.get('metadata', {})
+    lines = [f"{'Name:':<14}{metadata.get('name', '')}"]
+    if metadata.get('namespace'):
+        lines.append(f"{'Namespace:':<14}{metadata['namespace']}")
+    lines.extend(_format_map('Labels:', metadata.get('labels') or {}))
+    lines.extend(_format_map('Annotations:', metadata.get('annotations') or {}))
+    lines.append(f"{'API Version:':<14}{obj.get('apiVersion', '')}")
+    lines.append(f"{'Kind:':<14}{obj.get('kind', '')}")
+
+    remaining_metadata = {k: v for k, v in metadata.items()
+                          if k not in ('name', 'namespace', 'labels', 'annotations', 'managedFields')}
+    _describe_value(lines, 'metadata', remaining_metadata, 0)
+    for key in sorted(obj):
+        if key not in ('apiVersion', 'kind', 'metadata'):
+            _describe_value(lines, key, obj[key], 0)
+
+    if not events:
+        lines.append("Events:       <none>")
+    else:
+        lines.append("Events:")
+        lines.append("  Type    Reason    Age    From    Message")
+        lines.append("  ----    ------    ----   ----    -------")
+        for event in events:
+            source = event.get('source', {}).get('component') or event.get('reportingComponent', '')
+            lines.append(f"  {event.get('type', '')}  {event.get('reason', '')}  {_event_age(event)}  "
+                         f"{source}  {event.get('message', '')}")
+
+    return "\n".join(lines) + "\n"
+
+
+def initialize_kubernetes_backend(config_data: Dict[str, Any] = None):
+    """
+    Initialize the global backend used by the kubectl tools
+
+    The `kubernetes.backend` setting selects "api" (shared API client, default)
+    or "subprocess" (fork kubectl per call). If the API client cannot be set up,
+    the subprocess backend is used instead.
+
+    Args:
+        config_data: Configuration data from config.yaml
+
+    Returns:
+        The initialized backend
+    """
+    global _kubernetes_backend
+
+    with _kubernetes_backend_lock:
+        if _kubernetes_backend is not None:
+            return _kubernetes_backend
+
+        backend_name = ((config_data or {}).get('kubernetes', {}) or {}).get('backend', 'api')
+        if backend_name == 'api':
+            try:
+                _kubernetes_backend = KubernetesAPIBackend(config_data)
+            except Exception as e:
+                logger.warning(f"Kubernetes API backend unavailable, using kubectl subprocess backend: {e}")
+                _kubernetes_backend = KubectlSubprocessBackend()
+        else:
+            _kubernetes_backend = KubectlSubprocessBackend()
+
+        logger.info(f"Kubernetes tool backend initialized: {_kubernetes_backend.name}")
+        return _kubernetes_backend
+
+
+def get_kubernetes_backend():
+    """
+    Get the global kubectl tool backend, creating it if needed
+
+    Returns:
+        The global backend
+    """
+    if _kubernetes_backend is None:
+        from tools.core.config import CONFIG_DATA
+        return initialize_kubernetes_backend(CONFIG_DATA)
+    return _kubernetes_backend
@@ -9,6 +9,9 @@ resource management tools.
 import subprocess
 import shlex
 from langchain_core.tools import tool
+from tools.core.deadline import run_subprocess
+from tools.kubernetes.backend import get_kubernetes_backend
+from tools.kubernetes.result_cache import get_result_cache
 
 @tool
 def kubectl_get(resource_type: str, resource_name: str = None, namespace: str = None, output_format: str = "yaml") -> str:
@@ -24,27 +27,10 @@ def kubectl_get(resource_type: str, resource_name: str = None, namespace: str =
     Returns:
         str: Command output
     """
-    cmd = ["kubectl", "get", resource_type]
-    
-    if resource_name:
-        cmd.append(resource_name)
-    
-    if namespace:
-        cmd.extend(["-n", namespace])
-        
-    if output_format:
-        cmd.extend(["-o", output_format])
-    else:
-        cmd.append("-o=wide")
-
-    # Execute command
-    try:
-        result = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        return f"Error: {e.stderr}"
-    except Exception as e:
-        return f"Error executing kubectl get: {str(e)}"
+    return get_result_cache().get_or_load(
+        'get', resource_type, resource_name, namespace, output_format,
+        lambda: get_kubernetes_backend().get(resource_type, resource_name, namespace, output_format)
+    )
 
 @tool
 def kubectl_describe(resource_type: str, resource_name: str, namespace: str = None) -> str:
@@ -59,19 +45,10 @@ def kubectl_describe(resource_type: str, resource_name: str, namespace: str = No
     Returns:
         str: Command output
     """
-    cmd = ["kubectl", "describe", resource_type, resource_name]
-    
-    if namespace:
-        cmd.extend(["-n", namespace])
-    
-    # Execute command
-    try:
-        result = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        return f"Error: {e.stderr}"
-    except Exception as e:
-        return f"Error executing kubectl describe: {str(e)}"
+    return get_result_cache().get_or_load(
+        'describe', resource_type, resource_name, namespace, None,
+        lambda: get_kubernetes_backend().describe(resource_type, resource_name, namespace)
+    )
 
 @tool
 def kubectl_apply(yaml_content: str, namespace: str = None) -> str:
@@ -92,13 +69,16 @@ def kubectl_apply(yaml_content: str, namespace: str = None) -> str:
     
     # Execute command
     try:
-        result = subprocess.run(cmd, input=yaml_content, check=True, 
+        result = run_subprocess(cmd, input=yaml_content, check=True, 
                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
         return result.stdout
     except subprocess.CalledProcessError as e:
         return f"Error: {e.stderr}"
     except Exception as e:
         return f"Error executing kubectl apply: {str(e)}"
+    finally:
+        # Cluster state may have changed; drop cached read-only results
+        get_result_cache().invalidate(reason="kubectl_apply")
 
 @tool
 def kubectl_delete(resource_type: str, resource_name: str, namespace: str = None) -> str:
@@ -120,12 +100,15 @@ def kubectl_delete(resource_type: str, resource_name: str, namespace: str = None
     
     # Execute command
     try:
-        result = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        result = run_subprocess(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
         return result.stdout
     except subprocess.CalledProcessError as e:
         return f"Error: {e.stderr}"
     except Exception as e:
         return f"Error executing kubectl delete: {str(e)}"
+    finally:
+        # Cluster state may have changed; drop cached read-only results
+        get_result_cache().invalidate(reason="kubectl_delete")
 
 @tool
 def kubectl_exec(pod_name: str, command: str, namespace: str = None) -> str:
@@ -149,7 +132,7 @@ def kubectl_exec(pod_name: str, command: str, namespace: str = None) -> str:
     
     # Execute command
     try:
-        result = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        result = run_subprocess(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
         return result.stdout
     except subprocess.CalledProcessError as e:
         return f"Error: {e.stderr}"
@@ -183,7 +166,7 @@ def kubectl_logs(pod_name: str, namespace: str = None, container: str = None, ta
     
     # Execute command
     try:
-        result = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        result = run_subprocess(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
         return result.stdout
     except subprocess.CalledProcessError as e:
         return f"Error: {e.stderr}"
@@ -6,8 +6,9 @@ This module contains tools for interacting with CSI Baremetal custom resources
 and storage-specific operations.
 """
 
-import subprocess
 from langchain_core.tools import tool
+from tools.kubernetes.backend import get_kubernetes_backend
+from tools.kubernetes.result_cache import get_result_cache
 
 @tool
 def kubectl_get_drive(drive_uuid: str = None, output_format: str = "wide") -> str:
@@ -21,20 +22,10 @@ def kubectl_get_drive(drive_uuid: str = None, output_format: str = "wide") -> st
     Returns:
         str: Command output showing drive status, health, path, etc.
     """
-    cmd = ["kubectl", "get", "drive"]
-    
-    if drive_uuid:
-        cmd.append(drive_uuid)
-    
-    cmd.extend(["-o", output_format])
-    
-    try:
-        result = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        return f"Error: {e.stderr}"
-    except Exception as e:
-        return f"Error executing kubectl get drive: {str(e)}"
+    return get_result_cache().get_or_load(
+        'get', "drive", drive_uuid, None, output_format,
+        lambda: get_kubernetes_backend().get("drive", drive_uuid, None, output_format)
+    )
 
 @tool
 def kubectl_get_csibmnode(node_name: str = None, output_format: str = "wide") -> str:
@@ -48,20 +39,10 @@ def kubectl_get_csibmnode(node_name: str = None, output_format: str = "wide") ->
     Returns:
         str: Command output showing node mapping and drive associations
     """
-    cmd = ["kubectl", "get", "csibmnode"]
-    
-    if node_name:
-        cmd.append(node_name)
-    
-    cmd.extend(["-o", output_format])
-    
-    try:
-        result = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        return f"Error: {e.stderr}"
-    except Exception as e:
-        return f"Error executing kubectl get csibmnode: {str(e)}"
+    return get_result_cache().get_or_load(
+        'get', "csibmnode", node_name, None, output_format,
+        lambda: get_kubernetes_backend().get("csibmnode", node_name, None, output_format)
+    )
 
 @tool
 def kubectl_get_availablecapacity(ac_name: str = None, output_format: str = "wide") -> str:
@@ -75,20 +56,10 @@ def kubectl_get_availablecapacity(ac_name: str = None, output_format: str = "wid
     Returns:
         str: Command output showing available capacity and storage class mapping
     """
-    cmd = ["kubectl", "get", "ac"]
-    
-    if ac_name:
-        cmd.append(ac_name)
-    
-    cmd.extend(["-o", output_format])
-    
-    try:
-        result = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        return f"Error: {e.stderr}"
-    except Exception as e:
-        return f"Error executing kubectl get ac: {str(e)}"
+    return get_result_cache().get_or_load(
+        'get', "ac", ac_name, None, output_format,
+        lambda: get_kubernetes_backend().get("ac", ac_name, None, output_format)
+    )
 
 @tool
 def kubectl_get_logicalvolumegroup(lvg_name: str = None, output_format: str = "wide") -> str:
@@ -102,20 +73,10 @@ def kubectl_get_logicalvolumegroup(lvg_name: str = None, output_format: str = "w
     Returns:
         str: Command output showing LVG health and associated drives
     """
-    cmd = ["kubectl", "get", "lvg"]
-    
-    if lvg_name:
-        cmd.append(lvg_name)
-    
-    cmd.extend(["-o", output_format])
-    
-    try:
-        result = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        return f"Error: {e.stderr}"
-    except Exception as e:
-        return f"Error executing kubectl get lvg: {str(e)}"
+    return get_result_cache().get_or_load(
+        'get', "lvg", lvg_name, None, output_format,
+        lambda: get_kubernetes_backend().get("lvg", lvg_name, None, output_format)
+    )
 
 @tool
 def kubectl_get_storageclass(sc_name: str = None, output_format: str = "yaml") -> str:
@@ -129,20 +90,10 @@ def kubectl_get_storageclass(sc_name: str = None, output_format: str = "yaml") -
     Returns:
         str: Command output showing storage class configuration
     """
-    cmd = ["kubectl", "get", "storageclass"]
-    
-    if sc_name:
-        cmd.append(sc_name)
-    
-    cmd.extend(["-o", output_format])
-    
-    try:
-        result = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        return f"Error: {e.stderr}"
-    except Exception as e:
-        return f"Error executing kubectl get storageclass: {str(e)}"
+    return get_result_cache().get_or_load(
+        'get', "storageclass", sc_name, None, output_format,
+        lambda: get_kubernetes_backend().get("storageclass", sc_name, None, output_format)
+    )
 
 @tool
 def kubectl_get_csidrivers(output_format: str = "wide") -> str:
@@ -155,12 +106,7 @@ def kubectl_get_csidrivers(output_format: str = "wide") -> str:
     Returns:
         str: Command output showing registered CSI drivers
     """
-    cmd = ["kubectl", "get", "csidrivers", "-o", output_format]
-    
-    try:
-        result = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        return f"Error: {e.stderr}"
-    except Exception as e:
-        return f"Error executing kubectl get csidrivers: {str(e)}"
+    return get_result_cache().get_or_load(
+        'get', "csidrivers", None, None, output_format,
+        lambda: get_kubernetes_backend().get("csidrivers", None, None, output_format)
+    )
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Result cache for the read-only kubectl and CSI Baremetal tools.
+
+A single process-wide cache is shared by Phase 0, the plan phase, Phase 1 and
+Phase 2, so a resource fetched once is served from memory until its TTL runs
+out. Entries are evicted in LRU order when the cache is full, and the whole
+cache is invalidated after any tool that mutates cluster state.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from tools.kubernetes.backend import resolve_resource
+
+logger = logging.getLogger(__name__)
+
+# Global result cache instance
+_result_cache = None
+_result_cache_lock = threading.Lock()
+
+DEFAULT_MAX_ENTRIES = 512
+
+# TTLs in seconds keyed by resource plural; 'default' applies to anything else
+DEFAULT_TTL_SECONDS = {
+    'default': 30,
+    'pods': 15,
+    'events': 5,
+    'persistentvolumeclaims': 30,
+    'persistentvolumes': 30,
+    'nodes': 60,
+    'storageclasses': 300,
+    'csidrivers': 300,
+    'drives': 30,
+    'volumes': 30,
+    'logicalvolumegroups': 60,
+    'availablecapacities': 60,
+}
+
+# Tools that change cluster state; running any of them invalidates the cache
+MUTATING_TOOLS = {
+    'kubectl_apply',
+    'kubectl_delete',
+    'create_test_pod',
+    'create_test_pvc',
+    'create_test_storage_class',
+    'cleanup_test_resources',
+    'cleanup_specific_test_pod',
+    'cleanup_orphaned_pvs',
+    'force_cleanup_stuck_resources',
+}
+
+
+class KubectlResultCache:
+    """
+    TTL + LRU cache for kubectl get/describe tool output
+    """
+
+    def __init__(self, config_data: Dict[str, Any] = None):
+        """
+        Initialize the result cache
+
+        Args:
+            config_data: Configuration data from config.yaml
+        """
+        cache_config = ((config_data or {}).get('tools', {}) or {}).get('result_cache', {}) or {}
+
+        self.enabled = cache_config.get('enabled', True)
+        self.max_entries = max(1, int(cache_config.get('max_entries', DEFAULT_MAX_ENTRIES)))
+        self.ttl_seconds = {**DEFAULT_TTL_SECONDS, **(cache_config.get('ttl_seconds', {}) or {})}
+
+        self._entries: "OrderedDict[Hashable, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'expirations': 0,
+            'evictions': 0,
+            'invalidations': 0
+        }
+
+    def make_key(self, operation: str, resource_type: str, resource_name: str = None,
+                 namespace: str = None, output_format: str = None) -> Tuple[Hashable, str]:
+        """
+        Build a canonical cache key for a kubectl call
+
+        Resource aliases (po, pods, pod) share one key, and the namespace is
+        ignored for cluster-scoped resources just like kubectl ignores it.
+
+        Args:
+            operation: 'get' or 'describe'
+            resource_type: Resource type as passed to the tool
+            resource_name: Resource name (optional)
+            namespace: Namespace (optional)
+            output_format: Output format (optional)
+
+        Returns:
+            Tuple[Hashable, str]: (cache key, resource plural used for TTL lookup)
+        """
+        spec = resolve_resource(resource_type)
+        if spec is not None:
+            resource = f"{spec.plural}.{spec.api_version}"
+            plural = spec.plural
+            namespace = (namespace or 'default') if spec.namespaced else None
+        else:
+            resource = plural = (resource_type or '').lower()
+        return (operation, resource, resource_name or None, namespace or None, output_format or None), plural
+
+    def ttl_for(self, plural: str) -> float:
+        """Get the TTL in seconds for a resource plural"""
+        return self.ttl_seconds.get(plural, self.ttl_seconds['default'])
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """
+        Look up a cached result
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Optional[str]: Cached output, or None on miss or expiry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                self.stats['expirations'] += 1
+                self.stats['misses'] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return value
+
+    def put(self, key: Hashable, value: str, ttl: float):
+        """
+        Store a result, evicting least recently used entries when full
+
+        Args:
+            key: Cache key from make_key
+            value: Tool output
+            ttl: Time to live in seconds
+        """
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+
+    def get_or_load(self, operation: str, resource_type: str, resource_name: str, namespace: str,
+                    output_format: str, loader: Callable[[], str]) -> str:
+        """
+        Serve a kubectl call from the cache, running the loader on a miss
+
+        Error output is returned but never cached.
+
+        Args:
+            operation: 'get' or 'describe'
+            resource_type: Resource type as passed to the tool
+            resource_name: Resource name (optional)
+            namespace: Namespace (optional)
+            output_format: Output format (optional)
+            loader: Callable producing the tool output
+
+        Returns:
+            str: Tool output
+        """
+        if not self.enabled:
+            return loader()
+
+        key, plural = self.make_key(operation, resource_type, resource_name, namespace, output_format)
+        cached = self.get(key)
+        if cached is not None:
+            logger.debug(f"kubectl result cache hit: {key}")
+            return cached
+
+        value = loader()
+        if isinstance(value, str) and not value.startswith("Error"):
+            self.put(key, value, self.ttl_for(plural))
+        return value
+
+    def invalidate(self, reason: str = None):
+        """
+        Drop every cached result
+
+        Args:
+            reason: Why the cache is being invalidated (for logging)
+        """
+        with self._lock:
+            self._entries.clear()
+            self.stats['invalidations'] += 1
+        logger.info(f"kubectl result cache invalidated{f' after {reason}' if reason else ''}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict[str, Any]: Hit/miss counters, hit rate and current size
+        """
+        with self._lock:
+            size = len(self._entries)
+            stats = dict(self.stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        stats['size'] = size
+        return stats
+
+
+def initialize_result_cache(config_data: Dict[str, Any] = None) -> KubectlResultCache:
+    """
+    Initialize the global kubectl result cache
+
+    Args:
+        config_data: Configuration data from config.yaml
+
+    Returns:
+        KubectlResultCache: Global result cache
+    """
+    global _result_cache
+
+    with _result_cache_lock:
+        if _result_cache is None:
+            _result_cache = KubectlResultCache(config_data)
+            logger.info("kubectl result cache initialized")
+
+    return _result_cache
+
+
+def get_result_cache() -> KubectlResultCache:
+    """
+    Get the global kubectl result cache, creating it with defaults if needed
+
+    Returns:
+        KubectlResultCache: Global result cache
+    """
+    if _result_cache is None:
+        from tools.core.config import CONFIG_DATA
+        return initialize_result_cache(CONFIG_DATA)
+    return _result_cache
+
+
+def invalidate_after_tool(tool_name: str):
+    """
+    Invalidate the result cache if the given tool mutates cluster state
+
+    Args:
+        tool_name: Name of the tool that just ran
+    """
+    if tool_name in MUTATING_TOOLS:
+        get_result_cache().invalidate(reason=tool_name)
@@ -20,6 +20,7 @@ from tools.core.knowledge_graph import (
     kg_get_summary,
     kg_analyze_issues,
     kg_print_graph,
+    kg_batch_query,
     initialize_knowledge_graph,
     get_knowledge_graph
 )
@@ -120,6 +121,7 @@ def get_all_tools() -> List[Any]:
         kg_get_summary,
         kg_analyze_issues,
         kg_print_graph,
+        kg_batch_query,
         
         # Kubernetes core tools
         kubectl_get,
@@ -188,7 +190,8 @@ def get_knowledge_graph_tools() -> List[Any]:
         kg_find_path,
         kg_get_summary,
         kg_analyze_issues,
-        kg_print_graph
+        kg_print_graph,
+        kg_batch_query
     ]
 
 def get_kubernetes_tools() -> List[Any]:
@@ -268,6 +271,7 @@ def get_phase1_tools() -> List[Any]:
         kg_get_summary,
         kg_analyze_issues,
         kg_print_graph,
+        kg_batch_query,
         
         # Read-only Kubernetes tools
         kubectl_get,
@@ -11,6 +11,7 @@ import yaml
 from typing import Dict, Any
 from langchain_core.tools import tool
 from tools.core.config import validate_command, execute_command
+from tools.core.deadline import run_subprocess
 
 @tool
 def create_test_pod(pod_name: str, namespace: str = "default", 
@@ -84,17 +85,9 @@ spec:
     if pvc_yaml:
         try:
             cmd = ["kubectl", "apply", "-f", "-"]
-            # Create a process with stdin pipe to pass the YAML
-            import subprocess
-            process = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
-            )
-            stdout, stderr = process.communicate(input=pvc_yaml)
-            result = stdout if process.returncode == 0 else f"Error: {stderr}"
+            # Pass the YAML on stdin; the call's deadline kills a hung kubectl
+            process = run_subprocess(cmd, input=pvc_yaml, text=True)
+            result = process.stdout if process.returncode == 0 else f"Error: {process.stderr}"
             results.append(f"PVC Creation: {result}")
         except Exception as e:
             return f"Error creating PVC: {str(e)}"
@@ -102,17 +95,9 @@ spec:
     # Create pod
     try:
         cmd = ["kubectl", "apply", "-f", "-"]
-        # Create a process with stdin pipe to pass the YAML
-        import subprocess
-        process = subprocess.Popen(
-            cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True
-        )
-        stdout, stderr = process.communicate(input=pod_yaml)
-        result = stdout if process.returncode == 0 else f"Error: {stderr}"
+        # Pass the YAML on stdin; the call's deadline kills a hung kubectl
+        process = run_subprocess(cmd, input=pod_yaml, text=True)
+        result = process.stdout if process.returncode == 0 else f"Error: {process.stderr}"
         results.append(f"Pod Creation: {result}")
         
         # Wait for pod to be ready (optional check)
@@ -162,17 +147,9 @@ spec:
     
     try:
         cmd = ["kubectl", "apply", "-f", "-"]
-        # Create a process with stdin pipe to pass the YAML
-        import subprocess
-        process = subprocess.Popen(
-            cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True
-        )
-        stdout, stderr = process.communicate(input=pvc_yaml)
-        result = stdout if process.returncode == 0 else f"Error: {stderr}"
+        # Pass the YAML on stdin; the call's deadline kills a hung kubectl
+        process = run_subprocess(cmd, input=pvc_yaml, text=True)
+        result = process.stdout if process.returncode == 0 else f"Error: {process.stderr}"
         
         # Check PVC status
         cmd = ["kubectl", "get", "pvc", pvc_name, "-n", namespace, "-o", "yaml"]
@@ -216,17 +193,9 @@ reclaimPolicy: Delete
     
     try:
         cmd = ["kubectl", "apply", "-f", "-"]
-        # Create a process with stdin pipe to pass the YAML
-        import subprocess
-        process = subprocess.Popen(
-            cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True
-        )
-        stdout, stderr = process.communicate(input=sc_yaml)
-        result = stdout if process.returncode == 0 else f"Error: {stderr}"
+        # Pass the YAML on stdin; the call's deadline kills a hung kubectl
+        process = run_subprocess(cmd, input=sc_yaml, text=True)
+        result = process.stdout if process.returncode == 0 else f"Error: {process.stderr}"
         
         # Verify storage class
         cmd = ["kubectl", "get", "storageclass", sc_name, "-o", "yaml"]
@@ -7,7 +7,7 @@ and delegates hook management to a dedicated HookManager.
 """
 
 import asyncio
-import inspect
+import time
 from copy import copy
 from dataclasses import replace
 from typing import (
@@ -32,7 +32,7 @@ from langchain_core.messages import (
     ToolMessage,
 )
 from langchain_core.runnables import RunnableConfig
-from langchain_core.tools import BaseTool
+from langchain_core.tools import BaseTool, StructuredTool
 from langchain_core.tools import tool as create_tool
 from pydantic import BaseModel
 
@@ -55,16 +55,34 @@ from troubleshooting.strategies import (
     StrategyFactory
 )
 from troubleshooting.hook_manager import HookManager
+from troubleshooting.resource_scheduler import ResourceScheduler, get_resource_scheduler
+from troubleshooting.single_flight import SingleFlight, get_single_flight
+from troubleshooting.tool_memo import ToolResultMemo, canonical_args, is_failure
+from troubleshooting.tool_runtime import run_coroutine
+from tools.core.deadline import (TOOL_DEADLINE_KEY, ToolTimeout, deadline_scope, load_tool_timeouts, partial_output,
+                                 remaining)
+from tools.kubernetes.result_cache import MUTATING_TOOLS, invalidate_after_tool
 
 # Configure logging
 logger = logging.getLogger('execute_tool_node')
 logger.setLevel(logging.INFO)
 
+# Seconds an async call may outlive its deadline while its tool cleans up and returns partial output
+DEADLINE_GRACE_SECONDS = 5
+
 class ExecuteToolNode(RunnableCallable):
-    """A node that runs tools based on their configuration (parallel or serial).
+    """A node that runs tools concurrently, scheduled by the resources they touch.
     
-    Uses the Strategy pattern to separate execution logic for parallel and serial tools.
+    Every tool call of a step starts at once. Each call holds claims on the API
+    server, node, device, drive or pod it touches (see ResourceScheduler), so calls
+    on different resources overlap while conflicting calls, such as two benchmarks
+    of one device, wait for each other. Tools without a resource declaration fall
+    back to their configuration: parallel tools claim nothing, serial and
+    uncategorized tools run one at a time.
     Uses a HookManager to handle before/after tool execution hooks.
+    Whether a tool is called sync or through its coroutine is decided once per tool
+    when the node is built. Calls run on a process-wide thread pool, and async-only
+    tools (MCP tools) called from sync code run on one background event loop.
     
     It can be used either in StateGraph with a "messages" state key (or a custom key 
     passed via ExecuteToolNode's 'messages_key'). The output will be a list of 
@@ -72,10 +90,25 @@ class ExecuteToolNode(RunnableCallable):
 
     Tool calls can also be passed directly as a list of `ToolCall` dicts.
 
+    Repeated calls with identical arguments to tools whose cache policy allows it
+    are answered from a ToolResultMemo; those ToolMessages carry
+    `response_metadata["cached"]` and the hooks see the call type suffixed with ", cached".
+    Identical calls running at the same time, in this node or another, share one
+    execution; every caller still gets a ToolMessage with its own tool_call_id,
+    marked `response_metadata["shared"]` for all but the one that ran the tool.
+
+    Every call runs under a deadline: the tool's timeout, cut short by the phase
+    deadline in `config["configurable"]["tool_deadline"]` (a time.monotonic() value).
+    It starts before the call waits for resources or an identical in-flight call.
+    Subprocesses and SSH commands of a call that runs past it are killed, and the
+    call's ToolMessage holds the output so far, marked `response_metadata["timed_out"]`.
+
     Args:
         tools: A sequence of tools that can be invoked by the ExecuteToolNode.
-        parallel_tools: A set of tool names that should be executed in parallel.
-        serial_tools: A set of tool names that should be executed serially.
+        parallel_tools: A set of tool names that may run alongside anything when
+            they have no resource declaration.
+        serial_tools: A set of tool names that should be executed serially when
+            they have no resource declaration.
         name: The name of the ExecuteToolNode in the graph. Defaults to "execute_tools".
         max_workers: Maximum number of worker threads to use for parallel execution.
             Defaults to None (uses ThreadPoolExecutor default).
@@ -94,6 +127,14 @@ class ExecuteToolNode(RunnableCallable):
         messages_key: The state key in the input that contains the list of messages.
             The same key will be used for the output from the ExecuteToolNode.
             Defaults to "messages".
+        tool_memo: Memo of tool results. Defaults to a ToolResultMemo with the
+            built-in cache policies.
+        single_flight: Coalesces identical concurrent calls. Defaults to the
+            process-wide SingleFlight.
+        resource_scheduler: Grants the resource claims of tool calls. Defaults to
+            the process-wide ResourceScheduler.
+        tool_timeouts: Seconds each tool may run, by tool name with a 'default'
+            entry; None means no limit. Defaults to the built-in timeouts.
     """
 
     name: str = "ExecuteToolNode"
@@ -111,12 +152,19 @@ class ExecuteToolNode(RunnableCallable):
             bool, str, Callable[..., str], tuple[type[Exception], ...]
         ] = True,
         messages_key: str = "messages",
+        tool_memo: Optional[ToolResultMemo] = None,
+        single_flight: Optional[SingleFlight] = None,
+        resource_scheduler: Optional[ResourceScheduler] = None,
+        tool_timeouts: Optional[Dict[str, Optional[float]]] = None,
     ) -> None:
         super().__init__(self._func, self._afunc, name=name, tags=tags, trace=False)
         # Tool management
         self.tools_by_name: dict[str, BaseTool] = {}
         self.tool_to_state_args: dict[str, dict[str, Optional[str]]] = {}
         self.tool_to_store_arg: dict[str, Optional[str]] = {}
+        self.tool_to_arg_defaults: dict[str, dict[str, Any]] = {}
+        # Dispatch table: tools that must be called through their coroutine
+        self.tool_is_async_only: dict[str, bool] = {}
         
         # Configuration
         self.handle_tool_errors = handle_tool_errors
@@ -124,13 +172,21 @@ class ExecuteToolNode(RunnableCallable):
         self.parallel_tools = parallel_tools
         self.serial_tools = serial_tools
         self.max_workers = max_workers
+        self.tool_timeouts = tool_timeouts if tool_timeouts is not None else load_tool_timeouts()
         
         # Initialize hook manager
         self.hook_manager = HookManager()
         
-        # Create execution strategies
-        self.parallel_strategy = StrategyFactory.create_strategy(ExecutionType.PARALLEL, max_workers)
-        self.serial_strategy = StrategyFactory.create_strategy(ExecutionType.SERIAL)
+        # Memo answering repeated identical tool calls
+        self.tool_memo = tool_memo if tool_memo is not None else ToolResultMemo()
+        # Shared by every node in the process, so concurrent graphs coalesce identical calls too
+        self.single_flight = single_flight if single_flight is not None else get_single_flight()
+        # Shared by every node in the process, since graphs reach the same nodes and devices
+        self.resource_scheduler = (resource_scheduler if resource_scheduler is not None
+                                   else get_resource_scheduler())
+        
+        # Create execution strategy; resource claims decide which calls overlap
+        self.scheduled_strategy = StrategyFactory.create_strategy(ExecutionType.SCHEDULED, max_workers)
         
         # Process tools
         for tool_ in tools:
@@ -139,6 +195,10 @@ class ExecuteToolNode(RunnableCallable):
             self.tools_by_name[tool_.name] = tool_
             self.tool_to_state_args[tool_.name] = _get_state_args(tool_)
             self.tool_to_store_arg[tool_.name] = _get_store_arg(tool_)
+            self.tool_to_arg_defaults[tool_.name] = {
+                arg: schema["default"] for arg, schema in tool_.args.items() if "default" in schema
+            }
+            self.tool_is_async_only[tool_.name] = self._is_async_only_tool(tool_.name)
             
     def register_before_call_hook(self, hook: Callable) -> None:
         """Register a hook function to be called before tool execution.
@@ -173,31 +233,13 @@ class ExecuteToolNode(RunnableCallable):
             # If no tools to execute, return empty list
             return {"messages": []} if input_type == "dict" else []
         
-        # Filter tool calls into parallel and serial groups
-        parallel_tool_calls = self._filter_parallel_tools(tool_calls)
-        serial_tool_calls = self._filter_serial_tools(tool_calls)
-        
-        outputs = []
-        
-        # First, process parallel tools concurrently if any exist
-        if parallel_tool_calls:
-            parallel_outputs = self.parallel_strategy.execute(
-                parallel_tool_calls, 
-                input_type, 
-                config,
-                self._run_one
-            )
-            outputs.extend(parallel_outputs)
-        
-        # Then, process serial tools sequentially if any exist
-        if serial_tool_calls:
-            serial_outputs = self.serial_strategy.execute(
-                serial_tool_calls, 
-                input_type, 
-                config,
-                self._run_one
-            )
-            outputs.extend(serial_outputs)
+        # Start every call; each one waits only for the resources it touches
+        outputs = self.scheduled_strategy.execute(
+            tool_calls, 
+            input_type, 
+            config,
+            self._run_one
+        )
 
         return self._combine_tool_outputs(outputs, input_type)
 
@@ -218,58 +260,16 @@ class ExecuteToolNode(RunnableCallable):
             # If no tools to execute, return empty list
             return {"messages": []} if input_type == "dict" else []
         
-        # Filter tool calls into parallel and serial groups
-        parallel_tool_calls = self._filter_parallel_tools(tool_calls)
-        serial_tool_calls = self._filter_serial_tools(tool_calls)
-        
-        outputs = []
-        
-        # First, process parallel tools concurrently if any exist
-        if parallel_tool_calls:
-            parallel_outputs = await self.parallel_strategy.execute_async(
-                parallel_tool_calls, 
-                input_type, 
-                config,
-                self._arun_one
-            )
-            outputs.extend(parallel_outputs)
-        
-        # Then, process serial tools sequentially if any exist
-        if serial_tool_calls:
-            serial_outputs = await self.serial_strategy.execute_async(
-                serial_tool_calls, 
-                input_type, 
-                config,
-                self._arun_one
-            )
-            outputs.extend(serial_outputs)
+        # Start every call; each one waits only for the resources it touches
+        outputs = await self.scheduled_strategy.execute_async(
+            tool_calls, 
+            input_type, 
+            config,
+            self._arun_one
+        )
 
         return self._combine_tool_outputs(outputs, input_type)
 
-    def _filter_parallel_tools(self, tool_calls: List[ToolCall]) -> List[ToolCall]:
-        """Filter tool calls to only include those configured for parallel execution.
-        
-        Args:
-            tool_calls: List of tool calls to filter
-            
-        Returns:
-            List of tool calls for parallel execution
-        """
-        return [call for call in tool_calls if call["name"] in self.parallel_tools]
-    
-    def _filter_serial_tools(self, tool_calls: List[ToolCall]) -> List[ToolCall]:
-        """Filter tool calls to only include those configured for serial execution.
-        Also includes tools not explicitly categorized as parallel or serial (defaults to serial).
-        
-        Args:
-            tool_calls: List of tool calls to filter
-            
-        Returns:
-            List of tool calls for serial execution
-        """
-        return [call for call in tool_calls if call["name"] in self.serial_tools or 
-                (call["name"] not in self.parallel_tools and call["name"] not in self.serial_tools)]
-
     def _combine_tool_outputs(
         self,
         outputs: list[ToolMessage],
@@ -326,6 +326,9 @@ class ExecuteToolNode(RunnableCallable):
     def _is_async_only_tool(self, tool_name: str) -> bool:
         """Check if a tool only supports async invocation.
         
+        Called once per tool at construction to fill the dispatch table
+        `tool_is_async_only`; tool calls look the answer up there.
+        
         Args:
             tool_name: Name of the tool to check
             
@@ -334,11 +337,16 @@ class ExecuteToolNode(RunnableCallable):
         """
         tool = self.tools_by_name[tool_name]
         
-        # Check #1: Class-based detection for MCP tools and known async-only tool classes
+        # Check #1: Class-based detection for MCP tools and StructuredTools built from a coroutine alone
         tool_class_str = str(tool.__class__).lower()
-        if "mcp" in tool_class_str or "structuredtool" in tool_class_str:
+        if "mcp" in tool_class_str:
             logger.info(f"Tool {tool_name} detected as async-only based on class: {tool.__class__}")
             return True
+        if isinstance(tool, StructuredTool):
+            if tool.func is None:
+                logger.info(f"Tool {tool_name} detected as async-only (StructuredTool without a sync function)")
+                return True
+            return False
             
         # Check #2: Module-based detection
         if hasattr(tool, "__module__") and ("mcp" in tool.__module__.lower() or "langchain_mcp" in tool.__module__.lower()):
@@ -361,6 +369,130 @@ class ExecuteToolNode(RunnableCallable):
             
         return False
 
+    def _call_key(self, tool_name: str, tool_args: Dict[str, Any]) -> Tuple[str, str]:
+        """Build the identity of a tool call, used by the memo and the single flight.
+        
+        Args:
+            tool_name: Name of the tool
+            tool_args: Arguments of the call, including injected state and store
+            
+        Returns:
+            (tool name, canonical arguments) without the injected arguments.
+            Omitted arguments are filled in with their defaults first.
+        """
+        injected = list(self.tool_to_state_args.get(tool_name) or {})
+        if self.tool_to_store_arg.get(tool_name):
+            injected.append(self.tool_to_store_arg[tool_name])
+        args = {**self.tool_to_arg_defaults.get(tool_name, {}), **tool_args}
+        return tool_name, canonical_args(args, exclude=injected)
+
+    def _memoized_response(
+        self,
+        call: ToolCall,
+        call_key: Tuple[str, str],
+        call_type: str,
+    ) -> Optional[ToolMessage]:
+        """Answer a tool call from the memo, running the hooks with the call marked as cached.
+        
+        Args:
+            call: Tool call to answer
+            call_key: Key from _call_key
+            call_type: Type of call execution ("Scheduled", "Parallel" or "Serial")
+            
+        Returns:
+            A copy of the memoized ToolMessage for this call, or None on a miss
+        """
+        if not self.tool_memo.is_cacheable(call["name"]):
+            return None
+        hit = self.tool_memo.get(call_key)
+        if hit is None:
+            return None
+        response, age = hit
+        tool_args = call["args"] if "args" in call else {}
+        response = response.model_copy(update={
+            "tool_call_id": call["id"],
+            "response_metadata": {**response.response_metadata, "cached": True, "cache_age_seconds": round(age, 3)},
+        })
+        logger.info(f"Tool {call['name']} answered from memo ({age:.1f}s old)")
+        self.hook_manager.run_before_hook(call["name"], tool_args, f"{call_type}, cached")
+        self.hook_manager.run_after_hook(call["name"], tool_args, response, f"{call_type}, cached")
+        return response
+
+    def _remember(self, call_key: Tuple[str, str], response: Any) -> None:
+        """Memoize a successful tool response if the tool's cache policy allows it.
+        
+        Args:
+            call_key: Key from _call_key
+            response: Result of the tool call
+        """
+        if isinstance(response, ToolMessage) and response.status != "error" and not is_failure(response.content):
+            self.tool_memo.put(call_key, response)
+
+    def _call_timeout(self, tool_name: str, config: RunnableConfig) -> Optional[float]:
+        """Seconds a call may run: the tool's timeout, cut short by the phase deadline.
+        
+        Args:
+            tool_name: Name of the tool
+            config: Runnable configuration, possibly carrying the phase deadline
+            
+        Returns:
+            Seconds, or None if neither the tool nor the phase has a limit
+        """
+        timeout = self.tool_timeouts.get(tool_name, self.tool_timeouts.get("default"))
+        phase_deadline = ((config or {}).get("configurable") or {}).get(TOOL_DEADLINE_KEY)
+        if phase_deadline is not None:
+            left = max(0.0, phase_deadline - time.monotonic())
+            timeout = left if timeout is None else min(timeout, left)
+        return timeout
+
+    def _timed_out_response(self, call: ToolCall, error: ToolTimeout, call_type: str) -> ToolMessage:
+        """Turn a call that ran past its deadline into a ToolMessage with its partial output.
+        
+        Args:
+            call: Tool call that timed out
+            error: ToolTimeout raised by the tool, carrying the output so far
+            call_type: Type of call execution ("Scheduled", "Parallel" or "Serial")
+            
+        Returns:
+            ToolMessage marked `response_metadata["timed_out"]`
+        """
+        tool_args = call["args"] if "args" in call else {}
+        logger.warning(f"Tool {call['name']} timed out after {error.timeout:.1f}s")
+        if error.partial_output:
+            content = (f"{error.partial_output.rstrip()}\n\n[Timed out after {error.timeout:.0f}s; "
+                       f"the output above is partial]")
+        else:
+            content = f"Error: Tool {call['name']} timed out after {error.timeout:.0f}s with no output"
+        response = ToolMessage(
+            content=content,
+            name=call["name"],
+            tool_call_id=call["id"],
+            status="error",
+            response_metadata={"timed_out": True, "timeout_seconds": round(error.timeout, 3)},
+        )
+        self.hook_manager.run_after_hook(call["name"], tool_args, response, call_type)
+        return response
+
+    def _shared_response(self, call: ToolCall, response: ToolMessage, call_type: str) -> ToolMessage:
+        """Hand the result of an identical in-flight call to this call, running the hooks marked as shared.
+        
+        Args:
+            call: Tool call that waited for the in-flight execution
+            response: ToolMessage of the execution
+            call_type: Type of call execution ("Scheduled", "Parallel" or "Serial")
+            
+        Returns:
+            A copy of the response with this call's tool_call_id
+        """
+        tool_args = call["args"] if "args" in call else {}
+        response = response.model_copy(update={
+            "tool_call_id": call["id"],
+            "response_metadata": {**response.response_metadata, "shared": True},
+        })
+        self.hook_manager.run_before_hook(call["name"], tool_args, f"{call_type}, shared")
+        self.hook_manager.run_after_hook(call["name"], tool_args, response, f"{call_type}, shared")
+        return response
+
     def _run_one(
         self,
         call: ToolCall,
@@ -368,13 +500,13 @@ class ExecuteToolNode(RunnableCallable):
         config: RunnableConfig,
         call_type: str = "Serial",
     ) -> ToolMessage:
-        """Execute a single tool.
+        """Execute a single tool, unless the memo or an identical in-flight call answers it.
         
         Args:
             call: Tool call to execute
             input_type: Type of input (list, dict, or tool_calls)
             config: Runnable configuration
-            call_type: Type of call execution ("Parallel" or "Serial")
+            call_type: Type of call execution ("Scheduled", "Parallel" or "Serial")
             
         Returns:
             Result of tool execution as a ToolMessage
@@ -382,6 +514,132 @@ class ExecuteToolNode(RunnableCallable):
         if invalid_tool_message := self._validate_tool_call(call):
             return invalid_tool_message
 
+        # Repeated identical calls are answered from the memo
+        call_key = self._call_key(call["name"], call["args"] if "args" in call else {})
+        if (cached := self._memoized_response(call, call_key, call_type)) is not None:
+            return cached
+        # The call's deadline starts now: waiting for resources or an in-flight call counts against it
+        timeout = self._call_timeout(call["name"], config)
+        with deadline_scope(timeout):
+            try:
+                if call["name"] in MUTATING_TOOLS:
+                    return self._execute_scheduled(call, input_type, config, call_type, call_key)
+
+                # Identical concurrent calls, from this node or another graph, share one execution
+                response, shared = self.single_flight.do(
+                    call_key, lambda: self._execute_scheduled(call, input_type, config, call_type, call_key))
+                if not shared:
+                    return response
+                # The leader's timeout is its own; this call may still have time to run
+                if not isinstance(response, ToolMessage) or response.response_metadata.get("timed_out"):
+                    return self._execute_scheduled(call, input_type, config, call_type, call_key)
+            except ToolTimeout as e:
+                # The deadline passed before the call could run
+                self.hook_manager.run_before_hook(call["name"], call["args"] if "args" in call else {}, call_type)
+                return self._timed_out_response(call, ToolTimeout(timeout, e.partial_output), call_type)
+        return self._shared_response(call, response, call_type)
+
+    async def _arun_one(
+        self,
+        call: ToolCall,
+        input_type: Literal["list", "dict", "tool_calls"],
+        config: RunnableConfig,
+        call_type: str = "Serial",
+    ) -> ToolMessage:
+        """Execute a single tool asynchronously, unless the memo or an identical in-flight call answers it.
+        
+        Args:
+            call: Tool call to execute
+            input_type: Type of input (list, dict, or tool_calls)
+            config: Runnable configuration
+            call_type: Type of call execution ("Scheduled", "Parallel" or "Serial")
+            
+        Returns:
+            Result of tool execution as a ToolMessage
+        """
+        if invalid_tool_message := self._validate_tool_call(call):
+            return invalid_tool_message
+
+        # Repeated identical calls are answered from the memo
+        call_key = self._call_key(call["name"], call["args"] if "args" in call else {})
+        if (cached := self._memoized_response(call, call_key, call_type)) is not None:
+            return cached
+        # The call's deadline starts now: waiting for resources or an in-flight call counts against it
+        timeout = self._call_timeout(call["name"], config)
+        with deadline_scope(timeout):
+            try:
+                if call["name"] in MUTATING_TOOLS:
+                    return await self._aexecute_scheduled(call, input_type, config, call_type, call_key)
+
+                # Identical concurrent calls, from this node or another graph, share one execution
+                response, shared = await self.single_flight.do_async(
+                    call_key, lambda: self._aexecute_scheduled(call, input_type, config, call_type, call_key))
+                if not shared:
+                    return response
+                # The leader's timeout is its own; this call may still have time to run
+                if not isinstance(response, ToolMessage) or response.response_metadata.get("timed_out"):
+                    return await self._aexecute_scheduled(call, input_type, config, call_type, call_key)
+            except ToolTimeout as e:
+                # The deadline passed before the call could run
+                self.hook_manager.run_before_hook(call["name"], call["args"] if "args" in call else {}, call_type)
+                return self._timed_out_response(call, ToolTimeout(timeout, e.partial_output), call_type)
+        return self._shared_response(call, response, call_type)
+
+    def _resource_args(self, call: ToolCall) -> Dict[str, Any]:
+        """Arguments of a call with omitted ones filled in, naming the resources it touches."""
+        return {**self.tool_to_arg_defaults.get(call["name"], {}), **(call["args"] if "args" in call else {})}
+
+    def _execute_scheduled(
+        self,
+        call: ToolCall,
+        input_type: Literal["list", "dict", "tool_calls"],
+        config: RunnableConfig,
+        call_type: str,
+        call_key: Tuple[str, str],
+    ) -> ToolMessage:
+        """Execute a single validated tool call while holding the resources it touches.
+        
+        Only the call that runs the tool holds resources; callers sharing its
+        result wait on the single flight without claiming anything, so waits
+        cannot form a cycle.
+        """
+        with self.resource_scheduler.hold(call["name"], self._resource_args(call),
+                                          parallel=call["name"] in self.parallel_tools):
+            return self._execute_one(call, input_type, config, call_type, call_key)
+
+    async def _aexecute_scheduled(
+        self,
+        call: ToolCall,
+        input_type: Literal["list", "dict", "tool_calls"],
+        config: RunnableConfig,
+        call_type: str,
+        call_key: Tuple[str, str],
+    ) -> ToolMessage:
+        """Execute a single validated tool call asynchronously while holding the resources it touches."""
+        async with self.resource_scheduler.hold_async(call["name"], self._resource_args(call),
+                                                      parallel=call["name"] in self.parallel_tools):
+            return await self._aexecute_one(call, input_type, config, call_type, call_key)
+
+    def _execute_one(
+        self,
+        call: ToolCall,
+        input_type: Literal["list", "dict", "tool_calls"],
+        config: RunnableConfig,
+        call_type: str,
+        call_key: Tuple[str, str],
+    ) -> ToolMessage:
+        """Execute a single validated tool call.
+        
+        Args:
+            call: Tool call to execute
+            input_type: Type of input (list, dict, or tool_calls)
+            config: Runnable configuration
+            call_type: Type of call execution ("Scheduled", "Parallel" or "Serial")
+            call_key: Key from _call_key, under which a successful result is memoized
+            
+        Returns:
+            Result of tool execution as a ToolMessage
+        """
         # Extract tool name and arguments for hooks
         tool_name = call["name"]
         tool_args = call["args"] if "args" in call else {}
@@ -392,74 +650,41 @@ class ExecuteToolNode(RunnableCallable):
         # Get the tool
         tool = self.tools_by_name[tool_name]
         input_data = {**call, **{"type": "tool_call"}}
-        
-        # First attempt: Try to determine if it's an async-only tool
-        use_async = self._is_async_only_tool(tool_name)
+        # What is left of the deadline started in _run_one
+        timeout = remaining(self._call_timeout(tool_name, config))
 
         try:
-            # If we already know it's async-only, use the async method directly
-            if use_async:
-                logger.info(f"Tool {tool_name} identified as async-only, using async execution")
-                # Create a new event loop for this thread if needed
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                
-                # Run the async method in the event loop
-                response = loop.run_until_complete(tool.ainvoke(input_data, config))
-            else:
-                # Try normal sync invocation first
-                try:
-                    response = tool.invoke(input_data, config)
-                except NotImplementedError as e:
-                    # If we get a NotImplementedError with the specific message about StructuredTool,
-                    # fall back to async invocation
-                    if "StructuredTool does not support sync invocation" in str(e):
-                        logger.info(f"Tool {tool_name} raised NotImplementedError for sync invocation, falling back to async")
-                        # Create a new event loop for this thread if needed
-                        try:
-                            loop = asyncio.get_event_loop()
-                        except RuntimeError:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                        
-                        # Run the async method in the event loop
-                        response = loop.run_until_complete(tool.ainvoke(input_data, config))
-                    else:
-                        # If it's a different NotImplementedError, re-raise it
-                        raise
-
+            # Subprocesses and SSH commands inside the tool see the deadline
+            with deadline_scope(timeout):
+                # Async-only tools run on the shared background event loop
+                if self.tool_is_async_only[tool_name]:
+                    response = run_coroutine(tool.ainvoke(input_data, config), timeout)
+                else:
+                    # Try normal sync invocation first
+                    try:
+                        response = tool.invoke(input_data, config)
+                    except NotImplementedError as e:
+                        # If we get a NotImplementedError with the specific message about StructuredTool,
+                        # fall back to async invocation and dispatch this tool async from now on
+                        if "StructuredTool does not support sync invocation" in str(e):
+                            logger.warning(f"Tool {tool_name} only supports async invocation but wasn't detected. Retrying with async")
+                            self.tool_is_async_only[tool_name] = True
+                            response = run_coroutine(tool.ainvoke(input_data, config), timeout)
+                        else:
+                            # If it's a different NotImplementedError, re-raise it
+                            raise
+
+            self._remember(call_key, response)
             # Call after hook
             self.hook_manager.run_after_hook(tool_name, tool_args, response, call_type)
             return response
 
+        except ToolTimeout as e:
+            return self._timed_out_response(call, e, call_type)
         except GraphBubbleUp as e:
             # Special exception that will always be raised
             raise e
         except Exception as e:
-            # Special handling for structured tools that only support async invocation
-            if isinstance(e, NotImplementedError) and "StructuredTool does not support sync invocation" in str(e):
-                logger.warning(f"Tool {tool_name} only supports async invocation but wasn't detected. Retrying with async")
-                try:
-                    # Create a new event loop for this thread if needed
-                    try:
-                        loop = asyncio.get_event_loop()
-                    except RuntimeError:
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                    
-                    # Run the async method in the event loop
-                    response = loop.run_until_complete(tool.ainvoke(input_data, config))
-                    
-                    # Call after hook
-                    self.hook_manager.run_after_hook(tool_name, tool_args, response, call_type)
-                    return response
-                except Exception as async_e:
-                    # If async execution also fails, handle that error instead
-                    e = async_e
-            
             # Standard error handling
             if isinstance(self.handle_tool_errors, tuple):
                 handled_types: tuple = self.handle_tool_errors
@@ -486,28 +711,32 @@ class ExecuteToolNode(RunnableCallable):
             # Call after hook with error result
             self.hook_manager.run_after_hook(tool_name, tool_args, error_message, call_type)
             return error_message
+        finally:
+            # Mutating tools invalidate cached kubectl results shared across phases,
+            # and the memoized cluster or node state
+            invalidate_after_tool(tool_name)
+            self.tool_memo.invalidate_after_tool(tool_name, tool_args)
 
-    async def _arun_one(
+    async def _aexecute_one(
         self,
         call: ToolCall,
         input_type: Literal["list", "dict", "tool_calls"],
         config: RunnableConfig,
-        call_type: str = "Serial",
+        call_type: str,
+        call_key: Tuple[str, str],
     ) -> ToolMessage:
-        """Execute a single tool asynchronously.
+        """Execute a single validated tool call asynchronously.
         
         Args:
             call: Tool call to execute
             input_type: Type of input (list, dict, or tool_calls)
             config: Runnable configuration
-            call_type: Type of call execution ("Parallel" or "Serial")
+            call_type: Type of call execution ("Scheduled", "Parallel" or "Serial")
+            call_key: Key from _call_key, under which a successful result is memoized
             
         Returns:
             Result of tool execution as a ToolMessage
         """
-        if invalid_tool_message := self._validate_tool_call(call):
-            return invalid_tool_message
-
         # Extract tool name and arguments for hooks
         tool_name = call["name"]
         tool_args = call["args"] if "args" in call else {}
@@ -515,14 +744,32 @@ class ExecuteToolNode(RunnableCallable):
         # Call before hook
         self.hook_manager.run_before_hook(tool_name, tool_args, call_type)
 
+        # What is left of the deadline started in _arun_one
+        timeout = remaining(self._call_timeout(tool_name, config))
+
         try:
             input = {**call, **{"type": "tool_call"}}
-            response = await self.tools_by_name[tool_name].ainvoke(input, config)
+            # Sync tools run in an executor with a copy of this context, so they see the deadline.
+            # The backstop leaves them time to kill their subprocesses and return partial output
+            with deadline_scope(timeout):
+                backstop = asyncio.timeout(None if timeout is None else timeout + DEADLINE_GRACE_SECONDS)
+                try:
+                    async with backstop:
+                        response = await self.tools_by_name[tool_name].ainvoke(input, config)
+                except TimeoutError:
+                    # Only the backstop's own expiry is a timeout; a TimeoutError raised by the tool
+                    # (e.g. socket.timeout from an SSH connect) is handled as the tool's error
+                    if not backstop.expired():
+                        raise
+                    raise ToolTimeout(timeout, partial_output())
 
+            self._remember(call_key, response)
             # Call after hook
             self.hook_manager.run_after_hook(tool_name, tool_args, response, call_type)
             return response
 
+        except ToolTimeout as e:
+            return self._timed_out_response(call, e, call_type)
         except GraphBubbleUp as e:
             # Special exception that will always be raised
             raise e
@@ -553,6 +800,11 @@ class ExecuteToolNode(RunnableCallable):
             # Call after hook with error result
             self.hook_manager.run_after_hook(tool_name, tool_args, error_message, call_type)
             return error_message
+        finally:
+            # Mutating tools invalidate cached kubectl results shared across phases,
+            # and the memoized cluster or node state
+            invalidate_after_tool(tool_name)
+            self.tool_memo.invalidate_after_tool(tool_name, tool_args)
 
     def _parse_input(
         self,
@@ -27,6 +27,9 @@ from langchain_core.messages import BaseMessage, ToolMessage, HumanMessage, Syst
 from phases.llm_factory import LLMFactory
 from troubleshooting.execute_tool_node import ExecuteToolNode
 from troubleshooting.hook_manager import HookManager
+from troubleshooting.tool_memo import ToolResultMemo
+from troubleshooting.resource_scheduler import initialize_resource_scheduler
+from tools.core.deadline import load_tool_timeouts
 from troubleshooting.end_conditions import EndConditionFactory
 from rich.console import Console
 from rich.panel import Panel
@@ -227,7 +230,7 @@ def create_troubleshooting_graph_with_context(collected_info: Dict[str, Any], ph
     tools = _get_tools_for_phase(phase)
     
     # Create ExecuteToolNode with the configured tools
-    execute_tool_node = _create_execute_tool_node(tools, parallel_tools, serial_tools)
+    execute_tool_node = _create_execute_tool_node(tools, parallel_tools, serial_tools, config_data)
     
     # Build the graph
     graph = _build_graph(call_model, check_end_conditions, execute_tool_node)
@@ -345,7 +348,8 @@ def _get_tools_for_phase(phase: str) -> List[Any]:
     
     return tools
 
-def _create_execute_tool_node(tools: List[Any], parallel_tools: Set[str], serial_tools: Set[str]) -> ExecuteToolNode:
+def _create_execute_tool_node(tools: List[Any], parallel_tools: Set[str], serial_tools: Set[str],
+                              config_data: Dict[str, Any] = None) -> ExecuteToolNode:
     """
     Create and configure the ExecuteToolNode
     
@@ -353,6 +357,7 @@ def _create_execute_tool_node(tools: List[Any], parallel_tools: Set[str], serial
         tools: List of tools
         parallel_tools: Set of tool names to execute in parallel
         serial_tools: Set of tool names to execute serially
+        config_data: Configuration data (tools.memoization)
         
     Returns:
         ExecuteToolNode: Configured ExecuteToolNode
@@ -373,7 +378,10 @@ def _create_execute_tool_node(tools: List[Any], parallel_tools: Set[str], serial
     
     # Create ExecuteToolNode with the configured tools
     logging.info(f"Creating ExecuteToolNode for execution of {len(parallel_tools)} parallel and {len(serial_tools)} serial tools")
-    execute_tool_node = ExecuteToolNode(tools, parallel_tools, serial_tools, name="execute_tools")
+    execute_tool_node = ExecuteToolNode(tools, parallel_tools, serial_tools, name="execute_tools",
+                                        tool_memo=ToolResultMemo(config_data),
+                                        resource_scheduler=initialize_resource_scheduler(config_data),
+                                        tool_timeouts=load_tool_timeouts(config_data))
     
     # Register hook manager with the ExecuteToolNode
     execute_tool_node.register_before_call_hook(hook_manager.run_before_hook)
@@ -273,6 +273,7 @@ Follow these strict guidelines for safe, reliable, and effective troubleshooting
      4. Explore relationships: Use kg_get_related_entities(entity_type, id) to see connections
      5. Analyze issues: Use kg_get_all_issues() to find existing issues
      6. Trace dependencies: Use kg_find_path() to find connections between entities
+     7. Batch lookups: Use kg_batch_query(entities, volume_chain) to get several entities, or a Pod's whole PVC/PV/Drive/Node chain, in one call
    - Use kg_print_graph to get a human-readable overview of the entire system state.
    - First check issues with kg_get_all_issues before running diagnostic commands. These issues are critical information to find root cause.
    - Use kg_get_summary to get high-level statistics about the cluster state.
@@ -0,0 +1,379 @@
+"""
+Resource-Aware Tool Scheduling for Kubernetes Volume I/O Error Troubleshooting
+
+Every tool call in a ReAct step starts at once; what it may run alongside is
+decided by the resources it touches rather than by a global parallel/serial
+split. A tool declares claims on resources named from its arguments:
+    api_server              the Kubernetes API server
+    node:<node>             a node reached over SSH
+    device:<node>:<path>    a block device on a node
+    drive:<uuid>            a CSI Baremetal drive
+    pod:<namespace>/<pod>   a pod and its volumes
+A shared claim takes one slot of the resource, an exclusive claim takes all of
+them, so smartctl_check on node A runs next to fio_performance_test on node B,
+while a second benchmark of the same device waits. All claims of a call are
+granted together or not at all, so calls cannot deadlock on each other. While
+an exclusive claim waits, calls with only shared claims are not granted that
+resource, so a steady stream of them cannot starve a benchmark or fsck.
+
+Tools without a declaration keep their configured behaviour: tools listed under
+tools.parallel claim nothing, any other tool takes the exclusive "serial" lane
+and runs alone among such tools.
+
+One process-wide instance is shared by every ExecuteToolNode, since the plan
+phase and Phase 1 graphs reach the same nodes and devices.
+"""
+
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Sequence, Tuple
+
+from tools.core.deadline import ToolTimeout, remaining
+
+# Configure logging
+logger = logging.getLogger('resource_scheduler')
+logger.setLevel(logging.INFO)
+
+# Global scheduler instance
+_resource_scheduler = None
+_resource_scheduler_lock = threading.Lock()
+
+# Resource kinds
+API_SERVER = 'api_server'
+NODE = 'node'
+DEVICE = 'device'
+DRIVE = 'drive'
+POD = 'pod'
+SERIAL = 'serial'
+
+# Slots per resource of each kind
+DEFAULT_LIMITS = {
+    API_SERVER: 4,
+    NODE: 2,
+    DEVICE: 2,
+    DRIVE: 1,
+    POD: 2,
+    SERIAL: 1,
+}
+
+# A claim declaration: (resource kind, arguments naming the resource, exclusive)
+ClaimSpec = Tuple[str, Tuple[str, ...], bool]
+
+_API = (API_SERVER, (), False)
+_NODE = (NODE, ('node_name',), False)
+_DEVICE_SHARED = (DEVICE, ('node_name', 'device_path'), False)
+_DEVICE_EXCLUSIVE = (DEVICE, ('node_name', 'device_path'), True)
+_POD_SHARED = (POD, ('namespace', 'pod_name'), False)
+_POD_EXCLUSIVE = (POD, ('namespace', 'pod_name'), True)
+
+# Tool name -> resources it touches; Knowledge Graph tools only read memory and claim nothing
+TOOL_RESOURCES: Dict[str, Tuple[ClaimSpec, ...]] = {
+    'kg_get_entity_info': (),
+    'kg_get_related_entities': (),
+    'kg_get_all_issues': (),
+    'kg_find_path': (),
+    'kg_get_summary': (),
+    'kg_analyze_issues': (),
+    'kg_print_graph': (),
+    'kg_batch_query': (),
+    # Kubernetes API
+    'kubectl_get': (_API,),
+    'kubectl_describe': (_API,),
+    'kubectl_logs': (_API,),
+    'kubectl_get_drive': (_API,),
+    'kubectl_get_csibmnode': (_API,),
+    'kubectl_get_availablecapacity': (_API,),
+    'kubectl_get_logicalvolumegroup': (_API,),
+    'kubectl_get_storageclass': (_API,),
+    'kubectl_get_csidrivers': (_API,),
+    'kubectl_exec': (_API, _POD_SHARED),
+    'kubectl_ls_pod_volume': (_API, _POD_SHARED),
+    # Node inspection over SSH
+    'df_command': (_NODE,),
+    'lsblk_command': (_NODE,),
+    'mount_command': (_NODE,),
+    'dmesg_command': (_NODE,),
+    'journalctl_command': (_NODE,),
+    'get_system_hardware_info': (_NODE,),
+    'scan_disk_error_logs': (_NODE,),
+    'analyze_disk_space_usage': (_NODE,),
+    # Devices: reads share a device, benchmarks and filesystem checks own it
+    'smartctl_check': (_NODE, _DEVICE_SHARED),
+    'check_disk_health': (_NODE, _DEVICE_SHARED),
+    'fio_performance_test': (_NODE, _DEVICE_EXCLUSIVE),
+    'run_disk_readonly_test': (_NODE, _DEVICE_EXCLUSIVE),
+    'test_disk_io_performance': (_NODE, _DEVICE_EXCLUSIVE),
+    'fsck_check': (_NODE, _DEVICE_EXCLUSIVE),
+    'xfs_repair_check': (_NODE, _DEVICE_EXCLUSIVE),
+    'detect_disk_jitter': (_NODE, (DRIVE, ('drive_uuid',), True)),
+    # Pod volumes: I/O tests own the volume, checks share it
+    'validate_volume_mount': (_API, _POD_SHARED),
+    'verify_volume_mount': (_API, _POD_SHARED),
+    'test_volume_permissions': (_API, _POD_SHARED),
+    'check_pod_volume_filesystem': (_API, _POD_SHARED),
+    'analyze_volume_space_usage': (_API, _POD_SHARED),
+    'run_volume_io_test': (_API, _POD_EXCLUSIVE),
+    'run_volume_stress_test': (_API, _POD_EXCLUSIVE),
+    'test_volume_io_performance': (_API, _POD_EXCLUSIVE),
+    'monitor_volume_latency': (_API, _POD_EXCLUSIVE),
+    'check_volume_data_integrity': (_API, _POD_EXCLUSIVE),
+}
+
+
+def resource_key(kind: str, values: Sequence[Any]) -> str:
+    """
+    Name a resource from its kind and the argument values identifying it
+
+    Args:
+        kind: Resource kind
+        values: Argument values, e.g. (node name, device path)
+
+    Returns:
+        str: 'api_server', 'node:worker-1', 'device:worker-1:/dev/sdb', 'pod:default/app', ...
+    """
+    if not values:
+        return kind
+    if kind == POD:
+        namespace, name = values
+        return f"{POD}:{namespace or 'default'}/{name or ''}"
+    return ':'.join([kind, *('' if value is None else str(value) for value in values)])
+
+
+class ResourceScheduler:
+    """
+    Per-resource slots shared by all tool calls of a node, granted all-or-nothing
+    """
+
+    def __init__(self, config_data: Dict[str, Any] = None):
+        """
+        Initialize the scheduler
+
+        Args:
+            config_data: Configuration data from config.yaml (tools.scheduler)
+        """
+        scheduler_config = ((config_data or {}).get('tools', {}) or {}).get('scheduler', {}) or {}
+
+        self.limits = {**DEFAULT_LIMITS, **(scheduler_config.get('limits', {}) or {})}
+        self.tool_resources = dict(TOOL_RESOURCES)
+        for tool_name, claims in (scheduler_config.get('resources', {}) or {}).items():
+            self.tool_resources[tool_name] = tuple(
+                (claim['resource'], tuple(claim.get('args', ())), bool(claim.get('exclusive', False)))
+                for claim in claims or ())
+
+        self._held: Dict[str, int] = {}
+        self._condition = threading.Condition()
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        # Resource -> waiting calls that claim it exclusively
+        self._exclusive_waiting: Dict[str, int] = {}
+        self.stats = {
+            'grants': 0,
+            'waits': 0,
+            'wait_seconds': 0.0
+        }
+
+    def _limit(self, resource: str) -> int:
+        return max(1, int(self.limits.get(resource.split(':', 1)[0], 1)))
+
+    def claims_for(self, tool_name: str, args: Dict[str, Any], parallel: bool = False) -> List[Tuple[str, int]]:
+        """
+        Resolve the resources a call touches
+
+        Args:
+            tool_name: Tool name
+            args: Call arguments with defaults filled in
+            parallel: Whether the tool is configured under tools.parallel, used when it has no declaration
+
+        Returns:
+            List[Tuple[str, int]]: (resource key, slots) pairs, one per resource
+        """
+        specs = self.tool_resources.get(tool_name)
+        if specs is None:
+            specs = () if parallel else ((SERIAL, (), True),)
+        claims: Dict[str, int] = {}
+        for kind, arg_names, exclusive in specs:
+            resource = resource_key(kind, [args.get(name) for name in arg_names])
+            slots = self._limit(resource) if exclusive else 1
+            claims[resource] = max(claims.get(resource, 0), slots)
+        return sorted(claims.items())
+
+    def _try_acquire(self, claims: List[Tuple[str, int]]) -> bool:
+        """Take every claim if all of them fit; the caller holds the condition
+
+        A call without an exclusive claim is not granted a resource an exclusive
+        claim is waiting for, so a stream of shared claims cannot starve it.
+        """
+        if (not self._exclusive_resources(claims)
+                and any(self._exclusive_waiting.get(resource) for resource, _ in claims)):
+            return False
+        if any(self._held.get(resource, 0) + slots > self._limit(resource) for resource, slots in claims):
+            return False
+        for resource, slots in claims:
+            self._held[resource] = self._held.get(resource, 0) + slots
+        self.stats['grants'] += 1
+        return True
+
+    def _exclusive_resources(self, claims: List[Tuple[str, int]]) -> List[str]:
+        return [resource for resource, slots in claims if slots >= self._limit(resource)]
+
+    def _enqueue(self, claims: List[Tuple[str, int]]):
+        """Mark the exclusive claims of a waiting call as pending; the caller holds the condition"""
+        for resource in self._exclusive_resources(claims):
+            self._exclusive_waiting[resource] = self._exclusive_waiting.get(resource, 0) + 1
+
+    def _dequeue(self, claims: List[Tuple[str, int]]):
+        """Drop the pending exclusive claims of a call that stopped waiting; the caller holds the condition"""
+        resources = self._exclusive_resources(claims)
+        for resource in resources:
+            if self._exclusive_waiting.get(resource, 0) > 1:
+                self._exclusive_waiting[resource] -= 1
+            else:
+                self._exclusive_waiting.pop(resource, None)
+        if resources:
+            # Shared claims held back for this call may fit now
+            self._notify_waiters()
+
+    def _notify_waiters(self):
+        """Wake every waiter to retry; the caller holds the condition"""
+        self._condition.notify_all()
+        waiters, self._async_waiters = self._async_waiters, []
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_wake, future)
+
+    def acquire(self, claims: List[Tuple[str, int]]):
+        """Block until every claim is granted; raises ToolTimeout if the call's deadline passes first"""
+        if not claims:
+            return
+        with self._condition:
+            if self._try_acquire(claims):
+                return
+            self.stats['waits'] += 1
+            started = time.monotonic()
+            timeout = remaining()
+            self._enqueue(claims)
+            try:
+                while not self._try_acquire(claims):
+                    left = None if timeout is None else timeout - (time.monotonic() - started)
+                    if left is not None and left <= 0:
+                        raise ToolTimeout(timeout)
+                    self._condition.wait(left)
+            finally:
+                self._dequeue(claims)
+                self.stats['wait_seconds'] += time.monotonic() - started
+
+    async def acquire_async(self, claims: List[Tuple[str, int]]):
+        """Wait without blocking the event loop until every claim is granted; ToolTimeout at the deadline"""
+        if not claims:
+            return
+        loop = asyncio.get_running_loop()
+        started = None
+        timeout = remaining()
+        try:
+            while True:
+                with self._condition:
+                    if self._try_acquire(claims):
+                        return
+                    if started is None:
+                        self.stats['waits'] += 1
+                        started = time.monotonic()
+                        self._enqueue(claims)
+                    left = None if timeout is None else timeout - (time.monotonic() - started)
+                    if left is not None and left <= 0:
+                        raise ToolTimeout(timeout)
+                    waiter = (loop, loop.create_future())
+                    self._async_waiters.append(waiter)
+                try:
+                    await asyncio.wait((waiter[1],), timeout=left)
+                finally:
+                    with self._condition:
+                        if waiter in self._async_waiters:
+                            self._async_waiters.remove(waiter)
+        finally:
+            if started is not None:
+                with self._condition:
+                    self._dequeue(claims)
+                    self.stats['wait_seconds'] += time.monotonic() - started
+
+    def release(self, claims: List[Tuple[str, int]]):
+        """Return the claims and wake every waiter to retry"""
+        if not claims:
+            return
+        with self._condition:
+            for resource, slots in claims:
+                left = self._held.get(resource, 0) - slots
+                if left > 0:
+                    self._held[resource] = left
+                else:
+                    self._held.pop(resource, None)
+            self._notify_waiters()
+
+    @contextlib.contextmanager
+    def hold(self, tool_name: str, args: Dict[str, Any], parallel: bool = False):
+        """Hold the resources of a call for the duration of the block"""
+        claims = self.claims_for(tool_name, args, parallel)
+        self.acquire(claims)
+        try:
+            yield claims
+        finally:
+            self.release(claims)
+
+    @contextlib.asynccontextmanager
+    async def hold_async(self, tool_name: str, args: Dict[str, Any], parallel: bool = False):
+        """Hold the resources of a call for the duration of the async block"""
+        claims = self.claims_for(tool_name, args, parallel)
+        await self.acquire_async(claims)
+        try:
+            yield claims
+        finally:
+            self.release(claims)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scheduling statistics
+
+        Returns:
+            Dict[str, Any]: Grants, calls that had to wait, total wait time and resources in use
+        """
+        with self._condition:
+            stats = dict(self.stats)
+            stats['held'] = dict(self._held)
+        return stats
+
+
+def _wake(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+def initialize_resource_scheduler(config_data: Dict[str, Any] = None) -> ResourceScheduler:
+    """
+    Initialize the process-wide resource scheduler
+
+    Args:
+        config_data: Configuration data from config.yaml
+
+    Returns:
+        ResourceScheduler: Global resource scheduler
+    """
+    global _resource_scheduler
+
+    with _resource_scheduler_lock:
+        if _resource_scheduler is None:
+            _resource_scheduler = ResourceScheduler(config_data)
+            logger.info("Tool resource scheduler initialized")
+
+    return _resource_scheduler
+
+
+def get_resource_scheduler() -> ResourceScheduler:
+    """
+    Get the process-wide resource scheduler, creating it with the default limits if needed
+
+    Returns:
+        ResourceScheduler: Global resource scheduler
+    """
+    if _resource_scheduler is None:
+        return initialize_resource_scheduler()
+    return _resource_scheduler
@@ -0,0 +1,180 @@
+"""
+Single-Flight Tool Execution for Kubernetes Volume I/O Error Troubleshooting
+
+The model sometimes emits the same tool call twice in one turn, and the plan
+phase ReAct graph and the Phase 1 graph can ask for the same data at the same
+time. SingleFlight lets identical concurrent calls share one execution: the
+first caller of a key runs the tool, later callers wait for its result.
+
+One process-wide instance is shared by every ExecuteToolNode. It works for
+threads (the parallel strategy's pool) and coroutines (execute_async) alike,
+since every flight is a concurrent.futures.Future.
+
+A leader that is cancelled, or runs out of its own deadline, abandons its
+flight instead of failing it: its waiting callers run the call themselves,
+the first of them as the new leader.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from tools.core.deadline import ToolTimeout, remaining
+
+# Configure logging
+logger = logging.getLogger('single_flight')
+logger.setLevel(logging.INFO)
+
+# Global single-flight instance
+_single_flight = None
+_single_flight_lock = threading.Lock()
+
+# Result of an abandoned flight; its waiting callers start over
+_ABANDONED = object()
+
+# Errors that end the leader's call only, not the call itself
+_ABANDONING_ERRORS = (asyncio.CancelledError, ToolTimeout)
+
+
+class SingleFlight:
+    """
+    Shares one in-flight execution among concurrent callers with the same key
+    """
+
+    def __init__(self):
+        """Initialize with no flights in progress"""
+        self._flights: Dict[Hashable, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            'executions': 0,
+            'shared': 0
+        }
+
+    def _join(self, key: Hashable) -> Tuple[concurrent.futures.Future, bool]:
+        """Get the flight of a key, starting one if there is none; returns (flight, leader)"""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                self.stats['shared'] += 1
+                return flight, False
+            flight = concurrent.futures.Future()
+            self._flights[key] = flight
+            self.stats['executions'] += 1
+            return flight, True
+
+    def _land(self, key: Hashable, flight: concurrent.futures.Future, result: Any = None,
+              error: BaseException = None):
+        """Finish a flight; callers arriving afterwards start a new one"""
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        if error is not None:
+            flight.set_exception(error)
+        else:
+            flight.set_result(result)
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run func, or wait for the identical call already in flight
+
+        Args:
+            key: Identity of the call
+            func: Runs the call
+
+        Returns:
+            Tuple[Any, bool]: (result, whether it came from another caller's execution)
+        """
+        while True:
+            flight, leader = self._join(key)
+            if leader:
+                break
+            logger.info(f"Joining in-flight call {key[0] if isinstance(key, tuple) else key}")
+            timeout = remaining()
+            try:
+                # The caller's own deadline bounds the wait
+                result = flight.result(timeout)
+            except concurrent.futures.TimeoutError:
+                if flight.done():
+                    raise
+                raise ToolTimeout(timeout)
+            if result is not _ABANDONED:
+                return result, True
+        try:
+            result = func()
+        except _ABANDONING_ERRORS:
+            self._land(key, flight, _ABANDONED)
+            raise
+        except BaseException as e:
+            self._land(key, flight, error=e)
+            raise
+        self._land(key, flight, result)
+        return result, False
+
+    async def do_async(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Await func(), or wait for the identical call already in flight
+
+        Args:
+            key: Identity of the call
+            func: Returns the awaitable running the call
+
+        Returns:
+            Tuple[Any, bool]: (result, whether it came from another caller's execution)
+        """
+        while True:
+            flight, leader = self._join(key)
+            if leader:
+                break
+            logger.info(f"Joining in-flight call {key[0] if isinstance(key, tuple) else key}")
+            # Shielded: a cancelled or timed out caller stops waiting without cancelling the flight
+            timeout = remaining()
+            waiting = asyncio.timeout(timeout)
+            try:
+                async with waiting:
+                    result = await asyncio.shield(asyncio.wrap_future(flight))
+            except TimeoutError:
+                if not waiting.expired():
+                    raise
+                raise ToolTimeout(timeout)
+            if result is not _ABANDONED:
+                return result, True
+        try:
+            result = await func()
+        except _ABANDONING_ERRORS:
+            self._land(key, flight, _ABANDONED)
+            raise
+        except BaseException as e:
+            self._land(key, flight, error=e)
+            raise
+        self._land(key, flight, result)
+        return result, False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get single-flight statistics
+
+        Returns:
+            Dict[str, Any]: Executions, calls served by another caller's execution and flights in progress
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats['in_flight'] = len(self._flights)
+        return stats
+
+
+def get_single_flight() -> SingleFlight:
+    """
+    Get the process-wide single-flight instance shared by all ExecuteToolNodes
+
+    Returns:
+        SingleFlight: Global single-flight instance
+    """
+    global _single_flight
+
+    if _single_flight is None:
+        with _single_flight_lock:
+            if _single_flight is None:
+                _single_flight = SingleFlight()
+    return _single_flight
@@ -6,7 +6,6 @@ It implements the Strategy Pattern to separate different execution approaches.
 """
 
 import logging
-import concurrent.futures
 import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Literal, Optional, Union
@@ -16,6 +15,8 @@ from langchain_core.messages import ToolMessage
 from langchain_core.runnables import RunnableConfig
 from langchain_core.runnables.config import get_config_list
 
+from troubleshooting.tool_runtime import get_tool_executor
+
 # Configure logging
 logger = logging.getLogger('strategies')
 logger.setLevel(logging.INFO)
@@ -24,6 +25,7 @@ class ExecutionType(Enum):
     """Enumeration for tool execution types."""
     SERIAL = "Serial"
     PARALLEL = "Parallel"
+    SCHEDULED = "Scheduled"
 
 class ToolExecutionStrategy(ABC):
     """Abstract base class for tool execution strategies."""
@@ -146,12 +148,15 @@ class SerialToolExecutionStrategy(ToolExecutionStrategy):
 class ParallelToolExecutionStrategy(ToolExecutionStrategy):
     """Strategy for executing tools concurrently."""
     
+    call_type = ExecutionType.PARALLEL
+    
     def __init__(self, max_workers: Optional[int] = None):
         """Initialize the parallel execution strategy.
         
         Args:
             max_workers: Maximum number of worker threads to use for parallel execution.
-                Defaults to None (uses ThreadPoolExecutor default).
+                Defaults to None (uses ThreadPoolExecutor default). Strategies with the
+                same limit share one long-lived pool.
         """
         self.max_workers = max_workers
     
@@ -162,7 +167,7 @@ class ParallelToolExecutionStrategy(ToolExecutionStrategy):
         config: RunnableConfig,
         run_one_callback: callable,
     ) -> List[ToolMessage]:
-        """Execute tools concurrently using ThreadPoolExecutor.
+        """Execute tools concurrently on the shared tool call thread pool.
         
         Args:
             tool_calls: List of tool calls to execute in parallel
@@ -171,7 +176,7 @@ class ParallelToolExecutionStrategy(ToolExecutionStrategy):
             run_one_callback: Callback function to execute a single tool
             
         Returns:
-            List of ToolMessage results
+            List of ToolMessage results, in the order of tool_calls
         """
         if not tool_calls:
             return []
@@ -180,38 +185,38 @@ class ParallelToolExecutionStrategy(ToolExecutionStrategy):
         outputs = []
         
         try:
-            # Process tools in parallel using ThreadPoolExecutor
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Create a dictionary to map futures to their corresponding tool calls and configs
-                future_to_tool = {}
+            # Process tools in parallel on the pool shared across steps and nodes
+            executor = get_tool_executor(self.max_workers)
+            # Create a dictionary to map futures to their corresponding tool calls and configs
+            future_to_tool = {}
+            
+            # Submit all tool calls to the executor
+            for i, tool_call in enumerate(tool_calls):
+                # Get the individual config for this tool call
+                tool_config = config_list[i] if i < len(config_list) else config_list[-1]
                 
-                # Submit all tool calls to the executor
-                for i, tool_call in enumerate(tool_calls):
-                    # Get the individual config for this tool call
-                    tool_config = config_list[i] if i < len(config_list) else config_list[-1]
-                    
-                    # Submit the tool call to the executor with "Parallel" call type
-                    future = executor.submit(
-                        run_one_callback, tool_call, input_type, tool_config, ExecutionType.PARALLEL.value
+                # Submit the tool call to the executor with this strategy's call type
+                future = executor.submit(
+                    run_one_callback, tool_call, input_type, tool_config, self.call_type.value
+                )
+                future_to_tool[future] = (tool_call, tool_config)
+            
+            # Collect results in call order
+            for future in future_to_tool:
+                try:
+                    output = future.result()
+                    outputs.append(output)
+                except Exception as exc:
+                    # If an exception occurs in the thread, log it and create an error message
+                    tool_call, _ = future_to_tool[future]
+                    logger.error(f"Tool {tool_call['name']} generated an exception: {exc}")
+                    error_message = ToolMessage(
+                        content=f"Error executing tool {tool_call['name']}: {str(exc)}",
+                        name=tool_call["name"],
+                        tool_call_id=tool_call["id"],
+                        status="error",
                     )
-                    future_to_tool[future] = (tool_call, tool_config)
-                
-                # Process completed futures as they finish
-                for future in concurrent.futures.as_completed(future_to_tool):
-                    try:
-                        output = future.result()
-                        outputs.append(output)
-                    except Exception as exc:
-                        # If an exception occurs in the thread, log it and create an error message
-                        tool_call, _ = future_to_tool[future]
-                        logger.error(f"Tool {tool_call['name']} generated an exception: {exc}")
-                        error_message = ToolMessage(
-                            content=f"Error executing tool {tool_call['name']}: {str(exc)}",
-                            name=tool_call["name"],
-                            tool_call_id=tool_call["id"],
-                            status="error",
-                        )
-                        outputs.append(error_message)
+                    outputs.append(error_message)
         except Exception as e:
             # If ThreadPoolExecutor fails, log the error and fall back to sequential execution
             logger.error(f"Parallel execution failed, falling back to sequential: {e}")
@@ -252,9 +257,9 @@ class ParallelToolExecutionStrategy(ToolExecutionStrategy):
                 # Get the individual config for this tool call
                 tool_config = config_list[i] if i < len(config_list) else config_list[-1]
                 
-                # Create a task for each tool call with "Parallel" call type
+                # Create a task for each tool call with this strategy's call type
                 task = asyncio.create_task(
-                    run_one_callback(tool_call, input_type, tool_config, ExecutionType.PARALLEL.value)
+                    run_one_callback(tool_call, input_type, tool_config, self.call_type.value)
                 )
                 tasks.append(task)
             
@@ -285,6 +290,16 @@ class ParallelToolExecutionStrategy(ToolExecutionStrategy):
             
         return outputs
 
+class ScheduledToolExecutionStrategy(ParallelToolExecutionStrategy):
+    """Strategy for starting every tool call at once and leaving overlap to resource claims.
+    
+    The callback is expected to hold the resources a call touches (see
+    troubleshooting.resource_scheduler) while it runs, so calls on different
+    nodes, devices or pods proceed concurrently and conflicting calls wait.
+    """
+    
+    call_type = ExecutionType.SCHEDULED
+
 class StrategyFactory:
     """Factory class for creating execution strategies."""
     
@@ -293,12 +308,14 @@ class StrategyFactory:
         """Create a strategy based on execution type.
         
         Args:
-            strategy_type: Type of execution strategy (SERIAL or PARALLEL)
+            strategy_type: Type of execution strategy (SERIAL, PARALLEL or SCHEDULED)
             max_workers: Maximum number of worker threads for parallel execution
             
         Returns:
             An instance of a ToolExecutionStrategy
         """
+        if strategy_type == ExecutionType.SCHEDULED:
+            return ScheduledToolExecutionStrategy(max_workers)
         if strategy_type == ExecutionType.PARALLEL:
             return ParallelToolExecutionStrategy(max_workers)
         return SerialToolExecutionStrategy()
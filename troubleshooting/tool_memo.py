@@ -0,0 +1,284 @@
+"""
+Tool Result Memoization for Kubernetes Volume I/O Error Troubleshooting
+
+The LLM often repeats a tool call with identical arguments across ReAct
+iterations (kg_get_summary, kubectl_get_drive, smartctl_check, ...). An
+ExecuteToolNode answers those repeats from a ToolResultMemo instead of running
+the tool again.
+
+Every tool has a cacheability policy:
+    pure        the result depends only on the arguments; kept for the life of the node
+    TTL         a number of seconds the result stays valid (cluster and node state)
+    never       always run the tool (the default)
+Policies come from TOOL_CACHE_POLICIES, overridden per tool by
+tools.memoization.policies in config.yaml. Entries are keyed by tool name and
+canonicalized arguments, evicted in LRU order, and the whole memo is dropped
+after any tool that mutates cluster state. A call that can change a node (an
+SSH command, kubectl exec, fsck with repairs) drops the memoized node state.
+Failed calls are never memoized.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple, Union
+
+from tools.kubernetes.result_cache import DEFAULT_TTL_SECONDS, MUTATING_TOOLS
+
+# Configure logging
+logger = logging.getLogger('tool_memo')
+logger.setLevel(logging.INFO)
+
+PURE = 'pure'
+NEVER = 'never'
+
+DEFAULT_MAX_ENTRIES = 256
+
+# Tool name -> 'pure', 'never' or a TTL in seconds; tools not listed are never memoized
+TOOL_CACHE_POLICIES: Dict[str, Union[str, float]] = {
+    # The Knowledge Graph is built in Phase 0 and only read by the tools
+    'kg_get_entity_info': PURE,
+    'kg_get_related_entities': PURE,
+    'kg_get_all_issues': PURE,
+    'kg_find_path': PURE,
+    'kg_get_summary': PURE,
+    'kg_analyze_issues': PURE,
+    'kg_print_graph': PURE,
+    'kg_batch_query': PURE,
+    'kg_list_entity_types': PURE,
+    'kg_list_entities': PURE,
+    'kg_list_relationship_types': PURE,
+    'kg_get_entity_of_pod': PURE,
+    'kg_get_entity_of_pvc': PURE,
+    'kg_get_entity_of_pv': PURE,
+    'kg_get_entity_of_drive': PURE,
+    'kg_get_entity_of_node': PURE,
+    'kg_get_entity_of_lvg': PURE,
+    'kg_get_entity_of_ac': PURE,
+    'kg_get_entity_of_volume': PURE,
+    # Cluster state, as fresh as the shared result cache keeps it. kubectl_get and
+    # kubectl_describe are left to that cache's per-resource TTLs, kubectl_logs always runs
+    'kubectl_get_drive': DEFAULT_TTL_SECONDS['drives'],
+    'kubectl_get_csibmnode': DEFAULT_TTL_SECONDS['nodes'],
+    'kubectl_get_availablecapacity': DEFAULT_TTL_SECONDS['availablecapacities'],
+    'kubectl_get_logicalvolumegroup': DEFAULT_TTL_SECONDS['logicalvolumegroups'],
+    'kubectl_get_storageclass': DEFAULT_TTL_SECONDS['storageclasses'],
+    'kubectl_get_csidrivers': DEFAULT_TTL_SECONDS['csidrivers'],
+    # Node state
+    'smartctl_check': 60,
+    'check_disk_health': 60,
+    'scan_disk_error_logs': 30,
+    'df_command': 30,
+    'lsblk_command': 60,
+    'mount_command': 60,
+    'dmesg_command': 10,
+    'journalctl_command': 10,
+    'get_system_hardware_info': 300,
+}
+
+# Memoized tools reporting node state: disks, mounts, filesystems and logs
+NODE_STATE_TOOLS = {
+    'smartctl_check',
+    'check_disk_health',
+    'scan_disk_error_logs',
+    'df_command',
+    'lsblk_command',
+    'mount_command',
+    'dmesg_command',
+    'journalctl_command',
+    'get_system_hardware_info',
+}
+
+# Tool name -> whether a call with these arguments can change node state
+NODE_MUTATING_TOOLS: Dict[str, Callable[[Dict[str, Any]], bool]] = {
+    'ssh_execute': lambda args: True,
+    'kubectl_exec': lambda args: True,
+    'fsck_check': lambda args: not args.get('check_only', True),
+}
+
+# How tools report a failure in their result string
+FAILURE_PREFIXES = ('Error', 'SSH execution failed', 'SSH setup error')
+
+
+def is_failure(content: Any) -> bool:
+    """Whether a tool result reports a failure instead of data"""
+    return isinstance(content, str) and content.startswith(FAILURE_PREFIXES)
+
+
+def canonical_args(args: Dict[str, Any], exclude: Iterable[str] = ()) -> str:
+    """
+    Serialize tool arguments so that equal calls give equal strings
+
+    Keys are sorted at every level and None values are dropped, so an argument
+    left at its default of None matches an omitted one.
+
+    Args:
+        args: Tool call arguments
+        exclude: Argument names to leave out (injected graph state and store)
+
+    Returns:
+        str: Canonical JSON of the arguments
+    """
+    excluded = set(exclude)
+    return json.dumps({key: value for key, value in args.items() if key not in excluded and value is not None},
+                      sort_keys=True, separators=(',', ':'), default=str)
+
+
+class ToolResultMemo:
+    """
+    Per-node memo of tool results with pure, TTL and never policies
+    """
+
+    def __init__(self, config_data: Dict[str, Any] = None):
+        """
+        Initialize the memo
+
+        Args:
+            config_data: Configuration data from config.yaml
+        """
+        memo_config = ((config_data or {}).get('tools', {}) or {}).get('memoization', {}) or {}
+
+        self.enabled = memo_config.get('enabled', True)
+        self.max_entries = max(1, int(memo_config.get('max_entries', DEFAULT_MAX_ENTRIES)))
+        self.policies = {**TOOL_CACHE_POLICIES, **(memo_config.get('policies', {}) or {})}
+
+        # key -> (expiry on the monotonic clock or None, stored time, result)
+        self._entries: "OrderedDict[Hashable, Tuple[Optional[float], float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'expirations': 0,
+            'evictions': 0,
+            'invalidations': 0
+        }
+
+    def policy_for(self, tool_name: str) -> Union[str, float]:
+        """
+        Get the cacheability policy of a tool
+
+        Args:
+            tool_name: Tool name
+
+        Returns:
+            Union[str, float]: 'pure', 'never' or a TTL in seconds
+        """
+        policy = self.policies.get(tool_name, NEVER)
+        if policy in (PURE, NEVER):
+            return policy
+        try:
+            ttl = float(policy)
+        except (TypeError, ValueError):
+            logger.warning(f"Unknown cache policy {policy!r} for tool {tool_name}; not memoizing it")
+            return NEVER
+        return ttl if ttl > 0 else NEVER
+
+    def is_cacheable(self, tool_name: str) -> bool:
+        """Whether results of the tool may be memoized"""
+        return self.enabled and self.policy_for(tool_name) != NEVER
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        """
+        Look up a memoized result
+
+        Args:
+            key: (tool name, canonical arguments)
+
+        Returns:
+            Optional[Tuple[Any, float]]: (result, age in seconds), or None on miss or expiry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+
+            expires_at, stored_at, value = entry
+            now = time.monotonic()
+            if expires_at is not None and now >= expires_at:
+                del self._entries[key]
+                self.stats['expirations'] += 1
+                self.stats['misses'] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return value, now - stored_at
+
+    def put(self, key: Hashable, value: Any):
+        """
+        Store a result under the policy of its tool, evicting least recently used entries when full
+
+        Args:
+            key: (tool name, canonical arguments)
+            value: Tool result
+        """
+        policy = self.policy_for(key[0])
+        if not self.enabled or policy == NEVER:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (None if policy == PURE else now + policy, now, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+
+    def invalidate(self, reason: str = None):
+        """
+        Drop every memoized result
+
+        Args:
+            reason: Why the memo is being invalidated (for logging)
+        """
+        with self._lock:
+            self._entries.clear()
+            self.stats['invalidations'] += 1
+        logger.info(f"Tool result memo invalidated{f' after {reason}' if reason else ''}")
+
+    def invalidate_tools(self, tool_names: Iterable[str], reason: str = None):
+        """
+        Drop the memoized results of some tools
+
+        Args:
+            tool_names: Tools whose results are dropped
+            reason: Why they are being invalidated (for logging)
+        """
+        tool_names = set(tool_names)
+        with self._lock:
+            stale = [key for key in self._entries if key[0] in tool_names]
+            for key in stale:
+                del self._entries[key]
+            self.stats['invalidations'] += 1
+        logger.info(f"Dropped {len(stale)} memoized results{f' after {reason}' if reason else ''}")
+
+    def invalidate_after_tool(self, tool_name: str, args: Dict[str, Any] = None):
+        """
+        Invalidate the memo if the given tool mutates cluster state, or node state if it changes a node
+
+        Args:
+            tool_name: Name of the tool that just ran
+            args: Arguments of the call
+        """
+        if tool_name in MUTATING_TOOLS:
+            self.invalidate(reason=tool_name)
+        elif tool_name in NODE_MUTATING_TOOLS and NODE_MUTATING_TOOLS[tool_name](args or {}):
+            self.invalidate_tools(NODE_STATE_TOOLS, reason=tool_name)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get memo statistics
+
+        Returns:
+            Dict[str, Any]: Hit/miss counters, hit rate and current size
+        """
+        with self._lock:
+            size = len(self._entries)
+            stats = dict(self.stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        stats['size'] = size
+        return stats
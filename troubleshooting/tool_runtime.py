@@ -0,0 +1,150 @@
+"""
+Shared Tool Runtime for Kubernetes Volume I/O Error Troubleshooting
+
+Tool calls used to get a fresh ThreadPoolExecutor per graph step, and async-only
+tools (MCP tools) called from a worker thread got an event loop of their own.
+This module keeps one long-lived thread pool per worker limit and one background
+event loop for the whole process:
+    get_tool_executor(max_workers)  pool running the tool calls of every ExecuteToolNode
+    run_coroutine(coro)             runs a coroutine on the background loop and waits for it
+Both are created on first use and shut down at interpreter exit.
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import contextvars
+import logging
+import threading
+from typing import Any, Coroutine, Dict, Optional
+
+from tools.core.deadline import ToolTimeout, partial_output
+
+# Configure logging
+logger = logging.getLogger('tool_runtime')
+logger.setLevel(logging.INFO)
+
+# Global runtime: pools by worker limit and the background event loop
+_executors: Dict[Optional[int], concurrent.futures.ThreadPoolExecutor] = {}
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_runtime_lock = threading.Lock()
+
+
+def get_tool_executor(max_workers: Optional[int] = None) -> concurrent.futures.ThreadPoolExecutor:
+    """
+    Get the process-wide thread pool for tool calls
+
+    Args:
+        max_workers: Worker limit; None uses the ThreadPoolExecutor default
+
+    Returns:
+        concurrent.futures.ThreadPoolExecutor: Pool shared by every node with this limit
+    """
+    executor = _executors.get(max_workers)
+    if executor is None:
+        with _runtime_lock:
+            executor = _executors.get(max_workers)
+            if executor is None:
+                executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers,
+                                                                 thread_name_prefix='tool-call')
+                _executors[max_workers] = executor
+                logger.info(f"Tool call thread pool started (max_workers={max_workers})")
+    return executor
+
+
+def get_tool_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the background event loop for async-only tools, starting it if needed
+
+    Returns:
+        asyncio.AbstractEventLoop: Loop running forever in a daemon thread
+    """
+    global _loop, _loop_thread
+
+    if _loop is None:
+        with _runtime_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                _loop_thread = threading.Thread(target=loop.run_forever, name='tool-event-loop', daemon=True)
+                _loop_thread.start()
+                _loop = loop
+                logger.info("Tool event loop started")
+    return _loop
+
+
+def run_coroutine(coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+    """
+    Run a coroutine on the background event loop and wait for its result
+
+    Args:
+        coro: Coroutine to run, e.g. tool.ainvoke(...)
+        timeout: Seconds to wait; on expiry the coroutine is cancelled and ToolTimeout raised
+
+    Returns:
+        Any: Result of the coroutine; its exception is raised here
+    """
+    loop = get_tool_loop()
+    if threading.current_thread() is _loop_thread:
+        coro.close()
+        raise RuntimeError("run_coroutine called from the tool event loop would deadlock; await the coroutine")
+    future = _start_in_context(loop, coro, contextvars.copy_context())
+    try:
+        return future.result(timeout)
+    except concurrent.futures.TimeoutError:
+        if future.done():
+            # The coroutine itself raised TimeoutError
+            raise
+        future.cancel()
+        raise ToolTimeout(timeout, partial_output())
+
+
+def _start_in_context(loop: asyncio.AbstractEventLoop, coro: Coroutine[Any, Any, Any],
+                      context: contextvars.Context) -> concurrent.futures.Future:
+    """
+    Like asyncio.run_coroutine_threadsafe, but the task runs in the caller's context,
+    so the coroutine sees the call's deadline scope
+    """
+    future = concurrent.futures.Future()
+
+    def copy_outcome(task: asyncio.Task):
+        # The future stays pending until here, so the caller can still cancel it
+        if task.cancelled():
+            future.cancel()
+        elif future.set_running_or_notify_cancel():
+            if task.exception() is not None:
+                future.set_exception(task.exception())
+            else:
+                future.set_result(task.result())
+
+    def start():
+        if future.cancelled():
+            coro.close()
+            return
+        task = loop.create_task(coro, context=context)
+        task.add_done_callback(copy_outcome)
+        future.add_done_callback(lambda f: f.cancelled() and loop.call_soon_threadsafe(task.cancel))
+
+    loop.call_soon_threadsafe(start)
+    return future
+
+
+def shutdown_tool_runtime():
+    """Stop the thread pools and the background event loop"""
+    global _loop, _loop_thread
+
+    with _runtime_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+        loop, thread = _loop, _loop_thread
+        _loop = _loop_thread = None
+    for executor in executors:
+        executor.shutdown(wait=False, cancel_futures=True)
+    if loop is not None:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        if not loop.is_running():
+            loop.close()
+
+
+atexit.register(shutdown_tool_runtime)
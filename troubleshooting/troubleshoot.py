@@ -34,6 +34,10 @@ import json
 import os
 from phases.chat_mode import ChatMode
 from tools.core.mcp_adapter import initialize_mcp_adapter, get_mcp_adapter
+from tools.core.ssh_pool import initialize_ssh_pool, close_ssh_pool
+from tools.kubernetes.backend import initialize_kubernetes_backend
+from tools.kubernetes.result_cache import initialize_result_cache, get_result_cache
+from information_collector.resident_graph import initialize_resident_graph, close_resident_graph
 from rich.logging import RichHandler
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
@@ -114,7 +118,6 @@ def configure_module_loggers():
 # Global variables
 CONFIG_DATA = None
 INTERACTIVE_MODE = False
-SSH_CLIENTS = {}
 KNOWLEDGE_GRAPH = None
 RESULTS_DIR = os.path.join(tempfile.gettempdir(), "k8s-troubleshooting-results")
 
@@ -688,6 +691,9 @@ async def main():
         # Initialize MCP adapter
         mcp_adapter = await initialize_mcp_adapter(CONFIG_DATA)
 
+        # Initialize the shared SSH connection pool
+        initialize_ssh_pool(CONFIG_DATA)
+
         # Initialize Kubernetes configuration
         try:
             config.load_incluster_config()
@@ -700,6 +706,13 @@ async def main():
                 logging.error(f"Failed to load Kubernetes configuration: {e}")
                 sys.exit(1)
         
+        # Initialize the backend serving kubectl get/describe tools and its result cache
+        initialize_kubernetes_backend(CONFIG_DATA)
+        initialize_result_cache(CONFIG_DATA)
+        
+        # Start the resident cluster-wide Knowledge Graph if enabled
+        initialize_resident_graph(CONFIG_DATA)
+        
         # Run comprehensive troubleshooting
         results = await run_comprehensive_troubleshooting(
             args.pod_name, args.namespace, args.volume_path
@@ -727,12 +740,12 @@ async def main():
         logging.error(f"Critical error in main: {str(e)}")
         sys.exit(1)
     finally:
-        # Clean up SSH connections
-        for client in SSH_CLIENTS.values():
-            try:
-                client.close()
-            except:
-                pass
+        # Report kubectl result cache effectiveness
+        logging.info(f"kubectl result cache stats: {get_result_cache().get_stats()}")
+        
+        # Stop watching the cluster and clean up SSH connections
+        close_resident_graph()
+        close_ssh_pool()
                 
         # Clean up MCP connections
         mcp_adapter = get_mcp_adapter()